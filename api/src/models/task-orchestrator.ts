@@ -1,4 +1,4 @@
-import { Feature, FeatureCollection, Geometry } from 'geojson';
+import { Feature, FeatureCollection, Geometry, MultiPolygon, Polygon } from 'geojson';
 import { TaskType } from './task';
 
 /** Optional normalized reward for selected rook-adjacent planning-unit pairs. */
@@ -29,7 +29,20 @@ export interface PlanningUnitConstraintRequest {
   max?: number | null;
 }
 
-export type OptimizationConstraintRequest = AggregateConstraintRequest | PlanningUnitConstraintRequest;
+/** Planning units locked into or out of every solution by a polygon or a layer value range. */
+export interface LockConstraintRequest {
+  type: 'lock';
+  state: 'in' | 'out';
+  geometry?: Polygon | MultiPolygon;
+  layer?: string;
+  min?: number | null;
+  max?: number | null;
+}
+
+export type OptimizationConstraintRequest =
+  | AggregateConstraintRequest
+  | PlanningUnitConstraintRequest
+  | LockConstraintRequest;
 
 /** GeoJSON target area from which candidate planning units are constructed. */
 export type OptimizationTargetAreaRequest = Feature<Geometry> | FeatureCollection<Geometry>;
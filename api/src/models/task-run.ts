@@ -51,6 +51,7 @@ export const TaskRun = z.object({
   preliminary_estimate: z.record(z.unknown()).nullable(),
   admission_outcome: z.record(z.unknown()).nullable(),
   progress: z.record(z.unknown()).nullable(),
+  model_cache: z.record(z.unknown()).nullable(),
   planning_unit_count: z.coerce.number().int().nullable(),
   feature_nonzero_count: z.coerce.number().int().nullable(),
   neighbor_edge_count: z.coerce.number().int().nullable(),
@@ -94,6 +95,7 @@ export interface UpdateTaskRun {
   preliminary_estimate?: Record<string, unknown> | null;
   admission_outcome?: Record<string, unknown> | null;
   progress?: Record<string, unknown> | null;
+  model_cache?: Record<string, unknown> | null;
   planning_unit_count?: number | null;
   feature_nonzero_count?: number | null;
   neighbor_edge_count?: number | null;
@@ -46,6 +46,7 @@ export const TaskRunSchema: OpenAPIV3.SchemaObject = {
     preliminary_estimate: { type: 'object', additionalProperties: true, nullable: true },
     admission_outcome: { type: 'object', additionalProperties: true, nullable: true },
     progress: { type: 'object', additionalProperties: true, nullable: true },
+    model_cache: { type: 'object', additionalProperties: true, nullable: true },
     planning_unit_count: { type: 'integer', format: 'int64', nullable: true },
     feature_nonzero_count: { type: 'integer', format: 'int64', nullable: true },
     neighbor_edge_count: { type: 'integer', format: 'int64', nullable: true },
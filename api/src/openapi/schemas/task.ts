@@ -1,5 +1,5 @@
 import { OpenAPIV3 } from 'openapi-types';
-import { GeoJSONFeature } from './geoJson';
+import { GeoJSONFeature, GeoJSONMultiPolygon, GeoJSONPolygon } from './geoJson';
 import { TaskRunSchema } from './task-run';
 
 const TargetAreaSchema: OpenAPIV3.SchemaObject = {
@@ -52,6 +52,20 @@ const ConstraintSchema: OpenAPIV3.SchemaObject = {
         min: { type: 'number', nullable: true },
         max: { type: 'number', nullable: true }
       }
+    },
+    {
+      type: 'object',
+      required: ['type', 'state'],
+      additionalProperties: false,
+      description: 'Planning units forced into or out of every solution by a polygon or a layer value range.',
+      properties: {
+        type: { type: 'string', enum: ['lock'] },
+        state: { type: 'string', enum: ['in', 'out'] },
+        geometry: { oneOf: [GeoJSONPolygon, GeoJSONMultiPolygon] },
+        layer: { type: 'string' },
+        min: { type: 'number', nullable: true },
+        max: { type: 'number', nullable: true }
+      }
     }
   ],
   discriminator: { propertyName: 'type' }
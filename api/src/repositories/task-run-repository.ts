@@ -8,7 +8,7 @@ const TASK_RUN_COLUMNS = `
   execution_method_version, status, stage, revision,
   input_snapshot, input_hash, planning_unit_definition, solver_config,
   code_version, solver_name, solver_version, solver_status, objective_value, optimality_gap, runtime_seconds,
-  preliminary_estimate, admission_outcome, progress, planning_unit_count,
+  preliminary_estimate, admission_outcome, progress, model_cache, planning_unit_count,
   feature_nonzero_count, neighbor_edge_count,
   prefect_flow_run_id, prefect_deployment_id, dispatch_attempts,
   failure_code, failure_message, started_at, completed_at, failed_at, cancelled_at,
@@ -130,6 +130,9 @@ export class TaskRunRepository extends BaseRepository {
     if (updates.progress !== undefined) {
       fields.push(SQL`progress = ${JSON.stringify(updates.progress)}::jsonb`);
     }
+    if (updates.model_cache !== undefined) {
+      fields.push(SQL`model_cache = ${JSON.stringify(updates.model_cache)}::jsonb`);
+    }
     if (updates.planning_unit_count !== undefined) {
       fields.push(SQL`planning_unit_count = ${updates.planning_unit_count}`);
     }
@@ -80,7 +80,32 @@ export class TaskRunService extends DBService {
     if (objectives.some((objective) => !Number.isFinite(objective.importance) || objective.importance < 0)) {
       throw new ApiGeneralError('Objective importance must be a finite nonnegative number.', []);
     }
-    if (request.constraints.some((constraint) => constraint.min == null && constraint.max == null)) {
+    if (
+      request.constraints.some(
+        (constraint) =>
+          constraint.type === 'lock' && (constraint.geometry === undefined) === (constraint.layer === undefined)
+      )
+    ) {
+      throw new ApiGeneralError('Every lock requires exactly one geometry or layer.', []);
+    }
+    if (
+      request.constraints.some(
+        (constraint) =>
+          constraint.type === 'lock' &&
+          constraint.geometry !== undefined &&
+          (constraint.min != null || constraint.max != null)
+      )
+    ) {
+      throw new ApiGeneralError('Geometry locks cannot declare layer bounds.', []);
+    }
+    if (
+      request.constraints.some(
+        (constraint) =>
+          !(constraint.type === 'lock' && constraint.geometry !== undefined) &&
+          constraint.min == null &&
+          constraint.max == null
+      )
+    ) {
       throw new ApiGeneralError('Every optimization constraint requires a minimum or maximum.', []);
     }
     if (
@@ -99,7 +124,7 @@ export class TaskRunService extends DBService {
     const layerIds = Array.from(
       new Set([
         ...objectives.map((objective) => objective.layer),
-        ...request.constraints.map((constraint) => constraint.layer)
+        ...request.constraints.flatMap((constraint) => (constraint.layer === undefined ? [] : [constraint.layer]))
       ])
     );
     const layerContracts = layerIds.map((layerId) =>
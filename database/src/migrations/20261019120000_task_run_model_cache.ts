@@ -0,0 +1,15 @@
+import { Knex } from 'knex';
+
+/** Record whether a run reused a cached compiled model. */
+export async function up(knex: Knex): Promise<void> {
+  await knex.schema.alterTable('task_run', (table) => {
+    table.jsonb('model_cache').nullable();
+  });
+}
+
+/** Remove the compiled-model cache outcome. */
+export async function down(knex: Knex): Promise<void> {
+  await knex.schema.alterTable('task_run', (table) => {
+    table.dropColumn('model_cache');
+  });
+}
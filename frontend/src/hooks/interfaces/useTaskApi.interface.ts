@@ -121,6 +121,7 @@ export interface TaskRunResponse {
   preliminary_estimate?: Record<string, unknown> | null;
   admission_outcome?: Record<string, unknown> | null;
   progress?: Record<string, unknown> | null;
+  model_cache?: Record<string, unknown> | null;
   planning_unit_count?: number | null;
   feature_nonzero_count?: number | null;
   neighbor_edge_count?: number | null;
@@ -0,0 +1,68 @@
+"""Compare the shape-based LP profile with the fixed IPM-plus-crossover options."""
+
+import argparse
+import json
+from dataclasses import replace
+
+import numpy as np
+
+from scripts.benchmark_warm_start import synthetic_model
+from src.optimization.artifact import load_compiled_artifact
+from src.optimization.highs import solve_with_highs
+from src.optimization.model import SolveConfiguration
+
+FIXED_PRIORITY_OPTIONS = {"solver": "ipm", "run_crossover": "on", "presolve": "on"}
+
+
+def main() -> None:
+    """Solve one continuous model with both option sets and print JSON timings."""
+    parser = argparse.ArgumentParser()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--artifact", help="Compiled-model artifact directory.")
+    source.add_argument("--synthetic", type=int, help="Synthetic planning units.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=300.0)
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument(
+        "--no-vertex",
+        action="store_true",
+        help="Let large interior-point solves skip crossover.",
+    )
+    arguments = parser.parse_args()
+    model = (
+        load_compiled_artifact(arguments.artifact).model
+        if arguments.artifact
+        else synthetic_model(arguments.synthetic, arguments.seed)
+    )
+    model = replace(model, integrality=np.zeros(model.variable_count, dtype=np.uint8))
+    configuration = SolveConfiguration(
+        time_limit_seconds=arguments.time_limit,
+        thread_count=arguments.threads,
+    )
+    runs = {
+        "fixed_ipm_crossover": replace(configuration, options=FIXED_PRIORITY_OPTIONS),
+        "lp_profile": replace(configuration, vertex_solution=not arguments.no_vertex),
+    }
+    report: dict[str, object] = {
+        "variables": model.variable_count,
+        "rows": model.constraint_count,
+        "nonzeros": model.nonzero_count,
+    }
+    for name, run_configuration in runs.items():
+        result = solve_with_highs(model, configuration=run_configuration)
+        diagnostics = result.diagnostics or {}
+        report[name] = {
+            "status": result.status,
+            "objective_value": result.objective_value,
+            "runtime_seconds": result.runtime_seconds,
+            "profile": (result.solver_settings or {}).get("lp_profile"),
+            "lp_algorithm": diagnostics.get("lp_algorithm"),
+            "simplex_iterations": diagnostics.get("simplex_iterations"),
+            "ipm_iterations": diagnostics.get("ipm_iterations"),
+            "crossover_iterations": diagnostics.get("crossover_iterations"),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
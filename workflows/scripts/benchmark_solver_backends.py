@@ -0,0 +1,80 @@
+"""Compare registered solver backends on compiled-model artifacts."""
+
+import argparse
+import json
+
+import numpy as np
+
+from scripts.benchmark_warm_start import synthetic_model
+from src.optimization.artifact import load_compiled_artifact
+from src.optimization.backends import solve_with_backend
+from src.optimization.highs import require_acceptable_result, warm_start_is_feasible
+from src.optimization.model import SolveConfiguration
+
+
+def main() -> None:
+    """Solve every model with every backend and print a JSON comparison."""
+    parser = argparse.ArgumentParser()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--artifact", nargs="+", help="Compiled-model artifact directories."
+    )
+    source.add_argument("--synthetic", type=int, help="Synthetic planning units.")
+    parser.add_argument("--backends", default="highs,cpsat")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=300.0)
+    parser.add_argument("--gap", type=float, default=0.0)
+    parser.add_argument("--threads", type=int, default=None)
+    arguments = parser.parse_args()
+    models = (
+        {path: load_compiled_artifact(path).model for path in arguments.artifact}
+        if arguments.artifact
+        else {
+            f"synthetic-{arguments.synthetic}": synthetic_model(
+                arguments.synthetic, arguments.seed
+            )
+        }
+    )
+    comparisons = []
+    for name, model in models.items():
+        runs = {}
+        for backend in arguments.backends.split(","):
+            configuration = SolveConfiguration(
+                time_limit_seconds=arguments.time_limit,
+                relative_mip_gap=arguments.gap,
+                thread_count=arguments.threads,
+                random_seed=arguments.seed,
+                backend=backend,
+            )
+            try:
+                result = solve_with_backend(model, configuration=configuration)
+                require_acceptable_result(result, configuration, model)
+            except (RuntimeError, ValueError) as error:
+                runs[backend] = {"error": f"{type(error).__name__}: {error}"}
+                continue
+            runs[backend] = {
+                "status": result.status,
+                "objective_value": result.objective_value,
+                "best_bound": result.best_bound,
+                "optimality_gap": result.optimality_gap,
+                "runtime_seconds": result.runtime_seconds,
+                "first_incumbent_seconds": (result.diagnostics or {}).get(
+                    "first_incumbent_seconds"
+                ),
+                "feasible": warm_start_is_feasible(model, result.native_columns),
+                "selected": int(np.count_nonzero(np.asarray(result.decisions) >= 0.5)),
+            }
+        comparisons.append(
+            {
+                "model": name,
+                "variables": model.variable_count,
+                "rows": model.constraint_count,
+                "nonzeros": model.nonzero_count,
+                "backends": runs,
+            }
+        )
+    print(json.dumps(comparisons, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Compare the local-search incumbent with HiGHS' time to first incumbent."""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from src.optimization.artifact import load_compiled_artifact
+from src.optimization.compiler import (
+    SparseConstraintSpecification,
+    compile_spatial_optimization,
+)
+from src.optimization.highs import HighsModelSession
+from src.optimization.local_search import build_local_search_warm_start
+from src.optimization.model import SolveConfiguration
+
+
+def synthetic_model(planning_unit_count: int, seed: int):
+    """Compile a random model with two caps and one minimum target."""
+    generator = np.random.default_rng(seed)
+    indices = np.arange(planning_unit_count, dtype=np.int32)
+    half = planning_unit_count // 2
+    return compile_spatial_optimization(
+        planning_units=None,
+        planning_unit_count=planning_unit_count,
+        fused_objective=generator.normal(0.2, 1.0, planning_unit_count),
+        constraints=[
+            SparseConstraintSpecification(
+                "cost",
+                indices,
+                generator.uniform(1.0, 5.0, planning_unit_count),
+                [(None, 0.3 * planning_unit_count)],
+            ),
+            SparseConstraintSpecification(
+                "area",
+                indices,
+                generator.uniform(0.5, 2.0, planning_unit_count),
+                [(None, 0.1875 * planning_unit_count)],
+            ),
+            SparseConstraintSpecification(
+                "habitat",
+                indices[:half],
+                generator.uniform(0.0, 1.0, half),
+                [(0.04 * planning_unit_count, None)],
+            ),
+        ],
+    ).model
+
+
+def main() -> None:
+    """Run both incumbent sources on one model and print a JSON comparison."""
+    parser = argparse.ArgumentParser()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--artifact", help="Compiled-model artifact directory.")
+    source.add_argument("--synthetic", type=int, help="Synthetic planning units.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--local-search-seconds", type=float, default=30.0)
+    parser.add_argument("--time-limit", type=float, default=300.0)
+    parser.add_argument("--threads", type=int, default=None)
+    arguments = parser.parse_args()
+    model = (
+        load_compiled_artifact(arguments.artifact).model
+        if arguments.artifact
+        else synthetic_model(arguments.synthetic, arguments.seed)
+    )
+    heuristic = build_local_search_warm_start(
+        model,
+        time_budget_seconds=arguments.local_search_seconds,
+    )
+    incumbents: list[dict[str, float]] = []
+    started = time.perf_counter()
+
+    def record_incumbent(event) -> None:
+        incumbents.append(
+            {
+                "elapsed_seconds": time.perf_counter() - started,
+                "objective_value": float(event.data_out.objective_function_value),
+            }
+        )
+
+    configuration = SolveConfiguration(
+        time_limit_seconds=arguments.time_limit,
+        thread_count=arguments.threads,
+    )
+    with HighsModelSession(model, configuration=configuration) as session:
+        session._require_open().cbMipImprovingSolution.subscribe(record_incumbent)
+        started = time.perf_counter()
+        result = session.solve()
+    first = incumbents[0] if incumbents else None
+    print(
+        json.dumps(
+            {
+                "variables": model.variable_count,
+                "rows": model.constraint_count,
+                "nonzeros": model.nonzero_count,
+                "local_search": (
+                    {
+                        "elapsed_seconds": heuristic.elapsed_seconds,
+                        "objective_value": heuristic.objective_value,
+                        "rounds": heuristic.round_count,
+                        "flips": heuristic.flip_count,
+                        "swaps": heuristic.swap_count,
+                    }
+                    if heuristic is not None
+                    else None
+                ),
+                "highs_first_incumbent": first,
+                "highs_incumbent_at_time_to_heuristic": next(
+                    (
+                        incumbent
+                        for incumbent in reversed(incumbents)
+                        if heuristic is not None
+                        and incumbent["elapsed_seconds"] <= heuristic.elapsed_seconds
+                    ),
+                    None,
+                ),
+                "highs_final": {
+                    "status": result.status,
+                    "objective_value": result.objective_value,
+                    "best_bound": result.best_bound,
+                    "runtime_seconds": result.runtime_seconds,
+                },
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Replay a benchmark corpus under each tuning choice and refit the rules table."""
+
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+
+from scripts.benchmark_warm_start import synthetic_model
+from src.optimization.artifact import load_compiled_artifact
+from src.optimization.highs import solve_with_highs
+from src.optimization.local_search import build_local_search_warm_start
+from src.optimization.model import SolveConfiguration
+from src.optimization.tuning import (
+    DEFAULT_TUNING_TABLE_PATH,
+    ModelFeatures,
+    TuningChoice,
+    TuningObservation,
+    fit_tuning_table,
+    model_features,
+    write_tuning_table,
+)
+from src.utils.cpu import available_cpu_count
+
+CORPUS_CHOICES = (
+    TuningChoice("default", {}),
+    TuningChoice("serial", {"parallel": "off"}, max_threads=1),
+    TuningChoice("presolve_off", {"presolve": "off"}),
+    TuningChoice("primal_heuristics", {"mip_heuristic_effort": 0.3}),
+    TuningChoice("light_heuristics", {"mip_heuristic_effort": 0.01}),
+    TuningChoice("dual_serial_simplex", {"simplex_strategy": 1}),
+    TuningChoice("primal_simplex", {"simplex_strategy": 4}),
+)
+FAILED_RUNTIME_MULTIPLIER = 2.0
+
+
+def _load_model(source: tuple):
+    """Rebuild one corpus model inside the replay process."""
+    kind, value, continuous = source
+    model = (
+        load_compiled_artifact(value).model
+        if kind == "artifact"
+        else synthetic_model(int(value), seed=int(value) % 997)
+    )
+    if continuous:
+        model = replace(
+            model, integrality=np.zeros(model.variable_count, dtype=np.uint8)
+        )
+    return model
+
+
+def _replay(
+    source: tuple,
+    choice: TuningChoice,
+    warm: bool,
+    time_limit: float,
+) -> tuple[ModelFeatures, float]:
+    """Solve one corpus model with one choice and return features and runtime."""
+    model = _load_model(source)
+    warm_start = None
+    if warm:
+        searched = build_local_search_warm_start(model, time_budget_seconds=10.0)
+        warm_start = searched.columns if searched is not None else None
+    configuration = SolveConfiguration(
+        time_limit_seconds=time_limit,
+        thread_count=(
+            min(available_cpu_count(), choice.max_threads)
+            if choice.max_threads is not None
+            else None
+        ),
+        options=dict(choice.options) or None,
+    )
+    started = time.perf_counter()
+    result = solve_with_highs(
+        model,
+        configuration=configuration,
+        warm_start=warm_start,
+        retain_warm_start=warm_start is not None,
+    )
+    runtime = time.perf_counter() - started
+    if result.status != "optimal":
+        runtime = FAILED_RUNTIME_MULTIPLIER * time_limit
+    return model_features(model, has_warm_start=warm_start is not None), runtime
+
+
+def main() -> None:
+    """Replay every corpus model under every choice and write the fitted table."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--artifact",
+        action="append",
+        default=[],
+        help="Compiled-model artifact directory; may be repeated.",
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        action="append",
+        default=[],
+        help="Synthetic planning-unit count; may be repeated.",
+    )
+    parser.add_argument(
+        "--continuous",
+        action="store_true",
+        help="Also replay each model with its integrality relaxed.",
+    )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Also replay each model with a local-search warm start.",
+    )
+    parser.add_argument("--time-limit", type=float, default=300.0)
+    parser.add_argument("--max-depth", type=int, default=2)
+    parser.add_argument("--min-observations", type=int, default=2)
+    parser.add_argument("--output", default=str(DEFAULT_TUNING_TABLE_PATH))
+    arguments = parser.parse_args()
+    sources = [("artifact", path, False) for path in arguments.artifact] + [
+        ("synthetic", count, False) for count in arguments.synthetic
+    ]
+    if arguments.continuous:
+        sources += [(kind, value, True) for kind, value, _ in sources]
+    if not sources:
+        parser.error("Provide at least one --artifact or --synthetic model.")
+    variants = [
+        (source, warm)
+        for source in sources
+        for warm in ((False, True) if arguments.warm_start else (False,))
+    ]
+    observations = []
+    for source, warm in variants:
+        runtimes = {}
+        features = None
+        for choice in CORPUS_CHOICES:
+            # A fresh process per solve keeps thread schedulers and caches from
+            # leaking between measurements.
+            with ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                features, runtime = executor.submit(
+                    _replay, source, choice, warm, arguments.time_limit
+                ).result()
+            runtimes[choice.name] = runtime
+        print(source, "warm" if warm else "cold", runtimes)
+        observations.append(
+            TuningObservation(
+                features=features,
+                runtimes=runtimes,
+            )
+        )
+    table = fit_tuning_table(
+        observations,
+        CORPUS_CHOICES,
+        max_depth=arguments.max_depth,
+        min_observations=arguments.min_observations,
+        corpus={
+            "models": len(observations),
+            "sources": [f"{kind}:{value}" for kind, value, _ in sources],
+            "time_limit_seconds": arguments.time_limit,
+            "cpu_count": available_cpu_count(),
+            "failed_runtime_multiplier": FAILED_RUNTIME_MULTIPLIER,
+        },
+    )
+    write_tuning_table(table, arguments.output)
+    for rule in table.rules:
+        print(rule.choice, dict(rule.bounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,13 @@ from typing import Sequence
 from prefect import flow
 
 from ..optimization.artifact import load_compiled_artifact
+from ..optimization.conditioning import NumericalScaling
 from ..optimization.irreplaceability import analyze_irreplaceability
 from ..optimization.model import SolveConfiguration, SolverResult
+from ..optimization.solver_service import (
+    ResidentModelReference,
+    solver_service_authkey,
+)
 from ..utils.task_run_concurrency import acquire_task_run_slot
 
 
@@ -25,9 +30,14 @@ def irreplaceability(
     """Run a bounded exclusion analysis against one compiled artifact.
 
     Compilation is deliberately outside this flow. Only the resident HiGHS
-    exclusion solves occupy the scarce global solver slot.
+    exclusion solves occupy the scarce global solver slot. With
+    ``SOLVER_SERVICE_SOCKET`` set, they run on the solver service's resident
+    copy of the model when it answers, authenticated by
+    ``SOLVER_SERVICE_AUTHKEY``. ``reference_result`` is in original
+    units; counterfactuals on a conditioned artifact are unscaled to match.
     """
     maximum_scenarios = int(os.getenv("MAX_IRREPLACEABILITY_SCENARIOS", "100"))
+    service_address = os.getenv("SOLVER_SERVICE_SOCKET")
     artifact = load_compiled_artifact(compiled_artifact_directory)
     with acquire_task_run_slot():
         result = analyze_irreplaceability(
@@ -37,6 +47,16 @@ def irreplaceability(
             requested_planning_unit_ids=requested_planning_unit_ids,
             configuration=solve_configuration,
             maximum_scenarios=maximum_scenarios,
+            resident_model=(
+                ResidentModelReference(
+                    service_address,
+                    compiled_artifact_directory,
+                    solver_service_authkey(),
+                )
+                if service_address
+                else None
+            ),
+            scaling=NumericalScaling.from_provenance(artifact.manifest.provenance),
         )
     destination = Path(output_path)
     destination.parent.mkdir(parents=True, exist_ok=True)
@@ -11,15 +11,18 @@ from prefect import get_run_logger, task
 from prefect.runtime import flow_run
 
 from ..tasks.spatial_compilation import (
+    AggregateConstraint,
     OptimizationParameters,
     compile_prepared_artifact,
     count_planning_tile,
     finalize_planning_inventory,
     finalize_spatial_preparation,
     initialize_planning_grid,
+    planning_unit_lock_states,
     prepare_planning_tile,
+    problem_definition,
 )
-from ..optimization.grid import iter_grid_tiles
+from ..optimization.grid import coarser_resolution, iter_grid_tiles
 from ..optimization.admission import (
     SparseExecutionProfile,
     SparseModelDimensions,
@@ -27,20 +30,63 @@ from ..optimization.admission import (
     admit_structural_inventory,
 )
 from ..optimization.canonical_result import write_solver_canonical_zarr
+from ..optimization.conditioning import NumericalScaling
+from ..optimization.delta import (
+    resolve_model_delta,
+    structural_definition_hash,
+    write_derived_artifact,
+)
+from ..optimization.backends import solve_with_backend
 from ..optimization.highs import require_acceptable_result, solve_with_highs
 from ..optimization.model import SolveConfiguration
-from ..optimization.artifact import load_compiled_artifact
-from ..optimization.neighbor import load_neighbor_structure, raw_neighbor_value
+from ..optimization.model_cache import (
+    MODEL_CACHE_PREFIX,
+    MODEL_CACHE_SCHEMA_VERSION,
+    ModelCacheEntry,
+    ModelCacheEvictionPolicy,
+    model_cache_key,
+    source_content_root,
+)
+from ..optimization.lns import solve_with_spatial_lns
+from ..optimization.multiresolution import (
+    COARSE_TIME_FRACTION,
+    build_projected_warm_start,
+    project_coarse_decisions,
+)
+from ..optimization.artifact import ARTIFACT_SCHEMA_VERSION, load_compiled_artifact
+from ..optimization.compiler import COMPILER_VERSION
+from ..optimization.neighbor import (
+    attainable_neighbor_edge_count,
+    load_neighbor_structure,
+    raw_neighbor_value,
+)
+from ..optimization.prior_runs import (
+    PRIOR_RUN_MINIMUM_OVERLAP,
+    candidate_ordering_hash,
+    map_prior_decisions,
+    prior_solution_arrays,
+    prior_warm_start_reference,
+)
 from ..optimization.priority_ranking import (
     PRIORITY_BUDGET_FRACTIONS,
     solve_priority_ranking,
 )
-from ..optimization.validation import reconstruct_and_validate
+from ..optimization.post_solve import (
+    SolutionReconstruction,
+    original_objective_offset,
+    reconstruct_solution,
+)
+from ..optimization.racing import default_race_profiles
+from ..optimization.tuning import apply_solver_tuning, tune_solver_options
 from ..publication.parquet_export import export_selected_parquet
 from ..utils.object_store import (
     build_object_key,
+    delete_objects,
     download_object,
+    get_object,
     get_object_store_config,
+    list_objects,
+    object_exists,
     parse_uri,
     put_object,
 )
@@ -55,6 +101,13 @@ from ..utils.task_run_concurrency import acquire_task_run_slot
 
 
 DecisionDomain = Literal["continuous", "discrete"]
+SOLVER_CHECKPOINT_SCHEMA_VERSION = 1
+PRIOR_SOLUTION_SCHEMA_VERSION = 1
+DELTA_BASE_SCHEMA_VERSION = 1
+RESUMED_SOLVE_MINIMUM_SECONDS = 60.0
+SOLVER_STRATEGIES = ("monolithic", "spatial_lns")
+# CP-SAT stays library- and benchmark-only until its CI parity runs have a record.
+FLOW_SOLVER_BACKENDS = ("highs",)
 
 
 def _sha256(path: Path) -> str:
@@ -72,6 +125,7 @@ class CompiledRunPreparation:
     preparation_directory: str
     preparation_manifest: Dict[str, Any]
     canonical_path: str
+    coarse_preparation_directory: str | None = None
 
 
 def _submit_in_bounded_waves(records: list[Dict[str, Any]], submit_record: Any) -> None:
@@ -181,20 +235,34 @@ def _upload_finalized_artifact(
 def _upload_compiled_artifact(
     task_run_id: str,
     directory: Path,
+    reusable_parts: Dict[str, Dict[str, Any]] | None = None,
 ) -> Dict[str, Any]:
-    """Upload one numerical compiled artifact and commit its remote manifest last."""
+    """Upload one numerical compiled artifact and commit its remote manifest last.
+
+    Parts whose checksum appears in ``reusable_parts`` reference the already
+    committed object instead of being uploaded again.
+    """
     local_manifest_path = directory / "manifest.json"
     if not local_manifest_path.exists():
         raise RuntimeError("Compiled model has no committed local manifest.")
     compiled_manifest = json.loads(local_manifest_path.read_text(encoding="utf-8"))
     config = get_object_store_config()
     remote_parts: list[Dict[str, Any]] = []
-    array_paths = sorted(
-        directory / str(descriptor["path"])
+    # Compressed arrays upload only their encoded file, whose checksum the
+    # manifest already records.
+    array_files = sorted(
+        (
+            directory / str((descriptor.get("encoding") or descriptor)["path"]),
+            (descriptor.get("encoding") or {}).get("checksum"),
+        )
         for descriptor in compiled_manifest["arrays"].values()
     )
-    for path in array_paths:
-        checksum = _sha256(path)
+    for path, encoded_checksum in array_files:
+        checksum = encoded_checksum or _sha256(path)
+        reusable = (reusable_parts or {}).get(checksum)
+        if reusable is not None:
+            remote_parts.append({**reusable, "name": path.name})
+            continue
         key = build_object_key(f"runs/{task_run_id}/compiled_model/parts/{path.name}")
         uploaded = put_object(
             local_path=str(path),
@@ -258,6 +326,104 @@ def _upload_compiled_artifact(
     }
 
 
+def _download_compiled_artifact(artifact: Dict[str, Any], directory: Path) -> None:
+    """Restore a committed compiled artifact, verifying every part checksum."""
+    manifest = artifact.get("manifest") or {}
+    bucket, key = parse_uri(str(manifest["remote_manifest_uri"]))
+    directory.mkdir(parents=True, exist_ok=True)
+    remote_manifest_path = directory.parent / "compiled-model-remote-manifest.json"
+    download_object(bucket=bucket, key=key, local_path=str(remote_manifest_path))
+    if _sha256(remote_manifest_path) != manifest["remote_manifest_checksum"]:
+        raise RuntimeError("Compiled model remote manifest checksum mismatch.")
+    remote_manifest = json.loads(remote_manifest_path.read_text(encoding="utf-8"))
+    for part in remote_manifest["parts"]:
+        path = directory / str(part["name"])
+        bucket, key = parse_uri(str(part["uri"]))
+        download_object(bucket=bucket, key=key, local_path=str(path))
+        if _sha256(path) != part["checksum"]:
+            raise RuntimeError(f"Compiled model part checksum mismatch: {path.name}.")
+    (directory / "manifest.json").write_text(
+        json.dumps(remote_manifest["compiled_model"], sort_keys=True),
+        encoding="utf-8",
+    )
+
+
+def _upload_solver_checkpoint(
+    task_run_id: str,
+    mathematical_model_hash: str,
+    incumbent_path: Path,
+    consumed_seconds: float,
+) -> Dict[str, Any]:
+    """Publish the scratch incumbent under its model hash, pointer last."""
+    config = get_object_store_config()
+    checksum = _sha256(incumbent_path)
+    metadata_path = incumbent_path.with_suffix(".json")
+    metadata = (
+        json.loads(metadata_path.read_text(encoding="utf-8"))
+        if metadata_path.exists()
+        else {}
+    )
+    uploaded = put_object(
+        local_path=str(incumbent_path),
+        bucket=config.bucket,
+        key=build_object_key(
+            f"solver_checkpoints/{mathematical_model_hash}/incumbent-{checksum}.npy"
+        ),
+        content_type="application/octet-stream",
+        metadata={"task_run_id": task_run_id, "sha256": checksum},
+    )
+    pointer = {
+        "schema_version": SOLVER_CHECKPOINT_SCHEMA_VERSION,
+        "task_run_id": task_run_id,
+        "mathematical_model_hash": mathematical_model_hash,
+        "incumbent_uri": uploaded["uri"],
+        "incumbent_checksum": checksum,
+        "objective_value": metadata.get("objective_value"),
+        "consumed_seconds": consumed_seconds,
+        "created_at": time.time(),
+    }
+    pointer_path = incumbent_path.with_name("solver-checkpoint.json")
+    pointer_path.write_text(json.dumps(pointer, sort_keys=True), encoding="utf-8")
+    put_object(
+        local_path=str(pointer_path),
+        bucket=config.bucket,
+        key=build_object_key(
+            f"solver_checkpoints/{mathematical_model_hash}/checkpoint.json"
+        ),
+        content_type="application/json",
+        metadata={"task_run_id": task_run_id},
+    )
+    return pointer
+
+
+def _download_solver_checkpoint(
+    mathematical_model_hash: str,
+    directory: Path,
+) -> tuple[np.ndarray, Dict[str, Any]] | None:
+    """Return checkpointed incumbent columns for one model hash, if committed."""
+    config = get_object_store_config()
+    pointer_key = build_object_key(
+        f"solver_checkpoints/{mathematical_model_hash}/checkpoint.json"
+    )
+    if not object_exists(bucket=config.bucket, key=pointer_key):
+        return None
+    directory.mkdir(parents=True, exist_ok=True)
+    pointer_path = directory / "checkpoint.json"
+    download_object(bucket=config.bucket, key=pointer_key, local_path=str(pointer_path))
+    pointer = json.loads(pointer_path.read_text(encoding="utf-8"))
+    if (
+        pointer.get("schema_version") != SOLVER_CHECKPOINT_SCHEMA_VERSION
+        or pointer.get("mathematical_model_hash") != mathematical_model_hash
+    ):
+        return None
+    incumbent_path = directory / "incumbent.npy"
+    bucket, key = parse_uri(str(pointer["incumbent_uri"]))
+    download_object(bucket=bucket, key=key, local_path=str(incumbent_path))
+    if _sha256(incumbent_path) != pointer["incumbent_checksum"]:
+        raise RuntimeError("Solver checkpoint checksum mismatch.")
+    return np.load(incumbent_path), pointer
+
+
 def _upload_zarr_artifact(task_run_id: str, directory: Path) -> Dict[str, Any]:
     """Upload all committed Zarr parts and publish its remote manifest last."""
     local_manifest = json.loads(
@@ -305,6 +471,646 @@ def _upload_zarr_artifact(task_run_id: str, directory: Path) -> Dict[str, Any]:
     }
 
 
+def _prior_solution_keys(
+    task_id: str,
+    grid_definition: Dict[str, Any],
+) -> list[tuple[str, str]]:
+    """Return the pointer keys searched for a prior solution, narrowest first."""
+    return [
+        ("task", build_object_key(f"prior_solutions/tasks/{task_id}/latest.json")),
+        (
+            "grid",
+            build_object_key(
+                "prior_solutions/grids/"
+                f"{grid_definition['grid_family_id']}/"
+                f"{int(grid_definition['grid_level'])}/latest.json"
+            ),
+        ),
+    ]
+
+
+def _upload_prior_solution(
+    task_run_id: str,
+    task_id: str,
+    grid_definition: Dict[str, Any],
+    artifact: Any,
+    result: Any,
+    objective_value: float | None,
+    directory: Path,
+) -> Dict[str, Any]:
+    """Publish accepted decisions by planning-unit ID, pointers last."""
+    config = get_object_store_config()
+    planning_unit_ids, decisions = prior_solution_arrays(
+        artifact.candidate_planning_unit_ids,
+        np.asarray(result.native_columns)[: artifact.model.primary_variable_count],
+        artifact.fixed_planning_unit_ids,
+        artifact.fixed_values,
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    solution_path = directory / "prior-solution.npz"
+    np.savez(solution_path, planning_unit_ids=planning_unit_ids, decisions=decisions)
+    checksum = _sha256(solution_path)
+    uploaded = put_object(
+        local_path=str(solution_path),
+        bucket=config.bucket,
+        key=build_object_key(f"prior_solutions/solutions/{checksum}.npz"),
+        content_type="application/octet-stream",
+        metadata={"task_run_id": task_run_id, "sha256": checksum},
+    )
+    pointer = {
+        "schema_version": PRIOR_SOLUTION_SCHEMA_VERSION,
+        "task_id": task_id,
+        "task_run_id": task_run_id,
+        "mathematical_model_hash": artifact.manifest.mathematical_model_hash,
+        "artifact_uri": uploaded["uri"],
+        "artifact_content_hash": checksum,
+        "candidate_ordering_hash": candidate_ordering_hash(
+            artifact.candidate_planning_unit_ids
+        ),
+        "objective_value": objective_value,
+        "created_at": time.time(),
+    }
+    pointer_path = directory / "prior-solution.json"
+    pointer_path.write_text(json.dumps(pointer, sort_keys=True), encoding="utf-8")
+    for _, key in _prior_solution_keys(task_id, grid_definition):
+        put_object(
+            local_path=str(pointer_path),
+            bucket=config.bucket,
+            key=key,
+            content_type="application/json",
+            metadata={"task_run_id": task_run_id},
+        )
+    return pointer
+
+
+def _download_prior_solution(
+    task_id: str,
+    grid_definition: Dict[str, Any],
+    task_run_id: str,
+    directory: Path,
+) -> tuple[np.ndarray, np.ndarray, Dict[str, Any]] | None:
+    """Return the newest accepted solution of this task, else of this grid.
+
+    The current run's own pointer is skipped; its checkpoint covers retries.
+    """
+    config = get_object_store_config()
+    directory.mkdir(parents=True, exist_ok=True)
+    for scope, key in _prior_solution_keys(task_id, grid_definition):
+        if not object_exists(bucket=config.bucket, key=key):
+            continue
+        pointer_path = directory / f"{scope}.json"
+        download_object(bucket=config.bucket, key=key, local_path=str(pointer_path))
+        pointer = json.loads(pointer_path.read_text(encoding="utf-8"))
+        if (
+            pointer.get("schema_version") != PRIOR_SOLUTION_SCHEMA_VERSION
+            or pointer.get("task_run_id") == task_run_id
+        ):
+            continue
+        reference = prior_warm_start_reference(pointer)
+        solution_path = directory / f"{scope}.npz"
+        bucket, solution_key = parse_uri(reference.artifact_uri)
+        download_object(bucket=bucket, key=solution_key, local_path=str(solution_path))
+        if _sha256(solution_path) != reference.artifact_content_hash:
+            raise RuntimeError("Prior solution checksum mismatch.")
+        with np.load(solution_path) as arrays:
+            return (
+                arrays["planning_unit_ids"],
+                arrays["decisions"],
+                {**pointer, "scope": scope},
+            )
+    return None
+
+
+def _prior_run_warm_start(
+    artifact: Any,
+    planning_unit_ids: np.ndarray,
+    decisions: np.ndarray,
+    pointer: Dict[str, Any],
+) -> tuple[np.ndarray | None, Dict[str, Any]]:
+    """Map a prior run onto this candidate ordering and repair it to feasibility."""
+    reference = prior_warm_start_reference(pointer)
+    mapped, overlap = map_prior_decisions(
+        artifact.candidate_planning_unit_ids, planning_unit_ids, decisions
+    )
+    provenance: Dict[str, Any] = {
+        **asdict(reference),
+        "scope": pointer["scope"],
+        "task_run_id": pointer.get("task_run_id"),
+        "same_model": (
+            reference.mathematical_model_hash
+            == artifact.manifest.mathematical_model_hash
+        ),
+        "same_candidate_ordering": (
+            reference.candidate_ordering_hash
+            == candidate_ordering_hash(artifact.candidate_planning_unit_ids)
+        ),
+        "candidate_overlap": overlap,
+        "warm_start_feasible": False,
+        "warm_start_objective": None,
+    }
+    if overlap < PRIOR_RUN_MINIMUM_OVERLAP:
+        return None, provenance
+    warm_start = build_projected_warm_start(artifact.model, mapped)
+    provenance["warm_start_feasible"] = warm_start is not None
+    if warm_start is not None:
+        scaling = NumericalScaling.from_provenance(artifact.manifest.provenance)
+        objective = float(
+            np.dot(artifact.model.objective, warm_start)
+            + artifact.model.objective_offset
+        )
+        provenance["warm_start_objective"] = (
+            scaling.unscale_objective(objective) if scaling is not None else objective
+        )
+    return warm_start, provenance
+
+
+def _delta_structure_hash(
+    run: Dict[str, Any], parameters: OptimizationParameters
+) -> str:
+    """Identify runs whose models differ only in weights and bound values.
+
+    The compiler version and artifact schema are part of the structure, so a
+    deploy that changes either never derives a run from an older base.
+    """
+    snapshot = run["input_snapshot"]
+    return structural_definition_hash(
+        {
+            **problem_definition(parameters),
+            "grid_extent": parameters.grid_extent,
+            "analytical_source": snapshot["analytical_source"],
+            "planning_unit_definition": run["planning_unit_definition"],
+            "compiler_version": COMPILER_VERSION,
+            "artifact_schema_version": ARTIFACT_SCHEMA_VERSION,
+        }
+    )
+
+
+def _delta_base_key(structure_hash: str) -> str:
+    """Return the pointer key of the newest full compile of one structure."""
+    return build_object_key(f"delta_bases/{structure_hash}/latest.json")
+
+
+def _upload_preparation_parts(
+    task_run_id: str, preparation_dir: Path, prefix: str
+) -> list[Dict[str, Any]]:
+    """Upload the preparation files a solve needs to reconstruct its result."""
+    config = get_object_store_config()
+    paths = [
+        preparation_dir / "preparation-manifest.json",
+        *sorted((preparation_dir / "planning-units").glob("*.parquet")),
+    ]
+    if (preparation_dir / "planning-structure.json").exists():
+        paths.append(preparation_dir / "planning-structure.json")
+    parts: list[Dict[str, Any]] = []
+    for path in paths:
+        name = path.relative_to(preparation_dir).as_posix()
+        checksum = _sha256(path)
+        uploaded = put_object(
+            local_path=str(path),
+            bucket=config.bucket,
+            key=build_object_key(f"{prefix}/{name}"),
+            content_type="application/octet-stream",
+            metadata={"task_run_id": task_run_id, "sha256": checksum},
+        )
+        parts.append(
+            {
+                "name": name,
+                "uri": uploaded["uri"],
+                "checksum": checksum,
+                "size_bytes": path.stat().st_size,
+            }
+        )
+    return parts
+
+
+def _download_preparation_parts(
+    parts: list[Dict[str, Any]], preparation_dir: Path
+) -> Dict[str, Any]:
+    """Restore uploaded preparation files, verifying every part checksum."""
+    for part in parts:
+        path = preparation_dir / str(part["name"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        bucket, key = parse_uri(str(part["uri"]))
+        download_object(bucket=bucket, key=key, local_path=str(path))
+        if _sha256(path) != part["checksum"]:
+            raise RuntimeError(f"Preparation part checksum mismatch: {path.name}.")
+    return json.loads(
+        (preparation_dir / "preparation-manifest.json").read_text(encoding="utf-8")
+    )
+
+
+def _upload_delta_base(
+    task_run_id: str,
+    structure_hash: str,
+    compiled_metadata: Dict[str, Any],
+    preparation_dir: Path,
+) -> Dict[str, Any]:
+    """Publish the solve-time preparation files of a full compile, pointer last."""
+    config = get_object_store_config()
+    parts = _upload_preparation_parts(
+        task_run_id, preparation_dir, f"runs/{task_run_id}/delta_base"
+    )
+    pointer = {
+        "schema_version": DELTA_BASE_SCHEMA_VERSION,
+        "task_run_id": task_run_id,
+        "structure_hash": structure_hash,
+        "compiled_model": compiled_metadata,
+        "preparation_parts": parts,
+        "created_at": time.time(),
+    }
+    pointer_path = preparation_dir.parent / "delta-base.json"
+    pointer_path.write_text(json.dumps(pointer, sort_keys=True), encoding="utf-8")
+    put_object(
+        local_path=str(pointer_path),
+        bucket=config.bucket,
+        key=_delta_base_key(structure_hash),
+        content_type="application/json",
+        metadata={"task_run_id": task_run_id},
+    )
+    return pointer
+
+
+def _compile_from_delta_base(
+    task_run_id: str,
+    run: Dict[str, Any],
+    parameters: OptimizationParameters,
+    structure_hash: str,
+    output_dir: Path,
+) -> CompiledRunPreparation | None:
+    """Derive this run's model from a full compile of the same structure.
+
+    Planning-unit locks become fixed column bounds while they cover at most
+    the configured fraction of planning units; larger lock sets are cheaper
+    as preparation masks, which let domain presolve remove the locked units.
+
+    Returns ``None`` when no base exists. Raises ``ValueError`` when the
+    parameter change cannot be expressed over the base CSR structure.
+    """
+    logger = get_run_logger()
+    config = get_object_store_config()
+    key = _delta_base_key(structure_hash)
+    if not object_exists(bucket=config.bucket, key=key):
+        return None
+    base_dir = output_dir / "delta-base"
+    base_dir.mkdir(parents=True, exist_ok=True)
+    pointer_path = base_dir / "pointer.json"
+    download_object(bucket=config.bucket, key=key, local_path=str(pointer_path))
+    pointer = json.loads(pointer_path.read_text(encoding="utf-8"))
+    if pointer.get("schema_version") != DELTA_BASE_SCHEMA_VERSION:
+        return None
+    _download_compiled_artifact(pointer["compiled_model"], base_dir / "compiled-model")
+    base = load_compiled_artifact(base_dir / "compiled-model")
+    preparation_dir = output_dir / "prepared"
+    preparation_manifest = _download_preparation_parts(
+        pointer["preparation_parts"], preparation_dir
+    )
+    locks = planning_unit_lock_states(parameters, preparation_dir)
+    locked_count = int(np.count_nonzero(locks >= 0))
+    lock_fraction = float(
+        run["input_snapshot"]
+        .get("work_budget", {})
+        .get("lock_column_fraction", os.getenv("LOCK_COLUMN_FRACTION", "0.25"))
+    )
+    if locked_count > lock_fraction * len(locks):
+        raise ValueError("Lock set is large enough to apply during preparation.")
+    neighbor_edge_count = None
+    if locked_count and parameters.neighbor_penalty is not None:
+        neighbor_edge_count = attainable_neighbor_edge_count(
+            load_neighbor_structure(
+                json.loads(
+                    (preparation_dir / "planning-structure.json").read_text(
+                        encoding="utf-8"
+                    )
+                )
+            ),
+            locks,
+        )
+    delta = resolve_model_delta(
+        base,
+        objective_importance={
+            objective.layer: objective.importance
+            for objective in parameters.objectives
+        },
+        neighbor_strength=(
+            parameters.neighbor_penalty.strength
+            if parameters.neighbor_penalty is not None
+            else None
+        ),
+        aggregate_bounds={
+            constraint.layer: [
+                (value.min, value.max)
+                for value in parameters.constraints
+                if isinstance(value, AggregateConstraint)
+                and value.layer == constraint.layer
+            ]
+            for constraint in parameters.constraints
+            if isinstance(constraint, AggregateConstraint)
+        },
+        planning_unit_locks=locks,
+        neighbor_edge_count=neighbor_edge_count,
+    )
+    update_run(task_run_id, stage="compiling")
+    write_derived_artifact(
+        base,
+        delta,
+        preparation_dir / "compiled-model",
+        problem_definition_hash=run["input_hash"],
+        encoding=os.getenv("COMPILED_ARTIFACT_ENCODING", "raw"),
+    )
+    # The new compressed parts are uploaded below, so keep them beside the
+    # decoded arrays until then.
+    derived = load_compiled_artifact(
+        preparation_dir / "compiled-model", keep_encoded=True
+    )
+    update_run(
+        task_run_id,
+        stage="admitting",
+        planning_unit_count=int(preparation_manifest["planning_unit_count"]),
+        feature_nonzero_count=int(preparation_manifest["feature_nonzero_count"]),
+        neighbor_edge_count=int(
+            preparation_manifest.get("raw_neighbor_edge_count", 0)
+        ),
+    )
+    _admit_compiled_model(task_run_id, preparation_manifest, derived.model)
+    enforce_scratch_limit(output_dir, "delta recompilation")
+    base_remote = json.loads(
+        (base_dir / "compiled-model-remote-manifest.json").read_text(encoding="utf-8")
+    )
+    update_artifact(task_run_id, "compiled_model", status="building")
+    compiled_metadata = _upload_compiled_artifact(
+        task_run_id,
+        preparation_dir / "compiled-model",
+        reusable_parts={part["checksum"]: part for part in base_remote["parts"]},
+    )
+    update_artifact(task_run_id, "compiled_model", **compiled_metadata)
+    cleanup_scratch_directory(base_dir)
+    logger.info(
+        "Derived compiled model %s from base run %s (%s): %s",
+        derived.manifest.mathematical_model_hash,
+        pointer["task_run_id"],
+        delta.scenario.scenario_id,
+        delta.changes,
+    )
+    return CompiledRunPreparation(
+        preparation_directory=str(preparation_dir),
+        preparation_manifest=preparation_manifest,
+        canonical_path=str(output_dir / "canonical-result.zarr"),
+    )
+
+
+def _model_cache_key(
+    run: Dict[str, Any], parameters: OptimizationParameters
+) -> str | None:
+    """Address a run's compiled model, or ``None`` for an unaddressed source."""
+    content_root = source_content_root(run["input_snapshot"]["analytical_source"])
+    if content_root is None:
+        return None
+    return model_cache_key(
+        problem_definition(parameters),
+        content_root=content_root,
+        grid_extent=parameters.grid_extent,
+        planning_unit_definition=run["planning_unit_definition"],
+    )
+
+
+def _model_cache_entry_key(cache_key: str) -> str:
+    """Return the committed entry document of one cached compiled model."""
+    return build_object_key(f"{MODEL_CACHE_PREFIX}/{cache_key}/entry.json")
+
+
+def _model_cache_policy() -> ModelCacheEvictionPolicy:
+    """Read the cache age and size bounds from the deployment settings."""
+    max_bytes = os.getenv("COMPILED_MODEL_CACHE_MAX_BYTES")
+    return ModelCacheEvictionPolicy(
+        max_age_seconds=float(
+            os.getenv("COMPILED_MODEL_CACHE_MAX_AGE_SECONDS", "604800")
+        ),
+        max_bytes=(
+            parse_int_setting(max_bytes, "COMPILED_MODEL_CACHE_MAX_BYTES")
+            if max_bytes
+            else None
+        ),
+    )
+
+
+def _compile_from_model_cache(
+    task_run_id: str,
+    cache_key: str,
+    policy: ModelCacheEvictionPolicy,
+    output_dir: Path,
+) -> CompiledRunPreparation | None:
+    """Restore a compiled model and its preparation files from the cache.
+
+    The cached parts are verified on download and the run commits its own
+    compiled-model manifest that references them, so preparation, compile,
+    and the part uploads are all skipped. The coarse stage is skipped too.
+
+    Returns ``None`` when no live entry exists for the key.
+    """
+    logger = get_run_logger()
+    config = get_object_store_config()
+    key = _model_cache_entry_key(cache_key)
+    if not object_exists(bucket=config.bucket, key=key):
+        return None
+    cache_dir = output_dir / "model-cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry_path = cache_dir / "entry.json"
+    download_object(bucket=config.bucket, key=key, local_path=str(entry_path))
+    entry = json.loads(entry_path.read_text(encoding="utf-8"))
+    now = time.time()
+    if (
+        entry.get("schema_version") != MODEL_CACHE_SCHEMA_VERSION
+        or entry.get("cache_key") != cache_key
+        or policy.is_expired(ModelCacheEntry.from_dict(entry), now)
+    ):
+        return None
+    preparation_dir = output_dir / "prepared"
+    _download_compiled_artifact(
+        entry["compiled_model"], preparation_dir / "compiled-model"
+    )
+    cached = load_compiled_artifact(preparation_dir / "compiled-model")
+    preparation_manifest = _download_preparation_parts(
+        entry["preparation_parts"], preparation_dir
+    )
+    update_run(
+        task_run_id,
+        stage="admitting",
+        planning_unit_count=int(preparation_manifest["planning_unit_count"]),
+        feature_nonzero_count=int(preparation_manifest["feature_nonzero_count"]),
+        neighbor_edge_count=int(
+            preparation_manifest.get("raw_neighbor_edge_count", 0)
+        ),
+    )
+    _admit_compiled_model(task_run_id, preparation_manifest, cached.model)
+    enforce_scratch_limit(output_dir, "compiled model cache restore")
+    remote = json.loads(
+        (preparation_dir / "compiled-model-remote-manifest.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    update_artifact(task_run_id, "compiled_model", status="building")
+    compiled_metadata = _upload_compiled_artifact(
+        task_run_id,
+        preparation_dir / "compiled-model",
+        reusable_parts={part["checksum"]: part for part in remote["parts"]},
+    )
+    update_artifact(task_run_id, "compiled_model", **compiled_metadata)
+    update_run(
+        task_run_id,
+        model_cache={
+            "status": "hit",
+            "cache_key": cache_key,
+            "source_task_run_id": entry["task_run_id"],
+            "mathematical_model_hash": cached.manifest.mathematical_model_hash,
+            "age_seconds": now - float(entry["created_at"]),
+        },
+    )
+    try:
+        entry_path.write_text(
+            json.dumps({**entry, "last_used_at": now}, sort_keys=True),
+            encoding="utf-8",
+        )
+        put_object(
+            local_path=str(entry_path),
+            bucket=config.bucket,
+            key=key,
+            content_type="application/json",
+            metadata={"task_run_id": entry["task_run_id"]},
+        )
+    except Exception as error:
+        logger.warning("Model cache entry use was not recorded: %s", error)
+    cleanup_scratch_directory(cache_dir)
+    logger.info(
+        "Reused cached compiled model %s from run %s",
+        cached.manifest.mathematical_model_hash,
+        entry["task_run_id"],
+    )
+    return CompiledRunPreparation(
+        preparation_directory=str(preparation_dir),
+        preparation_manifest=preparation_manifest,
+        canonical_path=str(output_dir / "canonical-result.zarr"),
+    )
+
+
+def _publish_model_cache_entry(
+    task_run_id: str,
+    cache_key: str,
+    compiled_metadata: Dict[str, Any],
+    preparation_dir: Path,
+) -> Dict[str, Any]:
+    """Publish a full compile under its cache key, entry document last.
+
+    The entry references the run's compiled-model parts and owns copies of
+    its preparation files. Its size counts both, because both stay pinned
+    while the entry is live.
+    """
+    config = get_object_store_config()
+    parts = _upload_preparation_parts(
+        task_run_id, preparation_dir, f"{MODEL_CACHE_PREFIX}/{cache_key}/preparation"
+    )
+    remote = json.loads(
+        (preparation_dir / "compiled-model-remote-manifest.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    created_at = time.time()
+    entry = {
+        "schema_version": MODEL_CACHE_SCHEMA_VERSION,
+        "cache_key": cache_key,
+        "task_run_id": task_run_id,
+        "compiled_model": compiled_metadata,
+        "preparation_parts": parts,
+        "size_bytes": sum(
+            int(part["size_bytes"]) for part in [*remote["parts"], *parts]
+        ),
+        "created_at": created_at,
+        "last_used_at": created_at,
+    }
+    entry_path = preparation_dir.parent / "model-cache-entry.json"
+    entry_path.write_text(json.dumps(entry, sort_keys=True), encoding="utf-8")
+    put_object(
+        local_path=str(entry_path),
+        bucket=config.bucket,
+        key=_model_cache_entry_key(cache_key),
+        content_type="application/json",
+        metadata={"task_run_id": task_run_id},
+    )
+    return entry
+
+
+def _evict_model_cache_entries(policy: ModelCacheEvictionPolicy) -> list[str]:
+    """Delete the cache entries the policy evicts, entry document first.
+
+    Evicting drops the entry and its preparation copies; the compiled-model
+    parts belong to the run that produced them and follow its retention.
+    """
+    config = get_object_store_config()
+    objects = list_objects(
+        bucket=config.bucket, prefix=build_object_key(f"{MODEL_CACHE_PREFIX}/")
+    )
+    keys_by_entry: Dict[str, list[str]] = {}
+    for value in objects:
+        cache_key = str(value["Key"]).split(f"{MODEL_CACHE_PREFIX}/", 1)[1]
+        keys_by_entry.setdefault(cache_key.split("/", 1)[0], []).append(
+            str(value["Key"])
+        )
+    entries: list[ModelCacheEntry] = []
+    for cache_key in keys_by_entry:
+        entry_key = _model_cache_entry_key(cache_key)
+        if entry_key not in keys_by_entry[cache_key]:
+            continue
+        body = get_object(bucket=config.bucket, key=entry_key)
+        try:
+            entries.append(ModelCacheEntry.from_dict(json.loads(body.read())))
+        finally:
+            body.close()
+    evicted = policy.select_evictions(entries, time.time())
+    for cache_key in evicted:
+        entry_key = _model_cache_entry_key(cache_key)
+        delete_objects(bucket=config.bucket, keys=[entry_key])
+        delete_objects(
+            bucket=config.bucket,
+            keys=[key for key in keys_by_entry[cache_key] if key != entry_key],
+        )
+    return evicted
+
+
+def _admit_compiled_model(
+    task_run_id: str,
+    preparation_manifest: Dict[str, Any],
+    compiled_model: Any,
+) -> None:
+    """Admit one compiled model against the sparse execution profile."""
+    reduction = preparation_manifest["reduction"]
+    # Each pairwise neighbor edge owns exactly one auxiliary column.
+    auxiliary_variable_count = (
+        compiled_model.variable_count - compiled_model.primary_variable_count
+    )
+    second_admission = evaluate_sparse_admission(
+        int(preparation_manifest["planning_unit_count"]),
+        int(reduction["retained_relationship_nonzeros"]),
+        auxiliary_variable_count,
+        compiled_model.constraint_count,
+        compiled_model.nonzero_count,
+        auxiliary_variable_count,
+        compiled_model.primary_variable_count,
+    )
+    second_admission["reduction"] = reduction
+    update_run(
+        task_run_id,
+        admission_outcome={"reference": second_admission},
+    )
+    if not second_admission["admitted"]:
+        raise RuntimeError(
+            "Compiled sparse model was rejected by execution profile "
+            f"'{second_admission['profile']['name']}': "
+            f"{second_admission['reason_code']}; measured dimensions="
+            f"{second_admission['measured']}, footprint="
+            f"{second_admission['footprint']}, capacity="
+            f"{second_admission['profile']}."
+        )
+
+
 @task
 def evaluate_count_admission(
     planning_unit_count: int,
@@ -378,6 +1184,7 @@ def _solve_compiled_model(
     canonical_path: Path,
     grid_definition: Dict[str, Any],
     decision_domain: DecisionDomain,
+    coarse_preparation_dir: Path | None = None,
 ) -> str:
     """Solve, validate, reconstruct, and materialize one reference solution."""
     logger = get_run_logger()
@@ -389,76 +1196,313 @@ def _solve_compiled_model(
     )
     target_gap = float(work_budget.get("relative_gap", 0.15))
     last_progress_update = 0.0
+    last_incumbent_count: object = None
     artifact = load_compiled_artifact(preparation_dir / "compiled-model")
-
-    def validate_result(result: Any) -> Any:
-        """Apply the independent numerical acceptance gate before publication."""
-        validation = reconstruct_and_validate(
-            artifact.model,
-            result,
-            candidate_planning_unit_ids=artifact.candidate_planning_unit_ids,
-            fixed_planning_unit_ids=artifact.fixed_planning_unit_ids,
-            fixed_values=artifact.fixed_values,
-            collect_selected_ids=False,
+    model_hash = artifact.manifest.mathematical_model_hash
+    incumbent_path = output_dir / "incumbent.npy"
+    checkpoint_interval = float(os.getenv("HIGHS_CHECKPOINT_INTERVAL_SECONDS", "900"))
+    last_checkpoint = time.monotonic()
+    checkpointed_count: object = None
+    resumed_seconds = 0.0
+    warm_start = None
+    try:
+        checkpoint = _download_solver_checkpoint(
+            model_hash, output_dir / "solver-checkpoint"
         )
-        if not validation.accepted:
-            raise RuntimeError(
-                "Authoritative solution validation failed: "
-                f"{', '.join(validation.failures)}."
+    except Exception as error:
+        logger.warning("Solver checkpoint lookup failed: %s", error)
+        checkpoint = None
+    if checkpoint is not None:
+        warm_start, pointer = checkpoint
+        if pointer.get("task_run_id") == task_run_id:
+            resumed_seconds = float(pointer.get("consumed_seconds", 0.0))
+        logger.info(
+            "Resuming from solver checkpoint: objective=%s consumed=%.1fs",
+            pointer.get("objective_value"),
+            resumed_seconds,
+        )
+    task_id = str(snapshot["task"]["task_id"])
+    prior_solution = None
+    if warm_start is None and str(
+        work_budget.get("prior_warm_start", os.getenv("HIGHS_PRIOR_WARM_START", "true"))
+    ).lower() in {"true", "1"}:
+        try:
+            prior_solution = _download_prior_solution(
+                task_id, grid_definition, task_run_id, output_dir / "prior-solution"
             )
-        return validation
+        except Exception as error:
+            logger.warning("Prior solution lookup failed: %s", error)
 
     def report_progress(progress: dict[str, object]) -> None:
-        nonlocal last_progress_update
+        nonlocal last_progress_update, last_incumbent_count
+        nonlocal last_checkpoint, checkpointed_count
         current = time.monotonic()
         completed = progress.get("completed_work_units")
         maximum = progress.get("maximum_work_units")
-        if current - last_progress_update < 5.0 and completed != maximum:
+        incumbent_count = progress.get("incumbent_count")
+        improved = incumbent_count is not None and incumbent_count != (
+            last_incumbent_count
+        )
+        interval = 1.0 if improved else 5.0
+        if current - last_progress_update < interval and completed != maximum:
             return
         last_progress_update = current
+        last_incumbent_count = incumbent_count
         memory = progress.get("memory")
         logger.info(
-            "HiGHS %s: elapsed=%.1fs memory=%s",
+            "HiGHS %s: elapsed=%.1fs objective=%s bound=%s gap=%s nodes=%s "
+            "memory=%s",
             progress.get("phase", "solving"),
             float(progress.get("elapsed_seconds", 0.0)),
+            progress.get("incumbent_objective"),
+            progress.get("best_bound"),
+            progress.get("optimality_gap"),
+            progress.get("node_count"),
             memory,
         )
         update_run(task_run_id, stage="solving", progress=progress)
+        if (
+            incumbent_count
+            and incumbent_count != checkpointed_count
+            and current - last_checkpoint >= checkpoint_interval
+            and incumbent_path.exists()
+        ):
+            last_checkpoint = current
+            checkpointed_count = incumbent_count
+            try:
+                _upload_solver_checkpoint(
+                    task_run_id,
+                    model_hash,
+                    incumbent_path,
+                    resumed_seconds + float(progress.get("elapsed_seconds", 0.0)),
+                )
+            except Exception as error:
+                logger.warning("Solver checkpoint upload failed: %s", error)
 
     planning_paths = sorted((preparation_dir / "planning-units").glob("*.parquet"))
+    random_seed = int(work_budget.get("random_seed", 0))
+    race_workers = parse_int_setting(
+        str(work_budget.get("race_workers", os.getenv("HIGHS_RACE_WORKERS", "1"))),
+        "HIGHS_RACE_WORKERS",
+    )
+    lp_repair = str(
+        work_budget.get("lp_repair", os.getenv("HIGHS_LP_REPAIR", "false"))
+    ).lower() in {"true", "1"}
+    vertex_solution = str(
+        work_budget.get("vertex_solution", os.getenv("HIGHS_VERTEX_SOLUTION", "true"))
+    ).lower() in {"true", "1"}
+    solver_tuning = str(
+        work_budget.get("solver_tuning", os.getenv("HIGHS_SOLVER_TUNING", "false"))
+    ).lower() in {"true", "1"}
+    gap_plateau_seconds = work_budget.get(
+        "gap_plateau_seconds", os.getenv("HIGHS_GAP_PLATEAU_SECONDS")
+    )
+    memory_limit_fraction = float(
+        work_budget.get(
+            "memory_limit_fraction", os.getenv("HIGHS_MEMORY_LIMIT_FRACTION", "0.85")
+        )
+    )
+    backend = str(
+        work_budget.get("solver_backend", os.getenv("SOLVER_BACKEND", "highs"))
+    )
+    race_backends = tuple(
+        name.strip()
+        for name in str(
+            work_budget.get(
+                "race_backends", os.getenv("SOLVER_RACE_BACKENDS", backend)
+            )
+        ).split(",")
+        if name.strip()
+    )
+    refused = sorted({backend, *race_backends} - set(FLOW_SOLVER_BACKENDS))
+    if refused:
+        raise ValueError(
+            f"Solver backends not enabled for optimization runs: {', '.join(refused)}."
+        )
     configuration = SolveConfiguration(
-        time_limit_seconds=time_limit,
+        time_limit_seconds=max(
+            time_limit - resumed_seconds,
+            min(time_limit, RESUMED_SOLVE_MINIMUM_SECONDS),
+        ),
         relative_mip_gap=target_gap,
         thread_count=(
             int(work_budget["thread_count"])
             if work_budget.get("thread_count") is not None
             else None
         ),
-        random_seed=int(work_budget.get("random_seed", 0)),
+        random_seed=random_seed,
         mode=(
             "exact_audit"
             if snapshot.get("optimization_mode") == "exact_audit"
-            else "standard"
+            else "lp_repair" if lp_repair else "standard"
         ),
         options=_priority_solver_options(),
+        race_profiles=(
+            default_race_profiles(
+                race_workers, base_seed=random_seed, backends=race_backends
+            )
+            if race_workers > 1
+            else ()
+        ),
+        vertex_solution=vertex_solution,
+        gap_plateau_seconds=(
+            float(gap_plateau_seconds) if gap_plateau_seconds else None
+        ),
+        gap_plateau_improvement=float(
+            work_budget.get(
+                "gap_plateau_improvement",
+                os.getenv("HIGHS_GAP_PLATEAU_IMPROVEMENT", "0.001"),
+            )
+        ),
+        memory_limit_fraction=memory_limit_fraction or None,
+        backend=backend,
+    )
+    solver_strategy = str(
+        work_budget.get(
+            "solver_strategy", os.getenv("HIGHS_SOLVER_STRATEGY", "monolithic")
+        )
     )
+    if solver_strategy not in SOLVER_STRATEGIES:
+        raise ValueError(f"Unsupported solver strategy: {solver_strategy}.")
+    if solver_strategy == "spatial_lns" and backend != "highs":
+        raise ValueError("The spatial_lns strategy solves subproblems with HiGHS.")
     with acquire_task_run_slot():
-        result = solve_with_highs(
-            artifact.model,
-            configuration=configuration,
-            progress_callback=report_progress,
+        prior_stage = None
+        if prior_solution is not None:
+            warm_start, prior_stage = _prior_run_warm_start(artifact, *prior_solution)
+            logger.info(
+                "Prior %s run %s: overlap=%.3f warm_start=%s objective=%s",
+                prior_stage["scope"],
+                prior_stage["task_run_id"],
+                prior_stage["candidate_overlap"],
+                prior_stage["warm_start_feasible"],
+                prior_stage["warm_start_objective"],
+            )
+        coarse_stage = None
+        if warm_start is None and coarse_preparation_dir is not None:
+            try:
+                warm_start, coarse_stage = _solve_coarse_stage(
+                    coarse_preparation_dir,
+                    artifact,
+                    preparation_manifest,
+                    replace(
+                        configuration,
+                        time_limit_seconds=max(1.0, time_limit * COARSE_TIME_FRACTION),
+                        race_profiles=(),
+                    ),
+                )
+            except Exception as error:
+                logger.warning("Coarse-resolution solve failed; skipping: %s", error)
+            else:
+                logger.info(
+                    "Coarse %sm stage: status=%s objective=%s warm_start=%s",
+                    coarse_stage["resolution"],
+                    coarse_stage["status"],
+                    coarse_stage["objective_value"],
+                    coarse_stage["warm_start_feasible"],
+                )
+                configuration = replace(
+                    configuration,
+                    time_limit_seconds=max(
+                        configuration.time_limit_seconds
+                        - coarse_stage["runtime_seconds"],
+                        min(time_limit, RESUMED_SOLVE_MINIMUM_SECONDS),
+                    ),
+                )
+            cleanup_scratch_directory(coarse_preparation_dir.parent)
+        tuning = None
+        if solver_tuning:
+            configuration, tuning = apply_solver_tuning(
+                configuration,
+                tune_solver_options(
+                    artifact.model, has_warm_start=warm_start is not None
+                ),
+            )
+            logger.info(
+                "Solver tuning: choice=%s options=%s threads=%s",
+                tuning["choice"],
+                tuning["applied_options"],
+                tuning["thread_count"],
+            )
+        if solver_strategy == "spatial_lns" and np.any(artifact.model.integrality):
+            result = solve_with_spatial_lns(
+                artifact.model,
+                configuration=configuration,
+                candidate_planning_unit_ids=artifact.candidate_planning_unit_ids,
+                grid_width=int(preparation_manifest["full_grid_width"]),
+                fixed_planning_unit_ids=artifact.fixed_planning_unit_ids,
+                fixed_values=artifact.fixed_values,
+                warm_start=warm_start,
+                progress_callback=report_progress,
+                work_directory=output_dir,
+                incumbent_path=incumbent_path,
+            )
+        else:
+            result = solve_with_backend(
+                artifact.model,
+                configuration=configuration,
+                progress_callback=report_progress,
+                work_directory=output_dir,
+                incumbent_path=incumbent_path,
+                warm_start=warm_start,
+                retain_warm_start=warm_start is not None,
+            )
+    if coarse_stage is not None or tuning is not None or prior_stage is not None:
+        result = replace(
+            result,
+            solver_settings={
+                **dict(result.solver_settings or {}),
+                **({"prior_warm_start": prior_stage} if prior_stage else {}),
+                **({"multiresolution": coarse_stage} if coarse_stage else {}),
+                **({"tuning": tuning} if tuning else {}),
+            },
         )
     require_acceptable_result(result, configuration, artifact.model)
-    validation = validate_result(result)
-    source_decisions = _reconstruct_source_decisions(
-        result,
+    early_termination = (result.diagnostics or {}).get("early_termination")
+    if early_termination:
+        logger.info(
+            "HiGHS stopped early (%s) after %.1fs: %s",
+            early_termination["reason"],
+            early_termination["elapsed_seconds"],
+            early_termination,
+        )
+    if incumbent_path.exists():
+        try:
+            _upload_solver_checkpoint(
+                task_run_id,
+                model_hash,
+                incumbent_path,
+                resumed_seconds + result.runtime_seconds,
+            )
+        except Exception as error:
+            logger.warning("Final solver checkpoint upload failed: %s", error)
+    reconstruction = reconstruct_solution(
         artifact,
-        int(preparation_manifest["planning_unit_count"]),
+        result,
         output_dir / "decision-vectors" / "reference.npy",
+        planning_unit_count=int(preparation_manifest["planning_unit_count"]),
     )
+    validation = reconstruction.validation
+    if not validation.accepted:
+        raise RuntimeError(
+            "Authoritative solution validation failed: "
+            f"{', '.join(validation.failures)}."
+        )
+    try:
+        _upload_prior_solution(
+            task_run_id,
+            task_id,
+            grid_definition,
+            artifact,
+            result,
+            validation.objective_value,
+            output_dir / "prior-solution",
+        )
+    except Exception as error:
+        logger.warning("Prior solution upload failed: %s", error)
     result = _reconstruct_scientific_result(
         result,
-        source_decisions,
+        reconstruction,
         artifact,
         preparation_dir,
         snapshot,
@@ -501,33 +1545,15 @@ def _solve_compiled_model(
     cleanup_scratch_directory(preparation_dir)
     cleanup_scratch_directory(output_dir / "decision-vectors")
     enforce_scratch_limit(output_dir, "optimization materialization")
-    resource_rows = [
-        row_index
-        for row_index, row_name in enumerate(artifact.model.row_names)
-        if row_name in {"selection_cap", "cost_cap"}
-    ]
-    resource_value = None
-    if len(resource_rows) == 1:
-        row_index = resource_rows[0]
-        start = int(artifact.model.row_starts[row_index])
-        stop = int(artifact.model.row_starts[row_index + 1])
-        resource_value = float(
-            np.dot(
-                artifact.model.coefficients[start:stop],
-                result.native_columns[artifact.model.column_indices[start:stop]],
-            )
-        )
     update_solution(
         task_run_id,
         solution_index=0,
         role="reference",
         status=result.status,
         objective_value=result.objective_value,
-        resource_value=resource_value,
+        resource_value=reconstruction.resource_value,
         selected_planning_unit_count=(
-            int(np.count_nonzero(result.decisions >= 0.5))
-            if decision_domain == "discrete"
-            else None
+            reconstruction.selected_count if decision_domain == "discrete" else None
         ),
         optimality_gap=result.optimality_gap,
         solver_name=result.solver_name,
@@ -541,12 +1567,13 @@ def _solve_compiled_model(
             ),
             "decision_domain": decision_domain,
             "allocation_total": (
-                float(np.sum(result.decisions))
+                reconstruction.decision_total
                 if decision_domain == "continuous"
                 else None
             ),
             "best_bound": result.best_bound,
             "termination_reason": result.termination_reason,
+            "early_termination": early_termination,
             "raw_conservation_benefit": result.raw_conservation_benefit,
             "raw_neighbor_value": result.raw_neighbor_value,
             "neighbor_penalty_contribution": result.neighbor_penalty_contribution,
@@ -556,7 +1583,7 @@ def _solve_compiled_model(
             "neighbor_normalization": artifact.manifest.provenance.get(
                 "neighbor_penalty"
             ),
-            "objective_offset": artifact.model.objective_offset,
+            "objective_offset": original_objective_offset(artifact),
             "solver_settings": result.solver_settings,
             "solver_memory_profile": result.memory_profile,
             "authoritative_validation": {
@@ -584,60 +1611,94 @@ def _solve_compiled_model(
     return result.status
 
 
-def _reconstruct_source_decisions(
-    result: Any,
+def _solve_coarse_stage(
+    coarse_preparation_dir: Path,
     artifact: Any,
-    planning_unit_count: int,
-    output_path: Path,
-) -> np.ndarray:
-    """Restore source ordering into a file-backed, bounded-memory vector."""
-    columns = np.asarray(result.native_columns, dtype=np.float64)
-    candidate_sources = np.asarray(artifact.candidate_source_indices, dtype=np.int64)
-    fixed_sources = np.asarray(artifact.fixed_source_indices, dtype=np.int64)
-    fixed_values = np.asarray(artifact.fixed_values, dtype=np.float32)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    decisions = np.lib.format.open_memmap(
-        output_path,
-        mode="w+",
-        dtype=np.float32,
-        shape=(planning_unit_count,),
+    preparation_manifest: Dict[str, Any],
+    configuration: SolveConfiguration,
+) -> tuple[np.ndarray | None, Dict[str, Any]]:
+    """Solve the coarse model and project its decisions into a fine warm start."""
+    coarse = load_compiled_artifact(coarse_preparation_dir / "compiled-model")
+    coarse_manifest = json.loads(
+        (coarse_preparation_dir / "preparation-manifest.json").read_text(
+            encoding="utf-8"
+        )
     )
-    if len(candidate_sources) + len(fixed_sources) != planning_unit_count:
-        raise RuntimeError("Artifact reconstruction did not cover every planning unit.")
-    batch_size = 1_048_576
-    for start in range(0, len(candidate_sources), batch_size):
-        stop = min(start + batch_size, len(candidate_sources))
-        decisions[candidate_sources[start:stop]] = columns[start:stop]
-    for start in range(0, len(fixed_sources), batch_size):
-        stop = min(start + batch_size, len(fixed_sources))
-        decisions[fixed_sources[start:stop]] = fixed_values[start:stop]
-    decisions.flush()
-    return decisions
+    result = solve_with_highs(coarse.model, configuration=configuration)
+    coarse_scaling = NumericalScaling.from_provenance(coarse.manifest.provenance)
+    provenance: Dict[str, Any] = {
+        "resolution": int(coarse_manifest["resolution"]),
+        "mathematical_model_hash": coarse.manifest.mathematical_model_hash,
+        "planning_unit_count": coarse.model.primary_variable_count,
+        "status": result.status,
+        "objective_value": (
+            coarse_scaling.unscale_objective(result.objective_value)
+            if coarse_scaling is not None
+            else result.objective_value
+        ),
+        "optimality_gap": result.optimality_gap,
+        "runtime_seconds": result.runtime_seconds,
+        "warm_start_feasible": False,
+    }
+    if result.status not in {"optimal", "feasible"}:
+        return None, provenance
+    projected = project_coarse_decisions(
+        artifact.candidate_planning_unit_ids,
+        grid_width=int(preparation_manifest["full_grid_width"]),
+        coarse_cell_ids=coarse.candidate_planning_unit_ids,
+        coarse_decisions=result.decisions,
+        coarse_grid_width=int(coarse_manifest["full_grid_width"]),
+        factor=int(coarse_manifest["resolution"])
+        // int(preparation_manifest["resolution"]),
+    )
+    warm_start = build_projected_warm_start(artifact.model, projected)
+    provenance["projected_selected_count"] = int(np.count_nonzero(projected >= 0.5))
+    provenance["warm_start_feasible"] = warm_start is not None
+    scaling = NumericalScaling.from_provenance(artifact.manifest.provenance)
+    warm_start_objective = (
+        float(
+            np.dot(artifact.model.objective, warm_start)
+            + artifact.model.objective_offset
+        )
+        if warm_start is not None
+        else None
+    )
+    provenance["warm_start_objective"] = (
+        scaling.unscale_objective(warm_start_objective)
+        if scaling is not None
+        else warm_start_objective
+    )
+    return warm_start, provenance
 
 
 def _reconstruct_scientific_result(
     result: Any,
-    decisions: np.ndarray,
+    reconstruction: SolutionReconstruction,
     artifact: Any,
     preparation_directory: Path,
     snapshot: Dict[str, Any],
 ) -> Any:
-    """Reconstruct objective components from immutable compiled coefficients."""
+    """Reconstruct objective components from immutable compiled coefficients.
+
+    Objective values, bounds, and absolute gaps are returned in original units;
+    a conditioned artifact's power-of-two objective scale is undone exactly.
+    Artifacts without stored neighbor reconstruction metadata fall back to
+    regenerating neighbor edges from the planning structure.
+    """
+    scaling = NumericalScaling.from_provenance(artifact.manifest.provenance)
+    if scaling is not None:
+        result = replace(
+            result,
+            objective_value=scaling.unscale_objective(result.objective_value),
+            best_bound=scaling.unscale_objective(result.best_bound),
+            absolute_gap=scaling.unscale_objective(result.absolute_gap),
+        )
     conservation_benefit = 0.0
     objective_components: list[Dict[str, Any]] = []
-    raw_objectives = artifact.manifest.provenance.get("objectives")
-    if not isinstance(raw_objectives, list):
-        raise RuntimeError("Compiled objective provenance is incomplete.")
-    for raw_objective in raw_objectives:
-        if not isinstance(raw_objective, dict):
-            raise RuntimeError("Compiled objective provenance is invalid.")
-        indices_name = str(raw_objective["canonical_indices_array"])
-        values_name = str(raw_objective["canonical_values_array"])
-        indices = np.asarray(artifact.arrays[indices_name], dtype=np.int64)
-        values = np.asarray(artifact.arrays[values_name], dtype=np.float64)
-        if indices.shape != values.shape:
-            raise RuntimeError("Canonical objective arrays do not align.")
-        raw_contribution = float(np.dot(values, decisions[indices]))
+    raw_objectives = artifact.manifest.provenance["objectives"]
+    for raw_objective, raw_contribution in zip(
+        raw_objectives, reconstruction.raw_objective_contributions, strict=True
+    ):
         resolved_coefficient = float(raw_objective["resolved_coefficient"])
         normalized_contribution = resolved_coefficient * raw_contribution
         conservation_benefit += normalized_contribution
@@ -654,16 +1715,18 @@ def _reconstruct_scientific_result(
     neighbor_request = snapshot.get("neighbor_penalty")
     structure_path = preparation_directory / "planning-structure.json"
     if neighbor_request is not None:
-        if not isinstance(neighbor_request, dict) or not structure_path.exists():
-            raise RuntimeError("Neighbor reconstruction metadata is incomplete.")
-        structure = load_neighbor_structure(
-            json.loads(structure_path.read_text(encoding="utf-8"))
-        )
-        neighbor_value = raw_neighbor_value(
-            structure,
-            decisions,
-            str(snapshot.get("decision_domain", "discrete")),
-        )
+        neighbor_value = reconstruction.raw_neighbor_value
+        if neighbor_value is None:
+            if not isinstance(neighbor_request, dict) or not structure_path.exists():
+                raise RuntimeError("Neighbor reconstruction metadata is incomplete.")
+            structure = load_neighbor_structure(
+                json.loads(structure_path.read_text(encoding="utf-8"))
+            )
+            neighbor_value = raw_neighbor_value(
+                structure,
+                reconstruction.decisions,
+                str(snapshot.get("decision_domain", "discrete")),
+            )
         neighbor_provenance = artifact.manifest.provenance.get("neighbor_penalty")
         if not isinstance(neighbor_provenance, dict):
             raise RuntimeError("Compiled neighbor normalization is incomplete.")
@@ -682,7 +1745,7 @@ def _reconstruct_scientific_result(
         )
     return replace(
         result,
-        decisions=decisions,
+        decisions=reconstruction.decisions,
         raw_conservation_benefit=conservation_benefit,
         raw_neighbor_value=neighbor_value,
         neighbor_penalty_contribution=neighbor_contribution,
@@ -713,6 +1776,60 @@ def compile_optimization_run(
     inventory_path = output_dir / "planning-unit-inventory.json"
     grid_context_path = output_dir / "planning-grid-context.json"
     active_artifacts: list[str] = []
+    cache_key = None
+    cache_policy = None
+    if str(
+        snapshot.get("work_budget", {}).get(
+            "compiled_model_cache", os.getenv("COMPILED_MODEL_CACHE", "true")
+        )
+    ).lower() in {"true", "1"}:
+        cache_key = _model_cache_key(run, parameters)
+        cache_policy = _model_cache_policy()
+        if cache_key is None:
+            update_run(
+                task_run_id,
+                model_cache={"status": "bypassed", "reason": "unaddressed_source"},
+            )
+        else:
+            miss_reason = "no_live_entry"
+            try:
+                cached = _compile_from_model_cache(
+                    task_run_id, cache_key, cache_policy, output_dir
+                )
+            except Exception as error:
+                logger.info("Cached compiled model unusable; compiling: %s", error)
+                miss_reason = "unusable"
+                cached = None
+                cleanup_scratch_directory(output_dir / "model-cache")
+                cleanup_scratch_directory(preparation_dir)
+            if cached is not None:
+                return cached
+            update_run(
+                task_run_id,
+                model_cache={
+                    "status": "miss",
+                    "cache_key": cache_key,
+                    "reason": miss_reason,
+                },
+            )
+    structure_hash = None
+    if str(
+        snapshot.get("work_budget", {}).get(
+            "delta_recompilation", os.getenv("DELTA_RECOMPILATION", "true")
+        )
+    ).lower() in {"true", "1"}:
+        structure_hash = _delta_structure_hash(run, parameters)
+        try:
+            derived = _compile_from_delta_base(
+                task_run_id, run, parameters, structure_hash, output_dir
+            )
+        except Exception as error:
+            logger.info("Delta recompilation unavailable; compiling: %s", error)
+            cleanup_scratch_directory(output_dir / "delta-base")
+            cleanup_scratch_directory(preparation_dir)
+        else:
+            if derived is not None:
+                return derived
     try:
         grid_context_future = initialize_planning_grid.submit(
             parameters,
@@ -827,6 +1944,36 @@ def compile_optimization_run(
         )
         preparation_manifest_path = preparation_future.result()
         enforce_scratch_limit(output_dir, "spatial preparation")
+        ready_compiled_model = next(
+            (
+                artifact
+                for artifact in run.get("artifacts", [])
+                if artifact.get("type") == "compiled_model"
+                and artifact.get("status") == "ready"
+                and (artifact.get("manifest") or {}).get("remote_manifest_uri")
+                and artifact.get("lineage", {}).get("input_hash") == run["input_hash"]
+            ),
+            None,
+        )
+        if ready_compiled_model is not None:
+            try:
+                _download_compiled_artifact(
+                    ready_compiled_model, preparation_dir / "compiled-model"
+                )
+            except Exception as error:
+                logger.warning("Compiled model reuse failed; recompiling: %s", error)
+            else:
+                logger.info(
+                    "Reused committed compiled model for restarted run: %s",
+                    task_run_id,
+                )
+                return CompiledRunPreparation(
+                    preparation_directory=str(preparation_dir),
+                    preparation_manifest=json.loads(
+                        Path(preparation_manifest_path).read_text(encoding="utf-8")
+                    ),
+                    canonical_path=str(canonical_path),
+                )
         update_run(task_run_id, stage="compiling")
         active_artifacts = ["compiled_model"]
         update_artifact(task_run_id, "compiled_model", status="building")
@@ -839,7 +1986,6 @@ def compile_optimization_run(
             Path(preparation_manifest_path).read_text(encoding="utf-8")
         )
         feature_nonzero_count = int(preparation_manifest["feature_nonzero_count"])
-        reduction = preparation_manifest["reduction"]
         update_run(
             task_run_id,
             stage="admitting",
@@ -848,54 +1994,70 @@ def compile_optimization_run(
                 preparation_manifest.get("raw_neighbor_edge_count", 0)
             ),
         )
-        compiled_model = compilation.model
-        neighbor_metadata = compilation.reconstruction.neighbor
-        model_dimensions = {
-            "neighbor_edge_count": (
-                neighbor_metadata.pairwise_neighbor_edge_count
-                if neighbor_metadata is not None
-                else 0
-            ),
-            "constraint_row_count": compiled_model.constraint_count,
-            "matrix_nonzero_count": compiled_model.nonzero_count,
-            "auxiliary_variable_count": (
-                compiled_model.variable_count - compiled_model.primary_variable_count
-            ),
-            "primary_variable_count": compiled_model.primary_variable_count,
-        }
-        second_admission = evaluate_sparse_admission(
-            planning_unit_count,
-            int(reduction["retained_relationship_nonzeros"]),
-            model_dimensions["neighbor_edge_count"],
-            model_dimensions["constraint_row_count"],
-            model_dimensions["matrix_nonzero_count"],
-            model_dimensions["auxiliary_variable_count"],
-            model_dimensions["primary_variable_count"],
-        )
-        second_admission["reduction"] = reduction
-        update_run(
-            task_run_id,
-            admission_outcome={"reference": second_admission},
-        )
-        if not second_admission["admitted"]:
-            raise RuntimeError(
-                "Compiled sparse model was rejected by execution profile "
-                f"'{second_admission['profile']['name']}': "
-                f"{second_admission['reason_code']}; measured dimensions="
-                f"{second_admission['measured']}, footprint="
-                f"{second_admission['footprint']}, capacity="
-                f"{second_admission['profile']}."
-            )
+        _admit_compiled_model(task_run_id, preparation_manifest, compilation.model)
         enforce_scratch_limit(output_dir, "compiled model creation")
         compiled_metadata = _upload_compiled_artifact(
             task_run_id, preparation_dir / "compiled-model"
         )
         update_artifact(task_run_id, "compiled_model", **compiled_metadata)
         active_artifacts = []
+        # A base with locks fixed during preparation cannot express other locks.
+        if (
+            structure_hash is not None
+            and not preparation_manifest["fixed0_count"]
+            and not preparation_manifest["fixed1_count"]
+        ):
+            try:
+                _upload_delta_base(
+                    task_run_id, structure_hash, compiled_metadata, preparation_dir
+                )
+            except Exception as error:
+                logger.warning("Delta base upload failed: %s", error)
+        if cache_key is not None and cache_policy is not None:
+            try:
+                _publish_model_cache_entry(
+                    task_run_id, cache_key, compiled_metadata, preparation_dir
+                )
+                evicted = _evict_model_cache_entries(cache_policy)
+            except Exception as error:
+                logger.warning("Model cache publication failed: %s", error)
+            else:
+                if evicted:
+                    logger.info("Evicted %d cached compiled models.", len(evicted))
+        coarse_levels = parse_int_setting(
+            str(
+                snapshot.get("work_budget", {}).get(
+                    "coarse_levels", os.getenv("HIGHS_COARSE_LEVELS", "0")
+                )
+            ),
+            "HIGHS_COARSE_LEVELS",
+        )
+        if coarse_levels < 0:
+            raise ValueError("HIGHS_COARSE_LEVELS cannot be negative.")
+        coarse_preparation_dir = None
+        if (
+            coarse_levels
+            and parameters.decision_domain == "discrete"
+            and parameters.grid_extent
+            and coarser_resolution(parameters.resolution, coarse_levels)
+            != parameters.resolution
+        ):
+            try:
+                coarse_preparation_dir = _compile_coarse_stage(
+                    task_id,
+                    parameters,
+                    source["uri"],
+                    output_dir,
+                    coarser_resolution(parameters.resolution, coarse_levels),
+                    run["input_hash"],
+                )
+            except Exception as error:
+                logger.warning("Coarse-resolution stage failed; skipping: %s", error)
         return CompiledRunPreparation(
             preparation_directory=str(preparation_dir),
             preparation_manifest=preparation_manifest,
             canonical_path=str(canonical_path),
+            coarse_preparation_directory=coarse_preparation_dir,
         )
     except Exception as error:
         for artifact_type in active_artifacts:
@@ -916,6 +2078,73 @@ def compile_optimization_run(
         raise
 
 
+def _compile_coarse_stage(
+    task_id: str,
+    parameters: OptimizationParameters,
+    source_uri: str,
+    output_dir: Path,
+    resolution: int,
+    input_hash: str,
+) -> str:
+    """Prepare and compile the same problem on a coarser nested grid level."""
+    coarse_parameters = parameters.model_copy(update={"resolution": resolution})
+    stage_dir = output_dir / f"coarse-{resolution}"
+    preparation_dir = stage_dir / "prepared"
+    grid_context_path = stage_dir / "planning-grid-context.json"
+    inventory_path = stage_dir / "planning-unit-inventory.json"
+    tile_count_dir = stage_dir / "tile-counts"
+    initialize_planning_grid.submit(
+        coarse_parameters, str(grid_context_path)
+    ).result()
+    grid_context = json.loads(grid_context_path.read_text(encoding="utf-8"))
+    _submit_in_bounded_waves(
+        [
+            tile.to_dict()
+            for tile in iter_grid_tiles(
+                int(grid_context["height"]),
+                int(grid_context["width"]),
+                int(grid_context["tile_size"]),
+            )
+        ],
+        lambda record: count_planning_tile.submit(
+            coarse_parameters,
+            source_uri,
+            str(grid_context_path),
+            record,
+            str(tile_count_dir),
+        ),
+    )
+    finalize_planning_inventory.submit(
+        task_id,
+        str(grid_context_path),
+        str(tile_count_dir),
+        str(inventory_path),
+        coarse_parameters.neighbor_penalty is not None,
+    ).result()
+    inventory = json.loads(inventory_path.read_text(encoding="utf-8"))
+    _submit_in_bounded_waves(
+        inventory["tiles"],
+        lambda record: prepare_planning_tile.submit(
+            coarse_parameters,
+            source_uri,
+            str(grid_context_path),
+            record,
+            str(preparation_dir),
+        ),
+    )
+    finalize_spatial_preparation.submit(
+        task_id,
+        coarse_parameters,
+        str(grid_context_path),
+        str(preparation_dir),
+        str(inventory_path),
+    ).result()
+    compile_prepared_artifact(coarse_parameters, str(preparation_dir), input_hash)
+    cleanup_scratch_directory(tile_count_dir)
+    enforce_scratch_limit(output_dir, "coarse-resolution compilation")
+    return str(preparation_dir)
+
+
 def execute_optimization_run(
     task_run_id: str,
     *,
@@ -963,6 +2192,11 @@ def execute_optimization_run(
             canonical_path,
             grid_definition,
             decision_domain,
+            (
+                Path(prepared.coarse_preparation_directory)
+                if prepared.coarse_preparation_directory is not None
+                else None
+            ),
         )
         active_artifacts.remove("raw_solver_result")
         active_artifacts.append("canonical_result")
@@ -1088,12 +2322,13 @@ def _solve_priority_ranking_model(
             work_directory=output_dir / "priority-increments",
             budget_fractions=PRIORITY_BUDGET_FRACTIONS,
             progress_callback=report_progress,
+            scaling=NumericalScaling.from_provenance(artifact.manifest.provenance),
         )
-    final_source = _reconstruct_source_decisions(
-        ranking.final_result,
+    final_reconstruction = reconstruct_solution(
         artifact,
-        int(preparation_manifest["planning_unit_count"]),
+        ranking.final_result,
         output_dir / "decision-vectors" / "priority-final.npy",
+        planning_unit_count=int(preparation_manifest["planning_unit_count"]),
     )
     priority_source = _reconstruct_source_values(
         ranking.priority,
@@ -1103,7 +2338,7 @@ def _solve_priority_ranking_model(
     )
     final_scientific = _reconstruct_scientific_result(
         ranking.final_result,
-        final_source,
+        final_reconstruction,
         artifact,
         preparation_dir,
         snapshot,
@@ -1179,7 +2414,7 @@ def _solve_priority_ranking_model(
             "priority_total": ranking.allocation_total,
             "final_allocation_total": float(np.sum(final_scientific.decisions)),
             "increment_diagnostics": list(ranking.diagnostics),
-            "best_bound": ranking.final_result.best_bound,
+            "best_bound": final_scientific.best_bound,
             "termination_reason": ranking.final_result.termination_reason,
             "raw_conservation_benefit": final_scientific.raw_conservation_benefit,
             "raw_neighbor_value": final_scientific.raw_neighbor_value,
@@ -1192,7 +2427,7 @@ def _solve_priority_ranking_model(
             "neighbor_normalization": artifact.manifest.provenance.get(
                 "neighbor_penalty"
             ),
-            "objective_offset": artifact.model.objective_offset,
+            "objective_offset": original_objective_offset(artifact),
             "solver_settings": ranking.final_result.solver_settings,
             "solver_memory_profile": ranking.final_result.memory_profile,
         },
@@ -1211,11 +2446,15 @@ def _solve_priority_ranking_model(
 
 
 def _priority_solver_options() -> dict[str, int | float | str | bool]:
-    """Return HiGHS options tuned for large continuous priority-ranking LPs."""
+    """Return deployment overrides of the shape-based HiGHS LP profile."""
     options: dict[str, int | float | str | bool] = {
-        "solver": os.getenv("PRIORITY_HIGHS_SOLVER", "ipm"),
-        "run_crossover": os.getenv("PRIORITY_HIGHS_RUN_CROSSOVER", "on"),
-        "presolve": os.getenv("PRIORITY_HIGHS_PRESOLVE", "on"),
+        option: os.environ[variable]
+        for option, variable in (
+            ("solver", "PRIORITY_HIGHS_SOLVER"),
+            ("run_crossover", "PRIORITY_HIGHS_RUN_CROSSOVER"),
+            ("presolve", "PRIORITY_HIGHS_PRESOLVE"),
+        )
+        if os.getenv(variable)
     }
     if os.getenv("PRIORITY_HIGHS_IPM_TOLERANCE"):
         options["ipm_optimality_tolerance"] = float(
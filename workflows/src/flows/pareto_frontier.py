@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from prefect import flow
+
+from ..optimization.artifact import load_compiled_artifact
+from ..optimization.model import SolveConfiguration
+from ..optimization.pareto import (
+    PARETO_METHOD,
+    PARETO_METHOD_VERSION,
+    weighted_sum_frontier,
+)
+from ..utils.task_run_concurrency import acquire_task_run_slot
+
+
+@flow(name="pareto-frontier")
+def pareto_frontier(
+    compiled_artifact_directory: str,
+    layers: tuple[str, str],
+    output_directory: str,
+    solve_configuration: SolveConfiguration | None = None,
+) -> str:
+    """Trace the weighted-sum trade-off between two layers of one artifact.
+
+    Compilation is deliberately outside this flow. Points go to
+    ``frontier.parquet`` and their candidate decisions to one compact
+    ``decisions.npy`` row per point.
+    """
+    tolerance = float(os.getenv("PARETO_TOLERANCE", "1e-4"))
+    maximum_points = int(os.getenv("MAX_PARETO_POINTS", "32"))
+    artifact = load_compiled_artifact(compiled_artifact_directory)
+    with acquire_task_run_slot():
+        frontier = weighted_sum_frontier(
+            artifact,
+            layers=layers,
+            configuration=solve_configuration,
+            tolerance=tolerance,
+            maximum_points=maximum_points,
+        )
+    destination = Path(output_directory)
+    destination.mkdir(parents=True, exist_ok=True)
+    records = []
+    for ordinal, point in enumerate(frontier.points):
+        record: dict[str, object] = {"point": ordinal}
+        for layer in frontier.layers:
+            record[f"{layer}_importance"] = point.importance[layer]
+            record[f"{layer}_score"] = point.scores[layer]
+            record[f"{layer}_value"] = point.layer_values[layer]
+        record.update(
+            {
+                "objective_value": point.objective_value,
+                "status": point.status,
+                "optimality_gap": point.optimality_gap,
+                "runtime_seconds": point.runtime_seconds,
+                "warm_started": point.warm_started,
+            }
+        )
+        records.append(record)
+    metadata = {
+        "method": PARETO_METHOD,
+        "method_version": PARETO_METHOD_VERSION,
+        "layers": list(frontier.layers),
+        "decision_encoding": frontier.decision_encoding,
+        "candidate_count": frontier.candidate_count,
+        "resolved": frontier.resolved,
+        "solve_count": frontier.solve_count,
+        "tolerance": tolerance,
+    }
+    pq.write_table(
+        pa.Table.from_pylist(records).replace_schema_metadata(
+            {"pareto": json.dumps(metadata, sort_keys=True)}
+        ),
+        destination / "frontier.parquet",
+    )
+    np.save(destination / "decisions.npy", frontier.decisions)
+    return str(destination)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from prefect import flow
+
+from ..optimization.artifact import load_compiled_artifact
+from ..optimization.canonical_result import write_scenario_canonical_zarr
+from ..optimization.conditioning import NumericalScaling
+from ..optimization.highs import require_acceptable_result
+from ..optimization.model import SolveConfiguration, SolveScenario
+from ..optimization.post_solve import original_objective_offset, reconstruct_solution
+from ..optimization.scenario_batch import efficiency_frontier, solve_scenario_batch
+from ..utils.task_run_concurrency import acquire_task_run_slot
+
+
+@flow(name="scenario-batch")
+def scenario_batch(
+    preparation_directory: str,
+    scenarios: Sequence[SolveScenario],
+    output_directory: str,
+    grid_definition: Mapping[str, object],
+    sweep_row_index: int | None = None,
+    solve_configuration: SolveConfiguration | None = None,
+) -> str:
+    """Solve many bound scenarios of one prepared model as a single batch.
+
+    Compilation is deliberately outside this flow; every scenario reuses the
+    prepared artifact. Every scenario must meet the certification contract and
+    pass authoritative validation against its own bounds; otherwise the flow
+    fails before writing anything. It then writes every scenario's canonical
+    surface into one stacked Zarr and, for a budget sweep, the efficiency
+    frontier.
+    """
+    preparation = Path(preparation_directory)
+    output = Path(output_directory)
+    manifest = json.loads(
+        (preparation / "preparation-manifest.json").read_text(encoding="utf-8")
+    )
+    artifact = load_compiled_artifact(preparation / "compiled-model")
+    configuration = solve_configuration or SolveConfiguration()
+    worker_count = os.getenv("SCENARIO_BATCH_WORKERS")
+    with acquire_task_run_slot():
+        solves = solve_scenario_batch(
+            artifact.model,
+            scenarios,
+            configuration=configuration,
+            work_directory=output / "scenario-columns",
+            worker_count=int(worker_count) if worker_count else None,
+        )
+    missing = [solve.scenario_id for solve in solves if solve.columns_path is None]
+    if missing:
+        raise RuntimeError(f"Scenarios returned no solution: {', '.join(missing)}.")
+    planning_unit_count = int(manifest["planning_unit_count"])
+    scenario_decisions = []
+    rejected = []
+    for ordinal, (scenario, solve) in enumerate(zip(scenarios, solves, strict=True)):
+        result = replace(
+            solve.result,
+            native_columns=np.load(solve.columns_path, mmap_mode="r"),
+        )
+        try:
+            require_acceptable_result(result, configuration, artifact.model)
+        except RuntimeError as error:
+            rejected.append(f"{solve.scenario_id} ({error})")
+            continue
+        reconstruction = reconstruct_solution(
+            artifact,
+            result,
+            output / "decision-vectors" / f"{ordinal}.npy",
+            planning_unit_count=planning_unit_count,
+            scenario=scenario,
+        )
+        validation = reconstruction.validation
+        if not validation.accepted:
+            rejected.append(f"{solve.scenario_id} ({', '.join(validation.failures)})")
+            continue
+        scenario_decisions.append((solve.scenario_id, reconstruction.decisions))
+    if rejected:
+        raise RuntimeError(
+            f"Scenario solution validation failed: {'; '.join(rejected)}."
+        )
+    write_scenario_canonical_zarr(
+        output / "scenarios.zarr",
+        sorted((preparation / "planning-units").glob("*.parquet")),
+        scenario_decisions,
+        height=int(manifest["height"]),
+        width=int(manifest["width"]),
+        chunk_size=int(manifest["tile_size"]),
+        transform=manifest["transform"],
+        crs=manifest["crs"],
+        planning_unit_resolution=int(manifest["resolution"]),
+        grid_family_id=str(grid_definition["grid_family_id"]),
+        grid_level=int(grid_definition["grid_level"]),
+        full_grid_width=int(manifest["full_grid_width"]),
+        global_row_offset=int(manifest["global_row_offset"]),
+        global_col_offset=int(manifest["global_col_offset"]),
+        surface="decision" if np.any(artifact.model.integrality) else "allocation",
+    )
+    if sweep_row_index is not None:
+        records = efficiency_frontier(
+            artifact.model,
+            scenarios,
+            solves,
+            row_index=sweep_row_index,
+            scaling=NumericalScaling.from_provenance(artifact.manifest.provenance),
+        )
+        table = pa.Table.from_pylist(records)
+        offset = original_objective_offset(artifact)
+        pq.write_table(
+            table.replace_schema_metadata({"objective_offset": json.dumps(offset)}),
+            output / "frontier.parquet",
+        )
+    return str(output)
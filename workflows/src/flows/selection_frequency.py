@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Mapping
+
+import numpy as np
+from prefect import flow
+
+from ..optimization.artifact import load_compiled_artifact
+from ..optimization.canonical_result import write_solver_canonical_zarr
+from ..optimization.ensemble import (
+    ENSEMBLE_METHOD,
+    ENSEMBLE_METHOD_VERSION,
+    solve_selection_ensemble,
+)
+from ..optimization.model import SolveConfiguration
+from ..utils.task_run_concurrency import acquire_task_run_slot
+
+
+@flow(name="selection-frequency")
+def selection_frequency(
+    preparation_directory: str,
+    output_directory: str,
+    grid_definition: Mapping[str, object],
+    member_count: int,
+    perturbation: float = 0.0,
+    solve_configuration: SolveConfiguration | None = None,
+) -> str:
+    """Write Marxan-style selection frequency from one prepared model.
+
+    Compilation is deliberately outside this flow. Randomized members share the
+    prepared artifact, and their frequency becomes a ``frequency`` canonical
+    surface where fixed-in units read 1 and fixed-out units 0.
+    """
+    preparation = Path(preparation_directory)
+    output = Path(output_directory)
+    manifest = json.loads(
+        (preparation / "preparation-manifest.json").read_text(encoding="utf-8")
+    )
+    artifact = load_compiled_artifact(preparation / "compiled-model")
+    worker_count = os.getenv("ENSEMBLE_WORKERS")
+    with acquire_task_run_slot():
+        ensemble = solve_selection_ensemble(
+            artifact.model,
+            member_count=member_count,
+            configuration=solve_configuration or SolveConfiguration(),
+            totals_path=output / "selection-totals.npy",
+            perturbation=perturbation,
+            worker_count=int(worker_count) if worker_count else None,
+        )
+    frequency = np.lib.format.open_memmap(
+        output / "selection-frequency.npy",
+        mode="w+",
+        dtype=np.float32,
+        shape=(int(manifest["planning_unit_count"]),),
+    )
+    frequency[np.asarray(artifact.candidate_source_indices, dtype=np.int64)] = (
+        ensemble.selection_frequency()
+    )
+    frequency[np.asarray(artifact.fixed_source_indices, dtype=np.int64)] = np.asarray(
+        artifact.fixed_values, dtype=np.float32
+    )
+    frequency.flush()
+    write_solver_canonical_zarr(
+        output / "selection-frequency.zarr",
+        sorted((preparation / "planning-units").glob("*.parquet")),
+        frequency,
+        height=int(manifest["height"]),
+        width=int(manifest["width"]),
+        chunk_size=int(manifest["tile_size"]),
+        transform=manifest["transform"],
+        crs=manifest["crs"],
+        planning_unit_resolution=int(manifest["resolution"]),
+        grid_family_id=str(grid_definition["grid_family_id"]),
+        grid_level=int(grid_definition["grid_level"]),
+        full_grid_width=int(manifest["full_grid_width"]),
+        global_row_offset=int(manifest["global_row_offset"]),
+        global_col_offset=int(manifest["global_col_offset"]),
+        surface="frequency",
+    )
+    (output / "ensemble.json").write_text(
+        json.dumps(
+            {
+                "method": ENSEMBLE_METHOD,
+                "method_version": ENSEMBLE_METHOD_VERSION,
+                "member_count": member_count,
+                "counted_members": ensemble.counted_members,
+                "perturbation": ensemble.perturbation,
+                "worker_count": ensemble.worker_count,
+                "runtime_seconds": ensemble.runtime_seconds,
+                "members": [asdict(member) for member in ensemble.members],
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        ),
+        encoding="utf-8",
+    )
+    return str(output)
@@ -3,28 +3,71 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
-from typing import Mapping, Sequence
+from threading import Lock
+from typing import Literal, Mapping, Sequence
 
 import numpy as np
 
 from .model import CompactRowNames, CompiledOptimizationModel
+from ..utils.cpu import available_cpu_count
 
+try:
+    from numcodecs import Delta, Shuffle, Zstd
+except ImportError:  # pragma: no cover - numcodecs ships with zarr
+    Delta = Shuffle = Zstd = None
 
-ARTIFACT_SCHEMA_VERSION = 3
+ARTIFACT_SCHEMA_VERSION = 5
 COPY_CHUNK_ELEMENTS = 1_048_576
+HASH_CHUNK_BYTES = 8 * 1024 * 1024
+ARRAY_CODEC = "delta-shuffle-zstd-v1"
+ZSTD_LEVEL = 3
+
+# Files verified or written by this process, keyed by device, inode,
+# modification time, and size, mapped to their verified Merkle root. Manifest
+# files map to their verified mathematical-model hash.
+_VERIFIED_FILES: dict[tuple[int, int, int, int], str] = {}
+_VERIFIED_FILES_LOCK = Lock()
+
+
+@dataclass(frozen=True)
+class ArrayEncoding:
+    """Describe the compressed at-rest copy of one artifact array.
+
+    The file holds independently compressed chunks of ``chunk_elements``
+    elements. Integer chunks are delta encoded, then every chunk is byte
+    shuffled and Zstandard compressed. ``checksum`` is the SHA-256 of the
+    compressed file; the enclosing descriptor's checksum covers the decoded
+    ``.npy`` file.
+    """
+
+    codec: str
+    path: str
+    byte_size: int
+    checksum: str
+    chunk_elements: int
+    chunk_byte_sizes: tuple[int, ...]
 
 
 @dataclass(frozen=True)
 class ArrayDescriptor:
-    """Describe one checksummed typed numerical array in a compiled artifact."""
+    """Describe one checksummed typed numerical array in a compiled artifact.
+
+    ``chunk_digests`` are the SHA-256 digests of consecutive ``chunk_bytes``
+    slices of the file, and ``checksum`` is their Merkle root, so chunks can be
+    verified independently and in parallel.
+    """
 
     path: str
     dtype: str
     shape: tuple[int, ...]
     byte_size: int
     checksum: str
+    chunk_bytes: int
+    chunk_digests: tuple[str, ...]
+    encoding: ArrayEncoding | None = None
 
 
 @dataclass(frozen=True)
@@ -85,8 +128,19 @@ def write_compiled_artifact(
     provenance: Mapping[str, object] | None = None,
     actual_dimensions: Mapping[str, int] | None = None,
     additional_arrays: Mapping[str, np.ndarray] | None = None,
+    encoding: Literal["raw", "zstd"] = "raw",
 ) -> CompiledArtifactManifest:
-    """Write one manifest-last immutable compiled artifact with bounded copies."""
+    """Write one manifest-last immutable compiled artifact with bounded copies.
+
+    With ``encoding="zstd"``, each array is kept at rest only as a compressed
+    file and :func:`load_compiled_artifact` decodes it into a local memory map
+    on first use. Checksums and the mathematical-model hash are those of the
+    decoded arrays either way.
+    """
+    if encoding not in {"raw", "zstd"}:
+        raise ValueError(f"Unknown compiled artifact encoding: {encoding}.")
+    if encoding == "zstd" and Zstd is None:
+        raise RuntimeError("numcodecs is required for compressed artifacts.")
     destination = Path(directory)
     destination.mkdir(parents=True, exist_ok=True)
     manifest_path = destination / "manifest.json"
@@ -154,9 +208,16 @@ def write_compiled_artifact(
         if name in values:
             raise ValueError(f"Additional artifact array has a reserved name: {name}.")
         values[name] = np.asanyarray(array)
-    descriptors: dict[str, ArrayDescriptor] = {}
     for name, array in values.items():
-        descriptors[name] = _write_array(destination / f"{name}.npy", array)
+        _write_array(destination / f"{name}.npy", array)
+    descriptors = _describe_arrays(
+        {name: destination / f"{name}.npy" for name in values}
+    )
+    if encoding == "zstd":
+        for name, descriptor in descriptors.items():
+            path = destination / descriptor.path
+            descriptors[name] = replace(descriptor, encoding=_encode_array(path))
+            path.unlink()
 
     row_blocks = compact_row_blocks(model.row_names)
     content_hash = _artifact_content_hash(descriptors, row_blocks)
@@ -197,11 +258,29 @@ def write_compiled_artifact(
         encoding="utf-8",
     )
     os.replace(temporary, manifest_path)
+    _remember_verified(manifest_path, model_hash)
     return manifest
 
 
-def load_compiled_artifact(directory: str | Path) -> LoadedCompiledArtifact:
-    """Verify and memory-map one committed compiled optimization artifact."""
+def load_compiled_artifact(
+    directory: str | Path,
+    *,
+    use_verification_cache: bool = True,
+    thread_count: int | None = None,
+    keep_encoded: bool = False,
+) -> LoadedCompiledArtifact:
+    """Verify and memory-map one committed compiled optimization artifact.
+
+    Array chunks are verified against their manifest digests across a thread
+    pool while the mathematical-model hash streams over the same memory maps.
+    Files this process already verified or wrote, and whose device, inode,
+    modification time, and size are unchanged, are trusted without hashing;
+    when every file is trusted, the mathematical-model hash is skipped too.
+
+    Compressed arrays are decoded beside their ``.zst`` file, which is removed
+    once every decoded array verifies unless ``keep_encoded`` is set for a
+    caller that still uploads it.
+    """
     root = Path(directory)
     manifest_path = root / "manifest.json"
     if not manifest_path.exists():
@@ -215,10 +294,21 @@ def load_compiled_artifact(directory: str | Path) -> LoadedCompiledArtifact:
         raise ValueError("Compiled artifact content identity is invalid.")
 
     arrays: dict[str, np.ndarray] = {}
+    unverified: dict[str, Path] = {}
     for name, descriptor in manifest.arrays.items():
         path = root / descriptor.path
-        if _sha256(path) != descriptor.checksum:
+        if descriptor.encoding is not None and not path.exists():
+            _decode_array(root, name, descriptor)
+        if (
+            descriptor.chunk_bytes <= 0
+            or len(descriptor.chunk_digests)
+            != _chunk_count(descriptor.byte_size, descriptor.chunk_bytes)
+            or merkle_root(descriptor.chunk_digests) != descriptor.checksum
+            or path.stat().st_size != descriptor.byte_size
+        ):
             raise ValueError(f"Compiled artifact checksum mismatch: {name}.")
+        if not (use_verification_cache and _is_verified(path, descriptor.checksum)):
+            unverified[name] = path
         array = np.load(path, mmap_mode="r", allow_pickle=False)
         if array.shape != descriptor.shape or array.dtype.str != descriptor.dtype:
             raise ValueError(f"Compiled artifact array contract mismatch: {name}.")
@@ -239,10 +329,49 @@ def load_compiled_artifact(directory: str | Path) -> LoadedCompiledArtifact:
         maximize=manifest.objective_sense == "maximize",
         objective_offset=manifest.objective_offset,
     )
-    if mathematical_model_hash(
-        model, arrays["candidate_planning_unit_ids"]
-    ) != manifest.mathematical_model_hash:
-        raise ValueError("Compiled artifact mathematical-model hash is invalid.")
+    verify_model = bool(unverified) or not (
+        use_verification_cache
+        and _is_verified(manifest_path, manifest.mathematical_model_hash)
+    )
+    if unverified or verify_model:
+        chunks = [
+            (name, path, index, manifest.arrays[name].chunk_bytes)
+            for name, path in unverified.items()
+            for index in range(len(manifest.arrays[name].chunk_digests))
+        ]
+        with ThreadPoolExecutor(
+            max_workers=thread_count or available_cpu_count(),
+            thread_name_prefix="artifact-verify",
+        ) as pool:
+            model_hash = (
+                pool.submit(
+                    mathematical_model_hash,
+                    model,
+                    arrays["candidate_planning_unit_ids"],
+                )
+                if verify_model
+                else None
+            )
+            digests = pool.map(
+                lambda chunk: _chunk_digest(chunk[1], chunk[2], chunk[3]), chunks
+            )
+            for (name, _, index, _), digest in zip(chunks, digests, strict=True):
+                if digest != manifest.arrays[name].chunk_digests[index]:
+                    raise ValueError(f"Compiled artifact checksum mismatch: {name}.")
+            if (
+                model_hash is not None
+                and model_hash.result() != manifest.mathematical_model_hash
+            ):
+                raise ValueError(
+                    "Compiled artifact mathematical-model hash is invalid."
+                )
+        for name, path in unverified.items():
+            _remember_verified(path, manifest.arrays[name].checksum)
+        _remember_verified(manifest_path, manifest.mathematical_model_hash)
+    if not keep_encoded:
+        for descriptor in manifest.arrays.values():
+            if descriptor.encoding is not None:
+                (root / descriptor.encoding.path).unlink(missing_ok=True)
     return LoadedCompiledArtifact(
         manifest=manifest,
         model=model,
@@ -301,7 +430,33 @@ def compact_row_blocks(row_names: Sequence[str]) -> tuple[RowBlock, ...]:
     return tuple(blocks)
 
 
-def _write_array(path: Path, values: np.ndarray) -> ArrayDescriptor:
+def merkle_root(digests: Sequence[str]) -> str:
+    """Return the Merkle root of hexadecimal chunk digests.
+
+    Parent nodes hash a ``0x01`` prefix and their two children; an unpaired
+    node moves up a level unchanged.
+    """
+    level = [bytes.fromhex(digest) for digest in digests]
+    if not level:
+        return hashlib.sha256(b"\x01").hexdigest()
+    while len(level) > 1:
+        paired = [
+            hashlib.sha256(b"\x01" + level[index] + level[index + 1]).digest()
+            for index in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
+
+def clear_verification_cache() -> None:
+    """Forget every file this process verified or wrote."""
+    with _VERIFIED_FILES_LOCK:
+        _VERIFIED_FILES.clear()
+
+
+def _write_array(path: Path, values: np.ndarray) -> None:
     array = np.asanyarray(values)
     source_path = (
         Path(str(array.filename)).resolve()
@@ -310,13 +465,7 @@ def _write_array(path: Path, values: np.ndarray) -> ArrayDescriptor:
     )
     if source_path == path.resolve():
         array.flush()
-        return ArrayDescriptor(
-            path=path.name,
-            dtype=array.dtype.str,
-            shape=tuple(int(value) for value in array.shape),
-            byte_size=path.stat().st_size,
-            checksum=_sha256(path),
-        )
+        return
     destination = np.lib.format.open_memmap(
         path,
         mode="w+",
@@ -330,15 +479,177 @@ def _write_array(path: Path, values: np.ndarray) -> ArrayDescriptor:
         flat_destination[start:stop] = flat_source[start:stop]
     destination.flush()
     del destination
-    return ArrayDescriptor(
-        path=path.name,
-        dtype=array.dtype.str,
-        shape=tuple(int(value) for value in array.shape),
-        byte_size=path.stat().st_size,
-        checksum=_sha256(path),
+
+
+def _describe_arrays(paths: Mapping[str, Path]) -> dict[str, ArrayDescriptor]:
+    """Digest every written array's chunks across one thread pool."""
+    sizes = {name: path.stat().st_size for name, path in paths.items()}
+    chunks = [
+        (name, index)
+        for name in paths
+        for index in range(_chunk_count(sizes[name], HASH_CHUNK_BYTES))
+    ]
+    with ThreadPoolExecutor(
+        max_workers=available_cpu_count(), thread_name_prefix="artifact-digest"
+    ) as pool:
+        digests = list(
+            pool.map(
+                lambda chunk: _chunk_digest(
+                    paths[chunk[0]], chunk[1], HASH_CHUNK_BYTES
+                ),
+                chunks,
+            )
+        )
+    descriptors: dict[str, ArrayDescriptor] = {}
+    for name, path in paths.items():
+        header = np.load(path, mmap_mode="r", allow_pickle=False)
+        chunk_digests = tuple(
+            digest
+            for (chunk_name, _), digest in zip(chunks, digests, strict=True)
+            if chunk_name == name
+        )
+        descriptors[name] = ArrayDescriptor(
+            path=path.name,
+            dtype=header.dtype.str,
+            shape=tuple(int(value) for value in header.shape),
+            byte_size=sizes[name],
+            checksum=merkle_root(chunk_digests),
+            chunk_bytes=HASH_CHUNK_BYTES,
+            chunk_digests=chunk_digests,
+        )
+        del header
+        _remember_verified(path, descriptors[name].checksum)
+    return descriptors
+
+
+def _array_codecs(dtype: np.dtype) -> tuple[object, ...]:
+    codecs: tuple[object, ...] = (
+        Shuffle(elementsize=dtype.itemsize),
+        Zstd(level=ZSTD_LEVEL),
+    )
+    if dtype.kind in "iu":
+        return (Delta(dtype=dtype.str), *codecs)
+    return codecs
+
+
+def _encode_array(path: Path) -> ArrayEncoding:
+    """Compress one written ``.npy`` file chunk by chunk beside it."""
+    values = np.load(path, mmap_mode="r", allow_pickle=False)
+    flat = values.reshape(-1)
+    codecs = _array_codecs(flat.dtype)
+    encoded_path = path.with_name(f"{path.name}.zst")
+    digest = hashlib.sha256()
+    sizes: list[int] = []
+    with encoded_path.open("wb") as target:
+        for start in range(0, flat.size, COPY_CHUNK_ELEMENTS):
+            block = np.ascontiguousarray(flat[start : start + COPY_CHUNK_ELEMENTS])
+            for codec in codecs:
+                block = codec.encode(block)
+            encoded = bytes(block)
+            digest.update(encoded)
+            target.write(encoded)
+            sizes.append(len(encoded))
+    del flat, values
+    return ArrayEncoding(
+        codec=ARRAY_CODEC,
+        path=encoded_path.name,
+        byte_size=encoded_path.stat().st_size,
+        checksum=digest.hexdigest(),
+        chunk_elements=COPY_CHUNK_ELEMENTS,
+        chunk_byte_sizes=tuple(sizes),
     )
 
 
+def _decode_array(root: Path, name: str, descriptor: ArrayDescriptor) -> None:
+    """Stream a compressed array into its ``.npy`` memory map, then publish it.
+
+    The compressed checksum is checked on the same read; the decoded file is
+    verified against the logical digests like any other array.
+    """
+    encoding = descriptor.encoding
+    if encoding is None or encoding.codec != ARRAY_CODEC:
+        raise ValueError(f"Unsupported compiled artifact encoding: {name}.")
+    if Zstd is None:
+        raise RuntimeError("numcodecs is required for compressed artifacts.")
+    dtype = np.dtype(descriptor.dtype)
+    codecs = _array_codecs(dtype)[::-1]
+    temporary = root / f".{descriptor.path}.{os.getpid()}.partial"
+    destination = np.lib.format.open_memmap(
+        temporary, mode="w+", dtype=dtype, shape=descriptor.shape
+    )
+    flat = destination.reshape(-1)
+    digest = hashlib.sha256()
+    start = 0
+    try:
+        with (root / encoding.path).open("rb") as source:
+            for size in encoding.chunk_byte_sizes:
+                block: object = source.read(size)
+                digest.update(block)
+                try:
+                    for codec in codecs:
+                        block = codec.decode(block)
+                except (RuntimeError, ValueError) as error:
+                    raise ValueError(
+                        f"Compiled artifact checksum mismatch: {name}."
+                    ) from error
+                chunk = np.frombuffer(block, dtype=dtype)
+                if start + chunk.size > flat.size:
+                    break
+                flat[start : start + chunk.size] = chunk
+                start += chunk.size
+            complete = not source.read(1)
+        if (
+            not complete
+            or start != flat.size
+            or digest.hexdigest() != encoding.checksum
+        ):
+            raise ValueError(f"Compiled artifact checksum mismatch: {name}.")
+        destination.flush()
+        del flat, destination
+        os.replace(temporary, root / descriptor.path)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+def _chunk_count(byte_size: int, chunk_bytes: int) -> int:
+    return max(1, -(-byte_size // chunk_bytes))
+
+
+def _chunk_digest(path: Path, index: int, chunk_bytes: int) -> str:
+    """Hash one file chunk; positional reads let threads share no file offset."""
+    digest = hashlib.sha256(b"\x00")
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        offset = index * chunk_bytes
+        remaining = chunk_bytes
+        while remaining:
+            block = os.pread(descriptor, min(remaining, 1024 * 1024), offset)
+            if not block:
+                break
+            digest.update(block)
+            offset += len(block)
+            remaining -= len(block)
+    finally:
+        os.close(descriptor)
+    return digest.hexdigest()
+
+
+def _file_identity(path: Path) -> tuple[int, int, int, int]:
+    status = path.stat()
+    return (status.st_dev, status.st_ino, status.st_mtime_ns, status.st_size)
+
+
+def _is_verified(path: Path, digest: str) -> bool:
+    with _VERIFIED_FILES_LOCK:
+        return _VERIFIED_FILES.get(_file_identity(path)) == digest
+
+
+def _remember_verified(path: Path, digest: str) -> None:
+    identity = _file_identity(path)
+    with _VERIFIED_FILES_LOCK:
+        _VERIFIED_FILES[identity] = digest
+
+
 def _row_role(name: str) -> str:
     if name.startswith("neighbor_selected_first_"):
         return "neighbor_selected_first"
@@ -380,19 +691,15 @@ def _artifact_content_hash(
 def _update_array_hash(
     digest: "hashlib._Hash", values: np.ndarray, dtype: np.dtype
 ) -> None:
-    normalized = np.asarray(values, dtype=dtype).reshape(-1)
-    digest.update(np.asarray(values.shape, dtype="<i8").tobytes())
-    for start in range(0, normalized.size, COPY_CHUNK_ELEMENTS):
-        stop = min(start + COPY_CHUNK_ELEMENTS, normalized.size)
-        digest.update(normalized[start:stop].tobytes(order="C"))
+    """Stream normalized bytes, converting one chunk at a time.
 
-
-def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as source:
-        for chunk in iter(lambda: source.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    Chunks already in ``dtype`` are hashed straight from the memory map.
+    """
+    flat = values.reshape(-1)
+    digest.update(np.asarray(values.shape, dtype="<i8").tobytes())
+    for start in range(0, flat.size, COPY_CHUNK_ELEMENTS):
+        stop = min(start + COPY_CHUNK_ELEMENTS, flat.size)
+        digest.update(np.ascontiguousarray(flat[start:stop], dtype=dtype))
 
 
 def _manifest_to_dict(manifest: CompiledArtifactManifest) -> dict[str, object]:
@@ -414,6 +721,11 @@ def _manifest_from_dict(value: Mapping[str, object]) -> CompiledArtifactManifest
             shape=tuple(int(item) for item in descriptor["shape"]),
             byte_size=int(descriptor["byte_size"]),
             checksum=str(descriptor["checksum"]),
+            chunk_bytes=int(descriptor.get("chunk_bytes", 0)),
+            chunk_digests=tuple(
+                str(digest) for digest in descriptor.get("chunk_digests", ())
+            ),
+            encoding=_encoding_from_dict(descriptor.get("encoding")),
         )
         for name, descriptor in raw_arrays.items()
         if isinstance(descriptor, dict)
@@ -449,3 +761,18 @@ def _manifest_from_dict(value: Mapping[str, object]) -> CompiledArtifactManifest
             for name, item in dict(value.get("actual_dimensions") or {}).items()
         },
     )
+
+
+def _encoding_from_dict(value: object) -> ArrayEncoding | None:
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        raise ValueError("Compiled artifact array encoding is invalid.")
+    return ArrayEncoding(
+        codec=str(value["codec"]),
+        path=str(value["path"]),
+        byte_size=int(value["byte_size"]),
+        checksum=str(value["checksum"]),
+        chunk_elements=int(value["chunk_elements"]),
+        chunk_byte_sizes=tuple(int(size) for size in value["chunk_byte_sizes"]),
+    )
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+
+from . import cpsat, highs
+from .model import (
+    CompiledOptimizationModel,
+    SolveConfiguration,
+    SolverResult,
+    SolveScenario,
+)
+
+
+@dataclass(frozen=True)
+class SolverBackend:
+    """Named solver that turns a compiled model into a portable result.
+
+    ``solve`` accepts the keyword arguments of :func:`solve_with_backend`.
+    ``available`` reports whether the backend's optional dependency imported,
+    so a run can fail before preparation work instead of at solve time.
+    """
+
+    name: str
+    solve: Callable[..., SolverResult]
+    available: Callable[[], bool]
+
+
+_BACKENDS: dict[str, SolverBackend] = {}
+
+
+def register_solver_backend(backend: SolverBackend) -> None:
+    """Make a backend selectable by name in solve configurations and races."""
+    if not backend.name or backend.name != backend.name.strip().lower():
+        raise ValueError("Solver backend names must be lowercase identifiers.")
+    _BACKENDS[backend.name] = backend
+
+
+def solver_backend(name: str) -> SolverBackend:
+    """Return a registered backend whose dependency is importable.
+
+    Raises:
+        ValueError: If no backend is registered under ``name``.
+        RuntimeError: If the backend's optional dependency is missing.
+    """
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(
+            f"Unknown solver backend {name!r}; expected one of "
+            + ", ".join(sorted(_BACKENDS))
+            + "."
+        )
+    if not backend.available():
+        raise RuntimeError(f"Solver backend {name!r} is not installed.")
+    return backend
+
+
+def registered_solver_backends() -> tuple[str, ...]:
+    """Return registered backend names in a stable order."""
+    return tuple(sorted(_BACKENDS))
+
+
+def solve_with_backend(
+    model: CompiledOptimizationModel,
+    *,
+    configuration: SolveConfiguration,
+    scenario: SolveScenario | None = None,
+    warm_start: np.ndarray | Sequence[float] | None = None,
+    progress_callback: Callable[[dict[str, object]], None] | None = None,
+    work_directory: str | Path | None = None,
+    incumbent_path: str | Path | None = None,
+    retain_warm_start: bool = False,
+) -> SolverResult:
+    """Solve with the configured backend, or race the configured profiles.
+
+    Two or more race profiles start the shared race, where each profile names
+    its own backend; otherwise ``configuration.backend`` solves alone. Results
+    from every backend pass through the same acceptance and reconstruction
+    gates downstream.
+    """
+    if len(configuration.race_profiles) > 1:
+        from .racing import race_with_highs
+
+        for profile in configuration.race_profiles:
+            solver_backend(profile.backend)
+        return race_with_highs(
+            model,
+            configuration=configuration,
+            scenario=scenario,
+            warm_start=warm_start,
+            progress_callback=progress_callback,
+            work_directory=work_directory,
+            incumbent_path=incumbent_path,
+            retain_warm_start=retain_warm_start,
+        )
+    return solver_backend(configuration.backend).solve(
+        model,
+        configuration=configuration,
+        scenario=scenario,
+        warm_start=warm_start,
+        progress_callback=progress_callback,
+        work_directory=work_directory,
+        incumbent_path=incumbent_path,
+        retain_warm_start=retain_warm_start,
+    )
+
+
+register_solver_backend(
+    SolverBackend(
+        name="highs",
+        solve=highs.solve_with_highs,
+        available=lambda: highs.highspy is not None,
+    )
+)
+register_solver_backend(
+    SolverBackend(
+        name="cpsat",
+        solve=cpsat.solve_with_cpsat,
+        available=lambda: cpsat.cp_model is not None,
+    )
+)
@@ -9,7 +9,7 @@ import numpy as np
 import pyarrow.parquet as pq
 import zarr
 
-ResultSurface = Literal["decision", "allocation", "priority"]
+ResultSurface = Literal["decision", "allocation", "priority", "frequency"]
 
 
 def write_solver_canonical_zarr(
@@ -31,9 +31,10 @@ def write_solver_canonical_zarr(
     surface: ResultSurface = "decision",
 ) -> Path:
     """Write solver decisions to the canonical spatial result."""
-    if surface not in {"decision", "allocation", "priority"}:
+    if surface not in {"decision", "allocation", "priority", "frequency"}:
         raise ValueError(
-            "Canonical result surface must be decision, allocation, or priority."
+            "Canonical result surface must be decision, allocation, priority, "
+            "or frequency."
         )
     destination = Path(output_path)
     destination.mkdir(parents=True, exist_ok=True)
@@ -60,34 +61,11 @@ def write_solver_canonical_zarr(
                 values.vindex[rows, cols] = np.asarray(
                     decisions[indices] >= 0.5, dtype=np.uint8
                 )
-            elif surface == "allocation":
-                values.vindex[rows, cols] = np.asarray(
-                    np.clip(decisions[indices], 0.0, 1.0), dtype=np.float32
-                )
             else:
                 values.vindex[rows, cols] = np.asarray(
                     np.clip(decisions[indices], 0.0, 1.0), dtype=np.float32
                 )
-    surface_semantics: dict[str, object]
-    if surface == "decision":
-        surface_semantics = {
-            "not_selected": 0,
-            "selected": 1,
-            "outside_aoi": 255,
-        }
-    elif surface == "allocation":
-        surface_semantics = {
-            "minimum_allocation": 0.0,
-            "maximum_allocation": 1.0,
-            "outside_aoi": "NaN",
-        }
-    else:
-        surface_semantics = {
-            "minimum_priority": 0.0,
-            "maximum_priority": 1.0,
-            "outside_aoi": "NaN",
-            "score": "mean_nested_allocation_v1",
-        }
+    surface_semantics = _surface_semantics(surface)
     attributes = {
         "schema_version": 1,
         "surface": surface,
@@ -114,6 +92,117 @@ def write_solver_canonical_zarr(
     return destination
 
 
+def write_scenario_canonical_zarr(
+    output_path: str | Path,
+    planning_paths: Sequence[str | Path],
+    scenario_decisions: Sequence[tuple[str, np.ndarray]],
+    *,
+    height: int,
+    width: int,
+    chunk_size: int,
+    transform: Sequence[float],
+    crs: str,
+    planning_unit_resolution: int,
+    grid_family_id: str,
+    grid_level: int,
+    full_grid_width: int | None = None,
+    global_row_offset: int = 0,
+    global_col_offset: int = 0,
+    surface: Literal["decision", "allocation"] = "decision",
+) -> Path:
+    """Write one canonical surface per scenario into a stacked result.
+
+    The surface array has shape ``(scenario, row, col)`` with one scenario per
+    chunk, so a map read of one scenario touches only that scenario's chunks.
+    Planning-unit cells are read once and scattered into every scenario.
+    """
+    if surface not in {"decision", "allocation"}:
+        raise ValueError("Scenario result surface must be decision or allocation.")
+    if not scenario_decisions:
+        raise ValueError("A scenario result requires at least one scenario.")
+    destination = Path(output_path)
+    destination.mkdir(parents=True, exist_ok=True)
+    root = zarr.open_group(str(destination), mode="w")
+    values = root.create_dataset(
+        surface,
+        shape=(len(scenario_decisions), height, width),
+        chunks=(1, min(chunk_size, height), min(chunk_size, width)),
+        dtype="u1" if surface == "decision" else "f4",
+        fill_value=255 if surface == "decision" else np.nan,
+        compressor=zarr.Blosc(cname="zstd", clevel=5, shuffle=1),
+    )
+    for path in sorted(Path(value) for value in planning_paths):
+        parquet = pq.ParquetFile(path)
+        for batch in parquet.iter_batches(
+            batch_size=65536, columns=["variable_index", "row", "col"]
+        ):
+            indices = batch.column("variable_index").to_numpy().astype(np.int64)
+            rows = batch.column("row").to_numpy().astype(np.int64)
+            cols = batch.column("col").to_numpy().astype(np.int64)
+            for position, (_, decisions) in enumerate(scenario_decisions):
+                layer = np.full(len(indices), position, dtype=np.int64)
+                if surface == "decision":
+                    values.vindex[layer, rows, cols] = np.asarray(
+                        decisions[indices] >= 0.5, dtype=np.uint8
+                    )
+                else:
+                    values.vindex[layer, rows, cols] = np.asarray(
+                        np.clip(decisions[indices], 0.0, 1.0), dtype=np.float32
+                    )
+    root.attrs.update(
+        {
+            "schema_version": 1,
+            "surface": surface,
+            "scenario_ids": [scenario_id for scenario_id, _ in scenario_decisions],
+            "grid_family_id": grid_family_id,
+            "grid_level": grid_level,
+            "crs": crs,
+            "transform": list(transform),
+            "planning_unit_resolution": planning_unit_resolution,
+            "surface_semantics": _surface_semantics(surface),
+            "full_grid_width": full_grid_width or width,
+            "global_row_offset": global_row_offset,
+            "global_col_offset": global_col_offset,
+        }
+    )
+    zarr.consolidate_metadata(str(destination))
+    manifest = _directory_manifest(destination)
+    (destination / "manifest.json").write_text(
+        json.dumps(manifest, sort_keys=True, separators=(",", ":")),
+        encoding="utf-8",
+    )
+    return destination
+
+
+def _surface_semantics(surface: ResultSurface) -> dict[str, object]:
+    """Describe the encoded values of one canonical surface."""
+    if surface == "decision":
+        return {
+            "not_selected": 0,
+            "selected": 1,
+            "outside_aoi": 255,
+        }
+    if surface == "allocation":
+        return {
+            "minimum_allocation": 0.0,
+            "maximum_allocation": 1.0,
+            "outside_aoi": "NaN",
+        }
+    if surface == "priority":
+        return {
+            "minimum_priority": 0.0,
+            "maximum_priority": 1.0,
+            "outside_aoi": "NaN",
+            "score": "mean_nested_allocation_v1",
+        }
+    return {
+        "minimum_frequency": 0.0,
+        "maximum_frequency": 1.0,
+        "outside_aoi": "NaN",
+        "score": "selection_frequency_v1",
+    }
+
+
 def _build_surface_overviews(
     root: zarr.Group, surface: ResultSurface, chunk_size: int
 ) -> None:
@@ -182,6 +271,7 @@ def _build_surface_overviews(
                 "decision": "any_selected_v1",
                 "allocation": "maximum_allocation_v1",
                 "priority": "mean_priority_v1",
+                "frequency": "mean_frequency_v1",
             }[surface]
         )
         source = target
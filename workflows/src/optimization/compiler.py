@@ -9,6 +9,7 @@ import numpy as np
 from .neighbor import (
     NeighborPenaltySpecification,
     NeighborStructure,
+    attainable_neighbor_edge_count,
     iter_neighbor_edge_blocks,
     planning_fixed_values,
     resolve_neighbor_normalization,
@@ -27,6 +28,9 @@ from .reduction import (
     presolve_planning_unit_domain,
 )
 
+# Bump whenever preparation or compilation emits a different model for the
+# same inputs; cached models and delta bases from older compilers stop matching.
+COMPILER_VERSION = 1
 
 ConstraintSpecification = tuple[float | None, float | None]
 DecisionDomain = Literal["continuous", "discrete"]
@@ -84,11 +88,14 @@ def compile_spatial_optimization(
     decision_domain: DecisionDomain = "discrete",
     preserve_primary_domain: bool = False,
     allocation_target_row: bool = False,
+    fixed_values: np.ndarray | None = None,
 ) -> CompilationOutput:
     """Compile conservation semantics into preallocated solver-neutral CSR arrays.
 
     When ``array_directory`` is supplied, all model-scale arrays are memory mapped
     so compilation does not require a second in-memory representation of the model.
+    ``fixed_values`` supplies -1/0/1 planning-unit locks when they are not
+    carried by ``neighbor_structure``.
     """
     if decision_domain not in {"continuous", "discrete"}:
         raise ValueError("Decision domain must be continuous or discrete.")
@@ -112,11 +119,12 @@ def compile_spatial_optimization(
         if fused_objective is not None
         else np.zeros(planning_unit_count, dtype=np.float64)
     )
-    fixed_values = (
-        planning_fixed_values(neighbor_structure)
-        if neighbor_structure is not None
-        else np.full(planning_unit_count, -1, dtype=np.int8)
-    )
+    if fixed_values is not None:
+        fixed_values = np.asarray(fixed_values, dtype=np.int8)
+    elif neighbor_structure is not None:
+        fixed_values = planning_fixed_values(neighbor_structure)
+    else:
+        fixed_values = np.full(planning_unit_count, -1, dtype=np.int8)
     if primary_objective.shape != (planning_unit_count,):
         raise ValueError("Fused objective does not match the candidate domain.")
     if fixed_values.shape != (planning_unit_count,):
@@ -145,16 +153,9 @@ def compile_spatial_optimization(
             raise ValueError(
                 "Neighbor structure planning-unit count differs from model."
             )
-        attainable_edge_count = 0
-        for block in iter_neighbor_edge_blocks(neighbor_structure):
-            attainable_edge_count += int(
-                np.count_nonzero(
-                    (fixed_values[block.first] != 0) & (fixed_values[block.second] != 0)
-                )
-            )
         neighbor_normalization = resolve_neighbor_normalization(
             neighbor_penalty,
-            attainable_edge_count,
+            attainable_neighbor_edge_count(neighbor_structure, fixed_values),
         )
     presolve = (
         DomainPresolveResult(
@@ -271,14 +272,18 @@ def compile_spatial_optimization(
     objective[:primary_variable_count] = primary_objective[flexible]
 
     compiled_rows: list[tuple[np.ndarray, np.ndarray, float, float, str]] = []
+    aggregate_rows: list[dict[str, object]] = []
 
     def compile_row(
         indices: np.ndarray,
         values: np.ndarray,
         lower: float,
         upper: float,
-        name: str,
+        layer: str,
+        constraint_index: int,
+        side: Literal["minimum", "maximum"],
     ) -> None:
+        name = f"{layer}_{side}"
         fixed_one = compiled_fixed_values[indices] == 1
         contribution = float(np.sum(values[fixed_one]))
         retained = compiled_fixed_values[indices] < 0
@@ -293,12 +298,26 @@ def compile_spatial_optimization(
         retained_values = retained_values[nonzero]
         possible_minimum = float(np.sum(retained_values[retained_values < 0]))
         possible_maximum = float(np.sum(retained_values[retained_values > 0]))
+        # Delta recompilation needs every bound, including rows dropped here,
+        # to decide whether a changed bound still fits this CSR structure.
+        binding: dict[str, object] = {
+            "layer": layer,
+            "constraint_index": constraint_index,
+            "side": side,
+            "bound": lower if side == "minimum" else upper,
+            "row_index": None,
+            "fixed_in_contribution": contribution,
+            "possible_minimum": possible_minimum,
+            "possible_maximum": possible_maximum,
+        }
+        aggregate_rows.append(binding)
         if adjusted_lower <= possible_minimum and adjusted_upper >= possible_maximum:
             return
         if retained_indices.size == 0:
             if adjusted_lower <= 0 <= adjusted_upper:
                 return
             raise ValueError(f"Compiled constant row is infeasible: {name}.")
+        binding["row_index"] = len(compiled_rows)
         compiled_rows.append(
             (
                 retained_indices,
@@ -312,14 +331,16 @@ def compile_spatial_optimization(
     for feature in constraints:
         indices = np.asarray(feature.indices, dtype=np.int32)
         values = np.asarray(feature.values, dtype=np.float64)
-        for minimum, maximum in feature.constraints:
+        for constraint_index, (minimum, maximum) in enumerate(feature.constraints):
             if minimum is not None:
                 compile_row(
                     indices,
                     values,
                     float(minimum),
                     np.inf,
-                    f"{feature.layer_id}_minimum",
+                    feature.layer_id,
+                    constraint_index,
+                    "minimum",
                 )
             if maximum is not None:
                 compile_row(
@@ -327,7 +348,9 @@ def compile_spatial_optimization(
                     values,
                     -np.inf,
                     float(maximum),
-                    f"{feature.layer_id}_maximum",
+                    feature.layer_id,
+                    constraint_index,
+                    "maximum",
                 )
     if allocation_target_row:
         compiled_rows.append(
@@ -389,6 +412,9 @@ def compile_spatial_optimization(
             dtype=np.int64,
         )
         row_upper[neighbor_row_start:] = 0
+        fixed_in_neighbor_counts = allocate(
+            "neighbor-fixed-in-counts", primary_variable_count, np.uint8, 0
+        )
         pairwise_index = 0
         for block in iter_neighbor_edge_blocks(neighbor_structure):
             first_state = compiled_fixed_values[block.first]
@@ -419,6 +445,7 @@ def compile_spatial_optimization(
                     unary_columns[fixed_in],
                     coefficient,
                 )
+                np.add.at(fixed_in_neighbor_counts, unary_columns[fixed_in], 1)
 
             pairwise = ~first_fixed & ~second_fixed
             block_pairwise_count = int(np.count_nonzero(pairwise))
@@ -475,6 +502,7 @@ def compile_spatial_optimization(
             normalization_scale=neighbor_normalization.normalization_scale,
             resolved_coefficient=neighbor_normalization.resolved_coefficient,
             status=neighbor_normalization.status,
+            fixed_in_neighbor_counts=fixed_in_neighbor_counts,
         )
 
     if row_offset != row_count or nonzero_offset != nonzero_count:
@@ -519,6 +547,7 @@ def compile_spatial_optimization(
         canonical_objectives=tuple(canonical_objectives),
         neighbor=neighbor_metadata,
         reduction=reduction,
+        aggregate_rows=tuple(aggregate_rows),
     )
     return CompilationOutput(model=model, reconstruction=reconstruction)
 
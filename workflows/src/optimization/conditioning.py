@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field, replace
+from typing import Mapping
+
+import numpy as np
+
+from .model import CompiledOptimizationModel
+
+CONDITIONING_METHOD = "power_of_two_geometric_centering"
+CONDITIONING_METHOD_VERSION = 1
+HIGHS_FEASIBILITY_TOLERANCE = 1e-7
+HIGHS_SMALL_MATRIX_VALUE = 1e-9
+MAXIMUM_SCALE_EXPONENT = 64
+CONDITIONING_BATCH_SIZE = 1_048_576
+
+
+@dataclass(frozen=True)
+class NumericalScaling:
+    """Exact power-of-two factors that map original model units to solver units.
+
+    The solver objective and offset are the original ones times
+    ``2**objective_exponent``; each listed row, with its bounds, is the
+    original row times ``2**row_exponent``. Columns are never scaled, so
+    decisions need no conversion, and multiplying by a power of two is exact
+    in binary floating point, so every unscaled value equals the value the
+    original model would have produced.
+    """
+
+    objective_exponent: int = 0
+    scaled_rows: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    row_exponents: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int32)
+    )
+    report: Mapping[str, object] | None = None
+
+    def unscale_objective(self, value: float | None) -> float | None:
+        """Convert a solver-unit objective, bound, or gap to original units."""
+        if value is None:
+            return None
+        return math.ldexp(float(value), -self.objective_exponent)
+
+    def row_exponent_vector(self, row_count: int) -> np.ndarray:
+        """Return every row's exponent, zero for rows that were not scaled."""
+        exponents = np.zeros(row_count, dtype=np.int32)
+        exponents[np.asarray(self.scaled_rows, dtype=np.int64)] = self.row_exponents
+        return exponents
+
+    def unscale_rows(self, values: np.ndarray) -> np.ndarray:
+        """Convert solver-unit activities or bounds of every row to original units."""
+        return np.ldexp(
+            np.asarray(values, dtype=np.float64),
+            -self.row_exponent_vector(len(values)),
+        )
+
+    def unscale_row(self, row_index: int, value: float) -> float:
+        """Convert one solver-unit row activity to original units."""
+        position = np.flatnonzero(np.asarray(self.scaled_rows) == row_index)
+        exponent = int(self.row_exponents[position[0]]) if position.size else 0
+        return math.ldexp(float(value), -exponent)
+
+    def to_dict(self) -> dict[str, object]:
+        """Return deterministic JSON-compatible artifact provenance."""
+        return {
+            "method": CONDITIONING_METHOD,
+            "method_version": CONDITIONING_METHOD_VERSION,
+            "objective_exponent": int(self.objective_exponent),
+            "scaled_rows": [int(row) for row in self.scaled_rows],
+            "row_exponents": [int(exponent) for exponent in self.row_exponents],
+            "report": dict(self.report or {}),
+        }
+
+    @classmethod
+    def from_provenance(
+        cls, provenance: Mapping[str, object]
+    ) -> "NumericalScaling | None":
+        """Read scaling from artifact provenance; older artifacts have none."""
+        value = provenance.get("numerical_scaling")
+        if value is None:
+            return None
+        if not isinstance(value, Mapping) or value.get("method") != (
+            CONDITIONING_METHOD
+        ):
+            raise ValueError("Compiled numerical scaling provenance is invalid.")
+        rows = np.asarray(value["scaled_rows"], dtype=np.int64)
+        exponents = np.asarray(value["row_exponents"], dtype=np.int32)
+        if rows.shape != exponents.shape:
+            raise ValueError("Compiled row scaling provenance does not align.")
+        return cls(
+            objective_exponent=int(value["objective_exponent"]),
+            scaled_rows=rows,
+            row_exponents=exponents,
+            report=dict(value.get("report") or {}),
+        )
+
+
+def condition_model(
+    model: CompiledOptimizationModel,
+) -> tuple[CompiledOptimizationModel, NumericalScaling]:
+    """Rescale objective and rows in place so their magnitudes centre on one.
+
+    Normalized objectives give coefficients near ``1 / K`` and neighbour
+    coefficients near ``strength / edges``, which on large grids fall below
+    HiGHS' absolute dual tolerance. The objective is multiplied by the power
+    of two closest to the inverse geometric mean of its smallest and largest
+    magnitudes, and each row likewise by its own. Model arrays are updated in
+    place, so memory-mapped compiler output is rescaled without a copy.
+
+    Returns:
+        The model with its scaled offset, and the factors with a report of the
+        coefficient ranges and tolerances in original units.
+    """
+    objective = model.objective
+    objective_range = _magnitude_range(objective)
+    objective_exponent = _centering_exponent(*objective_range)
+    row_minimum, row_maximum = _row_magnitude_ranges(model)
+    row_exponents = np.zeros(model.constraint_count, dtype=np.int32)
+    nonempty = np.isfinite(row_minimum)
+    row_exponents[nonempty] = np.clip(
+        -np.rint(
+            (np.log2(row_minimum[nonempty]) + np.log2(row_maximum[nonempty])) / 2.0
+        ),
+        -MAXIMUM_SCALE_EXPONENT,
+        MAXIMUM_SCALE_EXPONENT,
+    ).astype(np.int32)
+    scaled_rows = np.flatnonzero(row_exponents != 0)
+    original_small = _count_below(model.coefficients, HIGHS_SMALL_MATRIX_VALUE)
+    original_dual_small = _count_below(objective, HIGHS_FEASIBILITY_TOLERANCE)
+
+    if objective_exponent:
+        _ldexp_in_place(objective, objective_exponent)
+    if scaled_rows.size:
+        row_ends = np.asarray(model.row_starts[1:], dtype=np.int64)
+        for start in range(0, model.nonzero_count, CONDITIONING_BATCH_SIZE):
+            stop = min(start + CONDITIONING_BATCH_SIZE, model.nonzero_count)
+            rows = np.searchsorted(
+                row_ends, np.arange(start, stop, dtype=np.int64), side="right"
+            )
+            model.coefficients[start:stop] = np.ldexp(
+                np.asarray(model.coefficients[start:stop]), row_exponents[rows]
+            )
+        for bounds in (model.row_lower, model.row_upper):
+            for start in range(0, model.constraint_count, CONDITIONING_BATCH_SIZE):
+                stop = min(start + CONDITIONING_BATCH_SIZE, model.constraint_count)
+                bounds[start:stop] = np.ldexp(
+                    np.asarray(bounds[start:stop]), row_exponents[start:stop]
+                )
+    conditioned = replace(
+        model,
+        objective_offset=math.ldexp(float(model.objective_offset), objective_exponent),
+    )
+    scaled_row_minimum = np.ldexp(row_minimum, row_exponents)
+    scaled_row_maximum = np.ldexp(row_maximum, row_exponents)
+    feasibility_in_original_units = np.ldexp(
+        HIGHS_FEASIBILITY_TOLERANCE, -row_exponents[nonempty]
+    )
+    report = {
+        "objective_coefficient_range": _range_or_none(objective_range),
+        "scaled_objective_coefficient_range": _range_or_none(
+            tuple(math.ldexp(value, objective_exponent) for value in objective_range)
+        ),
+        "objective_coefficients_below_dual_tolerance": original_dual_small,
+        "scaled_objective_coefficients_below_dual_tolerance": _count_below(
+            objective, HIGHS_FEASIBILITY_TOLERANCE
+        ),
+        "matrix_coefficient_range": _range_or_none(
+            (
+                float(np.min(row_minimum, initial=np.inf)),
+                float(np.max(row_maximum[nonempty], initial=-np.inf)),
+            )
+        ),
+        "scaled_matrix_coefficient_range": _range_or_none(
+            (
+                float(np.min(scaled_row_minimum, initial=np.inf)),
+                float(np.max(scaled_row_maximum[nonempty], initial=-np.inf)),
+            )
+        ),
+        "matrix_coefficients_below_small_value": original_small,
+        "scaled_matrix_coefficients_below_small_value": _count_below(
+            model.coefficients, HIGHS_SMALL_MATRIX_VALUE
+        ),
+        "dual_tolerance_in_objective_units": math.ldexp(
+            HIGHS_FEASIBILITY_TOLERANCE, -objective_exponent
+        ),
+        "primal_tolerance_in_row_units": _range_or_none(
+            (
+                float(np.min(feasibility_in_original_units, initial=np.inf)),
+                float(np.max(feasibility_in_original_units, initial=-np.inf)),
+            )
+        ),
+    }
+    return conditioned, NumericalScaling(
+        objective_exponent=objective_exponent,
+        scaled_rows=scaled_rows.astype(np.int64),
+        row_exponents=row_exponents[scaled_rows],
+        report=report,
+    )
+
+
+def _row_magnitude_ranges(
+    model: CompiledOptimizationModel,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return each row's smallest and largest nonzero magnitude in bounded batches."""
+    minimum = np.full(model.constraint_count, np.inf, dtype=np.float64)
+    maximum = np.full(model.constraint_count, -np.inf, dtype=np.float64)
+    row_ends = np.asarray(model.row_starts[1:], dtype=np.int64)
+    for start in range(0, model.nonzero_count, CONDITIONING_BATCH_SIZE):
+        stop = min(start + CONDITIONING_BATCH_SIZE, model.nonzero_count)
+        magnitudes = np.abs(
+            np.asarray(model.coefficients[start:stop], dtype=np.float64)
+        )
+        rows = np.searchsorted(
+            row_ends, np.arange(start, stop, dtype=np.int64), side="right"
+        )
+        keep = magnitudes > 0
+        magnitudes, rows = magnitudes[keep], rows[keep]
+        if rows.size == 0:
+            continue
+        group_starts = np.concatenate(
+            (np.asarray([0], dtype=np.int64), np.flatnonzero(np.diff(rows)) + 1)
+        )
+        group_rows = rows[group_starts]
+        minimum[group_rows] = np.minimum(
+            minimum[group_rows], np.minimum.reduceat(magnitudes, group_starts)
+        )
+        maximum[group_rows] = np.maximum(
+            maximum[group_rows], np.maximum.reduceat(magnitudes, group_starts)
+        )
+    return minimum, maximum
+
+
+def _magnitude_range(values: np.ndarray) -> tuple[float, float]:
+    """Return the smallest and largest nonzero magnitude, or infinities if none."""
+    minimum, maximum = np.inf, -np.inf
+    for start in range(0, len(values), CONDITIONING_BATCH_SIZE):
+        magnitudes = np.abs(
+            np.asarray(values[start : start + CONDITIONING_BATCH_SIZE], np.float64)
+        )
+        magnitudes = magnitudes[magnitudes > 0]
+        if magnitudes.size:
+            minimum = min(minimum, float(magnitudes.min()))
+            maximum = max(maximum, float(magnitudes.max()))
+    return minimum, maximum
+
+
+def _centering_exponent(minimum: float, maximum: float) -> int:
+    """Return the exponent whose power of two centres a magnitude range on one."""
+    if not np.isfinite(minimum) or not np.isfinite(maximum):
+        return 0
+    exponent = -round((math.log2(minimum) + math.log2(maximum)) / 2.0)
+    return int(max(-MAXIMUM_SCALE_EXPONENT, min(MAXIMUM_SCALE_EXPONENT, exponent)))
+
+
+def _ldexp_in_place(values: np.ndarray, exponent: int) -> None:
+    """Multiply an array by a power of two in bounded batches."""
+    for start in range(0, len(values), CONDITIONING_BATCH_SIZE):
+        stop = min(start + CONDITIONING_BATCH_SIZE, len(values))
+        values[start:stop] = np.ldexp(np.asarray(values[start:stop]), exponent)
+
+
+def _count_below(values: np.ndarray, threshold: float) -> int:
+    """Count nonzero magnitudes below a solver tolerance in bounded batches."""
+    count = 0
+    for start in range(0, len(values), CONDITIONING_BATCH_SIZE):
+        magnitudes = np.abs(
+            np.asarray(values[start : start + CONDITIONING_BATCH_SIZE], np.float64)
+        )
+        count += int(np.count_nonzero((magnitudes > 0) & (magnitudes < threshold)))
+    return count
+
+
+def _range_or_none(values: tuple[float, float]) -> list[float] | None:
+    """Return a JSON range, or ``None`` when nothing was measured."""
+    minimum, maximum = values
+    if not np.isfinite(minimum) or not np.isfinite(maximum):
+        return None
+    return [float(minimum), float(maximum)]
@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import math
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .highs import (
+    apply_solve_scenario,
+    build_budgeted_warm_start,
+    warm_start_is_feasible,
+    write_incumbent,
+)
+from .model import (
+    CompiledOptimizationModel,
+    SolveConfiguration,
+    SolveScenario,
+    SolverResult,
+)
+from ..utils.cpu import available_cpu_count
+
+try:
+    from ortools.sat.python import cp_model
+except ImportError:  # pragma: no cover - exercised by deployment validation
+    cp_model = None
+
+INTEGER_ROW_BITS = 40
+INTEGER_OBJECTIVE_BITS = 50
+
+
+def integer_row_constraints(
+    coefficients: np.ndarray,
+    lower: float,
+    upper: float,
+) -> tuple[list[tuple[np.ndarray, int | None, int | None]], bool]:
+    """Express one real row over nonnegative columns as integer constraints.
+
+    Coefficients are multiplied by the smallest power of two that makes them
+    integral, up to ``INTEGER_ROW_BITS`` of row magnitude. A row that is still
+    fractional at that scale is rounded conservatively: upper sides round
+    coefficients up and the bound down, lower sides the reverse. Every
+    integer-feasible point is then feasible for the real row, although a few
+    real-feasible points may be cut off.
+
+    Returns:
+        One ``(coefficients, lower, upper)`` triple per emitted constraint and
+        whether the integer form is exact.
+    """
+    values = np.asarray(coefficients, dtype=np.float64)
+    magnitude = float(np.sum(np.abs(values)))
+    limit = INTEGER_ROW_BITS - (math.frexp(magnitude)[1] if magnitude > 0 else 0)
+    exponent, exact = _integral_exponent(values, max(limit, 0))
+    scaled = np.ldexp(values, exponent)
+    if exact:
+        integral = np.rint(scaled).astype(np.int64)
+        return [
+            (
+                integral,
+                math.ceil(math.ldexp(lower, exponent)) if np.isfinite(lower) else None,
+                math.floor(math.ldexp(upper, exponent)) if np.isfinite(upper) else None,
+            )
+        ], True
+    constraints: list[tuple[np.ndarray, int | None, int | None]] = []
+    if np.isfinite(upper):
+        constraints.append(
+            (
+                np.ceil(scaled).astype(np.int64),
+                None,
+                math.floor(math.ldexp(upper, exponent)),
+            )
+        )
+    if np.isfinite(lower):
+        constraints.append(
+            (
+                np.floor(scaled).astype(np.int64),
+                math.ceil(math.ldexp(lower, exponent)),
+                None,
+            )
+        )
+    return constraints, False
+
+
+def integer_objective(objective: np.ndarray) -> tuple[np.ndarray, int, float]:
+    """Scale objective costs to integers and bound the rounding error.
+
+    Returns:
+        Integer costs, their power-of-two exponent, and the largest objective
+        error over unit-bounded columns, in solver objective units.
+    """
+    values = np.asarray(objective, dtype=np.float64)
+    magnitude = float(np.sum(np.abs(values)))
+    limit = INTEGER_OBJECTIVE_BITS - (math.frexp(magnitude)[1] if magnitude > 0 else 0)
+    exponent, _ = _integral_exponent(values, max(limit, 0))
+    scaled = np.ldexp(values, exponent)
+    integral = np.rint(scaled)
+    error = math.ldexp(float(np.sum(np.abs(scaled - integral))), -exponent)
+    return integral.astype(np.int64), exponent, error
+
+
+def solve_with_cpsat(
+    model: CompiledOptimizationModel,
+    *,
+    time_limit_seconds: float | None = None,
+    relative_mip_gap: float = 0.0,
+    configuration: SolveConfiguration | None = None,
+    scenario: SolveScenario | None = None,
+    warm_start: np.ndarray | Sequence[float] | None = None,
+    progress_callback: Callable[[dict[str, object]], None] | None = None,
+    work_directory: str | Path | None = None,
+    incumbent_path: str | Path | None = None,
+    retain_warm_start: bool = False,
+) -> SolverResult:
+    """Solve a binary compiled model with the OR-Tools CP-SAT portfolio.
+
+    Planning-unit columns must be integer; selected-neighbour auxiliaries are
+    declared Boolean, which is exact because their McCormick rows over binary
+    units make every optimal auxiliary integral. Those rows are passed as
+    native implications, and the remaining rows and the objective are scaled
+    to integers as :func:`integer_row_constraints` and
+    :func:`integer_objective` describe. The result reports the real objective
+    of the returned columns. It is ``optimal`` only when CP-SAT proved
+    optimality and both scalings were exact; otherwise a solution is
+    ``feasible`` and its gap, when known, includes the objective rounding.
+
+    Warm starts become CP-SAT hints. HiGHS option names in the configuration
+    do not apply, and ``work_directory`` and ``retain_warm_start`` are accepted
+    only for interface parity with :func:`solve_with_highs`.
+
+    Raises:
+        RuntimeError: If OR-Tools is not installed or rejects the model.
+        ValueError: If the model has continuous planning-unit columns.
+    """
+    del work_directory, retain_warm_start
+    if cp_model is None:
+        raise RuntimeError("The CP-SAT solver backend requires the ortools package.")
+    resolved = configuration or SolveConfiguration(
+        time_limit_seconds=time_limit_seconds,
+        relative_mip_gap=relative_mip_gap,
+    )
+    started = time.perf_counter()
+    bounded = apply_solve_scenario(model, scenario)
+    primary_count = model.primary_variable_count
+    integrality = np.asarray(model.integrality)
+    if not np.all(integrality[:primary_count] != 0):
+        raise ValueError("CP-SAT requires integer planning-unit columns.")
+    lower = np.ceil(np.asarray(bounded.variable_lower, dtype=np.float64) - 1e-9)
+    upper = np.floor(np.asarray(bounded.variable_upper, dtype=np.float64) + 1e-9)
+    if np.any(~np.isfinite(lower)) or np.any(~np.isfinite(upper)):
+        raise ValueError("CP-SAT requires finite column bounds.")
+    if np.any(lower[primary_count:] < 0) or np.any(upper[primary_count:] > 1):
+        raise ValueError("CP-SAT requires unit-bounded auxiliary columns.")
+
+    solver_model = cp_model.CpModel()
+    variables = [
+        solver_model.NewIntVar(int(lower[column]), int(upper[column]), f"x{column}")
+        for column in range(model.variable_count)
+    ]
+    row_starts = np.asarray(model.row_starts, dtype=np.int64)
+    column_indices = np.asarray(model.column_indices, dtype=np.int64)
+    coefficients = np.asarray(model.coefficients, dtype=np.float64)
+    row_lower = np.asarray(bounded.row_lower, dtype=np.float64)
+    row_upper = np.asarray(bounded.row_upper, dtype=np.float64)
+    implication_rows = 0
+    rounded_rows = 0
+    for row in range(model.constraint_count):
+        start, stop = int(row_starts[row]), int(row_starts[row + 1])
+        columns = column_indices[start:stop]
+        values = coefficients[start:stop]
+        if _is_mccormick_row(columns, values, row_lower[row], row_upper[row], model):
+            positive = int(columns[values > 0][0])
+            negative = int(columns[values < 0][0])
+            solver_model.AddImplication(variables[positive], variables[negative])
+            implication_rows += 1
+            continue
+        constraints, exact = integer_row_constraints(
+            values, row_lower[row], row_upper[row]
+        )
+        rounded_rows += 0 if exact else 1
+        for integral, minimum, maximum in constraints:
+            expression = cp_model.LinearExpr.WeightedSum(
+                [variables[int(column)] for column in columns],
+                [int(value) for value in integral],
+            )
+            if minimum is not None:
+                solver_model.Add(expression >= minimum)
+            if maximum is not None:
+                solver_model.Add(expression <= maximum)
+
+    costs, objective_exponent, objective_error = integer_objective(model.objective)
+    objective = cp_model.LinearExpr.WeightedSum(
+        variables, [int(value) for value in costs]
+    )
+    if model.maximize:
+        solver_model.Maximize(objective)
+    else:
+        solver_model.Minimize(objective)
+
+    hint = None if warm_start is None else np.asarray(warm_start, dtype=np.float64)
+    if hint is None and scenario is None and resolved.warm_start_search:
+        hint, resolved = build_budgeted_warm_start(model, resolved)
+    hinted = hint is not None and hint.shape == (model.variable_count,)
+    if hinted:
+        for column in range(primary_count):
+            solver_model.AddHint(variables[column], int(round(float(hint[column]))))
+
+    solver = cp_model.CpSolver()
+    thread_count = resolved.thread_count or available_cpu_count()
+    solver.parameters.num_workers = int(thread_count)
+    solver.parameters.random_seed = int(resolved.random_seed)
+    solver.parameters.log_search_progress = bool(resolved.output_flag)
+    solver.parameters.relative_gap_limit = float(resolved.effective_relative_mip_gap)
+    if resolved.effective_absolute_mip_gap is not None:
+        solver.parameters.absolute_gap_limit = math.ldexp(
+            float(resolved.effective_absolute_mip_gap), objective_exponent
+        )
+    if resolved.time_limit_seconds is not None:
+        solver.parameters.max_time_in_seconds = float(resolved.time_limit_seconds)
+    model_load_seconds = time.perf_counter() - started
+
+    incumbent_lock = Lock()
+    incumbent_state = {"count": 0, "first_seconds": None, "last_emitted": 0.0}
+
+    def objective_of(columns: np.ndarray) -> float:
+        return float(np.dot(model.objective, columns) + model.objective_offset)
+
+    class _IncumbentCallback(cp_model.CpSolverSolutionCallback):
+        """Persist and report each improving CP-SAT incumbent."""
+
+        def on_solution_callback(self) -> None:
+            elapsed = time.perf_counter() - started
+            with incumbent_lock:
+                incumbent_state["count"] += 1
+                if incumbent_state["first_seconds"] is None:
+                    incumbent_state["first_seconds"] = elapsed
+                columns = np.asarray(
+                    [self.Value(variable) for variable in variables],
+                    dtype=np.float64,
+                )
+                value = objective_of(columns)
+                if incumbent_path is not None:
+                    write_incumbent(
+                        Path(incumbent_path),
+                        columns,
+                        {
+                            "objective_value": value,
+                            "elapsed_seconds": elapsed,
+                            "source": "cpsat_incumbent",
+                        },
+                    )
+                if progress_callback is not None and (
+                    elapsed - incumbent_state["last_emitted"] >= 1.0
+                ):
+                    incumbent_state["last_emitted"] = elapsed
+                    progress_callback(
+                        {
+                            "phase": "solving",
+                            "backend": "cpsat",
+                            "elapsed_seconds": elapsed,
+                            "incumbent_objective": value,
+                            "best_bound": math.ldexp(
+                                float(self.BestObjectiveBound()), -objective_exponent
+                            )
+                            + model.objective_offset,
+                            "incumbent_count": incumbent_state["count"],
+                        }
+                    )
+
+    solve_started = time.perf_counter()
+    outcome = solver.Solve(solver_model, _IncumbentCallback())
+    solve_seconds = time.perf_counter() - solve_started
+    if outcome == cp_model.MODEL_INVALID:
+        raise RuntimeError(
+            f"CP-SAT rejected the compiled model: {solver_model.Validate()}"
+        )
+    exact = rounded_rows == 0 and objective_error == 0
+    columns = None
+    objective_value = None
+    best_bound = None
+    gap = None
+    if outcome in {cp_model.OPTIMAL, cp_model.FEASIBLE}:
+        columns = np.asarray(
+            [solver.Value(variable) for variable in variables], dtype=np.float64
+        )
+        if not warm_start_is_feasible(bounded, columns):
+            raise RuntimeError("CP-SAT returned columns outside the compiled model.")
+        objective_value = objective_of(columns)
+        if rounded_rows == 0:
+            bound = math.ldexp(float(solver.BestObjectiveBound()), -objective_exponent)
+            best_bound = (
+                bound
+                + model.objective_offset
+                + (objective_error if model.maximize else -objective_error)
+            )
+            gap = abs(best_bound - objective_value) / max(abs(objective_value), 1e-9)
+    if outcome == cp_model.INFEASIBLE:
+        status = "infeasible" if rounded_rows == 0 else "unknown"
+    elif columns is None:
+        status = "time_limit_reached" if resolved.time_limit_seconds else "unknown"
+    elif outcome == cp_model.OPTIMAL and exact and gap is not None and gap <= 1e-12:
+        status = "optimal"
+    else:
+        status = "feasible"
+    termination_reason = solver.StatusName(outcome).lower()
+    if termination_reason == "optimal" and status != "optimal":
+        # Optimal for the scaled integer model only, so racing must not treat
+        # it as certified.
+        termination_reason = "optimal_scaled_model"
+    return SolverResult(
+        status=status,
+        objective_value=objective_value,
+        optimality_gap=gap,
+        runtime_seconds=time.perf_counter() - started,
+        solver_name="cpsat",
+        solver_version=_ortools_version(),
+        decisions=(
+            columns[:primary_count].copy()
+            if columns is not None
+            else np.empty(0, dtype=np.float64)
+        ),
+        termination_reason=termination_reason,
+        best_bound=best_bound,
+        absolute_gap=(
+            abs(objective_value - best_bound)
+            if objective_value is not None and best_bound is not None
+            else None
+        ),
+        node_count=int(solver.NumBranches()),
+        model_load_seconds=model_load_seconds,
+        solve_seconds=solve_seconds,
+        solver_settings={
+            "backend": "cpsat",
+            "time_limit_seconds": resolved.time_limit_seconds,
+            "relative_mip_gap": resolved.effective_relative_mip_gap,
+            "absolute_mip_gap": resolved.effective_absolute_mip_gap,
+            "thread_count": int(thread_count),
+            "random_seed": resolved.random_seed,
+            "mode": resolved.mode,
+            "objective_exponent": objective_exponent,
+            "objective_rounding_error": objective_error,
+            "rounded_rows": rounded_rows,
+            "implication_rows": implication_rows,
+            "warm_start_hinted": hinted,
+        },
+        native_columns=columns,
+        diagnostics={
+            "incumbent_count": incumbent_state["count"],
+            "first_incumbent_seconds": incumbent_state["first_seconds"],
+            "conflicts": int(solver.NumConflicts()),
+            "wall_time_seconds": float(solver.WallTime()),
+        },
+    )
+
+
+def _integral_exponent(values: np.ndarray, limit: int) -> tuple[int, bool]:
+    """Return the smallest power-of-two exponent that makes values integral."""
+    for exponent in range(limit + 1):
+        scaled = np.ldexp(values, exponent)
+        if np.all(scaled == np.rint(scaled)):
+            return exponent, True
+    return limit, False
+
+
+def _is_mccormick_row(
+    columns: np.ndarray,
+    values: np.ndarray,
+    lower: float,
+    upper: float,
+    model: CompiledOptimizationModel,
+) -> bool:
+    """Recognize ``auxiliary - unit <= 0`` selected-neighbour rows."""
+    if len(columns) != 2 or upper != 0 or np.isfinite(lower):
+        return False
+    if sorted(values.tolist()) != [-1.0, 1.0]:
+        return False
+    positive = int(columns[values > 0][0])
+    return positive >= model.primary_variable_count
+
+
+def _ortools_version() -> str:
+    """Return the installed OR-Tools version string."""
+    import ortools
+
+    return str(ortools.__version__)
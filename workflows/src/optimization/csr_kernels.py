@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from .model import CompiledOptimizationModel
+from ..utils.cpu import available_cpu_count
+
+NONZERO_BATCH_SIZE = 1_048_576
+MINIMUM_PARTITION_NONZEROS = 262_144
+
+
+@dataclass(frozen=True)
+class ColumnEvaluation:
+    """Row activities and fused feasibility measures for one column vector.
+
+    Violations are absolute and, when row exponents are supplied, measured in
+    the unscaled row units. ``objective_value`` includes the model offset.
+    """
+
+    activities: np.ndarray
+    objective_value: float
+    maximum_row_violation: float
+    maximum_bound_violation: float
+    maximum_integrality_violation: float
+
+    def is_feasible(self, tolerance: float) -> bool:
+        """Return whether every violation is within ``tolerance``."""
+        return (
+            self.maximum_row_violation <= tolerance
+            and self.maximum_bound_violation <= tolerance
+            and self.maximum_integrality_violation <= tolerance
+        )
+
+
+def row_partitions(
+    row_starts: np.ndarray,
+    parts: int,
+    *,
+    minimum_nonzeros: int = MINIMUM_PARTITION_NONZEROS,
+) -> np.ndarray:
+    """Split CSR rows into at most ``parts`` ranges of similar nonzero counts.
+
+    Returns ``parts + 1`` or fewer increasing row boundaries from 0 to the row
+    count. Only the boundaries are searched, so the cost is independent of the
+    nonzero count, and no range is made smaller than ``minimum_nonzeros``
+    unless the matrix is.
+    """
+    row_count = len(row_starts) - 1
+    if row_count <= 0:
+        return np.zeros(2, dtype=np.int64)
+    nonzeros = int(row_starts[row_count])
+    parts = max(1, min(parts, nonzeros // max(1, minimum_nonzeros), row_count))
+    targets = np.linspace(0, nonzeros, parts + 1)[1:-1]
+    interior = np.searchsorted(np.asarray(row_starts), targets, side="left")
+    return np.unique(
+        np.concatenate(([0], np.clip(interior, 0, row_count), [row_count]))
+    ).astype(np.int64)
+
+
+def evaluate_columns(
+    model: CompiledOptimizationModel,
+    columns: np.ndarray,
+    *,
+    variable_upper: np.ndarray | None = None,
+    row_exponents: np.ndarray | None = None,
+    thread_count: int | None = None,
+    nonzero_batch_size: int = NONZERO_BATCH_SIZE,
+) -> ColumnEvaluation:
+    """Evaluate activities, violations, and the objective in one threaded pass.
+
+    Rows are partitioned by nonzero count and each worker walks its range in
+    bounded batches, locating row boundaries by pointer arithmetic on
+    ``row_starts`` rather than a search per nonzero. The same worker measures
+    the row violations of its range and the bound, integrality, and objective
+    terms of an equal share of the columns, so each memory-mapped array is read
+    once. ``row_exponents`` unscale activities and row bounds before row
+    violations are measured.
+    """
+    values = np.asarray(columns, dtype=np.float64)
+    if values.shape != (model.variable_count,):
+        raise ValueError("Columns must contain one value per solver column.")
+    upper = model.variable_upper if variable_upper is None else variable_upper
+    workers = thread_count or available_cpu_count()
+    boundaries = row_partitions(model.row_starts, workers)
+    ranges = len(boundaries) - 1
+    column_boundaries = np.linspace(0, model.variable_count, ranges + 1).astype(
+        np.int64
+    )
+    activities = np.zeros(model.constraint_count, dtype=np.float64)
+
+    def evaluate(part: int) -> tuple[float, float, float, float]:
+        first_row, last_row = int(boundaries[part]), int(boundaries[part + 1])
+        _accumulate_range(
+            model, values, activities, first_row, last_row, nonzero_batch_size
+        )
+        row_violation = _maximum_violation(
+            activities,
+            model.row_lower,
+            model.row_upper,
+            first_row,
+            last_row,
+            exponents=row_exponents,
+        )
+        first_column = int(column_boundaries[part])
+        last_column = int(column_boundaries[part + 1])
+        bound_violation = _maximum_violation(
+            values, model.variable_lower, upper, first_column, last_column
+        )
+        integrality_violation = 0.0
+        objective = 0.0
+        for start in range(first_column, last_column, NONZERO_BATCH_SIZE):
+            stop = min(start + NONZERO_BATCH_SIZE, last_column)
+            batch = values[start:stop]
+            integer = np.asarray(model.integrality[start:stop]) != 0
+            integrality_violation = max(
+                integrality_violation,
+                float(
+                    np.max(
+                        np.abs(batch[integer] - np.rint(batch[integer])), initial=0.0
+                    )
+                ),
+            )
+            objective += float(np.dot(np.asarray(model.objective[start:stop]), batch))
+        return row_violation, bound_violation, integrality_violation, objective
+
+    if ranges == 1:
+        partials = [evaluate(0)]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=ranges, thread_name_prefix="csr-kernel"
+        ) as pool:
+            partials = list(pool.map(evaluate, range(ranges)))
+    return ColumnEvaluation(
+        activities=activities,
+        objective_value=math.fsum(partial[3] for partial in partials)
+        + float(model.objective_offset),
+        maximum_row_violation=max(partial[0] for partial in partials),
+        maximum_bound_violation=max(partial[1] for partial in partials),
+        maximum_integrality_violation=max(partial[2] for partial in partials),
+    )
+
+
+def threaded_row_activities(
+    model: CompiledOptimizationModel,
+    columns: np.ndarray,
+    *,
+    thread_count: int | None = None,
+    nonzero_batch_size: int = NONZERO_BATCH_SIZE,
+) -> np.ndarray:
+    """Return ``A @ columns`` with rows split across a thread pool."""
+    values = np.asarray(columns, dtype=np.float64)
+    boundaries = row_partitions(model.row_starts, thread_count or available_cpu_count())
+    activities = np.zeros(model.constraint_count, dtype=np.float64)
+    ranges = len(boundaries) - 1
+    if ranges == 1:
+        _accumulate_range(
+            model, values, activities, 0, model.constraint_count, nonzero_batch_size
+        )
+        return activities
+    with ThreadPoolExecutor(
+        max_workers=ranges, thread_name_prefix="csr-kernel"
+    ) as pool:
+        list(
+            pool.map(
+                lambda part: _accumulate_range(
+                    model,
+                    values,
+                    activities,
+                    int(boundaries[part]),
+                    int(boundaries[part + 1]),
+                    nonzero_batch_size,
+                ),
+                range(ranges),
+            )
+        )
+    return activities
+
+
+def _accumulate_range(
+    model: CompiledOptimizationModel,
+    columns: np.ndarray,
+    activities: np.ndarray,
+    first_row: int,
+    last_row: int,
+    nonzero_batch_size: int,
+) -> None:
+    """Add one row range's activities in bounded nonzero batches.
+
+    Each batch searches only its two end positions among the row pointers;
+    within the batch, clipped row pointers give ``reduceat`` offsets directly.
+    Rows longer than a batch are accumulated across batches.
+    """
+    row_starts = model.row_starts
+    begin, end = int(row_starts[first_row]), int(row_starts[last_row])
+    for start in range(begin, end, nonzero_batch_size):
+        stop = min(start + nonzero_batch_size, end)
+        first = int(np.searchsorted(row_starts, start, side="right")) - 1
+        last = int(np.searchsorted(row_starts, stop, side="left"))
+        offsets = (
+            np.clip(
+                np.asarray(row_starts[first : last + 1], dtype=np.int64), start, stop
+            )
+            - start
+        )
+        nonempty = np.flatnonzero(offsets[1:] > offsets[:-1])
+        if nonempty.size == 0:
+            continue
+        weighted = (
+            np.asarray(model.coefficients[start:stop])
+            * columns[np.asarray(model.column_indices[start:stop], dtype=np.int64)]
+        )
+        activities[first + nonempty] += np.add.reduceat(weighted, offsets[nonempty])
+
+
+def _maximum_violation(
+    values: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    first: int,
+    last: int,
+    *,
+    exponents: np.ndarray | None = None,
+) -> float:
+    """Return how far ``values[first:last]`` leave their bounds, in batches.
+
+    With ``exponents``, values and bounds are unscaled by ``2**-exponent``
+    before they are compared.
+    """
+    maximum = 0.0
+    for start in range(first, last, NONZERO_BATCH_SIZE):
+        stop = min(start + NONZERO_BATCH_SIZE, last)
+        batch = np.asarray(values[start:stop])
+        lower_batch = np.asarray(lower[start:stop])
+        upper_batch = np.asarray(upper[start:stop])
+        if exponents is not None:
+            negated = -np.asarray(exponents[start:stop])
+            batch = np.ldexp(batch, negated)
+            lower_batch = np.ldexp(lower_batch, negated)
+            upper_batch = np.ldexp(upper_batch, negated)
+        maximum = max(
+            maximum,
+            float(np.max(lower_batch - batch, initial=0.0)),
+            float(np.max(batch - upper_batch, initial=0.0)),
+        )
+    return maximum
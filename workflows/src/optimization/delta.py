@@ -0,0 +1,435 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Literal, Mapping, Sequence
+
+import numpy as np
+
+from .artifact import (
+    CompiledArtifactManifest,
+    LoadedCompiledArtifact,
+    write_compiled_artifact,
+)
+from .conditioning import NumericalScaling
+from .model import (
+    ColumnBoundOverride,
+    CompiledOptimizationModel,
+    RowBoundOverride,
+    SolveScenario,
+)
+from .neighbor import NeighborPenaltySpecification, resolve_neighbor_normalization
+from .objective import resolve_objective_normalization
+
+DELTA_METHOD = "objective_weight_and_row_bound_delta"
+DELTA_METHOD_VERSION = 1
+DOMAIN_PRESOLVE_TOLERANCE = 1e-12
+
+AggregateBounds = Mapping[str, Sequence[tuple[float | None, float | None]]]
+
+
+@dataclass(frozen=True)
+class ModelDelta:
+    """Solve-only changes that turn a base compiled model into a derived one.
+
+    ``objective`` and ``objective_offset`` are in the base artifact's solver
+    units, so the base numerical scaling still applies unchanged; the
+    scenario carries every changed aggregate row bound and one fixed column
+    bound per locked candidate.
+    """
+
+    scenario: SolveScenario
+    objective: np.ndarray
+    objective_offset: float
+    objectives: tuple[dict[str, object], ...]
+    neighbor_penalty: dict[str, object] | None
+    aggregate_rows: tuple[dict[str, object], ...]
+    planning_unit_locks: dict[str, object]
+    changes: dict[str, object]
+
+
+def structural_definition_hash(definition: Mapping[str, object]) -> str:
+    """Hash a problem definition with its delta-eligible values masked.
+
+    Objective importance, neighbor strength, aggregate bound values, and
+    planning-unit locks are removed; which aggregate bound sides exist is kept
+    because it decides the compiled rows and the domain presolve.
+    """
+    value = json.loads(json.dumps(definition, sort_keys=True))
+    if isinstance(value.get("constraints"), list):
+        value["constraints"] = [
+            constraint
+            for constraint in value["constraints"]
+            if constraint.get("type") != "lock"
+        ]
+    for objective in value.get("objectives") or []:
+        objective.pop("importance", None)
+    for constraint in value.get("constraints") or []:
+        if constraint.get("type") == "aggregate":
+            for side in ("min", "max"):
+                constraint[side] = constraint.get(side) is not None
+    if isinstance(value.get("neighbor_penalty"), dict):
+        value["neighbor_penalty"].pop("strength", None)
+    value["delta_method"] = [DELTA_METHOD, DELTA_METHOD_VERSION]
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+def resolve_model_delta(
+    artifact: LoadedCompiledArtifact,
+    *,
+    objective_importance: Mapping[str, float],
+    neighbor_strength: float | None,
+    aggregate_bounds: AggregateBounds,
+    planning_unit_locks: np.ndarray | None = None,
+    neighbor_edge_count: int | None = None,
+) -> ModelDelta:
+    """Express new weights and bounds as changes to a compiled artifact.
+
+    Objective coefficients are rebuilt from the stored canonical per-layer
+    arrays and normalization scales, which do not depend on weights or
+    bounds. The base compile's fixed-in neighbor terms are recovered from the
+    difference between its objective and its own canonical terms.
+
+    ``planning_unit_locks`` holds one -1/free, 0/out, 1/in state per planning
+    unit and becomes fixed column bounds, so the base compile must not have
+    applied locks itself. Lock-outs shrink the attainable neighbor-edge count,
+    which the caller passes as ``neighbor_edge_count``.
+
+    Raises:
+        ValueError: If the change cannot be expressed over the base CSR
+            structure, for example because a bound would activate a row the
+            base compile dropped, or new weights could make a unit removed by
+            domain presolve worth selecting, or a lock-in targets such a unit.
+    """
+    provenance = artifact.manifest.provenance
+    base_objectives = provenance.get("objectives")
+    base_rows = provenance.get("aggregate_rows")
+    if not isinstance(base_objectives, list) or not isinstance(base_rows, list):
+        raise ValueError("Base artifact predates delta recompilation metadata.")
+    if {str(entry["layer"]) for entry in base_objectives} != set(objective_importance):
+        raise ValueError("Objective layers differ from the base compile.")
+    base_neighbor = provenance.get("neighbor_penalty")
+    if (base_neighbor is None) != (neighbor_strength is None):
+        raise ValueError("Neighbor penalty presence differs from the base compile.")
+
+    model = artifact.model
+    scaling = NumericalScaling.from_provenance(provenance) or NumericalScaling()
+    primary_count = model.primary_variable_count
+    candidate_sources = np.asarray(artifact.candidate_source_indices, dtype=np.int64)
+    fixed_sources = np.asarray(artifact.fixed_source_indices, dtype=np.int64)
+    fixed_values = np.asarray(artifact.fixed_values)
+    planning_unit_count = len(candidate_sources) + len(fixed_sources)
+    fixed_in = fixed_sources[fixed_values == 1]
+    fixed_out = fixed_sources[fixed_values == 0]
+    locks = (
+        np.asarray(planning_unit_locks, dtype=np.int8)
+        if planning_unit_locks is not None
+        else np.full(planning_unit_count, -1, dtype=np.int8)
+    )
+    if locks.shape != (planning_unit_count,):
+        raise ValueError("Planning-unit locks do not match the base compile.")
+    base_locks = provenance.get("planning_unit_locks") or {}
+    if np.any(locks >= 0) and (
+        int(base_locks.get("fixed_in", 0)) or int(base_locks.get("fixed_out", 0))
+    ):
+        raise ValueError("Base compile already applied planning-unit locks.")
+    if np.any(locks[fixed_out] == 1):
+        raise ValueError("Lock-in targets units removed by domain presolve.")
+
+    objectives = tuple(
+        {
+            **resolve_objective_normalization(
+                layer=str(entry["layer"]),
+                direction=str(entry["direction"]),
+                importance=float(objective_importance[str(entry["layer"])]),
+                attainable_scale=float(entry["normalization_scale"]),
+                selection_count=int(entry["selection_count"]),
+            ).to_dict(),
+            "canonical_indices_array": entry["canonical_indices_array"],
+            "canonical_values_array": entry["canonical_values_array"],
+        }
+        for entry in base_objectives
+    )
+    base_fused = _fused_objective(artifact, base_objectives, planning_unit_count)
+    fused = _fused_objective(artifact, objectives, planning_unit_count)
+    neighbor_penalty = None
+    base_coefficient = coefficient = 0.0
+    if neighbor_strength is not None and isinstance(base_neighbor, dict):
+        neighbor_penalty = resolve_neighbor_normalization(
+            NeighborPenaltySpecification(strength=float(neighbor_strength)),
+            (
+                int(neighbor_edge_count)
+                if neighbor_edge_count is not None
+                else int(base_neighbor["normalization_scale"])
+            ),
+        ).to_dict()
+        base_coefficient = float(base_neighbor["resolved_coefficient"])
+        coefficient = float(neighbor_penalty["resolved_coefficient"])
+
+    exponent = scaling.objective_exponent
+    base_objective = np.ldexp(np.asarray(model.objective, dtype=np.float64), -exponent)
+    residual = base_objective[:primary_count] - base_fused[candidate_sources]
+    offset_residual = math.ldexp(model.objective_offset, -exponent) - float(
+        np.sum(base_fused[fixed_in])
+    )
+    unary_counts = np.zeros(primary_count, dtype=np.float64)
+    selected_pair_count = 0.0
+    if base_coefficient > 0:
+        unary_counts = np.rint(residual / base_coefficient)
+        selected_pair_count = float(np.rint(offset_residual / base_coefficient))
+    magnitude = max(float(np.max(np.abs(base_objective), initial=0.0)), 1e-300)
+    if not np.allclose(
+        residual, unary_counts * base_coefficient, rtol=1e-9, atol=1e-9 * magnitude
+    ):
+        raise ValueError("Base objective does not decompose into canonical terms.")
+
+    if fixed_out.size and not provenance.get("preserve_primary_domain"):
+        # Presolve fixed these units out because their best marginal value,
+        # direct + coefficient * attainable neighbors, was not positive.
+        # Scaling the neighbor coefficient by r keeps that proof when the
+        # direct value does not grow faster than r times the old one.
+        ratio = coefficient / base_coefficient if base_coefficient > 0 else 0.0
+        dominated = fused[fixed_out] <= (
+            ratio * base_fused[fixed_out] + DOMAIN_PRESOLVE_TOLERANCE
+        )
+        if not np.all(dominated):
+            raise ValueError(
+                "New objective weights could select units removed by domain presolve."
+            )
+
+    objective = np.empty(model.variable_count, dtype=np.float64)
+    objective[:primary_count] = fused[candidate_sources] + coefficient * unary_counts
+    objective[primary_count:] = coefficient
+    objective_offset = float(np.sum(fused[fixed_in])) + (
+        coefficient * selected_pair_count
+    )
+
+    row_exponents = scaling.row_exponent_vector(model.constraint_count)
+    overrides: list[RowBoundOverride] = []
+    aggregate_rows: list[dict[str, object]] = []
+    bound_changes: list[dict[str, object]] = []
+    requested = {
+        (str(layer), index, side): value
+        for layer, constraints in aggregate_bounds.items()
+        for index, (minimum, maximum) in enumerate(constraints)
+        for side, value in (("minimum", minimum), ("maximum", maximum))
+        if value is not None
+    }
+    if requested.keys() != {
+        (str(row["layer"]), int(row["constraint_index"]), str(row["side"]))
+        for row in base_rows
+    }:
+        raise ValueError("Aggregate bound sides differ from the base compile.")
+    for row in base_rows:
+        side = str(row["side"])
+        bound = float(
+            requested[(str(row["layer"]), int(row["constraint_index"]), side)]
+        )
+        aggregate_rows.append({**row, "bound": bound})
+        if bound == float(row["bound"]):
+            continue
+        adjusted = bound - float(row["fixed_in_contribution"])
+        row_index = row["row_index"]
+        bound_changes.append(
+            {
+                "layer": row["layer"],
+                "constraint_index": row["constraint_index"],
+                "side": side,
+                "from": row["bound"],
+                "to": bound,
+                "row_index": row_index,
+            }
+        )
+        if row_index is None:
+            redundant = (
+                adjusted <= float(row["possible_minimum"])
+                if side == "minimum"
+                else adjusted >= float(row["possible_maximum"])
+            )
+            if not redundant:
+                raise ValueError(
+                    "Bound change activates a row the base compile dropped: "
+                    f"{row['layer']}_{side}."
+                )
+            continue
+        index = int(row_index)
+        scaled = math.ldexp(adjusted, int(row_exponents[index]))
+        overrides.append(
+            RowBoundOverride(
+                row_index=index,
+                lower=scaled if side == "minimum" else float(model.row_lower[index]),
+                upper=scaled if side == "maximum" else float(model.row_upper[index]),
+            )
+        )
+
+    column_locks = locks[candidate_sources]
+    locked_columns = np.flatnonzero(column_locks >= 0)
+    column_overrides = tuple(
+        ColumnBoundOverride(
+            column_index=int(column),
+            lower=float(column_locks[column]),
+            upper=float(column_locks[column]),
+        )
+        for column in locked_columns
+    )
+    lock_counts = {
+        "application": "column_bounds",
+        "fixed_in": int(np.count_nonzero(locks == 1)),
+        "fixed_out": int(np.count_nonzero(locks == 0)),
+    }
+
+    changes: dict[str, object] = {
+        "objectives": {
+            str(base["layer"]): {"from": base["importance"], "to": new["importance"]}
+            for base, new in zip(base_objectives, objectives, strict=True)
+            if float(base["importance"]) != float(new["importance"])
+        },
+        "neighbor_strength": (
+            {"from": base_neighbor["strength"], "to": neighbor_penalty["strength"]}
+            if isinstance(base_neighbor, dict)
+            and neighbor_penalty is not None
+            and float(base_neighbor["strength"]) != float(neighbor_penalty["strength"])
+            else None
+        ),
+        "bounds": bound_changes,
+        "locks": (
+            {key: lock_counts[key] for key in ("fixed_in", "fixed_out")}
+            if locked_columns.size or lock_counts["fixed_out"]
+            else None
+        ),
+    }
+    scenario_id = hashlib.sha256(
+        json.dumps(changes, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return ModelDelta(
+        scenario=SolveScenario(
+            scenario_id=f"delta-{scenario_id[:16]}",
+            row_bounds=tuple(overrides),
+            column_bounds=column_overrides,
+        ),
+        objective=np.ldexp(objective, exponent),
+        objective_offset=math.ldexp(objective_offset, exponent),
+        objectives=objectives,
+        neighbor_penalty=neighbor_penalty,
+        aggregate_rows=tuple(aggregate_rows),
+        planning_unit_locks=lock_counts,
+        changes=changes,
+    )
+
+
+def apply_model_delta(
+    model: CompiledOptimizationModel, delta: ModelDelta
+) -> CompiledOptimizationModel:
+    """Return the base model with the delta's objective, row and column bounds."""
+    row_lower = np.asarray(model.row_lower, dtype=np.float64).copy()
+    row_upper = np.asarray(model.row_upper, dtype=np.float64).copy()
+    for override in delta.scenario.row_bounds:
+        row_lower[override.row_index] = override.lower
+        row_upper[override.row_index] = override.upper
+    variable_lower = np.asarray(model.variable_lower, dtype=np.float64).copy()
+    variable_upper = np.asarray(model.variable_upper, dtype=np.float64).copy()
+    for column in delta.scenario.column_bounds:
+        variable_lower[column.column_index] = column.lower
+        variable_upper[column.column_index] = column.upper
+    return replace(
+        model,
+        objective=delta.objective,
+        objective_offset=delta.objective_offset,
+        row_lower=row_lower,
+        row_upper=row_upper,
+        variable_lower=variable_lower,
+        variable_upper=variable_upper,
+    )
+
+
+def write_derived_artifact(
+    base: LoadedCompiledArtifact,
+    delta: ModelDelta,
+    directory: str | Path,
+    *,
+    problem_definition_hash: str,
+    encoding: Literal["raw", "zstd"] = "raw",
+) -> CompiledArtifactManifest:
+    """Commit the base artifact with a delta applied as a new immutable artifact.
+
+    Matrix, mapping, and canonical arrays are copied byte for byte, so only
+    the objective and bound arrays change checksum. The derived
+    mathematical-model hash is computed from its own arrays as usual, and
+    ``derived_from`` records the base identities and the applied changes.
+    """
+    provenance = base.manifest.provenance
+    return write_compiled_artifact(
+        apply_model_delta(base.model, delta),
+        directory,
+        problem_definition_hash=problem_definition_hash,
+        candidate_planning_unit_ids=base.candidate_planning_unit_ids,
+        candidate_source_indices=base.candidate_source_indices,
+        fixed_planning_unit_ids=base.fixed_planning_unit_ids,
+        fixed_source_indices=base.fixed_source_indices,
+        fixed_values=base.fixed_values,
+        provenance={
+            **provenance,
+            "objectives": list(delta.objectives),
+            "neighbor_penalty": delta.neighbor_penalty,
+            "aggregate_rows": list(delta.aggregate_rows),
+            "planning_unit_locks": delta.planning_unit_locks,
+            "derived_from": {
+                "method": DELTA_METHOD,
+                "method_version": DELTA_METHOD_VERSION,
+                "problem_definition_hash": base.manifest.problem_definition_hash,
+                "mathematical_model_hash": base.manifest.mathematical_model_hash,
+                "artifact_content_hash": base.manifest.artifact_content_hash,
+                "scenario_id": delta.scenario.scenario_id,
+                "changes": delta.changes,
+            },
+        },
+        actual_dimensions=base.manifest.actual_dimensions,
+        additional_arrays={
+            **{
+                str(entry[name]): base.arrays[str(entry[name])]
+                for entry in delta.objectives
+                for name in ("canonical_indices_array", "canonical_values_array")
+            },
+            **_neighbor_reconstruction_arrays(base),
+        },
+        encoding=encoding,
+    )
+
+
+def _neighbor_reconstruction_arrays(
+    artifact: LoadedCompiledArtifact,
+) -> dict[str, np.ndarray]:
+    """Carry the base compile's neighbor reconstruction array, if it has one."""
+    metadata = artifact.manifest.provenance.get("neighbor_reconstruction")
+    if not isinstance(metadata, dict):
+        return {}
+    name = str(metadata["fixed_in_counts_array"])
+    return {name: artifact.arrays[name]}
+
+
+def _fused_objective(
+    artifact: LoadedCompiledArtifact,
+    objectives: Sequence[Mapping[str, object]],
+    planning_unit_count: int,
+) -> np.ndarray:
+    """Sum resolved coefficients times canonical values per planning unit."""
+    fused = np.zeros(planning_unit_count, dtype=np.float64)
+    for entry in objectives:
+        coefficient = float(entry["resolved_coefficient"])
+        if coefficient == 0:
+            continue
+        np.add.at(
+            fused,
+            np.asarray(artifact.arrays[str(entry["canonical_indices_array"])]),
+            coefficient
+            * np.asarray(
+                artifact.arrays[str(entry["canonical_values_array"])],
+                dtype=np.float64,
+            ),
+        )
+    return fused
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import multiprocessing
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from .highs import HighsModelSession
+from .model import CompiledOptimizationModel, SolveConfiguration
+from .shared_model import (
+    SharedModelReference,
+    attach_compiled_model,
+    run_worker_processes,
+    share_compiled_model,
+)
+from ..utils.cpu import available_cpu_count
+
+ENSEMBLE_METHOD = "seeded_objective_perturbation"
+ENSEMBLE_METHOD_VERSION = 1
+
+
+@dataclass(frozen=True)
+class EnsembleMember:
+    """Outcome of one randomized ensemble solve.
+
+    ``objective_value`` is measured against the member's own, possibly
+    perturbed, objective in solver units.
+    """
+
+    member: int
+    random_seed: int
+    status: str
+    objective_value: float | None
+    optimality_gap: float | None
+    runtime_seconds: float
+    worker: int
+    counted: bool
+
+
+@dataclass(frozen=True)
+class SelectionEnsemble:
+    """Per-column selection totals accumulated over randomized solves.
+
+    ``selection_totals`` is a memory-mapped float64 vector over candidate
+    columns: selection counts for discrete models and summed allocations for
+    continuous ones. Members without a solution are listed but not counted.
+    """
+
+    selection_totals: np.ndarray
+    members: tuple[EnsembleMember, ...]
+    perturbation: float
+    worker_count: int
+    runtime_seconds: float
+
+    @property
+    def counted_members(self) -> int:
+        """Return the number of solves that contributed a selection."""
+        return sum(1 for member in self.members if member.counted)
+
+    def selection_frequency(self) -> np.ndarray:
+        """Return each candidate column's selection frequency in [0, 1]."""
+        if self.counted_members == 0:
+            raise ValueError("No ensemble member returned a solution.")
+        return np.asarray(self.selection_totals, dtype=np.float64) / (
+            self.counted_members
+        )
+
+
+def perturbed_objective(
+    model: CompiledOptimizationModel, random_seed: int, perturbation: float
+) -> np.ndarray:
+    """Scale each planning-unit cost by an independent factor in [1-p, 1+p].
+
+    Neighbor columns keep their coefficients, so only the value of individual
+    units is randomized, and the draw depends on the seed alone.
+    """
+    objective = np.asarray(model.objective, dtype=np.float64).copy()
+    if perturbation > 0:
+        factors = np.random.default_rng(random_seed).uniform(
+            1.0 - perturbation, 1.0 + perturbation, model.primary_variable_count
+        )
+        objective[: model.primary_variable_count] *= factors
+    return objective
+
+
+def solve_selection_ensemble(
+    model: CompiledOptimizationModel,
+    *,
+    member_count: int,
+    configuration: SolveConfiguration,
+    totals_path: str | Path,
+    perturbation: float = 0.0,
+    worker_count: int | None = None,
+    progress_callback: Callable[[dict[str, object]], None] | None = None,
+) -> SelectionEnsemble:
+    """Solve one compiled model many times and count each unit's selections.
+
+    Member ``k`` uses seed ``configuration.random_seed + k`` and, with a
+    positive ``perturbation``, the planning-unit costs from
+    :func:`perturbed_objective` under that seed, so every member is
+    reproducible on its own. Workers share the memory-mapped model, keep one
+    HiGHS session each, and pull members from a common queue, so a slow solve
+    never idles the others. Selections are added to ``totals_path`` as each
+    member finishes.
+
+    Args:
+        model: Complete compiled optimization model, ideally memory-mapped.
+        member_count: Number of randomized solves.
+        configuration: Solve policy applied to every member.
+        totals_path: Destination of the float64 selection totals.
+        perturbation: Relative half-width of the objective noise in [0, 1).
+        worker_count: Parallel workers, by default one per available thread.
+        progress_callback: Optional receiver for per-member completions.
+
+    Returns:
+        Totals, member outcomes, and the resolved worker count.
+    """
+    if member_count <= 0:
+        raise ValueError("Ensemble member count must be positive.")
+    if not 0 <= perturbation < 1:
+        raise ValueError("Ensemble perturbation must be in [0, 1).")
+    total_threads = configuration.thread_count or available_cpu_count()
+    workers = min(worker_count or total_threads, member_count)
+    if workers <= 0:
+        raise ValueError("Ensemble worker count must be positive.")
+    started = time.perf_counter()
+    destination = Path(totals_path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    totals = np.lib.format.open_memmap(
+        destination,
+        mode="w+",
+        dtype=np.float64,
+        shape=(model.primary_variable_count,),
+    )
+    totals[:] = 0.0
+    discrete = bool(
+        np.any(np.asarray(model.integrality[: model.primary_variable_count]) != 0)
+    )
+    members: list[EnsembleMember] = []
+
+    def record(member: EnsembleMember, selection: np.ndarray | None) -> None:
+        if selection is not None:
+            totals[:] += (
+                np.unpackbits(selection, count=len(totals))
+                if discrete
+                else np.asarray(selection, dtype=np.float64)
+            )
+        members.append(member)
+        if progress_callback is not None:
+            progress_callback(
+                {
+                    "phase": "ensemble_member",
+                    "completed_members": len(members),
+                    "member_count": member_count,
+                    "status": member.status,
+                    "elapsed_seconds": time.perf_counter() - started,
+                }
+            )
+
+    worker_configuration = replace(
+        configuration,
+        thread_count=max(1, total_threads // workers),
+        race_profiles=(),
+        memory_limit_fraction=(
+            configuration.memory_limit_fraction / workers
+            if configuration.memory_limit_fraction is not None
+            else None
+        ),
+    )
+    if workers == 1:
+        with HighsModelSession(model, configuration=worker_configuration) as session:
+            for member in range(member_count):
+                record(
+                    *_solve_member(
+                        session, model, member, worker_configuration, perturbation, 0
+                    )
+                )
+    else:
+        _run_ensemble_workers(
+            model,
+            member_count,
+            worker_configuration,
+            perturbation,
+            workers,
+            record,
+        )
+    totals.flush()
+    return SelectionEnsemble(
+        selection_totals=totals,
+        members=tuple(sorted(members, key=lambda value: value.member)),
+        perturbation=perturbation,
+        worker_count=workers,
+        runtime_seconds=time.perf_counter() - started,
+    )
+
+
+def _run_ensemble_workers(
+    model: CompiledOptimizationModel,
+    member_count: int,
+    configuration: SolveConfiguration,
+    perturbation: float,
+    workers: int,
+    record: Callable[[EnsembleMember, np.ndarray | None], None],
+) -> None:
+    """Fan members out to spawned workers and record each as it arrives."""
+    reference = share_compiled_model(model)
+    context = multiprocessing.get_context("spawn")
+    tasks: multiprocessing.Queue = context.Queue()
+    results: multiprocessing.Queue = context.Queue()
+    for member in range(member_count):
+        tasks.put(member)
+    for _ in range(workers):
+        tasks.put(None)
+
+    def on_result(
+        worker: int, payload: tuple[EnsembleMember, np.ndarray | None]
+    ) -> None:
+        """Record one member as soon as its worker reports it."""
+        record(*payload)
+
+    try:
+        failures = run_worker_processes(
+            context,
+            {
+                worker: (
+                    _ensemble_worker,
+                    (worker, reference, configuration, perturbation, tasks, results),
+                )
+                for worker in range(workers)
+            },
+            results,
+            on_result,
+            name_prefix="highs-ensemble",
+        )
+    finally:
+        tasks.close()
+    if failures:
+        raise RuntimeError(
+            "Ensemble workers failed: "
+            + "; ".join(
+                f"worker {worker}: {error}" for worker, error in failures.items()
+            )
+        )
+
+
+def _ensemble_worker(
+    worker: int,
+    reference: SharedModelReference,
+    configuration: SolveConfiguration,
+    perturbation: float,
+    tasks: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+) -> None:
+    """Solve queued members in one session until the queue is drained."""
+    try:
+        model = attach_compiled_model(reference)
+        with HighsModelSession(model, configuration=configuration) as session:
+            while (member := tasks.get()) is not None:
+                outcome, selection = _solve_member(
+                    session, model, member, configuration, perturbation, worker
+                )
+                results.put((worker, (outcome, selection)))
+        results.put((worker, None))
+    except Exception as error:
+        results.put((worker, f"{type(error).__name__}: {error}"))
+
+
+def _solve_member(
+    session: HighsModelSession,
+    model: CompiledOptimizationModel,
+    member: int,
+    configuration: SolveConfiguration,
+    perturbation: float,
+    worker: int,
+) -> tuple[EnsembleMember, np.ndarray | None]:
+    """Solve one member and return its compact selection."""
+    seed = configuration.random_seed + member
+    session.change_random_seed(seed)
+    if perturbation > 0:
+        session.change_objective(
+            perturbed_objective(model, seed, perturbation), model.objective_offset
+        )
+    result = session.solve()
+    selection = None
+    if result.native_columns is not None:
+        primary = np.asarray(result.native_columns[: model.primary_variable_count])
+        selection = (
+            np.packbits(primary >= 0.5)
+            if np.any(np.asarray(model.integrality[: len(primary)]) != 0)
+            else primary.astype(np.float32)
+        )
+    return (
+        EnsembleMember(
+            member=member,
+            random_seed=seed,
+            status=result.status,
+            objective_value=result.objective_value,
+            optimality_gap=result.optimality_gap,
+            runtime_seconds=result.runtime_seconds,
+            worker=worker,
+            counted=selection is not None,
+        ),
+        selection,
+    )
@@ -53,6 +53,33 @@ def grid_cell_ids(rows: "object", cols: "object", grid_width: int) -> "object":
     return row_values * np.uint64(grid_width) + col_values
 
 
+def coarser_resolution(resolution: int, levels: int) -> int:
+    """Return the nested family resolution ``levels`` steps coarser, capped."""
+    if levels < 0:
+        raise ValueError("Coarsening levels cannot be negative.")
+    level = grid_level(resolution)
+    return GRID_RESOLUTIONS[min(level + levels, len(GRID_RESOLUTIONS) - 1)]
+
+
+def parent_cell_ids(
+    cell_ids: "object",
+    grid_width: int,
+    parent_grid_width: int,
+    factor: int,
+) -> "object":
+    """Map row-major cell IDs to their enclosing cell on a nested coarser grid."""
+    import numpy as np
+
+    if grid_width <= 0 or factor <= 0:
+        raise ValueError("grid_width and factor must be positive.")
+    values = np.asarray(cell_ids, dtype=np.uint64)
+    rows = values // np.uint64(grid_width)
+    cols = values % np.uint64(grid_width)
+    return grid_cell_ids(
+        rows // np.uint64(factor), cols // np.uint64(factor), parent_grid_width
+    )
+
+
 def iter_grid_tiles(
     height: int, width: int, tile_size: int, tile_width: int | None = None
 ) -> Iterator[GridTile]:
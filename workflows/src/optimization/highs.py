@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import json
+import math
+import os
 import time
-from threading import Event, Thread, Timer
+from collections import deque
+from dataclasses import replace
+from pathlib import Path
+from threading import Event, Lock, Thread, Timer
 from typing import Callable, Sequence
 
 import numpy as np
@@ -13,7 +19,8 @@ from .model import (
     SolverResult,
 )
 from ..utils.cpu import available_cpu_count
-from ..utils.memory import process_memory_sample
+from ..utils.memory import memory_limit_bytes, process_memory_sample
+from .csr_kernels import evaluate_columns
 from .numerical import csr_row_activities
 
 try:
@@ -21,6 +28,11 @@ try:
 except ImportError:  # pragma: no cover - exercised by deployment validation
     highspy = None
 
+LP_SIMPLEX_MAX_NONZEROS = 25_000
+MINIMUM_SOLVE_SECONDS = 1e-3
+_SCHEDULER_LOCK = Lock()
+_scheduler_thread_count: int | None = None
+
 
 def solve_with_highs(
     model: CompiledOptimizationModel,
@@ -31,8 +43,20 @@ def solve_with_highs(
     scenario: SolveScenario | None = None,
     warm_start: np.ndarray | Sequence[float] | None = None,
     progress_callback: Callable[[dict[str, object]], None] | None = None,
+    work_directory: str | Path | None = None,
+    incumbent_path: str | Path | None = None,
+    retain_warm_start: bool = False,
 ) -> SolverResult:
-    """Pass a compiled CSR optimization model to HiGHS and return portable metadata."""
+    """Pass a compiled CSR optimization model to HiGHS and return portable metadata.
+
+    The ``lp_repair`` mode is delegated to :func:`solve_with_lp_repair` for
+    models with integer columns. Configurations with two or more race profiles
+    are delegated to :func:`race_with_highs`, which writes worker columns under
+    ``work_directory``. Solves write each improving certified incumbent to
+    ``incumbent_path`` while they run; a race writes the best across workers.
+    A supplied warm start is kept as the deadline fallback only when
+    ``retain_warm_start`` is set and the columns are independently feasible.
+    """
     if highspy is None:
         raise RuntimeError(
             "The sparse solver profile must install the highspy dependency."
@@ -41,40 +65,115 @@ def solve_with_highs(
         time_limit_seconds=time_limit_seconds,
         relative_mip_gap=relative_mip_gap,
     )
+    if resolved_configuration.mode == "lp_repair" and np.any(model.integrality):
+        from .relaxation import solve_with_lp_repair
+
+        return solve_with_lp_repair(
+            model,
+            configuration=resolved_configuration,
+            scenario=scenario,
+            progress_callback=progress_callback,
+            work_directory=work_directory,
+            incumbent_path=incumbent_path,
+        )
+    if len(resolved_configuration.race_profiles) > 1:
+        from .racing import race_with_highs
+
+        return race_with_highs(
+            model,
+            configuration=resolved_configuration,
+            scenario=scenario,
+            warm_start=warm_start,
+            progress_callback=progress_callback,
+            work_directory=work_directory,
+            incumbent_path=incumbent_path,
+            retain_warm_start=retain_warm_start,
+        )
+    resolved_warm_start = warm_start
+    retain = retain_warm_start and warm_start_is_feasible(model, warm_start)
+    if (
+        resolved_warm_start is None
+        and scenario is None
+        and resolved_configuration.warm_start_search
+    ):
+        resolved_warm_start, resolved_configuration = build_budgeted_warm_start(
+            model, resolved_configuration
+        )
+        retain = resolved_warm_start is not None
     with HighsModelSession(model, configuration=resolved_configuration) as session:
         if scenario is not None:
             session.apply_scenario(scenario)
-        resolved_warm_start = warm_start
-        automatic_warm_start = False
-        if resolved_warm_start is None and scenario is None:
-            resolved_warm_start = build_objective_warm_start(model)
-            automatic_warm_start = resolved_warm_start is not None
         if resolved_warm_start is not None:
             session.apply_warm_start(
                 resolved_warm_start,
-                retain_as_deadline_fallback=automatic_warm_start,
+                retain_as_deadline_fallback=retain,
             )
-        return session.solve(progress_callback=progress_callback)
+        return session.solve(
+            progress_callback=progress_callback,
+            incumbent_path=incumbent_path,
+        )
+
+
+def build_budgeted_warm_start(
+    model: CompiledOptimizationModel,
+    configuration: SolveConfiguration,
+) -> tuple[np.ndarray | None, SolveConfiguration]:
+    """Build the objective warm start on the solve's own clock.
+
+    The local search gets :func:`local_search_budget_seconds` of the time
+    limit, and none for LP solves, which finish long before it would pay off.
+    The time the whole seed took is then taken off ``time_limit_seconds``, so
+    the solve that follows still ends on the caller's deadline.
+
+    Returns:
+        The seed, or ``None``, and the configuration with the remaining limit.
+    """
+    from .local_search import local_search_budget_seconds
+
+    started = time.perf_counter()
+    is_lp = not np.any(np.asarray(model.integrality) != 0)
+    warm_start = build_objective_warm_start(
+        model,
+        local_search_seconds=(
+            0.0
+            if is_lp
+            else local_search_budget_seconds(configuration.time_limit_seconds)
+        ),
+    )
+    if configuration.time_limit_seconds is None:
+        return warm_start, configuration
+    remaining = configuration.time_limit_seconds - (time.perf_counter() - started)
+    return warm_start, replace(
+        configuration, time_limit_seconds=max(MINIMUM_SOLVE_SECONDS, remaining)
+    )
 
 
 def build_objective_warm_start(
     model: CompiledOptimizationModel,
+    *,
+    local_search_seconds: float | None = None,
 ) -> np.ndarray | None:
     """Build a feasible incumbent from independently positive primary variables.
 
     The seed starts at every variable's lower bound, selects promising primary
     binaries, and derives selected-neighbour columns from those decisions. The
-    seed is returned only when it satisfies the complete compiled model, so
-    aggregate constraints or other coupling can safely cause the heuristic to
-    be skipped.
+    seed is returned only when it satisfies the complete compiled model. When
+    aggregate rows reject it and the single-resource greedy does not apply,
+    a time-budgeted constraint-aware local search repairs and improves it.
 
     Args:
         model: Complete compiled optimization model.
+        local_search_seconds: Optional local-search budget override.
 
     Returns:
-        A feasible native-column vector, or ``None`` when this simple seed does
-        not satisfy the compiled constraints.
+        A feasible native-column vector, or ``None`` when no heuristic found
+        one that satisfies the compiled constraints.
     """
+    from .local_search import (
+        LOCAL_SEARCH_TIME_BUDGET_SECONDS,
+        build_local_search_warm_start,
+    )
+
     columns = np.asarray(model.variable_lower, dtype=np.float64).copy()
     if columns.shape != (model.variable_count,) or np.any(~np.isfinite(columns)):
         return None
@@ -89,13 +188,26 @@ def build_objective_warm_start(
         return columns
     baseline = np.asarray(model.variable_lower, dtype=np.float64).copy()
     _populate_neighbor_columns(model, baseline)
-    if not _columns_are_feasible(model, baseline):
-        return None
-    constrained = _build_single_resource_warm_start(
+    baseline_feasible = _columns_are_feasible(model, baseline)
+    if baseline_feasible:
+        constrained = _build_single_resource_warm_start(
+            model,
+            baseline,
+        )
+        if constrained is not None:
+            return constrained
+    searched = build_local_search_warm_start(
         model,
-        baseline,
+        initial_columns=columns,
+        time_budget_seconds=(
+            LOCAL_SEARCH_TIME_BUDGET_SECONDS
+            if local_search_seconds is None
+            else local_search_seconds
+        ),
     )
-    return constrained if constrained is not None else baseline
+    if searched is not None:
+        return searched.columns
+    return baseline if baseline_feasible else None
 
 
 def _build_single_resource_warm_start(
@@ -212,6 +324,42 @@ def _populate_neighbor_columns(
         )
 
 
+def _aggregate_row_mask(model: CompiledOptimizationModel) -> np.ndarray:
+    """Mark rows that several windows may share, i.e. every non-neighbour row."""
+    shared = np.ones(model.constraint_count, dtype=bool)
+    blocks = getattr(model.row_names, "blocks", None)
+    if blocks is None:
+        shared[:] = [not name.startswith("neighbor_") for name in model.row_names]
+        return shared
+    for name, start, stop in blocks:
+        if name.startswith("neighbor_"):
+            shared[start:stop] = False
+    return shared
+
+
+def lp_solver_profile(
+    model: CompiledOptimizationModel,
+    *,
+    vertex_solution: bool = True,
+) -> dict[str, object]:
+    """Choose the HiGHS LP algorithm from the shape of a continuous model.
+
+    Dual simplex finishes small models before the interior point method has
+    factorized its normal equations, while the interior point method scales
+    far better with the nonzero count. Crossover to a basic solution is only
+    requested when the caller needs a vertex.
+    """
+    if model.nonzero_count <= LP_SIMPLEX_MAX_NONZEROS:
+        return {"reason": "small_model", "options": {"solver": "simplex"}}
+    return {
+        "reason": "large_model",
+        "options": {
+            "solver": "ipm",
+            "run_crossover": "on" if vertex_solution else "off",
+        },
+    }
+
+
 class HighsModelSession:
     """Own one mutable HiGHS model for memory-bounded incremental solves."""
 
@@ -264,6 +412,20 @@ class HighsModelSession:
         self._solver.setOptionValue("threads", int(self._resolved_thread_count))
         self._solver.setOptionValue("parallel", "choose")
         self._solver.setOptionValue("random_seed", int(self._configuration.random_seed))
+        self._is_lp = not np.any(np.asarray(model.integrality) != 0)
+        self._lp_profile = None
+        if self._is_lp:
+            profile = lp_solver_profile(
+                model, vertex_solution=self._configuration.vertex_solution
+            )
+            applied = {
+                name: value
+                for name, value in profile["options"].items()
+                if name not in (self._configuration.options or {})
+            }
+            for name, value in applied.items():
+                self._solver.setOptionValue(name, value)
+            self._lp_profile = {"reason": profile["reason"], "options": applied}
         for name, value in (self._configuration.options or {}).items():
             self._solver.setOptionValue(name, value)
         variable_count = model.variable_count
@@ -352,9 +514,64 @@ class HighsModelSession:
         if status != highspy.HighsStatus.kOk:
             raise ValueError("HiGHS rejected the column-bound update.")
 
+    def change_objective(
+        self,
+        objective: Sequence[float] | np.ndarray,
+        objective_offset: float,
+    ) -> None:
+        """Replace every column cost and the offset without rebuilding the model."""
+        costs = np.asarray(objective, dtype=np.float64)
+        if costs.shape != (self._model.variable_count,):
+            raise ValueError("Objective must contain one cost per solver column.")
+        if np.any(~np.isfinite(costs)) or not np.isfinite(objective_offset):
+            raise ValueError("Objective contains a non-finite value.")
+        solver = self._require_open()
+        column_batch_size = 262144
+        for start in range(0, len(costs), column_batch_size):
+            stop = min(start + column_batch_size, len(costs))
+            indices = np.arange(start, stop, dtype=np.int32)
+            solver.changeColsCost(len(indices), indices, costs[start:stop])
+        solver.changeObjectiveOffset(float(objective_offset))
+        self._model = replace(
+            self._model, objective=costs, objective_offset=float(objective_offset)
+        )
+        self._deadline_fallback = None
+
+    def change_random_seed(self, random_seed: int) -> None:
+        """Reseed HiGHS so the next solve explores a different search path."""
+        self._require_open().setOptionValue("random_seed", int(random_seed))
+        self._configuration = replace(self._configuration, random_seed=int(random_seed))
+
+    def change_solve_limits(
+        self,
+        *,
+        time_limit_seconds: float | None,
+        relative_mip_gap: float,
+    ) -> None:
+        """Change the deadline and gap of later solves on the loaded model."""
+        configuration = replace(
+            self._configuration,
+            time_limit_seconds=time_limit_seconds,
+            relative_mip_gap=relative_mip_gap,
+        )
+        solver = self._require_open()
+        solver.setOptionValue(
+            "time_limit",
+            float(time_limit_seconds) if time_limit_seconds is not None else math.inf,
+        )
+        solver.setOptionValue(
+            "mip_rel_gap", float(configuration.effective_relative_mip_gap)
+        )
+        self._configuration = configuration
+
     def apply_scenario(self, scenario: SolveScenario) -> None:
-        """Apply one solve-only scenario after restoring the compiled baseline."""
+        """Apply one solve-only scenario after restoring the compiled baseline.
+
+        A retained deadline fallback is dropped, since it was only checked
+        against the previous bounds.
+        """
         solver = self._require_open()
+        self._deadline_fallback = None
         for row_index in self._scenario_rows:
             solver.changeRowBounds(
                 row_index,
@@ -428,26 +645,135 @@ class HighsModelSession:
         self,
         *,
         progress_callback: Callable[[dict[str, object]], None] | None = None,
+        incumbent_path: str | Path | None = None,
     ) -> SolverResult:
-        """Solve the current model state and return portable result metadata."""
+        """Solve the current model state and return portable result metadata.
+
+        HiGHS MIP callbacks record each improving incumbent and periodic bound
+        samples. The heartbeat thread, never the solver thread, coalesces them
+        into at most one progress update per second and writes each newly
+        certified incumbent to ``incumbent_path``. When the configuration sets
+        a gap plateau window, the heartbeat also cancels the solve, as the
+        deadline watchdog does, once the gap stops shrinking. With a memory
+        limit fraction it samples resident memory every second and cancels the
+        solve once the threshold is crossed, harvesting the incumbent or the
+        deadline fallback instead of losing both to the kernel.
+        """
         solver = self._require_open()
         started = time.perf_counter()
         stopped = Event()
+        stop_requested = Event()
         phase = {"value": "solving"}
+        progress = _SolveProgress(started)
+        plateau_seconds = (
+            None if self._is_lp else self._configuration.effective_gap_plateau_seconds
+        )
+        plateau = (
+            _GapPlateau(plateau_seconds, self._configuration.gap_plateau_improvement)
+            if plateau_seconds is not None
+            else None
+        )
+        early_termination: dict[str, object] = {}
+        memory_limit = (
+            memory_limit_bytes()
+            if self._configuration.memory_limit_fraction is not None
+            else None
+        )
+        memory_threshold = (
+            int(memory_limit * self._configuration.memory_limit_fraction)
+            if memory_limit is not None
+            else None
+        )
+        memory_telemetry = {"sampled_peak_rss_bytes": 0, "sample_count": 0}
+        persist_lock = Lock()
+        resolved_incumbent_path = (
+            Path(incumbent_path) if incumbent_path is not None else None
+        )
+        subscriptions = [
+            (
+                getattr(solver, "cbMipImprovingSolution", None),
+                progress.record_incumbent,
+            ),
+            (getattr(solver, "cbMipInterrupt", None), progress.record_bound),
+        ]
+
+        def interrupt_when_requested(event) -> None:
+            # highspy's cancelSolve only takes effect with its user-interrupt
+            # handler enabled, so MIP interrupt callbacks honour the request.
+            if stop_requested.is_set():
+                event.interrupt()
+
+        subscriptions.append(
+            (getattr(solver, "cbMipInterrupt", None), interrupt_when_requested)
+        )
+        for callback, receiver in subscriptions:
+            if callback is not None:
+                callback.subscribe(receiver)
 
         def cancel_at_deadline() -> None:
+            stop_requested.set()
             solver.cancelSolve()
 
+        def persist_incumbent() -> None:
+            if resolved_incumbent_path is None:
+                return
+            incumbent = progress.take_unwritten_incumbent()
+            if incumbent is None:
+                return
+            columns, metadata = incumbent
+            if columns.shape != (self._model.variable_count,):
+                return
+            _populate_neighbor_columns(self._model, columns)
+            if not _columns_are_feasible(self._model, columns):
+                return
+            with persist_lock:
+                if not stopped.is_set():
+                    write_incumbent(resolved_incumbent_path, columns, metadata)
+
         def heartbeat() -> None:
-            while not stopped.wait(5.0):
-                if progress_callback is not None:
-                    progress_callback(
+            last_emitted = time.perf_counter()
+            while not stopped.wait(1.0):
+                persist_incumbent()
+                current = time.perf_counter()
+                memory = process_memory_sample()
+                memory_telemetry["sample_count"] += 1
+                memory_telemetry["sampled_peak_rss_bytes"] = max(
+                    memory_telemetry["sampled_peak_rss_bytes"],
+                    memory["current_rss_bytes"],
+                )
+                if (
+                    memory_threshold is not None
+                    and memory["current_rss_bytes"] >= memory_threshold
+                    and not early_termination
+                ):
+                    early_termination.update(
                         {
-                            "phase": phase["value"],
-                            "elapsed_seconds": time.perf_counter() - started,
-                            "memory": process_memory_sample(),
+                            "reason": "memory_limit",
+                            "elapsed_seconds": current - started,
+                            "current_rss_bytes": memory["current_rss_bytes"],
+                            "limit_bytes": memory_limit,
+                            "threshold_bytes": memory_threshold,
                         }
                     )
+                    cancel_at_deadline()
+                if plateau is not None and not early_termination:
+                    stall = plateau.observe(current - started, *progress.gap_sample())
+                    if stall is not None:
+                        early_termination.update(stall)
+                        cancel_at_deadline()
+                if progress_callback is None:
+                    continue
+                if not progress.has_news() and current - last_emitted < 5.0:
+                    continue
+                last_emitted = current
+                progress_callback(
+                    {
+                        "phase": phase["value"],
+                        "elapsed_seconds": current - started,
+                        "memory": memory,
+                        **progress.snapshot(),
+                    }
+                )
 
         thread = Thread(target=heartbeat, daemon=True)
         thread.start()
@@ -459,6 +785,7 @@ class HighsModelSession:
             watchdog.daemon = True
             watchdog.start()
         try:
+            _prepare_global_scheduler(self._resolved_thread_count)
             solve_started = time.perf_counter()
             solver.run()
             solve_seconds = time.perf_counter() - solve_started
@@ -468,7 +795,18 @@ class HighsModelSession:
                 watchdog.join(timeout=1.0)
             stopped.set()
             thread.join(timeout=1.0)
+            for callback, receiver in subscriptions:
+                if callback is not None:
+                    callback.unsubscribe(receiver)
         self._memory_profile["after_highs_solve"] = process_memory_sample()
+        self._memory_profile["during_highs_solve"] = {
+            **memory_telemetry,
+            **(
+                {"limit_bytes": memory_limit, "threshold_bytes": memory_threshold}
+                if memory_threshold is not None
+                else {}
+            ),
+        }
         runtime = time.perf_counter() - started
         status = (
             solver.modelStatusToString(solver.getModelStatus())
@@ -491,6 +829,7 @@ class HighsModelSession:
                 + self._model.objective_offset
             )
         limit_termination = status.startswith(("time_limit", "interrupt"))
+        interrupted = status.startswith("interrupt")
         fallback_used = False
         if (
             limit_termination
@@ -506,19 +845,45 @@ class HighsModelSession:
             fallback_used = True
         if limit_termination and has_incumbent:
             status = "feasible"
+        termination_reason = solver.modelStatusToString(solver.getModelStatus())
+        if early_termination and interrupted:
+            termination_reason = str(early_termination["reason"])
+        else:
+            early_termination.clear()
+        if resolved_incumbent_path is not None and has_incumbent:
+            with persist_lock:
+                write_incumbent(
+                    resolved_incumbent_path,
+                    native_columns,
+                    {
+                        "objective_value": objective,
+                        "elapsed_seconds": time.perf_counter() - started,
+                        "source": "deadline_fallback" if fallback_used else "final",
+                    },
+                )
         decisions = self._planning_unit_decisions(native_columns)
-        gap = float(info.mip_gap) if np.isfinite(info.mip_gap) else None
-        if status == "optimal" and gap is not None and abs(gap) > 1e-12:
-            status = "feasible"
-        best_bound = (
-            float(info.mip_dual_bound) if np.isfinite(info.mip_dual_bound) else None
-        )
+        if self._is_lp:
+            gap = None
+            if status == "optimal":
+                status = self._validated_lp_status(info)
+            best_bound = objective if status == "optimal" else None
+        else:
+            gap = float(info.mip_gap) if np.isfinite(info.mip_gap) else None
+            if status == "optimal" and gap is not None and abs(gap) > 1e-12:
+                status = "feasible"
+            best_bound = (
+                float(info.mip_dual_bound)
+                if np.isfinite(info.mip_dual_bound)
+                else None
+            )
         absolute_gap = (
             abs(objective - best_bound)
             if np.isfinite(objective) and best_bound is not None
             else None
         )
-        get_presolved_model = getattr(solver, "getPresolvedLp", None)
+        get_presolved_model = (
+            None if self._is_lp else getattr(solver, "getPresolvedLp", None)
+        )
         presolved_model = (
             get_presolved_model() if get_presolved_model is not None else None
         )
@@ -534,7 +899,7 @@ class HighsModelSession:
                 "rows": self._model.constraint_count,
                 "nonzeros": self._model.nonzero_count,
             },
-            "presolved_model": {
+            "presolved_model": None if self._is_lp else {
                 "columns": (
                     int(presolved_model.num_col_)
                     if presolved_model is not None
@@ -556,8 +921,18 @@ class HighsModelSession:
                     else None
                 ),
             },
-            "simplex_iterations": int(getattr(info, "simplex_iteration_count", 0)),
-            "ipm_iterations": int(getattr(info, "ipm_iteration_count", 0)),
+            "incumbent_count": progress.incumbent_count,
+            "first_incumbent_seconds": progress.first_incumbent_seconds,
+            **(
+                _lp_iteration_diagnostics(info)
+                if self._is_lp
+                else {
+                    "simplex_iterations": int(
+                        getattr(info, "simplex_iteration_count", 0)
+                    ),
+                    "ipm_iterations": int(getattr(info, "ipm_iteration_count", 0)),
+                }
+            ),
             "primal_dual_integral": (
                 float(getattr(info, "primal_dual_integral", np.nan))
                 if np.isfinite(getattr(info, "primal_dual_integral", np.nan))
@@ -578,6 +953,7 @@ class HighsModelSession:
                 if np.isfinite(getattr(info, "max_integrality_violation", np.nan))
                 else None
             ),
+            "early_termination": dict(early_termination) or None,
         }
         return SolverResult(
             status=status,
@@ -587,10 +963,10 @@ class HighsModelSession:
             solver_name="highs",
             solver_version=solver.version(),
             decisions=decisions,
-            termination_reason=solver.modelStatusToString(solver.getModelStatus()),
+            termination_reason=termination_reason,
             best_bound=best_bound,
             absolute_gap=absolute_gap,
-            node_count=int(info.mip_node_count),
+            node_count=None if self._is_lp else int(info.mip_node_count),
             model_load_seconds=self._model_load_seconds,
             presolve_seconds=None,
             solve_seconds=solve_seconds,
@@ -608,6 +984,17 @@ class HighsModelSession:
                 "mode": self._configuration.mode,
                 "options": dict(self._configuration.options or {}),
                 "deadline_fallback_used": fallback_used,
+                "gap_plateau_seconds": plateau_seconds,
+                "gap_plateau_improvement": (
+                    self._configuration.gap_plateau_improvement
+                    if plateau_seconds is not None
+                    else None
+                ),
+                **(
+                    {"lp_profile": self._lp_profile}
+                    if self._lp_profile is not None
+                    else {}
+                ),
             },
             native_columns=native_columns,
             memory_profile=dict(self._memory_profile),
@@ -633,6 +1020,26 @@ class HighsModelSession:
             return False
         return self._is_feasible_incumbent(columns)
 
+    def _validated_lp_status(self, info) -> str:
+        """Certify an optimal LP against its primal and dual feasibility tolerances.
+
+        A solution whose primal side fails is not usable. One whose dual side
+        fails is a feasible point without an optimality certificate.
+        """
+        primal_valid = int(info.primal_solution_status) == int(
+            highspy.kSolutionStatusFeasible
+        ) and float(info.max_primal_infeasibility) <= _option_value(
+            self._solver, "primal_feasibility_tolerance"
+        )
+        if not primal_valid:
+            return "lp_primal_tolerance_violated"
+        dual_valid = int(info.dual_solution_status) == int(
+            highspy.kSolutionStatusFeasible
+        ) and float(info.max_dual_infeasibility) <= _option_value(
+            self._solver, "dual_feasibility_tolerance"
+        )
+        return "optimal" if dual_valid else "feasible"
+
     def _planning_unit_decisions(self, native_columns: np.ndarray) -> np.ndarray:
         """Reconstruct the stable full spatial vector from compact solver columns."""
         return native_columns[: self._model.primary_variable_count].copy()
@@ -644,6 +1051,239 @@ class HighsModelSession:
         return self._solver
 
 
+class _SolveProgress:
+    """Thread-safe latest solve state shared by HiGHS callbacks and heartbeat.
+
+    Callbacks run on the solver thread and only copy values under a lock. The
+    live primal-dual integral accumulates the normalized gap from the first
+    MIP callback onward; the final value in diagnostics comes from HiGHS.
+    """
+
+    def __init__(self, started: float) -> None:
+        self._lock = Lock()
+        self._started = started
+        self._news = False
+        self._objective: float | None = None
+        self._bound: float | None = None
+        self._gap: float | None = None
+        self._nodes: int | None = None
+        self._integral = 0.0
+        self._sampled_at: float | None = None
+        self._normalized_gap = 1.0
+        self._columns: np.ndarray | None = None
+        self._columns_written = True
+        self.incumbent_count = 0
+        self.first_incumbent_seconds: float | None = None
+
+    def record_incumbent(self, event) -> None:
+        """Record one improving MIP solution reported by HiGHS."""
+        data = event.data_out
+        columns = np.array(data.mip_solution, dtype=np.float64)
+        with self._lock:
+            self._sample(data)
+            self._objective = _finite_or_none(data.objective_function_value)
+            self._columns = columns
+            self._columns_written = False
+            self.incumbent_count += 1
+            if self.first_incumbent_seconds is None:
+                self.first_incumbent_seconds = time.perf_counter() - self._started
+            self._news = True
+
+    def record_bound(self, event) -> None:
+        """Sample the dual bound, gap, and node count between incumbents."""
+        with self._lock:
+            self._sample(event.data_out)
+
+    def _sample(self, data) -> None:
+        current = time.perf_counter()
+        if self._sampled_at is not None:
+            self._integral += self._normalized_gap * (current - self._sampled_at)
+        self._sampled_at = current
+        self._bound = _finite_or_none(data.mip_dual_bound)
+        self._gap = _finite_or_none(data.mip_gap)
+        self._nodes = int(data.mip_node_count)
+        self._normalized_gap = min(self._gap, 1.0) if self._gap is not None else 1.0
+
+    def gap_sample(self) -> tuple[float | None, float | None, bool]:
+        """Return the gap, live primal-dual integral, and incumbent presence."""
+        with self._lock:
+            integral = (
+                self._integral
+                + self._normalized_gap * (time.perf_counter() - self._sampled_at)
+                if self._sampled_at is not None
+                else None
+            )
+            return self._gap, integral, self._columns is not None
+
+    def has_news(self) -> bool:
+        """Return whether an incumbent arrived since the last snapshot."""
+        with self._lock:
+            return self._news
+
+    def snapshot(self) -> dict[str, object]:
+        """Return the coalesced latest incumbent, bound, and gap telemetry."""
+        with self._lock:
+            self._news = False
+            return {
+                "incumbent_objective": self._objective,
+                "best_bound": self._bound,
+                "optimality_gap": self._gap,
+                "node_count": self._nodes,
+                "incumbent_count": self.incumbent_count,
+                "primal_dual_integral": (
+                    self._integral
+                    + self._normalized_gap * (time.perf_counter() - self._sampled_at)
+                    if self._sampled_at is not None
+                    else None
+                ),
+            }
+
+    def take_unwritten_incumbent(
+        self,
+    ) -> tuple[np.ndarray, dict[str, object]] | None:
+        """Return the newest incumbent once so it can be persisted off-thread."""
+        with self._lock:
+            if self._columns_written or self._columns is None:
+                return None
+            self._columns_written = True
+            return self._columns.copy(), {
+                "objective_value": self._objective,
+                "best_bound": self._bound,
+                "optimality_gap": self._gap,
+                "elapsed_seconds": time.perf_counter() - self._started,
+                "source": "callback",
+            }
+
+
+class _GapPlateau:
+    """Detect a MIP gap that stops shrinking over a trailing time window.
+
+    The heartbeat feeds one sample per second. A stall is reported only with an
+    incumbent in hand and a full window observed since the gap became finite,
+    so the cancelled solve always returns a certified ``feasible`` result.
+    """
+
+    def __init__(self, window_seconds: float, minimum_improvement: float) -> None:
+        self._window = float(window_seconds)
+        self._minimum_improvement = float(minimum_improvement)
+        self._samples: deque[tuple[float, float, float | None]] = deque()
+
+    def observe(
+        self,
+        elapsed: float,
+        gap: float | None,
+        integral: float | None,
+        has_incumbent: bool,
+    ) -> dict[str, object] | None:
+        """Record one sample and return the stop record once the gap stalls."""
+        if gap is None or not has_incumbent:
+            self._samples.clear()
+            return None
+        self._samples.append((elapsed, gap, integral))
+        while len(self._samples) > 1 and self._samples[1][0] <= elapsed - self._window:
+            self._samples.popleft()
+        window_started, window_gap, window_integral = self._samples[0]
+        observed = elapsed - window_started
+        if observed < self._window:
+            return None
+        if window_gap - gap > self._minimum_improvement:
+            return None
+        return {
+            "reason": "gap_plateau",
+            "elapsed_seconds": elapsed,
+            "window_seconds": self._window,
+            "minimum_improvement": self._minimum_improvement,
+            "gap_at_window_start": window_gap,
+            "gap": gap,
+            "window_mean_normalized_gap": (
+                (integral - window_integral) / observed
+                if integral is not None and window_integral is not None
+                else None
+            ),
+            "primal_dual_integral": integral,
+        }
+
+
+def write_incumbent(
+    path: Path,
+    columns: np.ndarray,
+    metadata: dict[str, object],
+) -> None:
+    """Atomically replace the scratch incumbent and its JSON sidecar."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp")
+    with temporary.open("wb") as target:
+        np.save(target, np.asarray(columns, dtype=np.float64))
+    os.replace(temporary, path)
+    sidecar = path.with_suffix(".json")
+    temporary = sidecar.with_name(f".{sidecar.name}.tmp")
+    temporary.write_text(json.dumps(metadata, sort_keys=True), encoding="utf-8")
+    os.replace(temporary, sidecar)
+
+
+def _prepare_global_scheduler(thread_count: int) -> None:
+    """Resize HiGHS' process-wide task scheduler when the thread count changes.
+
+    HiGHS creates one scheduler per process on its first solve and rejects
+    later solves that request a different thread count.
+    """
+    global _scheduler_thread_count
+    with _SCHEDULER_LOCK:
+        if _scheduler_thread_count not in (None, thread_count):
+            highspy.Highs.resetGlobalScheduler(True)
+        _scheduler_thread_count = thread_count
+
+
+def _lp_iteration_diagnostics(info) -> dict[str, object]:
+    """Report the LP algorithm that ran and only its own iteration counts."""
+    ipm_iterations = int(getattr(info, "ipm_iteration_count", 0))
+    pdlp_iterations = int(getattr(info, "pdlp_iteration_count", 0))
+    if ipm_iterations > 0:
+        return {
+            "lp_algorithm": "ipm",
+            "simplex_iterations": None,
+            "ipm_iterations": ipm_iterations,
+            "crossover_iterations": int(
+                getattr(info, "crossover_iteration_count", 0)
+            ),
+        }
+    if pdlp_iterations > 0:
+        return {
+            "lp_algorithm": "pdlp",
+            "simplex_iterations": None,
+            "ipm_iterations": None,
+            "pdlp_iterations": pdlp_iterations,
+        }
+    return {
+        "lp_algorithm": "simplex",
+        "simplex_iterations": int(getattr(info, "simplex_iteration_count", 0)),
+        "ipm_iterations": None,
+    }
+
+
+def _option_value(solver, name: str) -> float:
+    """Read a numeric HiGHS option across highspy return conventions."""
+    value = solver.getOptionValue(name)
+    if isinstance(value, tuple):
+        value = value[-1]
+    return float(value)
+
+
+def _finite_or_none(value: float) -> float | None:
+    """Return a finite float, or ``None`` for HiGHS' infinite placeholders."""
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def _relative_gap(objective: float, bound: float | None) -> float | None:
+    """Return HiGHS' relative gap between an incumbent and a dual bound."""
+    if bound is None or not np.isfinite(bound):
+        return None
+    if objective == 0:
+        return 0.0 if bound == 0 else float("inf")
+    return abs(bound - objective) / abs(objective)
+
+
 def require_acceptable_result(
     result: SolverResult,
     configuration: SolveConfiguration,
@@ -673,6 +1313,46 @@ def require_acceptable_result(
         )
 
 
+def apply_solve_scenario(
+    model: CompiledOptimizationModel,
+    scenario: SolveScenario | None,
+) -> CompiledOptimizationModel:
+    """Return a model whose bounds include the scenario's overrides."""
+    if scenario is None:
+        return model
+    row_lower = np.asarray(model.row_lower, dtype=np.float64).copy()
+    row_upper = np.asarray(model.row_upper, dtype=np.float64).copy()
+    variable_lower = np.asarray(model.variable_lower, dtype=np.float64).copy()
+    variable_upper = np.asarray(model.variable_upper, dtype=np.float64).copy()
+    for override in scenario.row_bounds:
+        row_lower[override.row_index] = override.lower
+        row_upper[override.row_index] = override.upper
+    for override in scenario.column_bounds:
+        variable_lower[override.column_index] = override.lower
+        variable_upper[override.column_index] = override.upper
+    return replace(
+        model,
+        row_lower=row_lower,
+        row_upper=row_upper,
+        variable_lower=variable_lower,
+        variable_upper=variable_upper,
+    )
+
+
+def warm_start_is_feasible(
+    model: CompiledOptimizationModel,
+    values: np.ndarray | Sequence[float] | None,
+) -> bool:
+    """Return whether a warm start, with derived neighbour columns, is feasible."""
+    if values is None:
+        return False
+    columns = np.asarray(values, dtype=np.float64).copy()
+    if columns.shape != (model.variable_count,):
+        return False
+    _populate_neighbor_columns(model, columns)
+    return _columns_are_feasible(model, columns)
+
+
 def _columns_are_feasible(
     model: CompiledOptimizationModel,
     columns: np.ndarray,
@@ -680,16 +1360,4 @@ def _columns_are_feasible(
     """Return whether native columns satisfy bounds, integrality, and all rows."""
     if columns.shape != (model.variable_count,) or not np.all(np.isfinite(columns)):
         return False
-    tolerance = 1e-6
-    if np.any(columns < model.variable_lower - tolerance) or np.any(
-        columns > model.variable_upper + tolerance
-    ):
-        return False
-    integer = model.integrality != 0
-    if np.any(np.abs(columns[integer] - np.rint(columns[integer])) > tolerance):
-        return False
-    activities = csr_row_activities(model, columns)
-    return bool(
-        np.all(activities >= model.row_lower - tolerance)
-        and np.all(activities <= model.row_upper + tolerance)
-    )
+    return evaluate_columns(model, columns).is_feasible(1e-6)
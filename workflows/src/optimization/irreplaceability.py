@@ -5,7 +5,8 @@ from typing import Literal, Sequence
 
 import numpy as np
 
-from .highs import HighsModelSession, require_acceptable_result
+from .conditioning import NumericalScaling
+from .highs import require_acceptable_result
 from .model import (
     ColumnBoundOverride,
     CompiledOptimizationModel,
@@ -13,6 +14,7 @@ from .model import (
     SolveScenario,
     SolverResult,
 )
+from .solver_service import ResidentModelReference, open_model_session
 from .validation import reconstruct_and_validate
 
 
@@ -52,22 +54,29 @@ def analyze_irreplaceability(
     configuration: SolveConfiguration | None = None,
     maximum_scenarios: int | None = None,
     use_warm_starts: bool = True,
+    resident_model: ResidentModelReference | None = None,
+    scaling: NumericalScaling | None = None,
 ) -> IrreplaceabilityResult:
     """Compute exact or certified replacement costs using bound overrides.
 
     The compiled coefficients and sparse matrix are loaded into HiGHS once. Each
     scenario changes only one primary variable's upper bound to zero. Replacement
     cost is ``z_reference - z_without_unit`` for maximization and the sign-reversed
-    equivalent for minimization.
+    equivalent for minimization. Every counterfactual objective and bound is
+    unscaled to original units before it is compared or reported.
 
     Parameters:
         model: Immutable compiled optimization model reused by every scenario.
-        reference_result: Accepted reference solve against the unchanged model.
+        reference_result: Accepted reference solve against the unchanged model,
+            with its objective and bound in original units.
         candidate_planning_unit_ids: Stable IDs in primary solver-column order.
         requested_planning_unit_ids: Optional bounded subset to analyze.
         configuration: Authoritative settings for every counterfactual solve.
         maximum_scenarios: Maximum number of actual HiGHS exclusion solves.
         use_warm_starts: Whether to offer bound-compatible reference values to HiGHS.
+        resident_model: Optional solver service holding this model's artifact,
+            used instead of loading a local HiGHS session when it answers.
+        scaling: Numerical conditioning recorded with a conditioned model.
 
     Returns:
         Per-unit absolute and reference-relative replacement costs.
@@ -137,7 +146,9 @@ def analyze_irreplaceability(
             )
 
     results: list[PlanningUnitIrreplaceability] = []
-    with HighsModelSession(model, configuration=solve_configuration) as session:
+    with open_model_session(
+        model, configuration=solve_configuration, resident_model=resident_model
+    ) as session:
         for planning_unit_id in requested:
             column = column_by_id[int(planning_unit_id)]
             selected = bool(selected_in_reference[column])
@@ -191,7 +202,7 @@ def analyze_irreplaceability(
                         counterfactual_objective=None,
                         replacement_cost_absolute=None,
                         replacement_cost_relative=None,
-                        best_bound=counterfactual.best_bound,
+                        best_bound=_original_units(counterfactual.best_bound, scaling),
                         optimality_gap=counterfactual.optimality_gap,
                     )
                 )
@@ -203,13 +214,16 @@ def analyze_irreplaceability(
                 candidate_planning_unit_ids=candidate_ids,
                 collect_selected_ids=False,
                 variable_upper_override=(column, 0.0),
+                scaling=scaling,
             )
             if not validation.accepted:
                 raise RuntimeError(
                     "Irreplaceability counterfactual failed independent validation: "
                     f"{', '.join(validation.failures)}."
                 )
-            counterfactual_objective = counterfactual.objective_value
+            counterfactual_objective = _original_units(
+                counterfactual.objective_value, scaling
+            )
             if counterfactual_objective is None:
                 raise RuntimeError(
                     "Irreplaceability counterfactual has no finite objective."
@@ -246,7 +260,7 @@ def analyze_irreplaceability(
                     replacement_cost_relative=(
                         opportunity_loss / scale if scale > 0 else None
                     ),
-                    best_bound=counterfactual.best_bound,
+                    best_bound=_original_units(counterfactual.best_bound, scaling),
                     optimality_gap=counterfactual.optimality_gap,
                 )
             )
@@ -264,6 +278,13 @@ def _exclusion_warm_start(reference_columns: np.ndarray, column: int) -> np.ndar
     return values
 
 
+def _original_units(
+    value: float | None, scaling: NumericalScaling | None
+) -> float | None:
+    """Return a solver-unit objective or bound in original model units."""
+    return value if scaling is None else scaling.unscale_objective(value)
+
+
 def _is_proven_optimal(result: SolverResult) -> bool:
     """Return whether HiGHS certified the reference objective as optimal."""
     return result.status == "optimal" and (
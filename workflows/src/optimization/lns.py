@@ -0,0 +1,538 @@
+from __future__ import annotations
+
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from .highs import (
+    _aggregate_row_mask,
+    _populate_neighbor_columns,
+    _relative_gap,
+    solve_with_highs,
+    warm_start_is_feasible,
+    write_incumbent,
+)
+from .model import (
+    CompactRowNames,
+    CompiledOptimizationModel,
+    SolveConfiguration,
+    SolverResult,
+)
+from .numerical import csr_row_activities
+from .shared_model import (
+    SharedColumnMajor,
+    SharedModelReference,
+    attach_column_major,
+    attach_compiled_model,
+    share_compiled_model,
+    write_column_major,
+)
+from .validation import reconstruct_and_validate
+from ..utils.cpu import available_cpu_count
+from ..utils.memory import process_memory_sample
+
+LNS_WINDOW_SIZE = 256
+LNS_WINDOW_TIME_LIMIT_SECONDS = 30.0
+LNS_INITIAL_TIME_FRACTION = 0.1
+LNS_INITIAL_TIME_LIMIT_SECONDS = 600.0
+LNS_MAX_WORKERS = 4
+LNS_MAX_WINDOW_DOUBLINGS = 2
+IMPROVEMENT_TOLERANCE = 1e-9
+NEIGHBOR_ROW_BLOCKS = ("neighbor_selected_first", "neighbor_selected_second")
+
+_WORKER_STATE: dict[str, object] = {}
+
+
+def solve_with_spatial_lns(
+    model: CompiledOptimizationModel,
+    *,
+    configuration: SolveConfiguration,
+    candidate_planning_unit_ids: np.ndarray | Sequence[int],
+    grid_width: int,
+    fixed_planning_unit_ids: np.ndarray | Sequence[int] = (),
+    fixed_values: np.ndarray | Sequence[int] = (),
+    window_size: int = LNS_WINDOW_SIZE,
+    window_time_limit_seconds: float = LNS_WINDOW_TIME_LIMIT_SECONDS,
+    worker_count: int | None = None,
+    warm_start: np.ndarray | Sequence[float] | None = None,
+    progress_callback: Callable[[dict[str, object]], None] | None = None,
+    work_directory: str | Path | None = None,
+    incumbent_path: str | Path | None = None,
+) -> SolverResult:
+    """Improve a monolithic incumbent by re-solving spatial windows.
+
+    A short monolithic solve supplies the starting incumbent and the global
+    dual bound. The search then frees one square window of planning units at a
+    time, fixes every other column at the incumbent, and solves the window's
+    sub-MIP with a short limit. Windows of one checkerboard colour share no rook
+    edge, so a batch of them is solved in parallel processes; each window
+    receives an equal share of every aggregate row's slack, which keeps the
+    merged batch feasible. Workers share one column-major copy of the matrix
+    through memory-mapped files, so a window touches only its own columns. A
+    pass without improvement doubles the window side, up to
+    ``LNS_MAX_WINDOW_DOUBLINGS`` times, before the search stops.
+    Each accepted incumbent must pass :func:`reconstruct_and_validate` against
+    the complete model.
+
+    Args:
+        model: Complete compiled optimization model, ideally memory-mapped.
+        configuration: Overall solve policy; its time limit bounds the search.
+        candidate_planning_unit_ids: Row-major grid cell ID of each primary
+            column.
+        grid_width: Width of the grid the cell IDs were derived from.
+        fixed_planning_unit_ids: Fixed planning units for validation.
+        fixed_values: Fixed planning-unit states aligned with their IDs.
+        window_size: Window side length in grid cells.
+        window_time_limit_seconds: Time limit for each window sub-MIP.
+        worker_count: Parallel window solves; defaults to the thread budget.
+        warm_start: Optional incumbent for the initial monolithic solve.
+        progress_callback: Optional receiver for search heartbeats.
+        work_directory: Directory for per-batch incumbent files.
+        incumbent_path: Optional path updated with each accepted incumbent.
+
+    Returns:
+        The best validated incumbent, gap measured against the global bound,
+        with search statistics under ``solver_settings.lns``.
+    """
+    if configuration.mode == "exact_audit":
+        raise ValueError("Spatial LNS cannot certify an exact audit.")
+    if window_size <= 0 or window_time_limit_seconds <= 0:
+        raise ValueError("LNS window size and time limit must be positive.")
+    candidate_ids = np.asarray(candidate_planning_unit_ids, dtype=np.uint64)
+    if candidate_ids.shape != (model.primary_variable_count,):
+        raise ValueError("LNS requires one grid cell ID per primary column.")
+    started = time.perf_counter()
+    total_threads = configuration.thread_count or available_cpu_count()
+    resolved_workers = max(1, min(worker_count or LNS_MAX_WORKERS, total_threads))
+    initial_limit = LNS_INITIAL_TIME_LIMIT_SECONDS
+    if configuration.time_limit_seconds is not None:
+        initial_limit = min(
+            initial_limit,
+            max(1.0, configuration.time_limit_seconds * LNS_INITIAL_TIME_FRACTION),
+        )
+    initial = solve_with_highs(
+        model,
+        configuration=replace(
+            configuration,
+            time_limit_seconds=initial_limit,
+            race_profiles=(),
+        ),
+        warm_start=warm_start,
+        retain_warm_start=warm_start_is_feasible(model, warm_start),
+        progress_callback=progress_callback,
+        incumbent_path=incumbent_path,
+    )
+    if initial.status not in {"optimal", "feasible"} or initial.native_columns is None:
+        return initial
+    if initial.status == "optimal" or _within_gap(
+        initial.optimality_gap, configuration
+    ):
+        return initial
+    global_bound = initial.best_bound
+    current = np.asarray(initial.native_columns, dtype=np.float64).copy()
+    objective = float(initial.objective_value)
+    # Model-space objective of ``current``, updated from the changed columns.
+    model_objective = float(np.dot(model.objective, current) + model.objective_offset)
+
+    def accept(columns: np.ndarray) -> float | None:
+        """Validate merged columns and return their objective when improving."""
+        validation = reconstruct_and_validate(
+            model,
+            replace(initial, objective_value=None, native_columns=columns),
+            candidate_planning_unit_ids=candidate_ids,
+            fixed_planning_unit_ids=fixed_planning_unit_ids,
+            fixed_values=fixed_values,
+            collect_selected_ids=False,
+        )
+        if not validation.accepted or not _improves(
+            validation.objective_value, objective, maximize=model.maximize
+        ):
+            return None
+        return validation.objective_value
+
+    shared_rows = _aggregate_row_mask(model)
+    deadline = (
+        started + configuration.time_limit_seconds
+        if configuration.time_limit_seconds is not None
+        else None
+    )
+    statistics = {
+        "window_size": window_size,
+        "worker_count": resolved_workers,
+        "passes": 0,
+        "solved_windows": 0,
+        "accepted_windows": 0,
+        "rejected_merges": 0,
+    }
+    termination = "lns_converged"
+    context = multiprocessing.get_context("spawn")
+    with (
+        tempfile.TemporaryDirectory(
+            prefix="highs-lns-",
+            dir=str(work_directory) if work_directory is not None else None,
+        ) as directory,
+        ProcessPoolExecutor(
+            max_workers=resolved_workers,
+            mp_context=context,
+            initializer=_initialize_window_worker,
+            initargs=(
+                share_compiled_model(model),
+                write_column_major(model, Path(directory) / "column-major"),
+                shared_rows,
+            ),
+        ) as executor,
+    ):
+        root = Path(directory)
+        columns_path = root / "columns.npy"
+        activities_path = root / "activities.npy"
+        stale = True
+        size = window_size
+        windows = _spatial_windows(model, candidate_ids, grid_width, size)
+        while termination == "lns_converged":
+            improved = False
+            statistics["passes"] += 1
+            for colour in windows:
+                for batch_start in range(0, len(colour), resolved_workers):
+                    remaining = (
+                        deadline - time.perf_counter()
+                        if deadline is not None
+                        else window_time_limit_seconds
+                    )
+                    if remaining < 1.0:
+                        termination = "lns_time_limit"
+                        break
+                    if _within_gap(
+                        _relative_gap(objective, global_bound), configuration
+                    ):
+                        termination = "lns_gap_reached"
+                        break
+                    batch = colour[batch_start : batch_start + resolved_workers]
+                    if stale:
+                        np.save(columns_path, current)
+                        np.save(activities_path, csr_row_activities(model, current))
+                        stale = False
+                    window_configuration = replace(
+                        configuration,
+                        time_limit_seconds=min(window_time_limit_seconds, remaining),
+                        thread_count=max(1, total_threads // resolved_workers),
+                        output_flag=False,
+                        race_profiles=(),
+                    )
+                    pending = {
+                        executor.submit(
+                            _solve_window,
+                            window,
+                            len(batch),
+                            str(columns_path),
+                            str(activities_path),
+                            model_objective,
+                            window_configuration,
+                        )
+                        for window in batch
+                    }
+                    proposals = []
+                    while pending:
+                        done, pending = wait(
+                            pending, timeout=5.0, return_when=FIRST_COMPLETED
+                        )
+                        for future in done:
+                            proposal = future.result()
+                            if proposal is not None:
+                                proposals.append(proposal)
+                        if pending and progress_callback is not None:
+                            progress_callback(
+                                _progress(started, objective, global_bound, statistics)
+                            )
+                    statistics["solved_windows"] += len(batch)
+                    if not proposals:
+                        continue
+                    merged = current.copy()
+                    for indices, values, _ in proposals:
+                        merged[indices] = values
+                    _populate_neighbor_columns(model, merged)
+                    merged_objective = accept(merged)
+                    if merged_objective is None:
+                        statistics["rejected_merges"] += 1
+                        ranked = sorted(
+                            proposals,
+                            key=lambda proposal: proposal[2],
+                            reverse=model.maximize,
+                        )
+                        merged = current.copy()
+                        merged[ranked[0][0]] = ranked[0][1]
+                        _populate_neighbor_columns(model, merged)
+                        merged_objective = accept(merged)
+                        proposals = ranked[:1]
+                    if merged_objective is None:
+                        continue
+                    changed = np.unique(
+                        np.concatenate([indices for indices, _, _ in proposals])
+                    )
+                    model_objective += float(
+                        np.dot(
+                            model.objective[changed],
+                            merged[changed] - current[changed],
+                        )
+                    )
+                    current = merged
+                    objective = merged_objective
+                    stale = True
+                    improved = True
+                    statistics["accepted_windows"] += len(proposals)
+                    if incumbent_path is not None:
+                        write_incumbent(
+                            incumbent_path,
+                            current,
+                            {
+                                "objective_value": objective,
+                                "elapsed_seconds": time.perf_counter() - started,
+                                "source": "lns",
+                            },
+                        )
+                    if progress_callback is not None:
+                        progress_callback(
+                            _progress(started, objective, global_bound, statistics)
+                        )
+                if termination != "lns_converged":
+                    break
+            if not improved and termination == "lns_converged":
+                if size >= window_size * 2**LNS_MAX_WINDOW_DOUBLINGS:
+                    break
+                size *= 2
+                windows = _spatial_windows(model, candidate_ids, grid_width, size)
+    gap = _relative_gap(objective, global_bound)
+    return replace(
+        initial,
+        status="feasible",
+        objective_value=objective,
+        optimality_gap=gap,
+        absolute_gap=(
+            abs(objective - global_bound) if global_bound is not None else None
+        ),
+        runtime_seconds=time.perf_counter() - started,
+        decisions=current[: model.primary_variable_count].copy(),
+        native_columns=current,
+        termination_reason=termination,
+        solver_settings={
+            **dict(initial.solver_settings or {}),
+            "time_limit_seconds": configuration.time_limit_seconds,
+            "lns": {
+                **statistics,
+                "final_window_size": size,
+                "window_time_limit_seconds": window_time_limit_seconds,
+                "initial_time_limit_seconds": initial_limit,
+                "initial_objective": initial.objective_value,
+            },
+        },
+    )
+
+
+def _spatial_windows(
+    model: CompiledOptimizationModel,
+    candidate_ids: np.ndarray,
+    grid_width: int,
+    window_size: int,
+) -> tuple[list[np.ndarray], ...]:
+    """Group flexible primary columns into square windows by checkerboard colour."""
+    if grid_width <= 0:
+        raise ValueError("grid_width must be positive.")
+    flexible = np.flatnonzero(
+        np.asarray(model.variable_upper[: model.primary_variable_count])
+        > np.asarray(model.variable_lower[: model.primary_variable_count])
+    )
+    window_rows = (candidate_ids[flexible] // np.uint64(grid_width)).astype(
+        np.int64
+    ) // window_size
+    window_cols = (candidate_ids[flexible] % np.uint64(grid_width)).astype(
+        np.int64
+    ) // window_size
+    keys = np.stack((window_rows, window_cols), axis=1)
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    boundaries = np.searchsorted(inverse[order], np.arange(1, len(unique_keys)))
+    groups = np.split(flexible[order], boundaries)
+    colours = (unique_keys[:, 0] % 2) * 2 + unique_keys[:, 1] % 2
+    return tuple(
+        [groups[index] for index in np.flatnonzero(colours == colour)]
+        for colour in range(4)
+    )
+
+
+def _initialize_window_worker(
+    reference: SharedModelReference,
+    column_major: SharedColumnMajor,
+    shared_rows: np.ndarray,
+) -> None:
+    """Attach the shared model and its shared column-major matrix."""
+    model = attach_compiled_model(reference)
+    blocks = getattr(model.row_names, "blocks", ())
+    _WORKER_STATE.update(
+        model=model,
+        column_major=attach_column_major(column_major),
+        shared_rows=shared_rows,
+        neighbor_rows=tuple(
+            (start, stop) for name, start, stop in blocks if name in NEIGHBOR_ROW_BLOCKS
+        ),
+    )
+
+
+def _solve_window(
+    window: np.ndarray,
+    share_count: int,
+    columns_path: str,
+    activities_path: str,
+    objective: float,
+    configuration: SolveConfiguration,
+) -> tuple[np.ndarray, np.ndarray, float] | None:
+    """Solve one window sub-MIP and return its columns when they improve.
+
+    ``objective`` is the complete model's objective at the current columns.
+    """
+    model: CompiledOptimizationModel = _WORKER_STATE["model"]  # type: ignore[assignment]
+    columns = np.load(columns_path, mmap_mode="r")
+    activities = np.load(activities_path, mmap_mode="r")
+    sub_model, free = _window_model(
+        model, window, share_count, columns, activities, objective
+    )
+    result = solve_with_highs(
+        sub_model,
+        configuration=configuration,
+        warm_start=np.asarray(columns[free], dtype=np.float64),
+        retain_warm_start=True,
+    )
+    if (
+        result.status not in {"optimal", "feasible"}
+        or result.native_columns is None
+        or result.objective_value is None
+        or not _improves(result.objective_value, objective, maximize=model.maximize)
+    ):
+        return None
+    return free, np.asarray(result.native_columns), float(result.objective_value)
+
+
+def _column_entries(
+    columns: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Gather the rows, local column positions, and values of some columns."""
+    column_starts, row_indices, values = _WORKER_STATE["column_major"]  # type: ignore[misc]
+    starts = np.asarray(column_starts[columns], dtype=np.int64)
+    counts = np.asarray(column_starts[columns + 1], dtype=np.int64) - starts
+    positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(
+        int(counts.sum()), dtype=np.int64
+    )
+    return (
+        np.asarray(row_indices[positions], dtype=np.int64),
+        np.repeat(np.arange(len(columns), dtype=np.int64), counts),
+        np.asarray(values[positions], dtype=np.float64),
+    )
+
+
+def _window_model(
+    model: CompiledOptimizationModel,
+    window: np.ndarray,
+    share_count: int,
+    columns: np.ndarray,
+    activities: np.ndarray,
+    objective: float,
+) -> tuple[CompiledOptimizationModel, np.ndarray]:
+    """Restrict the model to one window with every other column fixed.
+
+    The free set is the window's primary columns plus every selected-neighbour
+    auxiliary touching them, found through the window's own neighbour rows.
+    Rows shared with other windows may move by at most ``1 / share_count`` of
+    their current slack in either direction. The fixed columns' objective is
+    ``objective`` less the free columns' part, so no step scans every column.
+    """
+    window = np.sort(np.asarray(window, dtype=np.int64))
+    window_rows, _, _ = _column_entries(window)
+    neighbor = np.zeros(len(window_rows), dtype=bool)
+    for start, stop in _WORKER_STATE["neighbor_rows"]:  # type: ignore[attr-defined]
+        neighbor |= (window_rows >= start) & (window_rows < stop)
+    auxiliaries = np.unique(
+        np.asarray(
+            model.column_indices[model.row_starts[window_rows[neighbor]]],
+            dtype=np.int64,
+        )
+    )
+    free = np.concatenate((window, auxiliaries))
+    entry_rows, entry_columns, entry_values = _column_entries(free)
+    rows, local_rows = np.unique(entry_rows, return_inverse=True)
+    block = sparse.csr_array(
+        (entry_values, (local_rows, entry_columns)), shape=(len(rows), len(free))
+    )
+    block.sort_indices()
+    free_activity = block @ np.asarray(columns[free], dtype=np.float64)
+    current_activity = np.asarray(activities[rows], dtype=np.float64)
+    fixed_activity = current_activity - free_activity
+    row_lower = np.asarray(model.row_lower[rows], dtype=np.float64) - fixed_activity
+    row_upper = np.asarray(model.row_upper[rows], dtype=np.float64) - fixed_activity
+    shared = _WORKER_STATE["shared_rows"][rows]
+    if share_count > 1 and np.any(shared):
+        lower_slack = np.maximum(current_activity - model.row_lower[rows], 0.0)
+        upper_slack = np.maximum(model.row_upper[rows] - current_activity, 0.0)
+        row_lower[shared] = np.maximum(
+            row_lower[shared],
+            free_activity[shared] - lower_slack[shared] / share_count,
+        )
+        row_upper[shared] = np.minimum(
+            row_upper[shared],
+            free_activity[shared] + upper_slack[shared] / share_count,
+        )
+    free_objective = np.asarray(model.objective[free], dtype=np.float64)
+    return (
+        CompiledOptimizationModel(
+            objective=free_objective,
+            variable_lower=np.asarray(model.variable_lower[free], dtype=np.float64),
+            variable_upper=np.asarray(model.variable_upper[free], dtype=np.float64),
+            integrality=np.asarray(model.integrality[free]),
+            row_starts=block.indptr.astype(np.int64),
+            column_indices=block.indices.astype(np.int32),
+            coefficients=block.data.astype(np.float64),
+            row_lower=row_lower,
+            row_upper=row_upper,
+            row_names=CompactRowNames((("lns_window", 0, len(rows)),), len(rows)),
+            primary_variable_count=len(window),
+            maximize=model.maximize,
+            objective_offset=objective - float(np.dot(free_objective, columns[free])),
+        ),
+        free,
+    )
+
+
+def _progress(
+    started: float,
+    objective: float,
+    bound: float | None,
+    statistics: dict[str, object],
+) -> dict[str, object]:
+    """Describe the search in the same shape as monolithic solve progress."""
+    return {
+        "phase": "lns",
+        "elapsed_seconds": time.perf_counter() - started,
+        "incumbent_objective": objective,
+        "best_bound": bound,
+        "optimality_gap": _relative_gap(objective, bound),
+        "incumbent_count": statistics["accepted_windows"],
+        "lns": dict(statistics),
+        "memory": process_memory_sample(),
+    }
+
+
+def _improves(candidate: float, incumbent: float, *, maximize: bool) -> bool:
+    """Return whether an objective strictly improves beyond a relative tolerance."""
+    margin = IMPROVEMENT_TOLERANCE * max(1.0, abs(incumbent))
+    if maximize:
+        return candidate > incumbent + margin
+    return candidate < incumbent - margin
+
+
+def _within_gap(gap: float | None, configuration: SolveConfiguration) -> bool:
+    """Return whether a gap satisfies the configured relative gap."""
+    return gap is not None and gap <= configuration.effective_relative_mip_gap + 1e-12
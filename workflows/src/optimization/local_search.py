@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .highs import _columns_are_feasible, _neighbor_columns, _populate_neighbor_columns
+from .model import CompiledOptimizationModel
+
+LOCAL_SEARCH_TIME_BUDGET_SECONDS = 30.0
+LOCAL_SEARCH_TIME_FRACTION = 0.1
+LOCAL_SEARCH_MAX_ROUNDS = 10_000
+LOCAL_SEARCH_MAX_BATCH = 65_536
+SWAP_ROW_LIMIT = 64
+SWAP_CANDIDATE_COUNT = 64
+STRUCTURE_BATCH_ENTRIES = 1_048_576
+TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class LocalSearchIncumbent:
+    """Certified-feasible native columns produced by constraint-aware search."""
+
+    columns: np.ndarray
+    objective_value: float
+    elapsed_seconds: float
+    round_count: int
+    flip_count: int
+    swap_count: int
+
+
+@dataclass
+class _SearchState:
+    """Primary bound choices with incrementally maintained constraint activities."""
+
+    at_upper: np.ndarray
+    activities: np.ndarray
+
+
+def local_search_budget_seconds(time_limit_seconds: float | None) -> float:
+    """Return the local-search share of a solve's time limit."""
+    if time_limit_seconds is None:
+        return LOCAL_SEARCH_TIME_BUDGET_SECONDS
+    return min(
+        LOCAL_SEARCH_TIME_BUDGET_SECONDS,
+        LOCAL_SEARCH_TIME_FRACTION * float(time_limit_seconds),
+    )
+
+
+def build_local_search_warm_start(
+    model: CompiledOptimizationModel,
+    *,
+    initial_columns: np.ndarray | None = None,
+    time_budget_seconds: float = LOCAL_SEARCH_TIME_BUDGET_SECONDS,
+) -> LocalSearchIncumbent | None:
+    """Repair and improve a primary selection under every aggregate row.
+
+    Primary columns move between their lower and upper bounds. A repair phase
+    applies batches of flips that reduce total row violation; an improvement
+    phase then applies batches of add or drop flips with positive objective
+    gain, including selected-neighbour gain, that keep every row satisfied.
+    When no single flip improves, pairs of flips are tried as swaps on models
+    with few aggregate rows. Row activities are updated incrementally through
+    a column-major copy of the non-neighbour rows, and a batch that overshoots
+    is reverted and halved.
+
+    Args:
+        model: Complete compiled optimization model.
+        initial_columns: Optional native-column starting point.
+        time_budget_seconds: Wall-clock budget checked between structure
+            batches and between rounds.
+
+    Returns:
+        The improved incumbent, or ``None`` when no feasible selection was found
+        or the model has rows this heuristic does not own.
+    """
+    started = time.perf_counter()
+    primary_count = model.primary_variable_count
+    structure = _constraint_structure(model, deadline=started + time_budget_seconds)
+    if structure is None:
+        return None
+    constraint_rows, column_starts, entry_rows, entry_columns, entry_values = structure
+    lower = np.asarray(model.variable_lower[:primary_count], dtype=np.float64)
+    upper = np.asarray(model.variable_upper[:primary_count], dtype=np.float64)
+    span = upper - lower
+    movable = np.isfinite(span) & (span > TOLERANCE)
+    row_lower = np.asarray(model.row_lower, dtype=np.float64)[constraint_rows]
+    row_upper = np.asarray(model.row_upper, dtype=np.float64)[constraint_rows]
+    finite_bounds = np.where(
+        np.isfinite(row_upper), np.abs(row_upper), np.abs(row_lower)
+    )
+    row_weights = 1.0 / np.maximum(np.nan_to_num(finite_bounds, posinf=1.0), 1.0)
+    sense = 1.0 if model.maximize else -1.0
+    objective = sense * np.asarray(model.objective[:primary_count], dtype=np.float64)
+    edge_columns, first_columns, second_columns = _neighbor_columns(model)
+    edge_values = sense * np.asarray(model.objective[edge_columns], dtype=np.float64)
+    if initial_columns is None:
+        at_upper = movable & (objective > 0)
+    else:
+        midpoint = lower + span / 2
+        at_upper = movable & (
+            np.asarray(initial_columns[:primary_count], dtype=np.float64) > midpoint
+        )
+    state = _SearchState(at_upper=at_upper, activities=np.empty(0))
+    state.activities = _activities(
+        lower + np.where(state.at_upper, span, 0.0),
+        entry_rows,
+        entry_columns,
+        entry_values,
+        len(constraint_rows),
+    )
+
+    def out_of_time() -> bool:
+        return time.perf_counter() - started > time_budget_seconds
+
+    def steps() -> np.ndarray:
+        return np.where(state.at_upper, -span, span)
+
+    def gains(step: np.ndarray) -> np.ndarray:
+        values = lower + np.where(state.at_upper, span, 0.0)
+        neighbor = np.zeros(primary_count, dtype=np.float64)
+        if edge_columns.size:
+            neighbor += np.bincount(
+                first_columns,
+                weights=edge_values * values[second_columns],
+                minlength=primary_count,
+            )
+            neighbor += np.bincount(
+                second_columns,
+                weights=edge_values * values[first_columns],
+                minlength=primary_count,
+            )
+        return (objective + neighbor) * step
+
+    def violations(activities: np.ndarray) -> np.ndarray:
+        return np.maximum(row_lower - activities, 0.0) + np.maximum(
+            activities - row_upper, 0.0
+        )
+
+    def flip_effects(step: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return per-column violation change and rows each flip would break."""
+        moved = state.activities[entry_rows] + entry_values * step[entry_columns]
+        after = np.maximum(row_lower[entry_rows] - moved, 0.0) + np.maximum(
+            moved - row_upper[entry_rows], 0.0
+        )
+        before = violations(state.activities)[entry_rows]
+        change = np.bincount(
+            entry_columns, weights=after - before, minlength=primary_count
+        )
+        broken = np.bincount(
+            entry_columns,
+            weights=(after > TOLERANCE).astype(np.float64),
+            minlength=primary_count,
+        )
+        return change, broken
+
+    def consumption(step: np.ndarray) -> np.ndarray:
+        """Return each flip's movement across rows, weighted by row tightness."""
+        tightness = row_weights * np.maximum(
+            np.where(np.isfinite(row_upper), state.activities, 0.0),
+            np.where(np.isfinite(row_lower), 2 * row_lower - state.activities, 0.0),
+        )
+        return np.bincount(
+            entry_columns,
+            weights=np.abs(entry_values * step[entry_columns])
+            * np.maximum(tightness, TOLERANCE)[entry_rows],
+            minlength=primary_count,
+        )
+
+    def apply(columns: np.ndarray, step: np.ndarray) -> np.ndarray:
+        """Flip columns in place and return the previous activities."""
+        previous = state.activities.copy()
+        entries = _column_entries(column_starts, columns)
+        state.activities += np.bincount(
+            entry_rows[entries],
+            weights=entry_values[entries] * step[entry_columns[entries]],
+            minlength=len(constraint_rows),
+        )
+        state.at_upper[columns] = ~state.at_upper[columns]
+        return previous
+
+    def revert(columns: np.ndarray, previous: np.ndarray) -> None:
+        state.at_upper[columns] = ~state.at_upper[columns]
+        state.activities = previous
+
+    round_count = 0
+    flip_count = 0
+    swap_count = 0
+    batch_size = LOCAL_SEARCH_MAX_BATCH
+    total_violation = float(violations(state.activities).sum())
+    while total_violation > TOLERANCE:
+        if out_of_time() or round_count >= LOCAL_SEARCH_MAX_ROUNDS:
+            return None
+        round_count += 1
+        step = steps()
+        change, _ = flip_effects(step)
+        candidates = np.flatnonzero(movable & (change < -TOLERANCE))
+        if candidates.size == 0:
+            return None
+        order = np.lexsort((-gains(step)[candidates], change[candidates]))
+        batch = candidates[order[:batch_size]]
+        previous = apply(batch, step)
+        repaired = float(violations(state.activities).sum())
+        if repaired < total_violation - TOLERANCE:
+            total_violation = repaired
+            flip_count += len(batch)
+            batch_size = min(batch_size * 2, LOCAL_SEARCH_MAX_BATCH)
+        else:
+            revert(batch, previous)
+            batch_size = max(batch_size // 2, 1)
+    batch_size = LOCAL_SEARCH_MAX_BATCH
+    while not out_of_time() and round_count < LOCAL_SEARCH_MAX_ROUNDS:
+        round_count += 1
+        step = steps()
+        gain = gains(step)
+        _, broken = flip_effects(step)
+        candidates = np.flatnonzero(movable & (gain > TOLERANCE) & (broken == 0))
+        if candidates.size == 0:
+            swap = _best_swap(
+                state,
+                movable,
+                gain,
+                broken,
+                step,
+                column_starts,
+                entry_rows,
+                entry_values,
+                row_lower,
+                row_upper,
+                (first_columns, second_columns, edge_values),
+            )
+            if swap is None:
+                break
+            apply(swap, step)
+            swap_count += 1
+            continue
+        density = gain[candidates] / (consumption(step)[candidates] + TOLERANCE)
+        batch = candidates[np.argsort(-density, kind="stable")[:batch_size]]
+        previous = apply(batch, step)
+        if float(violations(state.activities).sum()) <= TOLERANCE:
+            flip_count += len(batch)
+            batch_size = min(batch_size * 2, LOCAL_SEARCH_MAX_BATCH)
+        else:
+            revert(batch, previous)
+            batch_size = max(batch_size // 2, 1)
+    columns = np.asarray(model.variable_lower, dtype=np.float64).copy()
+    columns[:primary_count] = lower + np.where(state.at_upper, span, 0.0)
+    _populate_neighbor_columns(model, columns)
+    if not _columns_are_feasible(model, columns):
+        return None
+    return LocalSearchIncumbent(
+        columns=columns,
+        objective_value=float(
+            np.dot(model.objective, columns) + model.objective_offset
+        ),
+        elapsed_seconds=time.perf_counter() - started,
+        round_count=round_count,
+        flip_count=flip_count,
+        swap_count=swap_count,
+    )
+
+
+def _constraint_structure(
+    model: CompiledOptimizationModel,
+    *,
+    deadline: float = math.inf,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """Return non-neighbour rows as column-major entries over primary columns.
+
+    Entries are read in bounded batches, and each batch checks ``deadline``.
+    A first pass counts entries per column. A second pass places every batch
+    with a counting sort, so no argsort ever spans all the entries.
+
+    Returns ``None`` when the deadline passes or a row reaches an auxiliary
+    column.
+    """
+    primary_count = model.primary_variable_count
+    row_starts = np.asarray(model.row_starts, dtype=np.int64)
+    blocks = getattr(model.row_names, "blocks", None)
+    if blocks is None:
+        constraint_rows = np.asarray(
+            [
+                row_index
+                for row_index, name in enumerate(model.row_names)
+                if not name.startswith("neighbor_")
+            ],
+            dtype=np.int64,
+        )
+    else:
+        constraint_rows = np.concatenate(
+            [np.asarray([], dtype=np.int64)]
+            + [
+                np.arange(start, stop, dtype=np.int64)
+                for name, start, stop in blocks
+                if not name.startswith("neighbor_")
+            ]
+        )
+    lengths = row_starts[constraint_rows + 1] - row_starts[constraint_rows]
+    ends = np.cumsum(lengths)
+    total = int(ends[-1]) if len(ends) else 0
+
+    def read(start: int) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """Return local rows, columns, and values of one entry batch."""
+        if time.perf_counter() > deadline:
+            return None
+        positions = np.arange(
+            start, min(start + STRUCTURE_BATCH_ENTRIES, total), dtype=np.int64
+        )
+        local_rows = np.searchsorted(ends, positions, side="right")
+        sources = (
+            row_starts[constraint_rows[local_rows]]
+            + positions
+            - (ends[local_rows] - lengths[local_rows])
+        )
+        return (
+            local_rows,
+            np.asarray(model.column_indices[sources], dtype=np.int64),
+            np.asarray(model.coefficients[sources], dtype=np.float64),
+        )
+
+    counts = np.zeros(primary_count, dtype=np.int64)
+    for start in range(0, total, STRUCTURE_BATCH_ENTRIES):
+        batch = read(start)
+        if batch is None:
+            return None
+        _, columns, _ = batch
+        if np.any(columns >= primary_count):
+            return None
+        counts += np.bincount(columns, minlength=primary_count)
+    column_starts = np.zeros(primary_count + 1, dtype=np.int64)
+    np.cumsum(counts, out=column_starts[1:])
+    entry_rows = np.empty(total, dtype=np.int64)
+    entry_columns = np.empty(total, dtype=np.int64)
+    entry_values = np.empty(total, dtype=np.float64)
+    cursor = column_starts[:-1].copy()
+    for start in range(0, total, STRUCTURE_BATCH_ENTRIES):
+        batch = read(start)
+        if batch is None:
+            return None
+        rows, columns, values = batch
+        order = np.argsort(columns, kind="stable")
+        ordered = columns[order]
+        # Rank within the batch keeps row order inside every column.
+        rank = np.arange(len(ordered), dtype=np.int64) - np.searchsorted(
+            ordered, ordered, side="left"
+        )
+        positions = cursor[ordered] + rank
+        entry_rows[positions] = rows[order]
+        entry_columns[positions] = ordered
+        entry_values[positions] = values[order]
+        present, present_counts = np.unique(ordered, return_counts=True)
+        cursor[present] += present_counts
+    return constraint_rows, column_starts, entry_rows, entry_columns, entry_values
+
+
+def _ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenate ``arange(start, start + length)`` for aligned arrays."""
+    total = int(lengths.sum())
+    if total == 0:
+        return np.asarray([], dtype=np.int64)
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(total, dtype=np.int64)
+
+
+def _column_entries(column_starts: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    """Return column-major entry positions belonging to the given columns."""
+    return _ranges(
+        column_starts[columns],
+        column_starts[columns + 1] - column_starts[columns],
+    )
+
+
+def _activities(
+    values: np.ndarray,
+    entry_rows: np.ndarray,
+    entry_columns: np.ndarray,
+    entry_values: np.ndarray,
+    row_count: int,
+) -> np.ndarray:
+    """Evaluate the constraint rows for primary values."""
+    return np.bincount(
+        entry_rows,
+        weights=entry_values * values[entry_columns],
+        minlength=row_count,
+    )
+
+
+def _best_swap(
+    state: _SearchState,
+    movable: np.ndarray,
+    gain: np.ndarray,
+    broken: np.ndarray,
+    step: np.ndarray,
+    column_starts: np.ndarray,
+    entry_rows: np.ndarray,
+    entry_values: np.ndarray,
+    row_lower: np.ndarray,
+    row_upper: np.ndarray,
+    edges: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> np.ndarray | None:
+    """Pair one blocked improving flip with one non-improving compensating flip.
+
+    Each flip's gain assumes its neighbours stay put, so a pair joined by a
+    neighbour edge also gains the edge value times the product of both steps.
+    """
+    row_count = len(row_lower)
+    if row_count == 0 or row_count > SWAP_ROW_LIMIT:
+        return None
+    blocked = np.flatnonzero(movable & (gain > TOLERANCE) & (broken > 0))
+    if blocked.size == 0:
+        return None
+    first = blocked[np.argsort(-gain[blocked], kind="stable")[:SWAP_CANDIDATE_COUNT]]
+    others = np.flatnonzero(movable & (gain <= TOLERANCE))
+    if others.size == 0:
+        return None
+    relief = np.bincount(
+        np.repeat(
+            np.arange(len(column_starts) - 1, dtype=np.int64),
+            np.diff(column_starts),
+        ),
+        weights=np.abs(entry_values),
+        minlength=len(column_starts) - 1,
+    )[others] * np.abs(step[others])
+    by_gain = np.argsort(-gain[others], kind="stable")[:SWAP_CANDIDATE_COUNT]
+    by_relief = np.argsort(-gain[others] / (relief + TOLERANCE), kind="stable")[
+        :SWAP_CANDIDATE_COUNT
+    ]
+    second = others[np.unique(np.concatenate((by_gain, by_relief)))]
+
+    def row_deltas(columns: np.ndarray) -> np.ndarray:
+        deltas = np.zeros((row_count, len(columns)), dtype=np.float64)
+        lengths = column_starts[columns + 1] - column_starts[columns]
+        entries = _ranges(column_starts[columns], lengths)
+        local = np.repeat(np.arange(len(columns), dtype=np.int64), lengths)
+        np.add.at(
+            deltas,
+            (entry_rows[entries], local),
+            entry_values[entries] * np.repeat(step[columns], lengths),
+        )
+        return deltas
+
+    moved = (
+        state.activities[:, None, None]
+        + row_deltas(first)[:, :, None]
+        + row_deltas(second)[:, None, :]
+    )
+    feasible = np.all(
+        (moved >= row_lower[:, None, None] - TOLERANCE)
+        & (moved <= row_upper[:, None, None] + TOLERANCE),
+        axis=0,
+    )
+    combined = gain[first][:, None] + gain[second][None, :]
+    edge_first, edge_second, edge_values = edges
+    if edge_values.size:
+        first_position = np.full(len(step), -1, dtype=np.int64)
+        first_position[first] = np.arange(len(first), dtype=np.int64)
+        second_position = np.full(len(step), -1, dtype=np.int64)
+        second_position[second] = np.arange(len(second), dtype=np.int64)
+        for one, other in ((edge_first, edge_second), (edge_second, edge_first)):
+            rows = first_position[one]
+            columns = second_position[other]
+            joined = (rows >= 0) & (columns >= 0)
+            np.add.at(
+                combined,
+                (rows[joined], columns[joined]),
+                edge_values[joined] * step[one[joined]] * step[other[joined]],
+            )
+    pair_gain = np.where(feasible, combined, -np.inf)
+    best = np.unravel_index(int(np.argmax(pair_gain)), pair_gain.shape)
+    if not pair_gain[best] > TOLERANCE:
+        return None
+    return np.asarray([first[best[0]], second[best[1]]], dtype=np.int64)
@@ -27,6 +27,7 @@ class NeighborCompilationMetadata:
     normalization_scale: float
     resolved_coefficient: float
     status: Literal["active", "degenerate"]
+    fixed_in_neighbor_counts: np.ndarray
 
 
 class CompactRowNames(Sequence[str]):
@@ -132,6 +133,7 @@ class CompilationReconstruction:
     canonical_objectives: tuple[CanonicalObjectiveValues, ...]
     neighbor: NeighborCompilationMetadata | None
     reduction: ReductionStatistics
+    aggregate_rows: tuple[Mapping[str, object], ...] = ()
 
     @property
     def planning_unit_count(self) -> int:
@@ -174,13 +176,39 @@ class SolverResult:
     diagnostics: dict[str, object] | None = None
 
 
+@dataclass(frozen=True)
+class SolverProfile:
+    """Name one seed, option variant, and backend raced against the same model."""
+
+    name: str
+    random_seed: int
+    options: Mapping[str, int | float | str | bool] | None = None
+    backend: str = "highs"
+
+
 @dataclass(frozen=True)
 class SolveConfiguration:
     """Authoritative solver policy that does not alter compiled-model identity.
 
     ``standard`` accepts a certified feasible incumbent when HiGHS reaches the
     configured limit. ``exact_audit`` requires a proven optimum and therefore
-    always requests zero relative and absolute MIP gaps.
+    always requests zero relative and absolute MIP gaps. ``lp_repair`` solves
+    the LP relaxation, repairs its rounding into an incumbent bounded by the LP
+    objective, and solves the full MIP only when that gap exceeds
+    ``relative_mip_gap``. Two or more
+    ``race_profiles`` solve the same model in that many worker processes and
+    keep the first result certified within the configured gap. Continuous
+    models that do not need a basic solution may clear ``vertex_solution`` so
+    large interior-point solves skip crossover. With ``gap_plateau_seconds``, a
+    MIP that has an incumbent but whose relative gap shrinks by no more than
+    ``gap_plateau_improvement`` over that many seconds stops early as
+    ``feasible``; exact audits never stop early. With ``memory_limit_fraction``,
+    a MIP whose resident memory crosses that fraction of the worker's memory
+    limit is interrupted and returns its incumbent, so the kernel does not kill
+    the worker first. ``backend`` names the registered solver backend of a
+    single solve; raced profiles name their own. A solve given no warm start
+    builds one within its time limit unless ``warm_start_search`` is cleared,
+    as it is for race workers that share the race's single seed.
     """
 
     time_limit_seconds: float | None = None
@@ -189,8 +217,15 @@ class SolveConfiguration:
     thread_count: int | None = None
     random_seed: int = 0
     output_flag: bool = False
-    mode: Literal["standard", "exact_audit"] = "standard"
+    mode: Literal["standard", "exact_audit", "lp_repair"] = "standard"
     options: Mapping[str, int | float | str | bool] | None = None
+    race_profiles: tuple[SolverProfile, ...] = ()
+    vertex_solution: bool = True
+    gap_plateau_seconds: float | None = None
+    gap_plateau_improvement: float = 1e-3
+    memory_limit_fraction: float | None = None
+    backend: str = "highs"
+    warm_start_search: bool = True
 
     def __post_init__(self) -> None:
         """Reject ambiguous or invalid solver resource settings."""
@@ -202,6 +237,14 @@ class SolveConfiguration:
             raise ValueError("Absolute MIP gap cannot be negative.")
         if self.thread_count is not None and self.thread_count <= 0:
             raise ValueError("Solver thread count must be positive.")
+        if self.gap_plateau_seconds is not None and self.gap_plateau_seconds <= 0:
+            raise ValueError("Gap plateau window must be positive.")
+        if self.gap_plateau_improvement < 0:
+            raise ValueError("Gap plateau improvement cannot be negative.")
+        if self.memory_limit_fraction is not None and not (
+            0 < self.memory_limit_fraction <= 1
+        ):
+            raise ValueError("Memory limit fraction must be in (0, 1].")
         reserved_options = {
             "time_limit",
             "mip_rel_gap",
@@ -211,11 +254,16 @@ class SolveConfiguration:
             "output_flag",
         }
         conflicts = reserved_options.intersection(self.options or {})
+        for profile in self.race_profiles:
+            conflicts |= reserved_options.intersection(profile.options or {})
         if conflicts:
             raise ValueError(
                 "Solve options cannot override authoritative settings: "
                 + ", ".join(sorted(conflicts))
             )
+        profile_names = [profile.name for profile in self.race_profiles]
+        if len(set(profile_names)) != len(profile_names):
+            raise ValueError("Solver race profile names must be unique.")
 
     @property
     def effective_relative_mip_gap(self) -> float:
@@ -227,6 +275,11 @@ class SolveConfiguration:
         """Return the absolute gap passed to HiGHS for the selected solve mode."""
         return 0.0 if self.mode == "exact_audit" else self.absolute_mip_gap
 
+    @property
+    def effective_gap_plateau_seconds(self) -> float | None:
+        """Return the plateau window, or ``None`` when early stops are disabled."""
+        return None if self.mode == "exact_audit" else self.gap_plateau_seconds
+
 
 @dataclass(frozen=True)
 class RowBoundOverride:
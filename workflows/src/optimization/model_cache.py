@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+from .artifact import ARTIFACT_SCHEMA_VERSION
+from .compiler import COMPILER_VERSION
+
+MODEL_CACHE_SCHEMA_VERSION = 1
+MODEL_CACHE_PREFIX = "compiled_model_cache"
+
+
+def source_content_root(source: Mapping[str, Any]) -> str | None:
+    """Return the content address of an analytical source snapshot.
+
+    Published sources carry the ``content_root`` of their committed parts;
+    registered sources record the same value as their ``checksum``. A source
+    with neither cannot address cached models and returns ``None``.
+    """
+    value = source.get("content_root") or source.get("checksum")
+    return str(value) if value else None
+
+
+def model_cache_key(
+    problem_definition: Mapping[str, Any],
+    *,
+    content_root: str,
+    grid_extent: Any,
+    planning_unit_definition: Mapping[str, Any],
+) -> str:
+    """Address one compiled model by its problem definition and source content.
+
+    The key also covers the compiled artifact schema and ``COMPILER_VERSION``,
+    so a workflows compiler change never serves a model built by an older one.
+    """
+    definition = {
+        "problem_definition": problem_definition,
+        "content_root": content_root,
+        "grid_extent": grid_extent,
+        "planning_unit_definition": planning_unit_definition,
+        "compiler_version": COMPILER_VERSION,
+        "artifact_schema_version": ARTIFACT_SCHEMA_VERSION,
+    }
+    digest = hashlib.sha256(b"compiled-model-cache-v1\0")
+    digest.update(
+        json.dumps(definition, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    )
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class ModelCacheEntry:
+    """Size and timestamps of one committed cache entry."""
+
+    cache_key: str
+    size_bytes: int
+    created_at: float
+    last_used_at: float
+
+    @classmethod
+    def from_dict(cls, value: Mapping[str, Any]) -> ModelCacheEntry:
+        """Read the eviction fields of a committed entry document."""
+        created_at = float(value["created_at"])
+        return cls(
+            cache_key=str(value["cache_key"]),
+            size_bytes=int(value["size_bytes"]),
+            created_at=created_at,
+            last_used_at=float(value.get("last_used_at", created_at)),
+        )
+
+
+@dataclass(frozen=True)
+class ModelCacheEvictionPolicy:
+    """Bound cache entries by age since compile and by total referenced bytes.
+
+    ``max_bytes`` of ``None`` leaves the total unbounded. Entries past
+    ``max_age_seconds`` are never served, even before they are evicted.
+    """
+
+    max_age_seconds: float
+    max_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        """Reject non-positive cache bounds."""
+        if not math.isfinite(self.max_age_seconds) or self.max_age_seconds <= 0:
+            raise ValueError("Model cache maximum age must be finite and positive.")
+        if self.max_bytes is not None and self.max_bytes <= 0:
+            raise ValueError("Model cache byte capacity must be positive.")
+
+    def is_expired(self, entry: ModelCacheEntry, now: float) -> bool:
+        """Return whether an entry is too old to serve."""
+        return now - entry.created_at > self.max_age_seconds
+
+    def select_evictions(
+        self, entries: Iterable[ModelCacheEntry], now: float
+    ) -> list[str]:
+        """Return the keys to evict: expired entries, then least recently used.
+
+        Live entries are kept newest use first while their cumulative size
+        fits ``max_bytes``; the first entry that does not fit and every less
+        recently used entry are evicted.
+        """
+        evicted: list[str] = []
+        live: list[ModelCacheEntry] = []
+        for entry in entries:
+            if self.is_expired(entry, now):
+                evicted.append(entry.cache_key)
+            else:
+                live.append(entry)
+        if self.max_bytes is None:
+            return evicted
+        retained_bytes = 0
+        for entry in sorted(
+            live, key=lambda value: (value.last_used_at, value.created_at), reverse=True
+        ):
+            retained_bytes += entry.size_bytes
+            if retained_bytes > self.max_bytes:
+                evicted.append(entry.cache_key)
+        return evicted
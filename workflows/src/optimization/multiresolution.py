@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from .grid import parent_cell_ids
+from .highs import _columns_are_feasible, _populate_neighbor_columns
+from .local_search import (
+    LOCAL_SEARCH_TIME_BUDGET_SECONDS,
+    build_local_search_warm_start,
+)
+from .model import CompiledOptimizationModel
+
+COARSE_TIME_FRACTION = 0.1
+
+
+def project_coarse_decisions(
+    cell_ids: np.ndarray | Sequence[int],
+    *,
+    grid_width: int,
+    coarse_cell_ids: np.ndarray | Sequence[int],
+    coarse_decisions: np.ndarray | Sequence[float],
+    coarse_grid_width: int,
+    factor: int,
+) -> np.ndarray:
+    """Give each fine planning unit the decision of its enclosing coarse cell.
+
+    Both cell-ID sets must come from the same nested grid family, so a fine
+    cell's parent is found by integer division of its row and column. Fine
+    cells whose parent was not a coarse candidate receive zero.
+    """
+    parents = parent_cell_ids(cell_ids, grid_width, coarse_grid_width, factor)
+    coarse_ids = np.asarray(coarse_cell_ids, dtype=np.uint64)
+    decisions = np.asarray(coarse_decisions, dtype=np.float64)
+    if coarse_ids.shape != decisions.shape:
+        raise ValueError("Coarse cell IDs and decisions must align.")
+    projected = np.zeros(len(parents), dtype=np.float64)
+    if coarse_ids.size == 0:
+        return projected
+    order = np.argsort(coarse_ids, kind="stable")
+    sorted_ids = coarse_ids[order]
+    positions = np.minimum(np.searchsorted(sorted_ids, parents), len(sorted_ids) - 1)
+    found = sorted_ids[positions] == parents
+    projected[found] = decisions[order][positions[found]]
+    return projected
+
+
+def build_projected_warm_start(
+    model: CompiledOptimizationModel,
+    primary_values: np.ndarray | Sequence[float],
+    *,
+    local_search_seconds: float = LOCAL_SEARCH_TIME_BUDGET_SECONDS,
+) -> np.ndarray | None:
+    """Round projected primary values and repair them into a feasible incumbent.
+
+    Integer primaries are rounded at one half and continuous primaries are
+    clipped to their bounds. When aggregate rows reject the projection, the
+    constraint-aware local search repairs and improves it within its budget.
+
+    Returns:
+        Feasible native columns, or ``None`` when repair did not succeed.
+    """
+    primary_count = model.primary_variable_count
+    values = np.asarray(primary_values, dtype=np.float64)
+    if values.shape != (primary_count,):
+        raise ValueError("Projected values must contain one value per primary column.")
+    lower = np.asarray(model.variable_lower, dtype=np.float64)
+    upper = np.asarray(model.variable_upper, dtype=np.float64)
+    columns = lower.copy()
+    integer = np.asarray(model.integrality[:primary_count]) != 0
+    columns[:primary_count] = np.where(
+        integer,
+        np.where(values >= 0.5, upper[:primary_count], lower[:primary_count]),
+        np.clip(values, lower[:primary_count], upper[:primary_count]),
+    )
+    _populate_neighbor_columns(model, columns)
+    if _columns_are_feasible(model, columns):
+        return columns
+    searched = build_local_search_warm_start(
+        model,
+        initial_columns=columns,
+        time_budget_seconds=local_search_seconds,
+    )
+    return searched.columns if searched is not None else None
@@ -249,6 +249,21 @@ def count_neighbor_edges(structure: NeighborStructure) -> int:
     return sum(block.count for block in iter_neighbor_edge_blocks(structure))
 
 
+def attainable_neighbor_edge_count(
+    structure: NeighborStructure, fixed_values: np.ndarray
+) -> int:
+    """Count rook edges whose endpoints are not fixed out of the selection."""
+    values = np.asarray(fixed_values)
+    return sum(
+        int(
+            np.count_nonzero(
+                (values[block.first] != 0) & (values[block.second] != 0)
+            )
+        )
+        for block in iter_neighbor_edge_blocks(structure)
+    )
+
+
 def measure_neighbor_structure(
     structure: NeighborStructure,
 ) -> NeighborStructureCounts:
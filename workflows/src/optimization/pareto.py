@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Literal, Mapping
+
+import numpy as np
+
+from .artifact import LoadedCompiledArtifact
+from .conditioning import NumericalScaling
+from .delta import resolve_model_delta
+from .highs import HighsModelSession
+from .model import SolveConfiguration, SolverResult
+
+PARETO_METHOD = "weighted_sum_dichotomic"
+PARETO_METHOD_VERSION = 1
+EXTREME_WEIGHT = 1e-6
+
+
+@dataclass(frozen=True)
+class ParetoPoint:
+    """One supported frontier point and the importances that produced it.
+
+    ``scores`` are the oriented, normalized layer values whose importance
+    weighted sum the fused objective maximizes; ``layer_values`` are the same
+    layers' raw canonical totals in original units.
+    """
+
+    importance: Mapping[str, float]
+    scores: Mapping[str, float]
+    layer_values: Mapping[str, float]
+    objective_value: float | None
+    status: str
+    optimality_gap: float | None
+    runtime_seconds: float
+    warm_started: bool
+
+
+@dataclass(frozen=True)
+class ParetoFrontier:
+    """Supported points of a two-layer trade-off, ordered along the first layer.
+
+    ``decisions`` holds one row of candidate-column values per point: packed
+    selection bits for discrete models, float32 allocations for continuous
+    ones. ``resolved`` is false when ``maximum_points`` stopped the search.
+    """
+
+    layers: tuple[str, str]
+    points: tuple[ParetoPoint, ...]
+    decisions: np.ndarray
+    decision_encoding: Literal["packed_bits", "float32"]
+    candidate_count: int
+    resolved: bool
+    solve_count: int
+
+    def candidate_decisions(self, ordinal: int) -> np.ndarray:
+        """Return one point's candidate-column values as float64."""
+        return _decode(
+            self.decisions[ordinal],
+            self.decision_encoding == "packed_bits",
+            self.candidate_count,
+        )
+
+
+def weighted_sum_frontier(
+    artifact: LoadedCompiledArtifact,
+    *,
+    layers: tuple[str, str],
+    configuration: SolveConfiguration | None = None,
+    tolerance: float = 1e-4,
+    maximum_points: int = 32,
+    progress_callback: Callable[[dict[str, object]], None] | None = None,
+) -> ParetoFrontier:
+    """Trace the supported trade-off between two objective layers.
+
+    The search starts from both near-lexicographic extremes and then runs a
+    dichotomic search: for each pair of adjacent points it solves with the
+    importances normal to the segment between them. A point that improves that
+    weighted sum by more than ``tolerance``, in normalized score units, splits
+    the segment; otherwise the segment is resolved. The pair's total
+    importance and every other layer, bound, and neighbor strength stay at the
+    base compile's values.
+
+    Each weight vector only rewrites column costs on one HiGHS session, and
+    each solve is warm-started from the segment's first point. Weights are
+    rebuilt from canonical arrays through the delta path, so a base compile
+    whose domain presolve removed units only supports weights that keep them
+    removed; compile with ``preserve_primary_domain`` to trace the whole
+    frontier.
+
+    Raises:
+        ValueError: If the layers are not two distinct compiled objectives,
+            or a weight vector is outside the base compile's domain.
+    """
+    provenance = artifact.manifest.provenance
+    objectives = provenance.get("objectives")
+    if not isinstance(objectives, list):
+        raise ValueError("Base artifact predates delta recompilation metadata.")
+    entries = {str(entry["layer"]): entry for entry in objectives}
+    if len(set(layers)) != 2 or not set(layers) <= entries.keys():
+        raise ValueError("A frontier requires two distinct compiled objective layers.")
+    if tolerance <= 0:
+        raise ValueError("Frontier tolerance must be positive.")
+    if maximum_points < 2:
+        raise ValueError("A frontier requires at least two points.")
+    base_importance = {
+        layer: float(entry["importance"]) for layer, entry in entries.items()
+    }
+    total = base_importance[layers[0]] + base_importance[layers[1]]
+    if total <= 0:
+        raise ValueError("The frontier layers carry no importance in the base compile.")
+    base_neighbor = provenance.get("neighbor_penalty")
+    neighbor_strength = (
+        float(base_neighbor["strength"]) if isinstance(base_neighbor, dict) else None
+    )
+    aggregate_bounds: dict[str, list[tuple[float | None, float | None]]] = {}
+    for row in provenance.get("aggregate_rows") or []:
+        bounds = aggregate_bounds.setdefault(str(row["layer"]), [])
+        index = int(row["constraint_index"])
+        bounds.extend([(None, None)] * (index + 1 - len(bounds)))
+        minimum, maximum = bounds[index]
+        if row["side"] == "minimum":
+            bounds[index] = (float(row["bound"]), maximum)
+        else:
+            bounds[index] = (minimum, float(row["bound"]))
+
+    model = artifact.model
+    scaling = NumericalScaling.from_provenance(provenance) or NumericalScaling()
+    primary_count = model.primary_variable_count
+    discrete = bool(np.any(np.asarray(model.integrality[:primary_count]) != 0))
+    candidate_sources = np.asarray(artifact.candidate_source_indices, dtype=np.int64)
+    fixed_sources = np.asarray(artifact.fixed_source_indices, dtype=np.int64)
+    source_decisions = np.zeros(
+        len(candidate_sources) + len(fixed_sources), dtype=np.float64
+    )
+    source_decisions[fixed_sources] = np.asarray(artifact.fixed_values)
+    canonical = {
+        layer: (
+            np.asarray(artifact.arrays[str(entries[layer]["canonical_indices_array"])]),
+            np.asarray(
+                artifact.arrays[str(entries[layer]["canonical_values_array"])],
+                dtype=np.float64,
+            ),
+        )
+        for layer in layers
+    }
+
+    points: list[ParetoPoint] = []
+    rows: list[np.ndarray] = []
+    started = time.perf_counter()
+    with HighsModelSession(model, configuration=configuration) as session:
+
+        def solve(weights: tuple[float, float], warm: int | None) -> int:
+            importance = {**base_importance, layers[0]: weights[0]}
+            importance[layers[1]] = weights[1]
+            delta = resolve_model_delta(
+                artifact,
+                objective_importance=importance,
+                neighbor_strength=neighbor_strength,
+                aggregate_bounds=aggregate_bounds,
+            )
+            session.change_objective(delta.objective, delta.objective_offset)
+            if warm is not None:
+                columns = np.zeros(model.variable_count, dtype=np.float64)
+                columns[:primary_count] = _decode(rows[warm], discrete, primary_count)
+                session.apply_warm_start(columns)
+            result = session.solve()
+            if result.native_columns is None:
+                raise RuntimeError(
+                    f"Frontier solve returned no solution: {result.status}."
+                )
+            primary = np.asarray(result.native_columns[:primary_count])
+            source_decisions[candidate_sources] = primary
+            layer_values = {
+                layer: float(np.dot(values, source_decisions[indices]))
+                for layer, (indices, values) in canonical.items()
+            }
+            points.append(
+                _point(result, importance, entries, layer_values, scaling, warm)
+            )
+            rows.append(
+                np.packbits(primary >= 0.5) if discrete else primary.astype(np.float32)
+            )
+            if progress_callback is not None:
+                progress_callback(
+                    {
+                        "phase": "pareto_point",
+                        "point_count": len(points),
+                        "importance": {layer: importance[layer] for layer in layers},
+                        "status": result.status,
+                        "elapsed_seconds": time.perf_counter() - started,
+                    }
+                )
+            return len(points) - 1
+
+        first = solve((total * (1 - EXTREME_WEIGHT), total * EXTREME_WEIGHT), None)
+        last = solve((total * EXTREME_WEIGHT, total * (1 - EXTREME_WEIGHT)), first)
+        pending = [(first, last)]
+        resolved = True
+        while pending:
+            if len(points) >= maximum_points:
+                resolved = False
+                break
+            left, right = pending.pop()
+            a = points[left].scores
+            b = points[right].scores
+            weight_first = b[layers[1]] - a[layers[1]]
+            weight_second = a[layers[0]] - b[layers[0]]
+            if weight_first <= 0 or weight_second <= 0:
+                continue
+            normal = weight_first + weight_second
+            weights = (total * weight_first / normal, total * weight_second / normal)
+            middle = solve(weights, left)
+            scores = points[middle].scores
+            improvement = (
+                weight_first * (scores[layers[0]] - a[layers[0]])
+                + weight_second * (scores[layers[1]] - a[layers[1]])
+            ) / normal
+            if improvement > tolerance:
+                pending.extend([(middle, right), (left, middle)])
+
+    frontier = sorted(
+        range(len(points)),
+        key=lambda ordinal: (
+            -points[ordinal].scores[layers[0]],
+            points[ordinal].scores[layers[1]],
+        ),
+    )
+    kept: list[int] = []
+    for ordinal in frontier:
+        if kept and _same_scores(points[kept[-1]], points[ordinal], layers):
+            continue
+        kept.append(ordinal)
+    return ParetoFrontier(
+        layers=layers,
+        points=tuple(points[ordinal] for ordinal in kept),
+        decisions=np.stack([rows[ordinal] for ordinal in kept]),
+        decision_encoding="packed_bits" if discrete else "float32",
+        candidate_count=primary_count,
+        resolved=resolved,
+        solve_count=len(points),
+    )
+
+
+def _point(
+    result: SolverResult,
+    importance: Mapping[str, float],
+    entries: Mapping[str, Mapping[str, object]],
+    layer_values: Mapping[str, float],
+    scaling: NumericalScaling,
+    warm: int | None,
+) -> ParetoPoint:
+    """Record one frontier solve in original units."""
+    scores = {}
+    for layer, value in layer_values.items():
+        scale = float(entries[layer]["normalization_scale"])
+        sign = 1.0 if entries[layer]["direction"] == "maximize" else -1.0
+        scores[layer] = sign * value / scale if scale > 0 else 0.0
+    return ParetoPoint(
+        importance={layer: importance[layer] for layer in layer_values},
+        scores=scores,
+        layer_values=dict(layer_values),
+        objective_value=scaling.unscale_objective(result.objective_value),
+        status=result.status,
+        optimality_gap=result.optimality_gap,
+        runtime_seconds=result.runtime_seconds,
+        warm_started=warm is not None,
+    )
+
+
+def _decode(row: np.ndarray, discrete: bool, count: int) -> np.ndarray:
+    """Unpack one stored point into candidate-column values."""
+    if discrete:
+        return np.unpackbits(row, count=count).astype(np.float64)
+    return np.asarray(row, dtype=np.float64)
+
+
+def _same_scores(
+    first: ParetoPoint, second: ParetoPoint, layers: tuple[str, str]
+) -> bool:
+    """Return whether two solves reached the same point in objective space."""
+    return all(
+        abs(first.scores[layer] - second.scores[layer]) <= 1e-12 for layer in layers
+    )
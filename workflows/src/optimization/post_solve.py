@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .artifact import LoadedCompiledArtifact
+from .conditioning import NumericalScaling
+from .csr_kernels import NONZERO_BATCH_SIZE, evaluate_columns
+from .highs import apply_solve_scenario
+from .model import SolveScenario, SolverResult
+from .validation import AuthoritativeValidation, validate_evaluation
+
+RESOURCE_ROW_ROLES = frozenset({"selection_cap", "cost_cap"})
+
+
+@dataclass(frozen=True)
+class SolutionReconstruction:
+    """Validation and source-domain measures of one solver column vector.
+
+    ``decisions`` is the file-backed source-ordered vector. Objective
+    contributions follow the artifact's objective provenance order and are
+    raw, before resolved coefficients are applied. ``raw_neighbor_value`` is
+    ``None`` when the artifact has no neighbor term or predates the stored
+    neighbor reconstruction metadata.
+    """
+
+    validation: AuthoritativeValidation
+    decisions: np.ndarray
+    raw_objective_contributions: tuple[float, ...]
+    raw_neighbor_value: float | None
+    resource_value: float | None
+    selected_count: int
+    decision_total: float
+
+
+def reconstruct_solution(
+    artifact: LoadedCompiledArtifact,
+    result: SolverResult,
+    output_path: str | Path,
+    *,
+    planning_unit_count: int,
+    scenario: SolveScenario | None = None,
+    tolerance: float = 1e-6,
+    thread_count: int | None = None,
+    batch_size: int = NONZERO_BATCH_SIZE,
+) -> SolutionReconstruction:
+    """Validate and reconstruct a result in one streaming pass per array.
+
+    One threaded CSR sweep yields every row activity together with the bound,
+    integrality, and objective measures. The resource value is read from the
+    activity of the artifact's resource row block, and the neighbor value from
+    the auxiliary columns: each neighbor row holds ``aux - endpoint``, so
+    ``aux`` minus the larger of its two row activities is the smaller endpoint
+    value, and no edge is regenerated from the planning structure. A single
+    batched walk over the candidate columns then scatters source decisions
+    and adds the fixed-in neighbor terms, and each canonical objective array is
+    read once against the scattered decisions. A ``scenario`` result is
+    validated against the scenario's row and column bounds.
+    """
+    model = apply_solve_scenario(artifact.model, scenario)
+    provenance = artifact.manifest.provenance
+    columns = np.asarray(
+        (
+            result.native_columns
+            if result.native_columns is not None
+            else result.decisions
+        ),
+        dtype=np.float64,
+    )
+    if columns.shape != (model.variable_count,):
+        raise ValueError("Solver columns do not match the compiled model.")
+    candidate_sources = np.asarray(artifact.candidate_source_indices)
+    fixed_sources = np.asarray(artifact.fixed_source_indices)
+    fixed_values = np.asarray(artifact.fixed_values)
+    if len(candidate_sources) + len(fixed_sources) != planning_unit_count:
+        raise RuntimeError("Artifact reconstruction did not cover every planning unit.")
+    raw_objectives = provenance.get("objectives")
+    if not isinstance(raw_objectives, list):
+        raise RuntimeError("Compiled objective provenance is incomplete.")
+    continuous = provenance.get("decision_domain") == "continuous"
+
+    scaling = NumericalScaling.from_provenance(provenance)
+    row_exponents = (
+        scaling.row_exponent_vector(model.constraint_count)
+        if scaling is not None
+        else np.zeros(model.constraint_count, dtype=np.int32)
+    )
+    evaluation = evaluate_columns(
+        model,
+        columns,
+        row_exponents=row_exponents if scaling is not None else None,
+        thread_count=thread_count,
+    )
+    validation = validate_evaluation(
+        evaluation, result, tolerance=tolerance, scaling=scaling
+    )
+    blocks = {block.name: block for block in artifact.manifest.row_blocks}
+    resource_rows = [
+        row
+        for name in sorted(RESOURCE_ROW_ROLES & blocks.keys())
+        for row in range(blocks[name].start, blocks[name].stop)
+    ]
+    resource_value = None
+    if len(resource_rows) == 1:
+        row = resource_rows[0]
+        resource_value = math.ldexp(
+            float(evaluation.activities[row]), -int(row_exponents[row])
+        )
+
+    neighbor = provenance.get("neighbor_reconstruction")
+    fixed_in_counts = None
+    neighbor_value = None
+    if isinstance(provenance.get("neighbor_penalty"), dict) and isinstance(
+        neighbor, dict
+    ):
+        fixed_in_counts = artifact.arrays[str(neighbor["fixed_in_counts_array"])]
+        if fixed_in_counts.shape != (model.primary_variable_count,):
+            raise RuntimeError("Neighbor reconstruction counts do not align.")
+        neighbor_value = float(neighbor["constant_selected_edges"]) + (
+            _pairwise_neighbor_value(
+                evaluation.activities,
+                row_exponents,
+                columns,
+                artifact,
+                continuous=continuous,
+                batch_size=batch_size,
+            )
+        )
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    decisions = np.lib.format.open_memmap(
+        output, mode="w+", dtype=np.float32, shape=(planning_unit_count,)
+    )
+    selected_count = 0
+    decision_total = 0.0
+    for start in range(0, len(candidate_sources), batch_size):
+        stop = min(start + batch_size, len(candidate_sources))
+        batch = columns[start:stop]
+        decisions[np.asarray(candidate_sources[start:stop], dtype=np.int64)] = batch
+        selected = batch >= 0.5
+        selected_count += int(np.count_nonzero(selected))
+        decision_total += float(np.sum(batch))
+        if fixed_in_counts is not None and neighbor_value is not None:
+            weights = np.clip(batch, 0.0, 1.0) if continuous else selected
+            neighbor_value += float(
+                np.dot(
+                    np.asarray(fixed_in_counts[start:stop], dtype=np.float64), weights
+                )
+            )
+    for start in range(0, len(fixed_sources), batch_size):
+        stop = min(start + batch_size, len(fixed_sources))
+        batch = np.asarray(fixed_values[start:stop], dtype=np.float32)
+        decisions[np.asarray(fixed_sources[start:stop], dtype=np.int64)] = batch
+        selected_count += int(np.count_nonzero(batch == 1))
+        decision_total += float(np.sum(batch))
+    decisions.flush()
+
+    contributions: list[float] = []
+    for raw_objective in raw_objectives:
+        if not isinstance(raw_objective, dict):
+            raise RuntimeError("Compiled objective provenance is invalid.")
+        indices = artifact.arrays[str(raw_objective["canonical_indices_array"])]
+        values = artifact.arrays[str(raw_objective["canonical_values_array"])]
+        if indices.shape != values.shape:
+            raise RuntimeError("Canonical objective arrays do not align.")
+        contribution = 0.0
+        for start in range(0, len(indices), batch_size):
+            stop = min(start + batch_size, len(indices))
+            contribution += float(
+                np.dot(
+                    np.asarray(values[start:stop], dtype=np.float64),
+                    decisions[np.asarray(indices[start:stop], dtype=np.int64)],
+                )
+            )
+        contributions.append(contribution)
+    return SolutionReconstruction(
+        validation=validation,
+        decisions=decisions,
+        raw_objective_contributions=tuple(contributions),
+        raw_neighbor_value=neighbor_value,
+        resource_value=resource_value,
+        selected_count=selected_count,
+        decision_total=decision_total,
+    )
+
+
+def original_objective_offset(artifact: LoadedCompiledArtifact) -> float:
+    """Return the compiled objective offset in original objective units."""
+    scaling = NumericalScaling.from_provenance(artifact.manifest.provenance)
+    if scaling is None:
+        return artifact.model.objective_offset
+    return scaling.unscale_objective(artifact.model.objective_offset)
+
+
+def _pairwise_neighbor_value(
+    activities: np.ndarray,
+    row_exponents: np.ndarray,
+    columns: np.ndarray,
+    artifact: LoadedCompiledArtifact,
+    *,
+    continuous: bool,
+    batch_size: int,
+) -> float:
+    """Sum flexible-pair neighbor values from auxiliary columns and row activities."""
+    model = artifact.model
+    blocks = {block.name: block for block in artifact.manifest.row_blocks}
+    first = blocks.get("neighbor_selected_first")
+    second = blocks.get("neighbor_selected_second")
+    auxiliary_start = model.primary_variable_count
+    pairwise_count = model.variable_count - auxiliary_start
+    if first is None or second is None:
+        if pairwise_count:
+            raise RuntimeError("Neighbor auxiliary rows are missing.")
+        return 0.0
+    if not (first.stop - first.start == second.stop - second.start == pairwise_count):
+        raise RuntimeError("Neighbor auxiliary rows do not match auxiliary columns.")
+    value = 0.0
+    for start in range(0, pairwise_count, batch_size):
+        stop = min(start + batch_size, pairwise_count)
+        first_rows = slice(first.start + start, first.start + stop)
+        second_rows = slice(second.start + start, second.start + stop)
+        # Each activity is aux - endpoint, so this recovers min(endpoints).
+        smaller = columns[auxiliary_start + start : auxiliary_start + stop] - (
+            np.maximum(
+                np.ldexp(activities[first_rows], -row_exponents[first_rows]),
+                np.ldexp(activities[second_rows], -row_exponents[second_rows]),
+            )
+        )
+        value += (
+            float(np.sum(np.clip(smaller, 0.0, 1.0)))
+            if continuous
+            else float(np.count_nonzero(smaller >= 0.5))
+        )
+    return value
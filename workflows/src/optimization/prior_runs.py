@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Sequence
+
+import numpy as np
+
+from .model import WarmStart
+
+PRIOR_RUN_MINIMUM_OVERLAP = 0.5
+PRIOR_RUN_BATCH_SIZE = 1_048_576
+
+
+def candidate_ordering_hash(planning_unit_ids: np.ndarray | Sequence[int]) -> str:
+    """Hash the ordered candidate planning-unit IDs that define primary columns."""
+    ids = np.asanyarray(planning_unit_ids)
+    digest = hashlib.sha256()
+    digest.update(b"candidate-ordering-v1\0")
+    for start in range(0, len(ids), PRIOR_RUN_BATCH_SIZE):
+        digest.update(
+            np.ascontiguousarray(
+                ids[start : start + PRIOR_RUN_BATCH_SIZE], dtype="<u8"
+            ).tobytes()
+        )
+    return digest.hexdigest()
+
+
+def prior_solution_arrays(
+    candidate_planning_unit_ids: np.ndarray | Sequence[int],
+    primary_values: np.ndarray | Sequence[float],
+    fixed_planning_unit_ids: np.ndarray | Sequence[int] = (),
+    fixed_values: np.ndarray | Sequence[int] = (),
+) -> tuple[np.ndarray, np.ndarray]:
+    """Key one accepted solution by planning-unit ID so later runs can reuse it.
+
+    Fixed planning units are included with their fixed state because a later
+    run with different planning-unit constraints may leave them free.
+
+    Returns:
+        Planning-unit IDs in ascending order and their decision values.
+    """
+    candidate_ids = np.asarray(candidate_planning_unit_ids, dtype=np.uint64)
+    values = np.asarray(primary_values, dtype=np.float64)
+    if values.shape != candidate_ids.shape:
+        raise ValueError("Prior decisions must contain one value per candidate.")
+    fixed_ids = np.asarray(fixed_planning_unit_ids, dtype=np.uint64)
+    fixed_state = np.asarray(fixed_values, dtype=np.float64)
+    if fixed_ids.shape != fixed_state.shape:
+        raise ValueError("Fixed planning-unit IDs and values must align.")
+    ids = np.concatenate((candidate_ids, fixed_ids))
+    decisions = np.concatenate((values, fixed_state))
+    order = np.argsort(ids, kind="stable")
+    return ids[order], decisions[order]
+
+
+def map_prior_decisions(
+    candidate_planning_unit_ids: np.ndarray | Sequence[int],
+    prior_planning_unit_ids: np.ndarray | Sequence[int],
+    prior_decisions: np.ndarray | Sequence[float],
+) -> tuple[np.ndarray, float]:
+    """Map a prior run's decisions onto the current candidate ordering.
+
+    Candidates the prior run never decided receive zero.
+
+    Returns:
+        One value per current primary column, and the share of current
+        candidates that the prior run covered.
+    """
+    candidate_ids = np.asarray(candidate_planning_unit_ids, dtype=np.uint64)
+    prior_ids = np.asarray(prior_planning_unit_ids, dtype=np.uint64)
+    decisions = np.asarray(prior_decisions, dtype=np.float64)
+    if prior_ids.shape != decisions.shape:
+        raise ValueError("Prior planning-unit IDs and decisions must align.")
+    mapped = np.zeros(len(candidate_ids), dtype=np.float64)
+    if prior_ids.size == 0 or candidate_ids.size == 0:
+        return mapped, 0.0
+    if np.any(prior_ids[1:] < prior_ids[:-1]):
+        order = np.argsort(prior_ids, kind="stable")
+        prior_ids, decisions = prior_ids[order], decisions[order]
+    matched = 0
+    for start in range(0, len(candidate_ids), PRIOR_RUN_BATCH_SIZE):
+        stop = min(start + PRIOR_RUN_BATCH_SIZE, len(candidate_ids))
+        ids = candidate_ids[start:stop]
+        positions = np.minimum(np.searchsorted(prior_ids, ids), len(prior_ids) - 1)
+        found = prior_ids[positions] == ids
+        mapped[start:stop][found] = decisions[positions[found]]
+        matched += int(np.count_nonzero(found))
+    return mapped, matched / len(candidate_ids)
+
+
+def prior_warm_start_reference(pointer: dict[str, object]) -> WarmStart:
+    """Read the solve-independent warm-start reference from a prior-run pointer."""
+    return WarmStart(
+        mathematical_model_hash=str(pointer["mathematical_model_hash"]),
+        artifact_uri=str(pointer["artifact_uri"]),
+        artifact_content_hash=str(pointer["artifact_content_hash"]),
+        candidate_ordering_hash=str(pointer["candidate_ordering_hash"]),
+    )
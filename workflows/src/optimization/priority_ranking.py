@@ -9,6 +9,7 @@ from typing import Callable, Sequence
 
 import numpy as np
 
+from .conditioning import NumericalScaling
 from .highs import HighsModelSession, require_acceptable_result
 from .model import CompiledOptimizationModel, SolveConfiguration, SolverResult
 from .numerical import csr_row_activities
@@ -53,8 +54,14 @@ def solve_priority_ranking(
     work_directory: str | Path,
     budget_fractions: Sequence[float] = PRIORITY_BUDGET_FRACTIONS,
     progress_callback: Callable[[dict[str, object]], None] | None = None,
+    scaling: NumericalScaling | None = None,
 ) -> PriorityRankingResult:
-    """Solve nested whole-AOI increments, persist them, and synthesize the mean."""
+    """Solve nested whole-AOI increments, persist them, and synthesize the mean.
+
+    With ``scaling`` from a conditioned model, the increment diagnostics and
+    ``objective_value`` are reported in original units; ``final_result`` keeps
+    the solver's units.
+    """
     _validate_priority_model(model)
     work_path = Path(work_directory)
     work_path.mkdir(parents=True, exist_ok=True)
@@ -161,7 +168,11 @@ def solve_priority_ranking(
                 "allocation_target": target,
                 "achieved_allocation": achieved,
                 "allocation_row_activity": float(row_activities[allocation_row]),
-                "objective_value": result.objective_value,
+                "objective_value": (
+                    result.objective_value
+                    if scaling is None
+                    else scaling.unscale_objective(result.objective_value)
+                ),
                 "solver_status": result.status,
                 "runtime_seconds": result.runtime_seconds,
                 "termination_reason": result.termination_reason,
@@ -243,7 +254,11 @@ def solve_priority_ranking(
         diagnostics=tuple(diagnostics),
         budget_fractions=fractions,
         allocation_total=allocation_total,
-        objective_value=final_result.objective_value,
+        objective_value=(
+            final_result.objective_value
+            if scaling is None
+            else scaling.unscale_objective(final_result.objective_value)
+        ),
         runtime_seconds=total_runtime,
     )
 
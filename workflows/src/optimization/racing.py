@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import multiprocessing
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .highs import (
+    HighsModelSession,
+    build_budgeted_warm_start,
+    warm_start_is_feasible,
+    write_incumbent,
+)
+from .model import (
+    CompiledOptimizationModel,
+    SolveConfiguration,
+    SolverProfile,
+    SolveScenario,
+    SolverResult,
+)
+from .shared_model import (
+    SharedModelReference,
+    attach_compiled_model,
+    run_worker_processes,
+    share_compiled_model,
+)
+from ..utils.cpu import available_cpu_count
+from ..utils.memory import process_memory_sample
+
+RACE_OPTION_PROFILES: tuple[tuple[str, dict[str, int | float | str | bool]], ...] = (
+    ("default", {}),
+    ("primal_heuristics", {"mip_heuristic_effort": 0.3}),
+    ("no_symmetry", {"mip_detect_symmetry": False}),
+    ("no_restart", {"mip_allow_restart": False, "mip_heuristic_effort": 0.1}),
+)
+RACE_SHUTDOWN_GRACE_SECONDS = 60.0
+
+
+def default_race_profiles(
+    count: int,
+    *,
+    base_seed: int = 0,
+    backends: Sequence[str] = ("highs",),
+) -> tuple[SolverProfile, ...]:
+    """Return ``count`` profiles cycling backends and option variants.
+
+    Profiles take ``backends`` in turn, HiGHS profiles cycle the option
+    variants, and every profile gets a distinct seed.
+    """
+    if count <= 0:
+        raise ValueError("Solver race profile count must be positive.")
+    if not backends:
+        raise ValueError("Solver race requires at least one backend.")
+    profiles = []
+    ordinals: dict[str, int] = {}
+    for index in range(count):
+        backend = backends[index % len(backends)]
+        ordinal = ordinals.get(backend, 0)
+        ordinals[backend] = ordinal + 1
+        if backend == "highs":
+            name, options = RACE_OPTION_PROFILES[ordinal % len(RACE_OPTION_PROFILES)]
+            cycle = ordinal // len(RACE_OPTION_PROFILES)
+        else:
+            name, options, cycle = backend, None, ordinal
+        profiles.append(
+            SolverProfile(
+                name=name if cycle == 0 else f"{name}_{cycle}",
+                random_seed=base_seed + index,
+                options=options,
+                backend=backend,
+            )
+        )
+    return tuple(profiles)
+
+
+def race_with_highs(
+    model: CompiledOptimizationModel,
+    *,
+    configuration: SolveConfiguration,
+    scenario: SolveScenario | None = None,
+    warm_start: np.ndarray | Sequence[float] | None = None,
+    progress_callback: Callable[[dict[str, object]], None] | None = None,
+    work_directory: str | Path | None = None,
+    incumbent_path: str | Path | None = None,
+    retain_warm_start: bool = False,
+) -> SolverResult:
+    """Race independent solver processes over one shared compiled model.
+
+    Each profile runs in its own process with its own seed, option variant, and
+    backend and an equal share of the thread budget. The first result certified within
+    the configured gap wins and the remaining workers are stopped. When every
+    worker reaches the deadline instead, the best certified incumbent wins.
+
+    Every worker writes its certified incumbents to its own scratch file. At
+    each heartbeat the best of them across the race is copied to
+    ``incumbent_path``, so checkpoints keep working while racing.
+
+    Args:
+        model: Complete compiled optimization model, ideally memory-mapped.
+        configuration: Solve policy whose ``race_profiles`` name the workers.
+        scenario: Optional solve-only RHS and bound changes.
+        warm_start: Optional incumbent applied to every worker.
+        progress_callback: Optional receiver for periodic race heartbeats.
+        work_directory: Directory for worker result columns.
+        incumbent_path: Optional path holding the race's best incumbent.
+        retain_warm_start: Keep a feasible supplied warm start as each worker's
+            deadline fallback.
+
+    Returns:
+        The winning worker's result with race outcomes in ``solver_settings``.
+    """
+    profiles = configuration.race_profiles
+    if len(profiles) < 2:
+        raise ValueError("Solver racing requires at least two profiles.")
+    total_threads = configuration.thread_count or available_cpu_count()
+    worker_threads = max(1, total_threads // len(profiles))
+    resolved_warm_start = warm_start
+    retain = retain_warm_start and warm_start_is_feasible(model, warm_start)
+    if (
+        resolved_warm_start is None
+        and scenario is None
+        and configuration.warm_start_search
+    ):
+        resolved_warm_start, configuration = build_budgeted_warm_start(
+            model, configuration
+        )
+        retain = resolved_warm_start is not None
+    reference = share_compiled_model(model)
+    context = multiprocessing.get_context("spawn")
+    results: multiprocessing.Queue = context.Queue()
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(
+        prefix="highs-race-",
+        dir=str(work_directory) if work_directory is not None else None,
+    ) as directory:
+        root = Path(directory)
+        warm_start_path = None
+        if resolved_warm_start is not None:
+            warm_start_path = root / "warm_start.npy"
+            np.save(warm_start_path, np.asarray(resolved_warm_start, dtype=np.float64))
+        workers = {}
+        for profile in profiles:
+            worker_configuration = replace(
+                configuration,
+                thread_count=worker_threads,
+                random_seed=profile.random_seed,
+                options={**(configuration.options or {}), **(profile.options or {})},
+                race_profiles=(),
+                warm_start_search=False,
+                backend=profile.backend,
+                # Workers share one memory limit, so each governs its share.
+                memory_limit_fraction=(
+                    configuration.memory_limit_fraction / len(profiles)
+                    if configuration.memory_limit_fraction is not None
+                    else None
+                ),
+            )
+            workers[profile.name] = (
+                _race_worker,
+                (
+                    profile.name,
+                    reference,
+                    worker_configuration,
+                    scenario,
+                    str(warm_start_path) if warm_start_path is not None else None,
+                    retain,
+                    str(root / f"{profile.name}.npy"),
+                    str(root / f"{profile.name}-incumbent.npy"),
+                    results,
+                ),
+            )
+        outcomes: dict[str, SolverResult] = {}
+        winner: str | None = None
+        reason = "best_incumbent_at_deadline"
+        promotion = _IncumbentPromotion(
+            model,
+            [root / f"{profile.name}-incumbent.npy" for profile in profiles],
+            Path(incumbent_path) if incumbent_path is not None else None,
+        )
+
+        def on_result(name: str, outcome: SolverResult) -> bool:
+            """Keep one worker's outcome and stop the race once it is certified."""
+            nonlocal winner, reason
+            outcomes[name] = outcome
+            if _is_certified_within_gap(outcome, configuration):
+                winner = name
+                reason = "certified_within_gap"
+                return True
+            return False
+
+        def on_idle(finished: int) -> None:
+            """Promote the best worker incumbent and report a race heartbeat."""
+            promotion.promote(time.perf_counter() - started)
+            if progress_callback is not None:
+                progress_callback(
+                    {
+                        "phase": "racing",
+                        "elapsed_seconds": time.perf_counter() - started,
+                        "finished_profiles": finished,
+                        "incumbent_count": promotion.count,
+                        "incumbent_objective": promotion.objective,
+                        "memory": process_memory_sample(),
+                    }
+                )
+
+        failures = run_worker_processes(
+            context,
+            workers,
+            results,
+            on_result,
+            name_prefix="highs-race",
+            on_idle=on_idle,
+            deadline=(
+                started + configuration.time_limit_seconds + RACE_SHUTDOWN_GRACE_SECONDS
+                if configuration.time_limit_seconds is not None
+                else None
+            ),
+        )
+        if winner is None:
+            winner = _best_incumbent(outcomes, maximize=model.maximize)
+        if winner is None:
+            if not outcomes:
+                raise RuntimeError(
+                    "Every solver race worker failed: "
+                    + "; ".join(f"{name}: {error}" for name, error in failures.items())
+                )
+            winner = next(iter(outcomes))
+            reason = "no_certified_incumbent"
+        result = outcomes[winner]
+        native_columns = np.load(root / f"{winner}.npy")
+        if (
+            incumbent_path is not None
+            and result.status in {"optimal", "feasible"}
+            and result.objective_value is not None
+        ):
+            write_incumbent(
+                Path(incumbent_path),
+                native_columns,
+                {
+                    "objective_value": result.objective_value,
+                    "elapsed_seconds": time.perf_counter() - started,
+                    "source": "final",
+                    "race_profile": winner,
+                },
+            )
+    return replace(
+        result,
+        runtime_seconds=time.perf_counter() - started,
+        decisions=native_columns[: model.primary_variable_count].copy(),
+        native_columns=native_columns,
+        solver_settings={
+            **dict(result.solver_settings or {}),
+            "race": {
+                "winner": winner,
+                "winner_reason": reason,
+                "worker_count": len(profiles),
+                "thread_count_per_worker": worker_threads,
+                "profiles": [
+                    {
+                        "name": profile.name,
+                        "random_seed": profile.random_seed,
+                        "options": dict(profile.options or {}),
+                        "backend": profile.backend,
+                    }
+                    for profile in profiles
+                ],
+                "outcomes": {
+                    name: {
+                        "status": outcome.status,
+                        "objective_value": outcome.objective_value,
+                        "optimality_gap": outcome.optimality_gap,
+                        "runtime_seconds": outcome.runtime_seconds,
+                    }
+                    for name, outcome in outcomes.items()
+                },
+                "failures": failures,
+            },
+        },
+    )
+
+
+def _race_worker(
+    name: str,
+    reference: SharedModelReference,
+    configuration: SolveConfiguration,
+    scenario: SolveScenario | None,
+    warm_start_path: str | None,
+    retain_warm_start: bool,
+    output_path: str,
+    incumbent_path: str,
+    results: multiprocessing.Queue,
+) -> None:
+    """Solve one race profile and report its result without the column vector."""
+    try:
+        model = attach_compiled_model(reference)
+        if configuration.backend != "highs":
+            from .backends import solver_backend
+
+            result = solver_backend(configuration.backend).solve(
+                model,
+                configuration=configuration,
+                scenario=scenario,
+                warm_start=(
+                    np.load(warm_start_path) if warm_start_path is not None else None
+                ),
+                retain_warm_start=retain_warm_start,
+                incumbent_path=incumbent_path,
+            )
+        else:
+            with HighsModelSession(model, configuration=configuration) as session:
+                if scenario is not None:
+                    session.apply_scenario(scenario)
+                if warm_start_path is not None:
+                    session.apply_warm_start(
+                        np.load(warm_start_path),
+                        retain_as_deadline_fallback=retain_warm_start,
+                    )
+                result = session.solve(incumbent_path=incumbent_path)
+        np.save(output_path, result.native_columns)
+        results.put(
+            (
+                name,
+                replace(
+                    result,
+                    decisions=np.empty(0, dtype=np.float64),
+                    native_columns=None,
+                ),
+            )
+        )
+        results.put((name, None))
+    except Exception as error:
+        results.put((name, f"{type(error).__name__}: {error}"))
+
+
+class _IncumbentPromotion:
+    """Copy the best incumbent any race worker has written to one path."""
+
+    def __init__(
+        self,
+        model: CompiledOptimizationModel,
+        worker_paths: Sequence[Path],
+        path: Path | None,
+    ) -> None:
+        self._model = model
+        self._worker_paths = tuple(worker_paths)
+        self._path = path
+        self._seen: dict[Path, int] = {}
+        self.count = 0
+        self.objective: float | None = None
+
+    def promote(self, elapsed_seconds: float) -> None:
+        """Promote any newly written worker incumbent that beats the current one.
+
+        The objective is evaluated from the columns, since a worker may replace
+        its file between writing the columns and their sidecar.
+        """
+        if self._path is None:
+            return
+        for worker_path in self._worker_paths:
+            try:
+                modified = worker_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if self._seen.get(worker_path) == modified:
+                continue
+            self._seen[worker_path] = modified
+            columns = np.load(worker_path)
+            objective = float(
+                np.dot(self._model.objective, columns) + self._model.objective_offset
+            )
+            if self.objective is not None and (
+                objective <= self.objective
+                if self._model.maximize
+                else objective >= self.objective
+            ):
+                continue
+            write_incumbent(
+                self._path,
+                columns,
+                {
+                    "objective_value": objective,
+                    "elapsed_seconds": elapsed_seconds,
+                    "source": "race",
+                    "race_profile": worker_path.name.removesuffix("-incumbent.npy"),
+                },
+            )
+            self.objective = objective
+            self.count += 1
+
+
+def _is_certified_within_gap(
+    result: SolverResult,
+    configuration: SolveConfiguration,
+) -> bool:
+    """Return whether HiGHS certified this incumbent within the requested gap."""
+    if result.status not in {"optimal", "feasible"}:
+        return False
+    if (result.termination_reason or "").lower() == "optimal":
+        return True
+    gap = result.optimality_gap
+    return gap is not None and gap <= configuration.effective_relative_mip_gap + 1e-12
+
+
+def _best_incumbent(
+    outcomes: dict[str, SolverResult],
+    *,
+    maximize: bool,
+) -> str | None:
+    """Return the profile with the best certified objective, if any."""
+    candidates = [
+        (name, outcome.objective_value)
+        for name, outcome in outcomes.items()
+        if outcome.status in {"optimal", "feasible"}
+        and outcome.objective_value is not None
+    ]
+    if not candidates:
+        return None
+    chooser = max if maximize else min
+    return chooser(candidates, key=lambda candidate: candidate[1])[0]
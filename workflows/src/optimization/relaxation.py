@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from .highs import (
+    MINIMUM_SOLVE_SECONDS,
+    HighsModelSession,
+    _aggregate_row_mask,
+    _columns_are_feasible,
+    _neighbor_columns,
+    _populate_neighbor_columns,
+    _relative_gap,
+    apply_solve_scenario,
+    solve_with_highs,
+    write_incumbent,
+)
+from .local_search import (
+    LOCAL_SEARCH_TIME_BUDGET_SECONDS,
+    build_local_search_warm_start,
+    local_search_budget_seconds,
+)
+from .model import (
+    CompiledOptimizationModel,
+    SolveConfiguration,
+    SolveScenario,
+    SolverResult,
+)
+from .numerical import csr_row_activities
+
+ROUNDING_TOLERANCE = 1e-9
+
+
+def solve_with_lp_repair(
+    model: CompiledOptimizationModel,
+    *,
+    configuration: SolveConfiguration,
+    scenario: SolveScenario | None = None,
+    progress_callback: Callable[[dict[str, object]], None] | None = None,
+    work_directory: str | Path | None = None,
+    incumbent_path: str | Path | None = None,
+) -> SolverResult:
+    """Solve the LP relaxation, repair it into an incumbent, and bound the gap.
+
+    The LP objective is a valid dual bound for the MIP and the repaired
+    rounding is an independently feasible incumbent. When their relative gap
+    exceeds ``configuration.relative_mip_gap`` the full MIP is solved with the
+    repaired incumbent retained as its warm start, within whatever remains of
+    the time limit after the relaxation and the repair.
+
+    Args:
+        model: Complete compiled optimization model.
+        configuration: Solve policy with ``mode="lp_repair"``.
+        scenario: Optional solve-only RHS and bound changes.
+        progress_callback: Optional receiver for progress heartbeats.
+        work_directory: Directory for fallback race worker columns.
+        incumbent_path: Optional path receiving the repaired incumbent.
+
+    Returns:
+        The repaired incumbent with the LP bound, or the fallback MIP result,
+        with stage details under ``solver_settings.lp_repair``.
+    """
+    started = time.perf_counter()
+    effective_model = apply_solve_scenario(model, scenario)
+    relaxed = replace(
+        effective_model,
+        integrality=np.zeros(effective_model.variable_count, dtype=np.uint8),
+    )
+    with HighsModelSession(
+        relaxed,
+        configuration=replace(configuration, mode="standard", race_profiles=()),
+    ) as session:
+        relaxation = session.solve(progress_callback=progress_callback)
+    if relaxation.status != "optimal" or relaxation.native_columns is None:
+        raise RuntimeError(
+            f"LP relaxation did not reach an optimum: {relaxation.status}."
+        )
+    lp_bound = float(relaxation.objective_value)
+    repaired = repair_lp_rounding(
+        effective_model,
+        relaxation.native_columns,
+        local_search_seconds=local_search_budget_seconds(
+            configuration.time_limit_seconds
+        ),
+    )
+    repair_objective = (
+        float(np.dot(model.objective, repaired) + model.objective_offset)
+        if repaired is not None
+        else None
+    )
+    gap = (
+        _relative_gap(repair_objective, lp_bound)
+        if repair_objective is not None
+        else None
+    )
+    stage = {
+        "lp_objective": lp_bound,
+        "lp_runtime_seconds": relaxation.runtime_seconds,
+        "lp_algorithm": (relaxation.diagnostics or {}).get("lp_algorithm"),
+        "lp_simplex_iterations": (relaxation.diagnostics or {}).get(
+            "simplex_iterations"
+        ),
+        "lp_ipm_iterations": (relaxation.diagnostics or {}).get("ipm_iterations"),
+        "fractional_columns": int(
+            np.count_nonzero(
+                np.abs(relaxation.native_columns - np.rint(relaxation.native_columns))[
+                    np.asarray(model.integrality) != 0
+                ]
+                > ROUNDING_TOLERANCE
+            )
+        ),
+        "repair_objective": repair_objective,
+        "repair_gap": gap,
+        "fallback": False,
+    }
+    if gap is None or gap > configuration.relative_mip_gap + 1e-12:
+        stage["fallback"] = True
+        remaining = (
+            None
+            if configuration.time_limit_seconds is None
+            else max(
+                MINIMUM_SOLVE_SECONDS,
+                configuration.time_limit_seconds - (time.perf_counter() - started),
+            )
+        )
+        result = solve_with_highs(
+            model,
+            configuration=replace(
+                configuration, mode="standard", time_limit_seconds=remaining
+            ),
+            scenario=scenario,
+            warm_start=repaired,
+            retain_warm_start=repaired is not None,
+            progress_callback=progress_callback,
+            work_directory=work_directory,
+            incumbent_path=incumbent_path,
+        )
+        return replace(
+            result,
+            runtime_seconds=time.perf_counter() - started,
+            solver_settings={
+                **dict(result.solver_settings or {}),
+                "mode": configuration.mode,
+                "lp_repair": stage,
+            },
+        )
+    if incumbent_path is not None:
+        write_incumbent(
+            incumbent_path,
+            repaired,
+            {
+                "objective_value": repair_objective,
+                "elapsed_seconds": time.perf_counter() - started,
+                "source": "lp_repair",
+            },
+        )
+    return replace(
+        relaxation,
+        status="optimal" if gap <= 1e-12 else "feasible",
+        objective_value=repair_objective,
+        optimality_gap=gap,
+        best_bound=lp_bound,
+        absolute_gap=abs(lp_bound - repair_objective),
+        runtime_seconds=time.perf_counter() - started,
+        decisions=repaired[: model.primary_variable_count].copy(),
+        native_columns=repaired,
+        termination_reason="lp_repair_within_gap",
+        node_count=0,
+        solver_settings={
+            **dict(relaxation.solver_settings or {}),
+            "mode": configuration.mode,
+            "lp_repair": stage,
+        },
+    )
+
+
+def repair_lp_rounding(
+    model: CompiledOptimizationModel,
+    lp_columns: np.ndarray | Sequence[float],
+    *,
+    local_search_seconds: float = LOCAL_SEARCH_TIME_BUDGET_SECONDS,
+) -> np.ndarray | None:
+    """Round an LP solution down and deterministically re-add fractional columns.
+
+    Integer primaries start at the floor of their LP value, which keeps every
+    nonnegative upper-bounded row feasible. Fractional columns are then raised
+    in decreasing LP value whenever doing so improves the objective, including
+    potential selected-neighbour value, and makes no row more violated. Rows
+    still violated after that pass are handed to the local-search repair.
+
+    Returns:
+        Feasible native columns, or ``None`` when repair did not succeed.
+    """
+    primary_count = model.primary_variable_count
+    values = np.asarray(lp_columns, dtype=np.float64)
+    if values.shape != (model.variable_count,):
+        raise ValueError("LP columns do not match the compiled model.")
+    lower = np.asarray(model.variable_lower, dtype=np.float64)
+    upper = np.asarray(model.variable_upper, dtype=np.float64)
+    integer = np.asarray(model.integrality[:primary_count]) != 0
+    columns = np.clip(values, lower, upper)
+    primary = columns[:primary_count]
+    floors = np.floor(primary + ROUNDING_TOLERANCE)
+    fractional = np.flatnonzero(integer & (primary - floors > ROUNDING_TOLERANCE))
+    primary[integer] = floors[integer]
+    _populate_neighbor_columns(model, columns)
+    objective = np.asarray(model.objective[:primary_count], dtype=np.float64)
+    potential = objective.copy()
+    auxiliaries, first_columns, second_columns = _neighbor_columns(model)
+    if auxiliaries.size:
+        edge_values = np.asarray(model.objective[auxiliaries], dtype=np.float64)
+        np.add.at(potential, first_columns, edge_values)
+        np.add.at(potential, second_columns, edge_values)
+    direction = 1.0 if model.maximize else -1.0
+    fractional = fractional[direction * potential[fractional] > 0]
+    order = np.lexsort((-direction * potential[fractional], -values[fractional]))
+    if fractional.size:
+        matrix = sparse.csr_array(
+            (
+                np.asarray(model.coefficients, dtype=np.float64),
+                np.asarray(model.column_indices, dtype=np.int64),
+                np.asarray(model.row_starts, dtype=np.int64),
+            ),
+            shape=(model.constraint_count, model.variable_count),
+        )[:, fractional].tocsc()
+        checked = _aggregate_row_mask(model)
+        row_lower = np.asarray(model.row_lower, dtype=np.float64)
+        row_upper = np.asarray(model.row_upper, dtype=np.float64)
+        activities = csr_row_activities(model, columns)
+        for position in order:
+            start, stop = matrix.indptr[position], matrix.indptr[position + 1]
+            rows = matrix.indices[start:stop]
+            keep = checked[rows]
+            rows = rows[keep]
+            column = fractional[position]
+            step = min(1.0, upper[column] - columns[column])
+            updated = activities[rows] + matrix.data[start:stop][keep] * step
+            before = np.maximum(row_lower[rows] - activities[rows], 0.0) + np.maximum(
+                activities[rows] - row_upper[rows], 0.0
+            )
+            after = np.maximum(row_lower[rows] - updated, 0.0) + np.maximum(
+                updated - row_upper[rows], 0.0
+            )
+            if np.any(after > before + ROUNDING_TOLERANCE):
+                continue
+            columns[column] += step
+            activities[rows] = updated
+        _populate_neighbor_columns(model, columns)
+    if _columns_are_feasible(model, columns):
+        return columns
+    searched = build_local_search_warm_start(
+        model,
+        initial_columns=columns,
+        time_budget_seconds=local_search_seconds,
+    )
+    return searched.columns if searched is not None else None
@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Literal, Sequence
+
+import numpy as np
+
+from .artifact import LoadedCompiledArtifact
+from .conditioning import NumericalScaling
+from .highs import HighsModelSession, apply_solve_scenario, warm_start_is_feasible
+from .model import (
+    CompiledOptimizationModel,
+    RowBoundOverride,
+    SolveConfiguration,
+    SolveScenario,
+    SolverResult,
+)
+from .numerical import csr_row_activities
+from .shared_model import (
+    SharedModelReference,
+    attach_compiled_model,
+    run_worker_processes,
+    share_compiled_model,
+)
+from ..utils.cpu import available_cpu_count
+
+SCENARIO_WORKER_THREADS = 2
+
+
+@dataclass(frozen=True)
+class ScenarioSolve:
+    """One batch scenario's solve result, with its columns persisted on disk."""
+
+    scenario_id: str
+    result: SolverResult
+    columns_path: str | None
+    warm_started: bool
+    worker: int
+
+
+def budget_sweep_scenarios(
+    artifact: LoadedCompiledArtifact,
+    *,
+    layer: str,
+    values: Sequence[float],
+    side: Literal["minimum", "maximum"] = "maximum",
+    constraint_index: int = 0,
+) -> tuple[SolveScenario, ...]:
+    """Express aggregate bound levels as row-bound scenarios of one artifact.
+
+    Bounds are shifted by the compile's fixed-in contribution and scaled by the
+    row's conditioning exponent, exactly as the compiler would have written
+    them. Compile the artifact at the tightest level, because a row the
+    compile dropped as redundant cannot carry the other levels.
+
+    Raises:
+        ValueError: If the artifact has no such aggregate row.
+    """
+    rows = artifact.manifest.provenance.get("aggregate_rows") or []
+    row = next(
+        (
+            value
+            for value in rows
+            if str(value["layer"]) == layer
+            and str(value["side"]) == side
+            and int(value["constraint_index"]) == constraint_index
+        ),
+        None,
+    )
+    if row is None:
+        raise ValueError(f"Compiled artifact has no aggregate row {layer}_{side}.")
+    if row["row_index"] is None:
+        raise ValueError(
+            f"Aggregate row {layer}_{side} was dropped as redundant; compile the "
+            "sweep at its tightest level."
+        )
+    model = artifact.model
+    index = int(row["row_index"])
+    scaling = (
+        NumericalScaling.from_provenance(artifact.manifest.provenance)
+        or NumericalScaling()
+    )
+    exponent = int(scaling.row_exponent_vector(model.constraint_count)[index])
+    scenarios = []
+    for value in values:
+        scaled = math.ldexp(
+            float(value) - float(row["fixed_in_contribution"]), exponent
+        )
+        scenarios.append(
+            SolveScenario(
+                scenario_id=f"{layer}_{side}={float(value):g}",
+                row_bounds=(
+                    RowBoundOverride(
+                        row_index=index,
+                        lower=(
+                            scaled
+                            if side == "minimum"
+                            else float(model.row_lower[index])
+                        ),
+                        upper=(
+                            scaled
+                            if side == "maximum"
+                            else float(model.row_upper[index])
+                        ),
+                    ),
+                ),
+            )
+        )
+    return tuple(scenarios)
+
+
+def solve_scenario_batch(
+    model: CompiledOptimizationModel,
+    scenarios: Sequence[SolveScenario],
+    *,
+    configuration: SolveConfiguration,
+    work_directory: str | Path,
+    worker_count: int | None = None,
+    progress_callback: Callable[[dict[str, object]], None] | None = None,
+) -> tuple[ScenarioSolve, ...]:
+    """Solve many row- and column-bound scenarios of one compiled model.
+
+    The model is loaded into HiGHS once per worker. Each worker solves a
+    contiguous run of the sweep in order, offering every scenario the previous
+    scenario's columns as a warm start whenever they remain feasible. With one
+    worker the batch runs in this process; otherwise the sweep is split across
+    spawned processes that share the memory-mapped model and an equal share of
+    the thread budget.
+
+    Args:
+        model: Complete compiled optimization model, ideally memory-mapped.
+        scenarios: Ordered scenarios, typically increasing budget levels.
+        configuration: Solve policy applied to every scenario.
+        work_directory: Directory for each scenario's native columns.
+        worker_count: Parallel workers, by default as many as the thread
+            budget allows at ``SCENARIO_WORKER_THREADS`` each.
+        progress_callback: Optional receiver for per-scenario completions.
+
+    Returns:
+        One solve per scenario in input order, without column vectors.
+    """
+    if not scenarios:
+        raise ValueError("A scenario batch requires at least one scenario.")
+    identifiers = [scenario.scenario_id for scenario in scenarios]
+    if len(set(identifiers)) != len(identifiers):
+        raise ValueError("Scenario IDs within a batch must be unique.")
+    total_threads = configuration.thread_count or available_cpu_count()
+    workers = (
+        worker_count
+        if worker_count is not None
+        else max(1, total_threads // SCENARIO_WORKER_THREADS)
+    )
+    if workers <= 0:
+        raise ValueError("Scenario batch worker count must be positive.")
+    workers = min(workers, len(scenarios))
+    root = Path(work_directory)
+    root.mkdir(parents=True, exist_ok=True)
+    chunks = [
+        [int(index) for index in chunk]
+        for chunk in np.array_split(np.arange(len(scenarios)), workers)
+    ]
+    if workers == 1:
+        solves = _solve_scenario_run(
+            0, model, scenarios, configuration, root, progress_callback
+        )
+        return tuple(solves)
+
+    worker_configuration = replace(
+        configuration,
+        thread_count=max(1, total_threads // workers),
+        race_profiles=(),
+        memory_limit_fraction=(
+            configuration.memory_limit_fraction / workers
+            if configuration.memory_limit_fraction is not None
+            else None
+        ),
+    )
+    reference = share_compiled_model(model)
+    context = multiprocessing.get_context("spawn")
+    results: multiprocessing.Queue = context.Queue()
+    solves: dict[str, ScenarioSolve] = {}
+
+    def on_result(worker: int, solve: ScenarioSolve) -> None:
+        """Keep one finished scenario and report its completion."""
+        solves[solve.scenario_id] = solve
+        if progress_callback is not None:
+            progress_callback(_completion_progress(solve, len(solves)))
+
+    failures = run_worker_processes(
+        context,
+        {
+            worker: (
+                _scenario_worker,
+                (
+                    worker,
+                    reference,
+                    [scenarios[index] for index in chunk],
+                    worker_configuration,
+                    str(root),
+                    results,
+                ),
+            )
+            for worker, chunk in enumerate(chunks)
+        },
+        results,
+        on_result,
+        name_prefix="highs-scenarios",
+    )
+    if failures:
+        raise RuntimeError(
+            "Scenario batch workers failed: "
+            + "; ".join(
+                f"worker {worker}: {error}" for worker, error in failures.items()
+            )
+        )
+    return tuple(solves[identifier] for identifier in identifiers)
+
+
+def efficiency_frontier(
+    model: CompiledOptimizationModel,
+    scenarios: Sequence[SolveScenario],
+    solves: Sequence[ScenarioSolve],
+    *,
+    row_index: int,
+    scaling: NumericalScaling | None = None,
+) -> list[dict[str, object]]:
+    """Tabulate objective against one swept row bound in original units.
+
+    Args:
+        model: The compiled model every scenario was solved against.
+        scenarios: The solved scenarios in sweep order.
+        solves: Their solves from :func:`solve_scenario_batch`.
+        row_index: The swept aggregate row, such as a budget row.
+        scaling: The artifact's numerical conditioning, if any.
+
+    Returns:
+        One record per scenario with the bound, achieved row activity, and
+        solve certification.
+    """
+    resolved = scaling or NumericalScaling()
+    exponent = int(resolved.row_exponent_vector(model.constraint_count)[row_index])
+    records = []
+    for scenario, solve in zip(scenarios, solves, strict=True):
+        if scenario.scenario_id != solve.scenario_id:
+            raise ValueError("Scenario batch solves are out of sweep order.")
+        override = next(
+            (value for value in scenario.row_bounds if value.row_index == row_index),
+            None,
+        )
+        lower = (
+            float(model.row_lower[row_index]) if override is None else override.lower
+        )
+        upper = (
+            float(model.row_upper[row_index]) if override is None else override.upper
+        )
+        activity = None
+        if solve.columns_path is not None:
+            columns = np.load(solve.columns_path, mmap_mode="r")
+            activity = math.ldexp(
+                float(csr_row_activities(model, columns)[row_index]), -exponent
+            )
+        result = solve.result
+        records.append(
+            {
+                "scenario_id": scenario.scenario_id,
+                "bound": math.ldexp(upper if np.isfinite(upper) else lower, -exponent),
+                "row_activity": activity,
+                "objective_value": (
+                    resolved.unscale_objective(result.objective_value)
+                    if result.objective_value is not None
+                    else None
+                ),
+                "best_bound": (
+                    resolved.unscale_objective(result.best_bound)
+                    if result.best_bound is not None
+                    else None
+                ),
+                "status": result.status,
+                "optimality_gap": result.optimality_gap,
+                "runtime_seconds": result.runtime_seconds,
+                "warm_started": solve.warm_started,
+                "worker": solve.worker,
+            }
+        )
+    return records
+
+
+def _solve_scenario_run(
+    worker: int,
+    model: CompiledOptimizationModel,
+    scenarios: Sequence[SolveScenario],
+    configuration: SolveConfiguration,
+    root: Path,
+    on_solve: Callable[[dict[str, object]], None] | None = None,
+    results: multiprocessing.Queue | None = None,
+) -> list[ScenarioSolve]:
+    """Solve one contiguous run of scenarios in a single HiGHS session."""
+    solves: list[ScenarioSolve] = []
+    previous: np.ndarray | None = None
+    with HighsModelSession(model, configuration=configuration) as session:
+        for scenario in scenarios:
+            session.apply_scenario(scenario)
+            warm_started = previous is not None and warm_start_is_feasible(
+                apply_solve_scenario(model, scenario), previous
+            )
+            if warm_started:
+                session.apply_warm_start(previous)
+            result = session.solve()
+            path = None
+            if result.native_columns is not None:
+                path = root / f"{_safe_name(scenario.scenario_id)}.npy"
+                np.save(path, result.native_columns)
+                previous = np.asarray(result.native_columns, dtype=np.float64)
+            solve = ScenarioSolve(
+                scenario_id=scenario.scenario_id,
+                result=replace(
+                    result,
+                    decisions=np.empty(0, dtype=np.float64),
+                    native_columns=None,
+                ),
+                columns_path=None if path is None else str(path),
+                warm_started=warm_started,
+                worker=worker,
+            )
+            solves.append(solve)
+            if results is not None:
+                results.put((worker, solve))
+            if on_solve is not None:
+                on_solve(_completion_progress(solve, len(solves)))
+    return solves
+
+
+def _scenario_worker(
+    worker: int,
+    reference: SharedModelReference,
+    scenarios: Sequence[SolveScenario],
+    configuration: SolveConfiguration,
+    directory: str,
+    results: multiprocessing.Queue,
+) -> None:
+    """Solve one worker's run of the sweep and report each solve as it ends."""
+    try:
+        _solve_scenario_run(
+            worker,
+            attach_compiled_model(reference),
+            scenarios,
+            configuration,
+            Path(directory),
+            results=results,
+        )
+        results.put((worker, None))
+    except Exception as error:
+        results.put((worker, f"{type(error).__name__}: {error}"))
+
+
+def _completion_progress(solve: ScenarioSolve, completed: int) -> dict[str, object]:
+    """Describe one finished scenario for heartbeat progress."""
+    return {
+        "phase": "scenario_complete",
+        "scenario_id": solve.scenario_id,
+        "completed_scenarios": completed,
+        "status": solve.result.status,
+        "objective_value": solve.result.objective_value,
+        "runtime_seconds": solve.result.runtime_seconds,
+        "warm_started": solve.warm_started,
+        "finished_at": time.time(),
+    }
+
+
+def _safe_name(scenario_id: str) -> str:
+    """Return a file-name-safe form of one scenario ID."""
+    return "".join(
+        character if character.isalnum() or character in "-_.=" else "_"
+        for character in scenario_id
+    )
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import mmap
+import queue
+import time
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import Any, Callable, Hashable, Mapping, Sequence
+
+import numpy as np
+
+from .model import CompiledOptimizationModel
+
+MODEL_ARRAY_FIELDS = (
+    "objective",
+    "variable_lower",
+    "variable_upper",
+    "integrality",
+    "row_starts",
+    "column_indices",
+    "coefficients",
+    "row_lower",
+    "row_upper",
+)
+COLUMN_MAJOR_BATCH_NONZEROS = 16_777_216
+WORKER_POLL_SECONDS = 5.0
+WORKER_JOIN_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Describe one model array that a worker process can reopen cheaply.
+
+    File-backed arrays are reopened read-only at the same byte offset so every
+    worker shares the page cache instead of receiving a pickled copy. Arrays
+    that only exist in memory are carried inline.
+    """
+
+    dtype: str
+    shape: tuple[int, ...]
+    path: str | None = None
+    offset: int = 0
+    values: np.ndarray | None = None
+
+
+@dataclass(frozen=True)
+class SharedModelReference:
+    """Picklable handle for reopening one compiled model in another process."""
+
+    arrays: dict[str, SharedArray]
+    row_names: Sequence[str]
+    primary_variable_count: int
+    maximize: bool
+    objective_offset: float
+
+
+def share_compiled_model(model: CompiledOptimizationModel) -> SharedModelReference:
+    """Describe a compiled model without copying its memory-mapped arrays."""
+    return SharedModelReference(
+        arrays={
+            field: _share_array(getattr(model, field)) for field in MODEL_ARRAY_FIELDS
+        },
+        row_names=model.row_names,
+        primary_variable_count=model.primary_variable_count,
+        maximize=model.maximize,
+        objective_offset=model.objective_offset,
+    )
+
+
+def attach_compiled_model(reference: SharedModelReference) -> CompiledOptimizationModel:
+    """Reopen a shared compiled model read-only inside a worker process."""
+    return CompiledOptimizationModel(
+        **{
+            field: _attach_array(descriptor)
+            for field, descriptor in reference.arrays.items()
+        },
+        row_names=reference.row_names,
+        primary_variable_count=reference.primary_variable_count,
+        maximize=reference.maximize,
+        objective_offset=reference.objective_offset,
+    )
+
+
+def _share_array(values: np.ndarray) -> SharedArray:
+    """Reference a whole-file memory map, or carry other arrays inline."""
+    if (
+        isinstance(values, np.memmap)
+        and isinstance(values.base, mmap.mmap)
+        and values.filename is not None
+        and values.flags.c_contiguous
+    ):
+        return SharedArray(
+            dtype=values.dtype.str,
+            shape=tuple(values.shape),
+            path=str(values.filename),
+            offset=int(values.offset),
+        )
+    array = np.ascontiguousarray(values)
+    return SharedArray(dtype=array.dtype.str, shape=tuple(array.shape), values=array)
+
+
+def _attach_array(descriptor: SharedArray) -> np.ndarray:
+    """Return a read-only view of one shared model array."""
+    if descriptor.path is None:
+        return descriptor.values
+    if not descriptor.shape or 0 in descriptor.shape:
+        return np.empty(descriptor.shape, dtype=np.dtype(descriptor.dtype))
+    return np.memmap(
+        descriptor.path,
+        dtype=np.dtype(descriptor.dtype),
+        mode="r",
+        offset=descriptor.offset,
+        shape=descriptor.shape,
+    )
+
+
+@dataclass(frozen=True)
+class SharedColumnMajor:
+    """Picklable handle for a compressed-column copy of one model's matrix."""
+
+    column_starts: SharedArray
+    row_indices: SharedArray
+    values: SharedArray
+
+
+def write_column_major(
+    model: CompiledOptimizationModel,
+    directory: str | Path,
+    *,
+    batch_nonzeros: int = COLUMN_MAJOR_BATCH_NONZEROS,
+) -> SharedColumnMajor:
+    """Write the model matrix column-major to memory-mapped files once.
+
+    Rows are streamed in bounded nonzero batches: one pass counts entries per
+    column, and a second places each batch with a counting sort that keeps row
+    order inside every column. Row indices and coefficients keep their stored
+    dtypes, so peak memory stays at the output maps plus one batch.
+    """
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    row_starts = model.row_starts
+    column_indices = model.column_indices
+    coefficients = model.coefficients
+    nonzero_count = int(row_starts[-1]) if len(row_starts) else 0
+    row_dtype = np.int32 if model.constraint_count < 2**31 else np.int64
+    counts = np.zeros(model.variable_count, dtype=np.int64)
+    for start in range(0, nonzero_count, batch_nonzeros):
+        stop = min(start + batch_nonzeros, nonzero_count)
+        counts += np.bincount(
+            np.asarray(column_indices[start:stop], dtype=np.int64),
+            minlength=model.variable_count,
+        )
+    column_starts = np.lib.format.open_memmap(
+        target / "column_starts.npy",
+        mode="w+",
+        dtype=np.int64,
+        shape=(model.variable_count + 1,),
+    )
+    column_starts[0] = 0
+    np.cumsum(counts, out=column_starts[1:])
+    del counts
+    row_indices = np.lib.format.open_memmap(
+        target / "row_indices.npy",
+        mode="w+",
+        dtype=row_dtype,
+        shape=(nonzero_count,),
+    )
+    values = np.lib.format.open_memmap(
+        target / "values.npy",
+        mode="w+",
+        dtype=np.asarray(coefficients[:0]).dtype,
+        shape=(nonzero_count,),
+    )
+    cursor = np.asarray(column_starts[:-1]).copy()
+    for start in range(0, nonzero_count, batch_nonzeros):
+        stop = min(start + batch_nonzeros, nonzero_count)
+        columns = np.asarray(column_indices[start:stop], dtype=np.int64)
+        rows = (
+            np.searchsorted(
+                row_starts, np.arange(start, stop, dtype=np.int64), side="right"
+            )
+            - 1
+        )
+        order = np.argsort(columns, kind="stable")
+        ordered = columns[order]
+        # Rank within the batch keeps row order inside every column.
+        rank = np.arange(len(ordered), dtype=np.int64) - np.searchsorted(
+            ordered, ordered, side="left"
+        )
+        positions = cursor[ordered] + rank
+        row_indices[positions] = rows[order]
+        values[positions] = np.asarray(coefficients[start:stop])[order]
+        present, present_counts = np.unique(ordered, return_counts=True)
+        cursor[present] += present_counts
+    for array in (column_starts, row_indices, values):
+        array.flush()
+    return SharedColumnMajor(
+        column_starts=_share_array(column_starts),
+        row_indices=_share_array(row_indices),
+        values=_share_array(values),
+    )
+
+
+def attach_column_major(
+    reference: SharedColumnMajor,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reopen column starts, row indices, and values read-only."""
+    return (
+        _attach_array(reference.column_starts),
+        _attach_array(reference.row_indices),
+        _attach_array(reference.values),
+    )
+
+
+def run_worker_processes(
+    context: BaseContext,
+    workers: Mapping[Hashable, tuple[Callable[..., None], tuple[Any, ...]]],
+    results: Any,
+    on_result: Callable[[Hashable, Any], bool | None],
+    *,
+    name_prefix: str,
+    on_idle: Callable[[int], None] | None = None,
+    deadline: float | None = None,
+) -> dict[Hashable, str]:
+    """Spawn workers, dispatch their results, and stop every one on exit.
+
+    Each worker puts ``(key, payload)`` tuples on ``results``: ``None`` once it
+    has finished, an error string when it fails, and any other payload is
+    passed to ``on_result``, which returns true to stop the remaining workers
+    early. ``on_idle`` receives the number of finished workers whenever no
+    message arrives for a poll interval.
+    A worker found dead has the queue drained before it is judged, so a
+    result still in transit is never lost; a dead worker then counts as
+    finished with exit code 0 and as failed otherwise. Polling also stops
+    once ``deadline``, a ``time.perf_counter`` value, passes.
+
+    Returns:
+        Error text by worker key for every worker that failed.
+    """
+    failures: dict[Hashable, str] = {}
+    finished: set[Hashable] = set()
+
+    def dispatch(key: Hashable, payload: Any) -> bool:
+        """Record one message and return whether to stop early."""
+        if payload is None:
+            finished.add(key)
+            return False
+        if isinstance(payload, str):
+            failures[key] = payload
+            finished.add(key)
+            return False
+        return bool(on_result(key, payload))
+
+    processes = {}
+    try:
+        for key, (target, args) in workers.items():
+            process = context.Process(
+                target=target, args=args, name=f"{name_prefix}-{key}", daemon=True
+            )
+            process.start()
+            processes[key] = process
+        stopped = False
+        while not stopped and len(finished) < len(processes):
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            try:
+                key, payload = results.get(timeout=WORKER_POLL_SECONDS)
+            except queue.Empty:
+                if on_idle is not None:
+                    on_idle(len(finished))
+                dead = [
+                    key
+                    for key, process in processes.items()
+                    if key not in finished and not process.is_alive()
+                ]
+                while dead and not stopped:
+                    try:
+                        key, payload = results.get_nowait()
+                    except queue.Empty:
+                        break
+                    stopped = dispatch(key, payload)
+                for key in dead:
+                    if key not in finished:
+                        finished.add(key)
+                        exit_code = processes[key].exitcode
+                        if exit_code != 0:
+                            failures[key] = f"exit code {exit_code}"
+                continue
+            stopped = dispatch(key, payload)
+    finally:
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in processes.values():
+            process.join(timeout=WORKER_JOIN_SECONDS)
+        results.close()
+    return failures
@@ -0,0 +1,659 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .admission import SparseModelDimensions, estimate_sparse_model_footprint
+from .artifact import load_compiled_artifact
+from .highs import HighsModelSession, warm_start_is_feasible
+from .model import (
+    CompiledOptimizationModel,
+    SolveConfiguration,
+    SolverResult,
+    SolveScenario,
+)
+from ..utils.memory import memory_limit_bytes
+
+SOLVER_SERVICE_PROTOCOL_VERSION = 1
+BASELINE_SCENARIO = SolveScenario(scenario_id="baseline")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResidentModelReference:
+    """Locate a compiled artifact and the solver service that may hold it."""
+
+    service_address: str
+    artifact_directory: str
+    authkey: bytes = field(repr=False)
+
+
+@dataclass(frozen=True)
+class ResidentSolveRequest:
+    """One solve against a resident model, expressed as edits to its baseline.
+
+    Row and column bound changes travel as ``scenario`` and ``objective``
+    replaces every column cost. Edits last for this solve only; the service
+    restores the compiled baseline before the next request. ``configuration``
+    supplies the time limit, relative gap, and seed, while thread counts, HiGHS
+    options, and the solve mode belong to the service.
+    """
+
+    artifact_directory: str
+    mathematical_model_hash: str | None = None
+    configuration: SolveConfiguration | None = None
+    scenario: SolveScenario | None = None
+    objective: np.ndarray | None = None
+    objective_offset: float | None = None
+    warm_start: np.ndarray | None = None
+    retain_warm_start: bool = False
+
+
+@dataclass(frozen=True)
+class ResidentSolveResponse:
+    """Result of one resident solve and how the service obtained the model."""
+
+    result: SolverResult
+    mathematical_model_hash: str
+    cache_hit: bool
+    load_seconds: float
+    wait_seconds: float
+
+
+@dataclass(frozen=True)
+class ResidentCacheStatistics:
+    """Counters and contents of the resident session cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    resident_models: tuple[str, ...]
+    resident_bytes: int
+    max_sessions: int
+    memory_budget_bytes: int
+
+
+@dataclass
+class _ResidentModel:
+    lock: Lock
+    model: CompiledOptimizationModel | None = None
+    session: HighsModelSession | None = None
+    footprint_bytes: int = 0
+    objective_changed: bool = False
+    evicted: bool = False
+
+
+class ResidentSessionCache:
+    """Keep loaded HiGHS sessions keyed by mathematical model hash.
+
+    Requests for one model are serialized on that model's lock, while
+    different models solve concurrently. Idle sessions are evicted least
+    recently used first once ``max_sessions`` or ``memory_budget_bytes`` is
+    exceeded. Busy sessions are never evicted, so the budget can be exceeded
+    while every resident model is solving.
+    """
+
+    def __init__(
+        self,
+        configuration: SolveConfiguration,
+        *,
+        max_sessions: int = 4,
+        memory_budget_bytes: int | None = None,
+    ) -> None:
+        """Create an empty cache whose sessions share one solve policy."""
+        if max_sessions <= 0:
+            raise ValueError("Resident session count must be positive.")
+        self._configuration = replace(configuration, race_profiles=())
+        self._max_sessions = max_sessions
+        self._memory_budget_bytes = (
+            memory_budget_bytes
+            if memory_budget_bytes is not None
+            else memory_limit_bytes() // 2
+        )
+        if self._memory_budget_bytes <= 0:
+            raise ValueError("Resident memory budget must be positive.")
+        self._entries: OrderedDict[str, _ResidentModel] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def load(self, artifact_directory: str | Path) -> tuple[str, bool]:
+        """Make one artifact resident and return its hash and whether it was."""
+        model_hash = _manifest_model_hash(artifact_directory)
+        entry = self._acquire(model_hash)
+        try:
+            hit, _ = self._ensure_loaded(entry, model_hash, artifact_directory)
+        finally:
+            entry.lock.release()
+        return model_hash, hit
+
+    def solve(self, request: ResidentSolveRequest) -> ResidentSolveResponse:
+        """Apply one request's edits to its resident model and solve it."""
+        received = time.perf_counter()
+        model_hash = _manifest_model_hash(request.artifact_directory)
+        if (
+            request.mathematical_model_hash is not None
+            and request.mathematical_model_hash != model_hash
+        ):
+            raise ValueError(
+                "Resident solve request does not match the artifact's "
+                "mathematical model hash."
+            )
+        entry = self._acquire(model_hash)
+        try:
+            wait_seconds = time.perf_counter() - received
+            hit, load_seconds = self._ensure_loaded(
+                entry, model_hash, request.artifact_directory
+            )
+            result = self._solve_resident(entry, request)
+        finally:
+            entry.lock.release()
+        return ResidentSolveResponse(
+            result=result,
+            mathematical_model_hash=model_hash,
+            cache_hit=hit,
+            load_seconds=load_seconds,
+            wait_seconds=wait_seconds,
+        )
+
+    def statistics(self) -> ResidentCacheStatistics:
+        """Return hit, miss, and eviction counts with the resident models."""
+        with self._lock:
+            resident = [
+                (model_hash, entry)
+                for model_hash, entry in self._entries.items()
+                if entry.session is not None
+            ]
+            return ResidentCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                resident_models=tuple(model_hash for model_hash, _ in resident),
+                resident_bytes=sum(entry.footprint_bytes for _, entry in resident),
+                max_sessions=self._max_sessions,
+                memory_budget_bytes=self._memory_budget_bytes,
+            )
+
+    def close(self) -> None:
+        """Release every resident session, waiting for running solves."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            with entry.lock:
+                if entry.session is not None:
+                    entry.session.close()
+                entry.session = None
+                entry.model = None
+                entry.evicted = True
+
+    def _acquire(self, model_hash: str) -> _ResidentModel:
+        """Return the locked entry for one hash, skipping evicted entries."""
+        while True:
+            with self._lock:
+                entry = self._entries.get(model_hash)
+                if entry is None:
+                    entry = _ResidentModel(lock=Lock())
+                    self._entries[model_hash] = entry
+                self._entries.move_to_end(model_hash)
+            entry.lock.acquire()
+            if not entry.evicted:
+                return entry
+            entry.lock.release()
+
+    def _ensure_loaded(
+        self,
+        entry: _ResidentModel,
+        model_hash: str,
+        artifact_directory: str | Path,
+    ) -> tuple[bool, float]:
+        """Load the entry's session on a miss; the caller holds its lock."""
+        if entry.session is not None:
+            with self._lock:
+                self._hits += 1
+            return True, 0.0
+        started = time.perf_counter()
+        try:
+            artifact = load_compiled_artifact(artifact_directory)
+            if artifact.manifest.mathematical_model_hash != model_hash:
+                raise ValueError("Compiled artifact changed while it was being loaded.")
+            model = artifact.model
+            session = HighsModelSession(model, configuration=self._configuration)
+        except Exception:
+            with self._lock:
+                if self._entries.get(model_hash) is entry:
+                    del self._entries[model_hash]
+                entry.evicted = True
+            raise
+        entry.session = session
+        entry.model = model
+        entry.objective_changed = False
+        entry.footprint_bytes = resident_session_bytes(model)
+        with self._lock:
+            self._misses += 1
+            self._evict_idle(keep=model_hash)
+        return False, time.perf_counter() - started
+
+    def _evict_idle(self, *, keep: str) -> None:
+        """Close idle sessions until the cache fits; the caller holds the lock."""
+        for model_hash in list(self._entries):
+            resident = [
+                entry for entry in self._entries.values() if entry.session is not None
+            ]
+            if len(resident) <= self._max_sessions and (
+                sum(entry.footprint_bytes for entry in resident)
+                <= self._memory_budget_bytes
+            ):
+                return
+            entry = self._entries[model_hash]
+            if model_hash == keep or entry.session is None:
+                continue
+            if not entry.lock.acquire(blocking=False):
+                continue
+            try:
+                entry.session.close()
+                entry.session = None
+                entry.model = None
+                entry.evicted = True
+                del self._entries[model_hash]
+                self._evictions += 1
+            finally:
+                entry.lock.release()
+
+    def _solve_resident(
+        self,
+        entry: _ResidentModel,
+        request: ResidentSolveRequest,
+    ) -> SolverResult:
+        """Restore the baseline, apply the request's edits, and solve."""
+        session = entry.session
+        model = entry.model
+        if session is None or model is None:
+            raise RuntimeError("Resident model session is not loaded.")
+        configuration = request.configuration or self._configuration
+        session.change_solve_limits(
+            time_limit_seconds=configuration.time_limit_seconds,
+            relative_mip_gap=configuration.relative_mip_gap,
+        )
+        session.change_random_seed(configuration.random_seed)
+        session.apply_scenario(request.scenario or BASELINE_SCENARIO)
+        if request.objective is not None:
+            session.change_objective(
+                request.objective,
+                (
+                    request.objective_offset
+                    if request.objective_offset is not None
+                    else model.objective_offset
+                ),
+            )
+            entry.objective_changed = True
+        elif entry.objective_changed:
+            session.change_objective(model.objective, model.objective_offset)
+            entry.objective_changed = False
+        if request.warm_start is not None:
+            session.apply_warm_start(
+                request.warm_start,
+                retain_as_deadline_fallback=request.retain_warm_start
+                and request.scenario is None
+                and request.objective is None
+                and warm_start_is_feasible(model, request.warm_start),
+            )
+        return session.solve()
+
+
+class SolverService:
+    """Serve resident solves to local clients over a Unix socket.
+
+    Each connection is handled on its own thread and may send any number of
+    requests. Messages are pickled ``(operation, payload)`` tuples, so the
+    socket is bound readable by its owner only and every connection must
+    answer an ``authkey`` challenge before its first message is loaded.
+    """
+
+    def __init__(
+        self, address: str | Path, cache: ResidentSessionCache, authkey: bytes
+    ) -> None:
+        """Bind the listening socket without accepting connections yet."""
+        if not authkey:
+            raise ValueError("Solver service authkey must not be empty.")
+        self._address = str(address)
+        self._authkey = authkey
+        self._cache = cache
+        self._stopping = Event()
+        Path(self._address).parent.mkdir(parents=True, exist_ok=True)
+        if Path(self._address).exists():
+            Path(self._address).unlink()
+        previous_umask = os.umask(0o077)
+        try:
+            self._listener = Listener(
+                self._address, family="AF_UNIX", authkey=self._authkey
+            )
+        finally:
+            os.umask(previous_umask)
+        os.chmod(self._address, 0o600)
+
+    @property
+    def address(self) -> str:
+        """Return the listening socket path."""
+        return self._address
+
+    def serve_forever(self) -> None:
+        """Accept connections until a client requests shutdown."""
+        try:
+            while not self._stopping.is_set():
+                try:
+                    connection = self._listener.accept()
+                except (AuthenticationError, ConnectionError, EOFError) as error:
+                    logger.warning("Solver service rejected a client: %r", error)
+                    continue
+                except OSError:
+                    if self._stopping.is_set():
+                        break
+                    raise
+                Thread(
+                    target=self._handle,
+                    args=(connection,),
+                    name="solver-service-connection",
+                    daemon=True,
+                ).start()
+        finally:
+            self._listener.close()
+            self._cache.close()
+            Path(self._address).unlink(missing_ok=True)
+
+    def stop(self) -> None:
+        """Stop accepting connections and wake the accept loop."""
+        if self._stopping.is_set():
+            return
+        self._stopping.set()
+        try:
+            Client(self._address, family="AF_UNIX", authkey=self._authkey).close()
+        except (AuthenticationError, OSError):
+            pass
+
+    def _preload(self, artifact_directory: str) -> None:
+        """Load an artifact on a background thread and answer immediately."""
+
+        def load() -> None:
+            try:
+                self._cache.load(artifact_directory)
+            except Exception:
+                logger.exception(
+                    "Solver service preload of %s failed.", artifact_directory
+                )
+
+        Thread(target=load, name="solver-service-preload", daemon=True).start()
+
+    def _handle(self, connection: Connection) -> None:
+        """Answer one client's requests until it disconnects."""
+        operations: dict[str, Callable[[object], object]] = {
+            "solve": self._cache.solve,
+            "load": self._cache.load,
+            "preload": self._preload,
+            "statistics": lambda _: self._cache.statistics(),
+            "protocol": lambda _: SOLVER_SERVICE_PROTOCOL_VERSION,
+        }
+        with connection:
+            while True:
+                try:
+                    operation, payload = connection.recv()
+                except (EOFError, OSError):
+                    return
+                if operation == "shutdown":
+                    connection.send(("ok", None))
+                    self.stop()
+                    return
+                handler = operations.get(operation)
+                try:
+                    if handler is None:
+                        raise ValueError(
+                            f"Unknown solver service operation {operation!r}."
+                        )
+                    response = ("ok", handler(payload))
+                except Exception as error:
+                    logger.exception("Solver service %s request failed.", operation)
+                    response = ("error", f"{type(error).__name__}: {error}")
+                connection.send(response)
+
+
+class SolverServiceClient:
+    """Send requests to a local solver service over one connection."""
+
+    def __init__(self, address: str | Path, authkey: bytes) -> None:
+        """Connect and reject services speaking another protocol version."""
+        try:
+            self._connection = Client(str(address), family="AF_UNIX", authkey=authkey)
+        except AuthenticationError as error:
+            raise RuntimeError("Solver service rejected the authkey.") from error
+        self._lock = Lock()
+        version = self._call("protocol", None)
+        if version != SOLVER_SERVICE_PROTOCOL_VERSION:
+            self.close()
+            raise RuntimeError(
+                f"Solver service protocol {version} is not "
+                f"{SOLVER_SERVICE_PROTOCOL_VERSION}."
+            )
+
+    def __enter__(self) -> "SolverServiceClient":
+        """Return this connected client."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection; the service keeps its resident models."""
+        self._connection.close()
+
+    def solve(self, request: ResidentSolveRequest) -> ResidentSolveResponse:
+        """Solve one request on the service's resident copy of its model."""
+        return self._call("solve", request)
+
+    def load(self, artifact_directory: str | Path) -> tuple[str, bool]:
+        """Make an artifact resident ahead of its follow-up analyses."""
+        return self._call("load", str(artifact_directory))
+
+    def preload(self, artifact_directory: str | Path) -> None:
+        """Start loading an artifact on the service without waiting for it."""
+        self._call("preload", str(artifact_directory))
+
+    def statistics(self) -> ResidentCacheStatistics:
+        """Return the service's cache counters."""
+        return self._call("statistics", None)
+
+    def shutdown(self) -> None:
+        """Ask the service to stop after its running solves."""
+        self._call("shutdown", None)
+
+    def _call(self, operation: str, payload: object):
+        """Send one request and raise a service-side failure as RuntimeError."""
+        with self._lock:
+            self._connection.send((operation, payload))
+            status, value = self._connection.recv()
+        if status != "ok":
+            raise RuntimeError(f"Solver service {operation} failed: {value}")
+        return value
+
+
+class ResidentModelSession:
+    """Drive a service-resident model through the ``HighsModelSession`` calls.
+
+    Edits are buffered on the client and sent with the next :meth:`solve`, so
+    each solve starts from the compiled baseline plus the edits made since the
+    previous one. Progress callbacks and incumbent files stay local to the
+    service and are not forwarded.
+    """
+
+    def __init__(
+        self,
+        reference: ResidentModelReference,
+        *,
+        configuration: SolveConfiguration,
+        mathematical_model_hash: str | None = None,
+    ) -> None:
+        """Connect to the service named by ``reference``."""
+        self._client = SolverServiceClient(reference.service_address, reference.authkey)
+        self._artifact_directory = reference.artifact_directory
+        self._mathematical_model_hash = mathematical_model_hash
+        self._configuration = configuration
+        self._scenario: SolveScenario | None = None
+        self._objective: tuple[np.ndarray, float] | None = None
+        self._warm_start: tuple[np.ndarray, bool] | None = None
+        self.last_response: ResidentSolveResponse | None = None
+
+    def __enter__(self) -> "ResidentModelSession":
+        """Return this active session."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the service connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the service connection."""
+        self._client.close()
+
+    def apply_scenario(self, scenario: SolveScenario) -> None:
+        """Replace the bound edits sent with the next solve."""
+        self._scenario = scenario
+
+    def change_objective(
+        self,
+        objective: Sequence[float] | np.ndarray,
+        objective_offset: float,
+    ) -> None:
+        """Replace the column costs sent with the next solve."""
+        self._objective = (
+            np.asarray(objective, dtype=np.float64),
+            float(objective_offset),
+        )
+
+    def change_random_seed(self, random_seed: int) -> None:
+        """Reseed the next solve."""
+        self._configuration = replace(self._configuration, random_seed=random_seed)
+
+    def apply_warm_start(
+        self,
+        values: Sequence[float] | np.ndarray,
+        *,
+        retain_as_deadline_fallback: bool = False,
+    ) -> None:
+        """Send an incumbent with the next solve."""
+        self._warm_start = (
+            np.asarray(values, dtype=np.float64),
+            retain_as_deadline_fallback,
+        )
+
+    def solve(
+        self,
+        *,
+        progress_callback: Callable[[dict[str, object]], None] | None = None,
+        incumbent_path: str | Path | None = None,
+    ) -> SolverResult:
+        """Solve the buffered edits on the service and return its result."""
+        del progress_callback, incumbent_path
+        self.last_response = self._client.solve(
+            ResidentSolveRequest(
+                artifact_directory=self._artifact_directory,
+                mathematical_model_hash=self._mathematical_model_hash,
+                configuration=self._configuration,
+                scenario=self._scenario,
+                objective=self._objective[0] if self._objective else None,
+                objective_offset=self._objective[1] if self._objective else None,
+                warm_start=self._warm_start[0] if self._warm_start else None,
+                retain_warm_start=bool(self._warm_start and self._warm_start[1]),
+            )
+        )
+        self._warm_start = None
+        return self.last_response.result
+
+
+def open_model_session(
+    model: CompiledOptimizationModel,
+    *,
+    configuration: SolveConfiguration,
+    resident_model: ResidentModelReference | None = None,
+) -> HighsModelSession | ResidentModelSession:
+    """Open a resident service session when one answers, else a local one.
+
+    An unreachable service falls back to loading ``model`` into a local HiGHS
+    session, so analyses never depend on the daemon being up.
+    """
+    if resident_model is not None:
+        try:
+            return ResidentModelSession(resident_model, configuration=configuration)
+        except (OSError, RuntimeError) as error:
+            logger.warning(
+                "Solver service at %s is unavailable; solving locally: %s",
+                resident_model.service_address,
+                error,
+            )
+    return HighsModelSession(model, configuration=configuration)
+
+
+def resident_session_bytes(model: CompiledOptimizationModel) -> int:
+    """Estimate the native HiGHS memory one resident model occupies."""
+    return estimate_sparse_model_footprint(
+        SparseModelDimensions(
+            planning_units=model.primary_variable_count,
+            primary_variables=model.primary_variable_count,
+            auxiliary_variables=model.variable_count - model.primary_variable_count,
+            constraint_rows=model.constraint_count,
+            matrix_nonzeros=model.nonzero_count,
+            feature_nonzeros=0,
+            neighbor_edges=0,
+        ),
+        safety_factor=1.0,
+    ).solver_model_bytes
+
+
+def solver_service_authkey() -> bytes:
+    """Read the shared secret that service and clients authenticate with."""
+    authkey = os.getenv("SOLVER_SERVICE_AUTHKEY")
+    if not authkey:
+        raise ValueError("SOLVER_SERVICE_AUTHKEY must hold the service secret.")
+    return authkey.encode("utf-8")
+
+
+def serve_solver_service() -> None:
+    """Run the service configured by ``SOLVER_SERVICE_*`` until shut down."""
+    address = os.getenv("SOLVER_SERVICE_SOCKET")
+    if not address:
+        raise ValueError("SOLVER_SERVICE_SOCKET must name the service socket.")
+    authkey = solver_service_authkey()
+    threads = os.getenv("SOLVER_SERVICE_THREADS")
+    memory_budget = os.getenv("SOLVER_SERVICE_MEMORY_BUDGET_BYTES")
+    cache = ResidentSessionCache(
+        SolveConfiguration(thread_count=int(threads) if threads else None),
+        max_sessions=int(os.getenv("SOLVER_SERVICE_MAX_SESSIONS", "4")),
+        memory_budget_bytes=int(memory_budget) if memory_budget else None,
+    )
+    SolverService(address, cache, authkey).serve_forever()
+
+
+def _manifest_model_hash(artifact_directory: str | Path) -> str:
+    """Read an artifact's committed model hash without hashing its arrays."""
+    manifest_path = Path(artifact_directory) / "manifest.json"
+    if not manifest_path.exists():
+        raise ValueError("Compiled artifact has no committed manifest.")
+    return str(
+        json.loads(manifest_path.read_text(encoding="utf-8"))["mathematical_model_hash"]
+    )
+
+
+if __name__ == "__main__":
+    serve_solver_service()
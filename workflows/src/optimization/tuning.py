@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from .model import CompiledOptimizationModel, SolveConfiguration
+from ..utils.cpu import available_cpu_count
+
+DEFAULT_TUNING_TABLE_PATH = Path(__file__).with_name("tuning_rules.json")
+FEATURE_NAMES = (
+    "rows",
+    "nonzeros",
+    "nonzeros_per_row",
+    "neighbor_auxiliary_share",
+    "integrality_share",
+    "has_warm_start",
+)
+TUNED_OPTIONS = frozenset(
+    {"parallel", "presolve", "mip_heuristic_effort", "simplex_strategy"}
+)
+RUNTIME_TIE_TOLERANCE = 0.02
+
+
+@dataclass(frozen=True)
+class ModelFeatures:
+    """Cheap shape statistics of one compiled model used to pick solver options."""
+
+    rows: int
+    columns: int
+    nonzeros: int
+    nonzeros_per_row: float
+    neighbor_auxiliary_share: float
+    integrality_share: float
+    has_warm_start: bool
+
+    def value(self, name: str) -> float:
+        """Return one named feature as a number for rule comparisons."""
+        return float(getattr(self, name))
+
+
+@dataclass(frozen=True)
+class TuningChoice:
+    """Name one HiGHS option set and the thread cap it is measured with."""
+
+    name: str
+    options: Mapping[str, int | float | str | bool]
+    max_threads: int | None = None
+
+
+@dataclass(frozen=True)
+class TuningRule:
+    """Select a choice when every bounded feature lies in ``(lower, upper]``."""
+
+    choice: str
+    bounds: Mapping[str, tuple[float | None, float | None]]
+
+    def matches(self, features: ModelFeatures) -> bool:
+        """Return whether the features fall inside every bound of this rule."""
+        for name, (lower, upper) in self.bounds.items():
+            value = features.value(name)
+            if lower is not None and value <= lower:
+                return False
+            if upper is not None and value > upper:
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class TuningTable:
+    """Ordered rules whose first match picks a choice; the rules cover all models."""
+
+    choices: tuple[TuningChoice, ...]
+    rules: tuple[TuningRule, ...]
+    corpus: Mapping[str, object] | None = None
+
+    def __post_init__(self) -> None:
+        """Reject rules that name unknown choices or features."""
+        names = {choice.name for choice in self.choices}
+        if len(names) != len(self.choices):
+            raise ValueError("Tuning choice names must be unique.")
+        if not self.rules:
+            raise ValueError("A tuning table needs at least one rule.")
+        for rule in self.rules:
+            if rule.choice not in names:
+                raise ValueError(f"Unknown tuning choice: {rule.choice}.")
+            unknown = set(rule.bounds).difference(FEATURE_NAMES)
+            if unknown:
+                raise ValueError(
+                    "Unknown tuning features: " + ", ".join(sorted(unknown))
+                )
+        for choice in self.choices:
+            reserved = set(choice.options).difference(TUNED_OPTIONS)
+            if reserved:
+                raise ValueError(
+                    "Tuning choices may only set "
+                    + ", ".join(sorted(TUNED_OPTIONS))
+                    + "."
+                )
+
+    def choice(self, name: str) -> TuningChoice:
+        """Return the named choice."""
+        return next(choice for choice in self.choices if choice.name == name)
+
+
+@dataclass(frozen=True)
+class TuningObservation:
+    """Replayed runtimes of every choice on one corpus model.
+
+    Runtimes of solves that did not certify a result carry the corpus penalty,
+    so the fit never prefers an option set that failed.
+    """
+
+    features: ModelFeatures
+    runtimes: Mapping[str, float]
+
+
+@dataclass(frozen=True)
+class SolverTuning:
+    """Options and thread cap chosen for one model, with the matched rule."""
+
+    choice: str
+    options: Mapping[str, int | float | str | bool]
+    thread_count: int | None
+    rule_index: int
+    bounds: Mapping[str, tuple[float | None, float | None]]
+    features: ModelFeatures
+
+
+def model_features(
+    model: CompiledOptimizationModel,
+    *,
+    has_warm_start: bool = False,
+) -> ModelFeatures:
+    """Extract tuning features without touching the coefficient values."""
+    columns = model.variable_count
+    rows = model.constraint_count
+    return ModelFeatures(
+        rows=rows,
+        columns=columns,
+        nonzeros=model.nonzero_count,
+        nonzeros_per_row=model.nonzero_count / max(rows, 1),
+        neighbor_auxiliary_share=(
+            (columns - model.primary_variable_count) / columns if columns else 0.0
+        ),
+        integrality_share=(
+            float(np.count_nonzero(np.asarray(model.integrality) != 0)) / columns
+            if columns
+            else 0.0
+        ),
+        has_warm_start=bool(has_warm_start),
+    )
+
+
+def tune_solver_options(
+    model: CompiledOptimizationModel,
+    *,
+    has_warm_start: bool = False,
+    table: TuningTable | None = None,
+) -> SolverTuning:
+    """Pick HiGHS options and a thread cap for a model from the rules table."""
+    table = table or load_tuning_table()
+    features = model_features(model, has_warm_start=has_warm_start)
+    for index, rule in enumerate(table.rules):
+        if rule.matches(features):
+            choice = table.choice(rule.choice)
+            return SolverTuning(
+                choice=choice.name,
+                options=dict(choice.options),
+                thread_count=(
+                    min(available_cpu_count(), choice.max_threads)
+                    if choice.max_threads is not None
+                    else None
+                ),
+                rule_index=index,
+                bounds=dict(rule.bounds),
+                features=features,
+            )
+    raise ValueError("No tuning rule matched the model features.")
+
+
+def apply_solver_tuning(
+    configuration: SolveConfiguration,
+    tuning: SolverTuning,
+) -> tuple[SolveConfiguration, dict[str, object]]:
+    """Merge tuned options beneath explicitly configured ones.
+
+    Returns:
+        The tuned configuration and the ``solver_settings.tuning`` record of
+        what was applied and why.
+    """
+    explicit = dict(configuration.options or {})
+    applied = {
+        name: value for name, value in tuning.options.items() if name not in explicit
+    }
+    thread_count = configuration.thread_count or tuning.thread_count
+    tuned = replace(
+        configuration,
+        options={**applied, **explicit} or None,
+        thread_count=thread_count,
+    )
+    return tuned, {
+        "choice": tuning.choice,
+        "rule_index": tuning.rule_index,
+        "rationale": {
+            name: [lower, upper] for name, (lower, upper) in tuning.bounds.items()
+        },
+        "features": asdict(tuning.features),
+        "applied_options": applied,
+        "thread_count": (
+            tuning.thread_count if configuration.thread_count is None else None
+        ),
+    }
+
+
+def fit_tuning_table(
+    observations: Sequence[TuningObservation],
+    choices: Sequence[TuningChoice],
+    *,
+    max_depth: int = 2,
+    min_observations: int = 2,
+    corpus: Mapping[str, object] | None = None,
+) -> TuningTable:
+    """Fit a shallow decision list that minimizes the corpus' summed runtime.
+
+    Each node keeps the choice with the lowest total runtime over its models,
+    preferring earlier choices within ``RUNTIME_TIE_TOLERANCE`` so timing noise
+    does not move the table. A node is split on the feature threshold that
+    lowers that total the most, until ``max_depth`` or ``min_observations``
+    stops it. The leaves partition the feature space, so the rules cover
+    every model.
+    """
+    if not observations:
+        raise ValueError("Fitting a tuning table needs at least one observation.")
+    names = [choice.name for choice in choices]
+    for observation in observations:
+        missing = set(names).difference(observation.runtimes)
+        if missing:
+            raise ValueError(
+                "Observation is missing runtimes for: " + ", ".join(sorted(missing))
+            )
+    runtimes = np.asarray(
+        [
+            [observation.runtimes[name] for name in names]
+            for observation in observations
+        ],
+        dtype=np.float64,
+    )
+    features = np.asarray(
+        [
+            [observation.features.value(name) for name in FEATURE_NAMES]
+            for observation in observations
+        ],
+        dtype=np.float64,
+    )
+    rules: list[TuningRule] = []
+
+    def best_choice(rows: np.ndarray) -> tuple[int, float]:
+        totals = runtimes[rows].sum(axis=0)
+        lowest = float(totals.min())
+        index = int(np.flatnonzero(totals <= lowest * (1.0 + RUNTIME_TIE_TOLERANCE))[0])
+        return index, float(totals[index])
+
+    def grow(
+        rows: np.ndarray,
+        bounds: dict[str, tuple[float | None, float | None]],
+        depth: int,
+    ) -> None:
+        choice, cost = best_choice(rows)
+        split = None
+        if depth < max_depth and len(rows) >= 2 * min_observations:
+            for feature in range(len(FEATURE_NAMES)):
+                values = np.unique(features[rows, feature])
+                for threshold in (values[:-1] + values[1:]) / 2.0:
+                    left = rows[features[rows, feature] <= threshold]
+                    right = rows[features[rows, feature] > threshold]
+                    if min(len(left), len(right)) < min_observations:
+                        continue
+                    split_cost = best_choice(left)[1] + best_choice(right)[1]
+                    if split_cost < cost * (1.0 - RUNTIME_TIE_TOLERANCE) and (
+                        split is None or split_cost < split[0]
+                    ):
+                        split = (split_cost, feature, float(threshold), left, right)
+        if split is None:
+            rules.append(TuningRule(choice=names[choice], bounds=dict(bounds)))
+            return
+        _, feature, threshold, left, right = split
+        name = FEATURE_NAMES[feature]
+        lower, upper = bounds.get(name, (None, None))
+        grow(left, {**bounds, name: (lower, threshold)}, depth + 1)
+        grow(right, {**bounds, name: (threshold, upper)}, depth + 1)
+
+    grow(np.arange(len(observations)), {}, 0)
+    return TuningTable(choices=tuple(choices), rules=tuple(rules), corpus=corpus)
+
+
+def load_tuning_table(path: str | Path | None = None) -> TuningTable:
+    """Read a tuning table, defaulting to ``HIGHS_TUNING_TABLE`` or the shipped one."""
+    resolved = Path(
+        path or os.getenv("HIGHS_TUNING_TABLE") or DEFAULT_TUNING_TABLE_PATH
+    )
+    document = json.loads(resolved.read_text("utf-8"))
+    return TuningTable(
+        choices=tuple(
+            TuningChoice(
+                name=choice["name"],
+                options=dict(choice.get("options") or {}),
+                max_threads=choice.get("max_threads"),
+            )
+            for choice in document["choices"]
+        ),
+        rules=tuple(
+            TuningRule(
+                choice=rule["choice"],
+                bounds={
+                    name: (bound[0], bound[1])
+                    for name, bound in (rule.get("bounds") or {}).items()
+                },
+            )
+            for rule in document["rules"]
+        ),
+        corpus=document.get("corpus"),
+    )
+
+
+def write_tuning_table(table: TuningTable, path: str | Path) -> None:
+    """Atomically write a tuning table as indented JSON."""
+    destination = Path(path)
+    document = {
+        "choices": [
+            {
+                "name": choice.name,
+                "options": dict(choice.options),
+                "max_threads": choice.max_threads,
+            }
+            for choice in table.choices
+        ],
+        "rules": [
+            {
+                "choice": rule.choice,
+                "bounds": {
+                    name: [lower, upper] for name, (lower, upper) in rule.bounds.items()
+                },
+            }
+            for rule in table.rules
+        ],
+        "corpus": dict(table.corpus) if table.corpus is not None else None,
+    }
+    temporary = destination.with_name(f".{destination.name}.tmp")
+    temporary.write_text(json.dumps(document, indent=2) + "\n", "utf-8")
+    temporary.replace(destination)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Sequence
 
 import numpy as np
 
+from .conditioning import NumericalScaling
 from .model import CompiledOptimizationModel, SolverResult
-from .numerical import csr_row_activities
+from .csr_kernels import ColumnEvaluation, evaluate_columns
 
 
 @dataclass(frozen=True)
@@ -32,8 +33,14 @@ def reconstruct_and_validate(
     tolerance: float = 1e-6,
     collect_selected_ids: bool = True,
     variable_upper_override: tuple[int, float] | None = None,
+    scaling: NumericalScaling | None = None,
 ) -> AuthoritativeValidation:
-    """Reconstruct stable identities and independently validate a solver result."""
+    """Reconstruct stable identities and independently validate a solver result.
+
+    With ``scaling``, row activities and bounds are unscaled exactly before the
+    tolerance is applied, so violations are measured in the original units, and
+    the reported objective is the original-unit objective.
+    """
     columns = np.asarray(
         (
             result.native_columns
@@ -60,35 +67,19 @@ def reconstruct_and_validate(
             raise ValueError("Variable-bound validation override is invalid.")
         variable_upper = variable_upper.copy()
         variable_upper[column] = upper
-    maximum_bound_violation = _maximum_bound_violation(
+    evaluation = evaluate_columns(
+        model,
         columns,
-        model.variable_lower,
-        variable_upper,
-    )
-    integer = np.asarray(model.integrality) != 0
-    maximum_integrality_violation = float(
-        np.max(np.abs(columns[integer] - np.rint(columns[integer])), initial=0.0)
+        variable_upper=variable_upper,
+        row_exponents=(
+            scaling.row_exponent_vector(model.constraint_count)
+            if scaling is not None
+            else None
+        ),
     )
-    activities = csr_row_activities(model, columns)
-    maximum_row_violation = _maximum_bound_violation(
-        activities,
-        model.row_lower,
-        model.row_upper,
+    validation = validate_evaluation(
+        evaluation, result, tolerance=tolerance, scaling=scaling
     )
-    objective = float(np.dot(model.objective, columns) + model.objective_offset)
-    failures: list[str] = []
-    if maximum_bound_violation > tolerance:
-        failures.append("variable_bound_violation")
-    if maximum_integrality_violation > tolerance:
-        failures.append("integrality_violation")
-    if maximum_row_violation > tolerance:
-        failures.append("constraint_violation")
-    if (
-        result.objective_value is not None
-        and abs(objective - result.objective_value)
-        > tolerance * max(1.0, abs(objective))
-    ):
-        failures.append("objective_mismatch")
 
     if np.intersect1d(candidate_ids, fixed_ids, assume_unique=True).size:
         raise ValueError("A planning-unit ID is both candidate and fixed.")
@@ -104,32 +95,43 @@ def reconstruct_and_validate(
         if collect_selected_ids
         else np.empty(0, dtype=np.uint64)
     )
+    return replace(validation, selected_planning_unit_ids=selected)
+
+
+def validate_evaluation(
+    evaluation: ColumnEvaluation,
+    result: SolverResult,
+    *,
+    tolerance: float = 1e-6,
+    scaling: NumericalScaling | None = None,
+) -> AuthoritativeValidation:
+    """Apply the acceptance tolerances to an already evaluated column vector.
+
+    No planning-unit identities are collected; callers that need them use
+    :func:`reconstruct_and_validate`.
+    """
+    objective = evaluation.objective_value
+    failures: list[str] = []
+    if evaluation.maximum_bound_violation > tolerance:
+        failures.append("variable_bound_violation")
+    if evaluation.maximum_integrality_violation > tolerance:
+        failures.append("integrality_violation")
+    if evaluation.maximum_row_violation > tolerance:
+        failures.append("constraint_violation")
+    if (
+        result.objective_value is not None
+        and abs(objective - result.objective_value)
+        > tolerance * max(1.0, abs(objective))
+    ):
+        failures.append("objective_mismatch")
     return AuthoritativeValidation(
         accepted=not failures,
-        objective_value=objective,
-        maximum_row_violation=maximum_row_violation,
-        maximum_bound_violation=maximum_bound_violation,
-        maximum_integrality_violation=maximum_integrality_violation,
+        objective_value=(
+            scaling.unscale_objective(objective) if scaling is not None else objective
+        ),
+        maximum_row_violation=evaluation.maximum_row_violation,
+        maximum_bound_violation=evaluation.maximum_bound_violation,
+        maximum_integrality_violation=evaluation.maximum_integrality_violation,
         failures=tuple(failures),
-        selected_planning_unit_ids=selected,
+        selected_planning_unit_ids=np.empty(0, dtype=np.uint64),
     )
-
-
-def _maximum_bound_violation(
-    values: np.ndarray,
-    lower: np.ndarray,
-    upper: np.ndarray,
-    *,
-    batch_size: int = 1_048_576,
-) -> float:
-    """Measure bound violation without allocating full-size difference arrays."""
-    maximum = 0.0
-    for start in range(0, len(values), batch_size):
-        stop = min(start + batch_size, len(values))
-        batch = values[start:stop]
-        maximum = max(
-            maximum,
-            float(np.max(lower[start:stop] - batch, initial=0.0)),
-            float(np.max(batch - upper[start:stop], initial=0.0)),
-        )
-    return maximum
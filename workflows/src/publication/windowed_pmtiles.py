@@ -328,9 +328,7 @@ def _render_metatile(
     )
     if specification.surface == "decision" and not np.any(source_values != 255):
         return []
-    if specification.surface in {"allocation", "priority"} and not np.any(
-        np.isfinite(source_values)
-    ):
+    if specification.surface != "decision" and not np.any(np.isfinite(source_values)):
         return []
 
     window_transform = source_transform * Affine.translation(col_start, row_start)
@@ -397,14 +395,13 @@ def _style_destination(
 ) -> np.ndarray | None:
     """Style decision or allocation surfaces and keep NoData transparent."""
     rgba = np.zeros((*destination.shape, 4), dtype=np.uint8)
-    if surface in {"allocation", "priority"}:
+    if surface in {"allocation", "priority", "frequency"}:
         valid = np.isfinite(destination)
         if not np.any(valid):
             return None
         clipped = np.clip(destination, 0.0, 1.0)
-        colours = plt.get_cmap("viridis" if surface == "allocation" else "magma")(
-            clipped
-        )
+        ramp = {"allocation": "viridis", "priority": "magma"}.get(surface, "cividis")
+        colours = plt.get_cmap(ramp)(clipped)
         rgba[valid] = np.asarray(np.round(colours[valid] * 255), dtype=np.uint8)
         rgba[valid, 3] = np.asarray(80 + np.round(clipped[valid] * 175), dtype=np.uint8)
         return rgba
@@ -538,6 +535,7 @@ def _tileset_metadata(
                 "decision": "any_selected_v1",
                 "allocation": "maximum_allocation_v1",
                 "priority": "mean_priority_v1",
+                "frequency": "mean_frequency_v1",
             }[surface]
         ),
         "color_ramp": (
@@ -545,6 +543,7 @@ def _tileset_metadata(
                 "decision": "decision_selected_viridis_unselected_gray_v2",
                 "allocation": "allocation_viridis_continuous_v1",
                 "priority": "priority_magma_continuous_v1",
+                "frequency": "frequency_cividis_continuous_v1",
             }[surface]
         ),
         "source_canonical_checksum": specification.canonical_checksum,
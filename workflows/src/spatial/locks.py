@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+from affine import Affine
+from rasterio.features import rasterize
+from rasterio.transform import array_bounds
+from shapely import STRtree, box
+from shapely.geometry import mapping
+from shapely.geometry.base import BaseGeometry
+
+
+@dataclass(frozen=True)
+class PlanningLocks:
+    """Lock-in and lock-out polygons in the planning-grid CRS."""
+
+    lock_in: tuple[BaseGeometry, ...] = ()
+    lock_out: tuple[BaseGeometry, ...] = ()
+
+    @property
+    def empty(self) -> bool:
+        """Return whether no lock polygon was supplied."""
+        return not self.lock_in and not self.lock_out
+
+    @cached_property
+    def _trees(self) -> tuple[STRtree, STRtree]:
+        """Index both polygon sets once so each window rasterizes only its hits."""
+        return STRtree(self.lock_in), STRtree(self.lock_out)
+
+
+def rasterize_lock_window(
+    locks: PlanningLocks,
+    transform: Affine,
+    row_start: int,
+    col_start: int,
+    shape: tuple[int, int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rasterize lock-in and lock-out cell-center membership for one grid window.
+
+    Polygons are filtered by the window bounds before burning, so a large
+    lock set costs one rasterization of its intersecting polygons per tile.
+
+    Returns:
+        Lock-in and lock-out masks of ``shape``.
+    """
+    window_transform = transform * Affine.translation(col_start, row_start)
+    bounds = box(*array_bounds(shape[0], shape[1], window_transform))
+    masks = []
+    for geometries, tree in zip(
+        (locks.lock_in, locks.lock_out), locks._trees, strict=True
+    ):
+        hits = np.sort(tree.query(bounds)) if geometries else ()
+        if len(hits) == 0:
+            masks.append(np.zeros(shape, dtype=bool))
+            continue
+        masks.append(
+            rasterize(
+                [(mapping(geometries[int(index)]), 1) for index in hits],
+                out_shape=shape,
+                transform=window_transform,
+                fill=0,
+                dtype=np.uint8,
+            ).astype(bool)
+        )
+    return masks[0], masks[1]
+
+
+def lock_states(lock_in: np.ndarray, lock_out: np.ndarray) -> np.ndarray:
+    """Combine lock masks into -1/free, 0/locked-out, 1/locked-in states.
+
+    Lock-out wins where both apply, so an exclusion is never overridden.
+    """
+    return np.where(
+        lock_out, np.int8(0), np.where(lock_in, np.int8(1), np.int8(-1))
+    ).astype(np.int8, copy=False)
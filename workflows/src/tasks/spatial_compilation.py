@@ -39,6 +39,7 @@ from ..optimization.neighbor import (
     load_neighbor_structure,
     measure_neighbor_structure,
     packed_mask_checksum,
+    planning_fixed_values,
     resolve_neighbor_normalization,
 )
 from ..optimization.model import (
@@ -51,7 +52,9 @@ from ..optimization.objective import (
     top_k_attainable_scale,
 )
 from ..optimization.artifact import write_compiled_artifact
+from ..optimization.conditioning import condition_model
 from ..optimization.grid import GridTile, grid_cell_ids, iter_grid_tiles
+from ..spatial.locks import PlanningLocks, lock_states, rasterize_lock_window
 from ..spatial.native_mapping import (
     NativeLayer,
     PlanningGrid,
@@ -118,8 +121,40 @@ class PlanningUnitConstraint(BaseModel):
         return self
 
 
+class LockConstraint(BaseModel):
+    """Planning units forced into or out of every solution.
+
+    Units are locked either by a GeoJSON polygon in EPSG:4326, using the
+    planning grid's cell-center rule, or by a layer value range.
+    """
+
+    type: Literal["lock"]
+    state: Literal["in", "out"]
+    geometry: Optional[Dict[str, Any]] = None
+    layer: Optional[str] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+    @model_validator(mode="after")
+    def require_source(self):
+        if (self.geometry is None) == (self.layer is None):
+            raise ValueError("Lock constraints require exactly one geometry or layer.")
+        if self.geometry is not None:
+            if self.min is not None or self.max is not None:
+                raise ValueError("Geometry locks cannot declare layer bounds.")
+            try:
+                shape(self.geometry)
+            except Exception as error:
+                raise ValueError("Lock geometry must be a GeoJSON geometry.") from error
+        elif self.min is None and self.max is None:
+            raise ValueError("Layer locks require a minimum or maximum.")
+        if self.min is not None and self.max is not None and self.min > self.max:
+            raise ValueError("Lock constraint minimum cannot exceed maximum.")
+        return self
+
+
 OptimizationConstraint = Annotated[
-    Union[AggregateConstraint, PlanningUnitConstraint],
+    Union[AggregateConstraint, PlanningUnitConstraint, LockConstraint],
     Field(discriminator="type"),
 ]
 
@@ -133,7 +168,8 @@ class OptimizationParameters(BaseModel):
         resolution: Output resolution in meters (must be > 0)
         resampling: How to resample input data ("mode", "min", "max")
         objectives: Normalized preferences determining solution quality
-        constraints: Aggregate requirements and planning-unit eligibility bounds
+        constraints: Aggregate requirements, planning-unit eligibility bounds,
+            and planning-unit locks
     """
 
     target_area: Sequence[BaseGeometry]
@@ -173,7 +209,11 @@ class OptimizationParameters(BaseModel):
             raise ValueError("Each layer may appear at most once in objectives.")
         referenced = {
             *(objective.layer for objective in self.objectives),
-            *(constraint.layer for constraint in self.constraints),
+            *(
+                constraint.layer
+                for constraint in self.constraints
+                if constraint.layer is not None
+            ),
         }
         missing = referenced - self.layer_contracts.keys()
         if missing:
@@ -381,20 +421,25 @@ def compile_prepared_model(
                 ],
             )
         )
+    structure_path = artifact_dir / "planning-structure.json"
+    planning_structure = (
+        load_neighbor_structure(
+            json.loads(structure_path.read_text(encoding="utf-8"))
+        )
+        if structure_path.exists()
+        else None
+    )
     compiled = compile_spatial_optimization(
         planning_units=None,
         planning_unit_count=planning_unit_count,
         constraints=features,
         neighbor_penalty=conditions.neighbor_penalty,
         neighbor_structure=(
-            load_neighbor_structure(
-                json.loads(
-                    (artifact_dir / "planning-structure.json").read_text(
-                        encoding="utf-8"
-                    )
-                )
-            )
-            if conditions.neighbor_penalty is not None
+            planning_structure if conditions.neighbor_penalty is not None else None
+        ),
+        fixed_values=(
+            planning_fixed_values(planning_structure)
+            if planning_structure is not None
             else None
         ),
         array_directory=compiled_dir,
@@ -468,6 +513,75 @@ def _resolve_analysis_geometry(
     return [unified_geometry]
 
 
+def resolve_planning_locks(conditions: OptimizationParameters) -> PlanningLocks:
+    """Resolve geometry locks in the authoritative planning-grid CRS."""
+    resolved: Dict[str, tuple[BaseGeometry, ...]] = {}
+    for state in ("in", "out"):
+        geometries = [
+            shape(constraint.geometry)
+            for constraint in conditions.constraints
+            if isinstance(constraint, LockConstraint)
+            and constraint.state == state
+            and constraint.geometry is not None
+        ]
+        resolved[state] = (
+            tuple(gpd.GeoSeries(geometries, crs="EPSG:4326").to_crs("EPSG:3005"))
+            if geometries
+            else ()
+        )
+    return PlanningLocks(lock_in=resolved["in"], lock_out=resolved["out"])
+
+
+def planning_unit_lock_states(
+    conditions: OptimizationParameters,
+    preparation_output_dir: str | Path,
+) -> np.ndarray:
+    """Rasterize geometry locks onto the planning units of a committed preparation.
+
+    Returns:
+        One -1/free, 0/locked-out, 1/locked-in state per planning unit.
+
+    Raises:
+        ValueError: If a lock is defined by a layer, whose mapped values only
+            exist while tiles are being prepared.
+    """
+    if any(
+        isinstance(constraint, LockConstraint) and constraint.layer is not None
+        for constraint in conditions.constraints
+    ):
+        raise ValueError("Layer locks require mapped values from tile preparation.")
+    root = Path(preparation_output_dir)
+    manifest = json.loads(
+        (root / "preparation-manifest.json").read_text(encoding="utf-8")
+    )
+    states = np.full(int(manifest["planning_unit_count"]), -1, dtype=np.int8)
+    locks = resolve_planning_locks(conditions)
+    if locks.empty:
+        return states
+    transform = Affine.from_gdal(*(float(value) for value in manifest["transform"]))
+    for segment in manifest["compilation_segments"]:
+        table = pq.read_table(
+            root / str(segment["planning_unit_path"]),
+            columns=["variable_index", "row", "col"],
+        )
+        if table.num_rows == 0:
+            continue
+        rows = table.column("row").to_numpy().astype(np.int64)
+        cols = table.column("col").to_numpy().astype(np.int64)
+        row_start, col_start = int(rows.min()), int(cols.min())
+        lock_in, lock_out = rasterize_lock_window(
+            locks,
+            transform,
+            row_start,
+            col_start,
+            (int(rows.max()) - row_start + 1, int(cols.max()) - col_start + 1),
+        )
+        states[table.column("variable_index").to_numpy()] = lock_states(
+            lock_in, lock_out
+        )[rows - row_start, cols - col_start]
+    return states
+
+
 def _open_native_layers(
     source_uri: str,
     conditions: OptimizationParameters,
@@ -576,6 +690,38 @@ def _planning_tile_validity(
     return mask
 
 
+def _planning_tile_locks(
+    tile: Any,
+    planning_grid: PlanningGrid,
+    locks: PlanningLocks,
+    mapped: Dict[str, xr.Dataset],
+    conditions: OptimizationParameters,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Combine geometry and layer locks into lock-in and lock-out tile masks."""
+    lock_in, lock_out = rasterize_lock_window(
+        locks,
+        planning_grid.transform,
+        tile.row_start,
+        tile.col_start,
+        tile.shape,
+    )
+    for constraint in conditions.constraints:
+        if not isinstance(constraint, LockConstraint) or constraint.layer is None:
+            continue
+        group_path, variable = constraint.layer.rsplit("/", 1)
+        values = np.asarray(mapped[group_path][variable].values, dtype=np.float64)
+        matched = np.isfinite(values)
+        if constraint.min is not None:
+            matched &= values >= constraint.min
+        if constraint.max is not None:
+            matched &= values <= constraint.max
+        if constraint.state == "in":
+            lock_in |= matched
+        else:
+            lock_out |= matched
+    return lock_in, lock_out
+
+
 def _eligibility_layers(
     conditions: OptimizationParameters,
 ) -> Dict[str, Dict[str, Any]]:
@@ -642,6 +788,16 @@ def _load_planning_grid_context(
     return grid, geometries, int(context["tile_size"])
 
 
+@lru_cache(maxsize=16)
+def _load_planning_locks(context_path: str) -> PlanningLocks:
+    """Load the projected lock polygons once per worker and grid context."""
+    context = json.loads(Path(context_path).read_text(encoding="utf-8"))
+    return PlanningLocks(
+        lock_in=tuple(shape(value) for value in context.get("lock_in", [])),
+        lock_out=tuple(shape(value) for value in context.get("lock_out", [])),
+    )
+
+
 @task
 def initialize_planning_grid(
     conditions: OptimizationParameters,
@@ -656,6 +812,7 @@ def initialize_planning_grid(
         conditions.grid_extent,
     )
     resolved_tile_size = tile_size or int(os.getenv("SPATIAL_TILE_SIZE", "1024"))
+    locks = resolve_planning_locks(conditions)
     return _write_compact_json(
         Path(output_path),
         {
@@ -670,6 +827,8 @@ def initialize_planning_grid(
             "global_col_offset": grid.global_col_offset,
             "tile_size": resolved_tile_size,
             "geometries": [mapping(geometry) for geometry in geometries],
+            "lock_in": [mapping(geometry) for geometry in locks.lock_in],
+            "lock_out": [mapping(geometry) for geometry in locks.lock_out],
         },
     )
 
@@ -835,6 +994,15 @@ def prepare_planning_tile(
         raise RuntimeError(
             f"Prepared tile {tile.tile_id} validity differs from its inventory."
         )
+    lock_in, lock_out = _planning_tile_locks(
+        tile,
+        planning_grid,
+        _load_planning_locks(grid_context_path),
+        mapped,
+        conditions,
+    )
+    fixed0 = lock_out & mask
+    fixed1 = lock_in & ~lock_out & mask
     offset = int(tile_record["variable_index_offset"])
     variable_indices = np.arange(offset, offset + expected_count, dtype=np.int64)
     stable_rows = rows.astype(np.int64) + planning_grid.global_row_offset
@@ -928,10 +1096,10 @@ def prepare_planning_tile(
             "tile_id": tile.tile_id,
             "variable_index_offset": offset,
             "planning_unit_count": expected_count,
-            "fixed0_mask": encode_packed_mask(np.zeros(mask.shape, dtype=bool)),
-            "fixed1_mask": encode_packed_mask(np.zeros(mask.shape, dtype=bool)),
-            "fixed0_count": 0,
-            "fixed1_count": 0,
+            "fixed0_mask": encode_packed_mask(fixed0),
+            "fixed1_mask": encode_packed_mask(fixed1),
+            "fixed0_count": int(np.count_nonzero(fixed0)),
+            "fixed1_count": int(np.count_nonzero(fixed1)),
             "feature_nonzero_counts": feature_counts,
             "objective_positive_sums": objective_positive_sums,
             "planning_unit_path": str(planning_path.relative_to(root)),
@@ -1001,7 +1169,11 @@ def finalize_spatial_preparation(
         )
         objective_normalization[objective.layer] = resolved.to_dict()
     neighbor_metadata: Dict[str, Any] = {}
-    if conditions.neighbor_penalty is not None:
+    locked = any(
+        int(value["fixed0_count"]) or int(value["fixed1_count"])
+        for value in metadata_by_id.values()
+    )
+    if conditions.neighbor_penalty is not None or locked:
         structure_tiles = []
         for inventory_tile in inventory["tiles"]:
             metadata = metadata_by_id[str(inventory_tile["tile_id"])]
@@ -1023,10 +1195,15 @@ def finalize_spatial_preparation(
             "width": planning_grid.width,
             "tile_size": tile_size,
             "planning_unit_count": planning_unit_count,
-            "raw_neighbor_edge_count": int(inventory["raw_neighbor_edge_count"]),
             "tiles": structure_tiles,
         }
+        planning_structure["raw_neighbor_edge_count"] = (
+            int(inventory["raw_neighbor_edge_count"])
+            if "raw_neighbor_edge_count" in inventory
+            else count_neighbor_edges(load_neighbor_structure(planning_structure))
+        )
         _write_compact_json(root / "planning-structure.json", planning_structure)
+    if conditions.neighbor_penalty is not None:
         structure_counts = measure_neighbor_structure(
             load_neighbor_structure(planning_structure)
         )
@@ -1123,6 +1300,30 @@ def finalize_spatial_preparation(
 
 
 
+def problem_definition(conditions: OptimizationParameters) -> Dict[str, Any]:
+    """Return the JSON-compatible parameters that define one compiled model."""
+    return {
+        "target_area": [mapping(value) for value in conditions.target_area],
+        "objectives": [
+            value.model_dump(mode="json") for value in conditions.objectives
+        ],
+        "constraints": [
+            value.model_dump(mode="json") for value in conditions.constraints
+        ],
+        "neighbor_penalty": (
+            asdict(conditions.neighbor_penalty)
+            if conditions.neighbor_penalty is not None
+            else None
+        ),
+        "resolution": conditions.resolution,
+        "resampling": conditions.resampling,
+        "decision_domain": conditions.decision_domain,
+        "preserve_primary_domain": conditions.preserve_primary_domain,
+        "allocation_target_row": conditions.allocation_target_row,
+        "layer_contracts": conditions.layer_contracts,
+    }
+
+
 @task
 def compile_prepared_artifact(
     conditions: OptimizationParameters,
@@ -1135,7 +1336,7 @@ def compile_prepared_artifact(
         sparse_artifact_dir=preparation_output_dir,
     )
     reconstruction = compiled.reconstruction
-    model = compiled.model
+    model, scaling = condition_model(compiled.model)
     reduction_manifest = reconstruction.reduction.to_dict()
     _write_compact_json(
         Path(preparation_output_dir) / "reduction-manifest.json",
@@ -1153,28 +1354,7 @@ def compile_prepared_artifact(
         problem_definition_hash
         or hashlib.sha256(
             json.dumps(
-                {
-                    "target_area": [mapping(value) for value in conditions.target_area],
-                    "objectives": [
-                        value.model_dump(mode="json")
-                        for value in conditions.objectives
-                    ],
-                    "constraints": [
-                        value.model_dump(mode="json")
-                        for value in conditions.constraints
-                    ],
-                    "neighbor_penalty": (
-                        asdict(conditions.neighbor_penalty)
-                        if conditions.neighbor_penalty is not None
-                        else None
-                    ),
-                    "resolution": conditions.resolution,
-                    "resampling": conditions.resampling,
-                    "decision_domain": conditions.decision_domain,
-                    "preserve_primary_domain": conditions.preserve_primary_domain,
-                    "allocation_target_row": conditions.allocation_target_row,
-                    "layer_contracts": conditions.layer_contracts,
-                },
+                problem_definition(conditions),
                 sort_keys=True,
                 separators=(",", ":"),
             ).encode("utf-8")
@@ -1203,6 +1383,19 @@ def compile_prepared_artifact(
                 "canonical_values_array": values_name,
             }
         )
+    neighbor_reconstruction = None
+    if reconstruction.neighbor is not None:
+        # Post-solve reconstruction reads neighbor terms from these instead
+        # of regenerating edges from the planning structure.
+        additional_arrays["neighbor_fixed_in_counts"] = (
+            reconstruction.neighbor.fixed_in_neighbor_counts
+        )
+        neighbor_reconstruction = {
+            "fixed_in_counts_array": "neighbor_fixed_in_counts",
+            "constant_selected_edges": (
+                reconstruction.neighbor.constant_selected_neighbor_edge_count
+            ),
+        }
     write_compiled_artifact(
         model,
         Path(preparation_output_dir) / "compiled-model",
@@ -1222,8 +1415,17 @@ def compile_prepared_artifact(
             "neighbor_penalty": preparation_manifest.get(
                 "neighbor_normalization"
             ),
+            "neighbor_reconstruction": neighbor_reconstruction,
+            "aggregate_rows": list(reconstruction.aggregate_rows),
+            "planning_unit_locks": {
+                "application": "preparation",
+                "fixed_in": int(preparation_manifest["fixed1_count"]),
+                "fixed_out": int(preparation_manifest["fixed0_count"]),
+            },
+            "numerical_scaling": scaling.to_dict(),
         },
         additional_arrays=additional_arrays,
+        encoding=os.getenv("COMPILED_ARTIFACT_ENCODING", "raw"),
     )
     _discard_intermediate_sparse_vectors(
         {
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import resource
 import sys
+from pathlib import Path
 
 import psutil
 
@@ -17,3 +18,27 @@ def process_memory_sample() -> dict[str, int]:
         "current_rss_bytes": int(psutil.Process().memory_info().rss),
         "peak_rss_bytes": peak,
     }
+
+
+CGROUP_MEMORY_LIMIT_PATHS = (
+    Path("/sys/fs/cgroup/memory.max"),
+    Path("/sys/fs/cgroup/memory/memory.limit_in_bytes"),
+)
+
+
+def memory_limit_bytes() -> int:
+    """Return the cgroup memory limit, or physical memory when unconstrained.
+
+    cgroup v2 reports ``max`` and v1 a page-rounded huge value when no limit
+    applies; either way the kernel then kills at physical memory instead.
+    """
+    physical = int(psutil.virtual_memory().total)
+    for path in CGROUP_MEMORY_LIMIT_PATHS:
+        try:
+            value = path.read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < physical:
+            return int(value)
+        return physical
+    return physical
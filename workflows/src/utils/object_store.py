@@ -7,6 +7,7 @@ from typing import Any, Dict, Optional, Tuple
 import boto3
 import fsspec
 from botocore.config import Config
+from botocore.exceptions import ClientError
 
 
 @dataclass(frozen=True)
@@ -322,6 +323,27 @@ def head_object(
     return client.head_object(Bucket=bucket, Key=key)
 
 
+def object_exists(
+    *,
+    bucket: str,
+    key: str,
+) -> bool:
+    """
+    Return whether an object exists, treating only not-found responses as absent.
+    """
+    try:
+        head_object(bucket=bucket, key=key)
+    except ClientError as error:
+        if error.response.get("Error", {}).get("Code") in {
+            "404",
+            "NoSuchKey",
+            "NotFound",
+        }:
+            return False
+        raise
+    return True
+
+
 def download_object(
     *,
     bucket: str,
@@ -335,3 +357,40 @@ def download_object(
     client = get_object_store_client(config)
     client.download_file(bucket, key, local_path)
     return local_path
+
+
+def list_objects(
+    *,
+    bucket: str,
+    prefix: str,
+) -> list[Dict[str, Any]]:
+    """
+    List every object under a key prefix with its size and modification time.
+    """
+    config = get_object_store_config()
+    client = get_object_store_client(config)
+    paginator = client.get_paginator("list_objects_v2")
+    objects: list[Dict[str, Any]] = []
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        objects.extend(page.get("Contents", []))
+    return objects
+
+
+def delete_objects(
+    *,
+    bucket: str,
+    keys: list[str],
+) -> None:
+    """
+    Delete objects in batches of the S3 per-request limit.
+    """
+    config = get_object_store_config()
+    client = get_object_store_client(config)
+    for start in range(0, len(keys), 1000):
+        client.delete_objects(
+            Bucket=bucket,
+            Delete={
+                "Objects": [{"Key": key} for key in keys[start : start + 1000]],
+                "Quiet": True,
+            },
+        )
@@ -0,0 +1,40 @@
+import numpy as np
+
+from src.optimization.compiler import (
+    CompilationOutput,
+    SparseConstraintSpecification,
+    compile_spatial_optimization,
+)
+
+
+def knapsack_compilation(
+    benefit,
+    cost,
+    budget: float,
+    *,
+    additional_constraints=(),
+    **arguments,
+) -> CompilationOutput:
+    """Compile a gridless knapsack: select cells by ``benefit`` under a cost cap.
+
+    ``additional_constraints`` follow the ``cost`` row; any other keyword is
+    passed through to :func:`compile_spatial_optimization`.
+    """
+    indices = np.arange(len(benefit), dtype=np.int32)
+    return compile_spatial_optimization(
+        planning_units=None,
+        planning_unit_count=len(benefit),
+        fused_objective=np.asarray(benefit, dtype=np.float64),
+        constraints=[
+            SparseConstraintSpecification(
+                "cost", indices, np.asarray(cost, dtype=np.float64), [(None, budget)]
+            ),
+            *additional_constraints,
+        ],
+        **arguments,
+    )
+
+
+def knapsack_model(benefit, cost, budget: float, **arguments):
+    """Return only the compiled model of :func:`knapsack_compilation`."""
+    return knapsack_compilation(benefit, cost, budget, **arguments).model
@@ -0,0 +1,149 @@
+import hashlib
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import numpy as np
+
+from src.optimization import artifact as artifact_module
+from src.optimization.artifact import (
+    clear_verification_cache,
+    load_compiled_artifact,
+    mathematical_model_hash,
+    merkle_root,
+    write_compiled_artifact,
+)
+from tests.helpers import knapsack_model
+
+BENEFIT = np.linspace(0.5, 4.0, 64)
+BUDGET = 20.0
+
+
+class ArtifactVerificationTest(unittest.TestCase):
+    """Verify chunked artifact digests and the local verification cache."""
+
+    def test_chunks_are_verified_once_per_file_identity(self) -> None:
+        with (
+            TemporaryDirectory() as directory,
+            patch.object(artifact_module, "HASH_CHUNK_BYTES", 256),
+        ):
+            manifest = write_compiled_artifact(
+                knapsack_model(BENEFIT, BENEFIT, BUDGET),
+                directory,
+                problem_definition_hash="chunks",
+                candidate_planning_unit_ids=np.arange(len(BENEFIT)),
+            )
+            objective = manifest.arrays["objective"]
+            self.assertGreater(len(objective.chunk_digests), 2)
+            self.assertEqual(merkle_root(objective.chunk_digests), objective.checksum)
+            with patch.object(
+                artifact_module,
+                "_chunk_digest",
+                wraps=artifact_module._chunk_digest,
+            ) as digest:
+                load_compiled_artifact(directory)
+                self.assertEqual(0, digest.call_count)
+                clear_verification_cache()
+                load_compiled_artifact(directory, thread_count=3)
+                self.assertEqual(
+                    sum(
+                        len(descriptor.chunk_digests)
+                        for descriptor in manifest.arrays.values()
+                    ),
+                    digest.call_count,
+                )
+
+            path = Path(directory) / objective.path
+            content = bytearray(path.read_bytes())
+            content[-1] ^= 1
+            path.write_bytes(bytes(content))
+            with self.assertRaisesRegex(ValueError, "checksum mismatch: objective"):
+                load_compiled_artifact(directory)
+
+    def test_compressed_arrays_decode_into_identical_memory_maps(self) -> None:
+        model = knapsack_model(BENEFIT, BENEFIT, BUDGET)
+        with TemporaryDirectory() as directory:
+            raw, compressed, corrupt = (
+                Path(directory) / name for name in ("raw", "zstd", "corrupt")
+            )
+            for target, encoding in (
+                (raw, "raw"),
+                (compressed, "zstd"),
+                (corrupt, "zstd"),
+            ):
+                write_compiled_artifact(
+                    model,
+                    target,
+                    problem_definition_hash="encoding",
+                    candidate_planning_unit_ids=np.arange(len(BENEFIT)),
+                    encoding=encoding,
+                )
+            self.assertEqual([], sorted(compressed.glob("*.npy")))
+            indices = load_compiled_artifact(
+                compressed, keep_encoded=True
+            ).manifest.arrays["matrix_indices"]
+            self.assertTrue((compressed / indices.encoding.path).exists())
+            self.assertLess(indices.encoding.byte_size, indices.byte_size // 4)
+            clear_verification_cache()
+            expected = load_compiled_artifact(raw)
+            decoded = load_compiled_artifact(compressed)
+            self.assertEqual(
+                expected.manifest.mathematical_model_hash,
+                decoded.manifest.mathematical_model_hash,
+            )
+            for name, values in expected.arrays.items():
+                np.testing.assert_array_equal(values, decoded.arrays[name])
+                self.assertEqual(
+                    expected.manifest.arrays[name].checksum,
+                    decoded.manifest.arrays[name].checksum,
+                )
+
+            self.assertEqual([], sorted(compressed.glob("*.zst")))
+            clear_verification_cache()
+            reloaded = load_compiled_artifact(compressed)
+            np.testing.assert_array_equal(
+                expected.arrays["matrix_indices"], reloaded.arrays["matrix_indices"]
+            )
+
+            encoded = corrupt / indices.encoding.path
+            content = bytearray(encoded.read_bytes())
+            content[len(content) // 2] ^= 1
+            encoded.write_bytes(bytes(content))
+            with self.assertRaisesRegex(ValueError, "matrix_indices"):
+                load_compiled_artifact(corrupt)
+            self.assertEqual([], sorted(corrupt.glob(".*.partial")))
+            self.assertTrue(encoded.exists())
+
+    def test_model_hash_streams_narrow_indices_as_normalized_bytes(self) -> None:
+        model = knapsack_model(BENEFIT, BENEFIT, BUDGET)
+        self.assertEqual(np.int32, np.asarray(model.column_indices).dtype)
+        digest = hashlib.sha256()
+        digest.update(b"compiled-mathematical-model-v1\0")
+        digest.update(b"maximize\0" if model.maximize else b"minimize\0")
+        digest.update(np.asarray([model.objective_offset], dtype="<f8").tobytes())
+        for name, array, dtype in (
+            ("objective", model.objective, "<f8"),
+            ("variable_lower", model.variable_lower, "<f8"),
+            ("variable_upper", model.variable_upper, "<f8"),
+            ("integrality", model.integrality, "u1"),
+            ("row_lower", model.row_lower, "<f8"),
+            ("row_upper", model.row_upper, "<f8"),
+            ("matrix_starts", model.row_starts, "<i8"),
+            ("matrix_indices", model.column_indices, "<i8"),
+            ("matrix_values", model.coefficients, "<f8"),
+            ("candidate_ids", np.arange(len(BENEFIT)), "<u8"),
+        ):
+            values = np.asarray(array)
+            digest.update(name.encode("utf-8") + b"\0")
+            digest.update(np.asarray(values.shape, dtype="<i8").tobytes())
+            digest.update(np.asarray(values, dtype=dtype).tobytes())
+        with patch.object(artifact_module, "COPY_CHUNK_ELEMENTS", 7):
+            self.assertEqual(
+                digest.hexdigest(),
+                mathematical_model_hash(model, np.arange(len(BENEFIT))),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
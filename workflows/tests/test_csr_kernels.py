@@ -0,0 +1,97 @@
+import unittest
+
+import numpy as np
+from scipy import sparse
+
+from src.optimization.csr_kernels import (
+    evaluate_columns,
+    row_partitions,
+    threaded_row_activities,
+)
+from src.optimization.model import CompiledOptimizationModel
+
+
+def _random_model(seed: int) -> tuple[CompiledOptimizationModel, sparse.csr_matrix]:
+    generator = np.random.default_rng(seed)
+    columns = 4_000
+    lengths = generator.integers(0, 60, size=12_000)
+    lengths[::7] = 0
+    lengths[5] = 700_000 // 2
+    matrix = sparse.csr_matrix(
+        (
+            generator.normal(size=int(lengths.sum())),
+            generator.integers(0, columns, size=int(lengths.sum())),
+            np.concatenate(([0], np.cumsum(lengths))),
+        ),
+        shape=(len(lengths), columns),
+    )
+    model = CompiledOptimizationModel(
+        objective=generator.normal(size=columns),
+        variable_lower=np.zeros(columns),
+        variable_upper=np.ones(columns),
+        integrality=np.ones(columns, dtype=np.uint8),
+        row_starts=matrix.indptr.astype(np.int64),
+        column_indices=matrix.indices.astype(np.int32),
+        coefficients=matrix.data,
+        row_lower=np.full(len(lengths), -5.0),
+        row_upper=np.full(len(lengths), 5.0),
+        row_names=["constraint"] * len(lengths),
+        primary_variable_count=columns,
+        objective_offset=1.5,
+    )
+    return model, matrix
+
+
+class CsrKernelTest(unittest.TestCase):
+    """Verify threaded CSR kernels against a reference sparse product."""
+
+    def test_threaded_activities_match_sparse_product_across_partitions(
+        self,
+    ) -> None:
+        model, matrix = _random_model(3)
+        columns = np.random.default_rng(4).uniform(size=model.variable_count)
+        boundaries = row_partitions(model.row_starts, 4)
+        self.assertGreater(len(boundaries), 2)
+        self.assertEqual([0, model.constraint_count], [boundaries[0], boundaries[-1]])
+        expected = matrix @ columns
+        for thread_count, batch in ((1, 1_048_576), (4, 1_000), (4, 65_536)):
+            np.testing.assert_allclose(
+                expected,
+                threaded_row_activities(
+                    model,
+                    columns,
+                    thread_count=thread_count,
+                    nonzero_batch_size=batch,
+                ),
+                rtol=1e-12,
+                atol=1e-9,
+            )
+
+    def test_fused_evaluation_measures_violations_and_objective(self) -> None:
+        model, matrix = _random_model(5)
+        columns = np.random.default_rng(6).integers(0, 2, model.variable_count)
+        columns = columns.astype(np.float64)
+        columns[7] = 1.25
+        activities = matrix @ columns
+        exponents = np.zeros(model.constraint_count, dtype=np.int64)
+        exponents[1] = 3
+        evaluation = evaluate_columns(
+            model, columns, row_exponents=exponents, thread_count=4
+        )
+        unscaled = np.ldexp(activities, -exponents)
+        expected_row = max(
+            float(np.max(np.ldexp(-5.0, -exponents) - unscaled, initial=0.0)),
+            float(np.max(unscaled - np.ldexp(5.0, -exponents), initial=0.0)),
+        )
+        self.assertAlmostEqual(expected_row, evaluation.maximum_row_violation)
+        self.assertAlmostEqual(0.25, evaluation.maximum_bound_violation)
+        self.assertAlmostEqual(0.25, evaluation.maximum_integrality_violation)
+        self.assertAlmostEqual(
+            float(model.objective @ columns) + 1.5, evaluation.objective_value
+        )
+        self.assertFalse(evaluation.is_feasible(1e-6))
+        np.testing.assert_allclose(activities, evaluation.activities, atol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from src.optimization.artifact import load_compiled_artifact, write_compiled_artifact
+from src.optimization.compiler import (
+    SparseConstraintSpecification,
+    compile_spatial_optimization,
+)
+from src.optimization.conditioning import NumericalScaling, condition_model
+from src.optimization.delta import (
+    resolve_model_delta,
+    structural_definition_hash,
+    write_derived_artifact,
+)
+from src.optimization.highs import solve_with_highs
+from src.optimization.model import CanonicalObjectiveValues
+from src.optimization.objective import resolve_objective_normalization
+
+BENEFIT = np.asarray([3.0, 1.0, 2.5, 0.5, 4.0, 2.0, 1.5, 0.1])
+THREAT = np.asarray([1.0, 0.5, 1.0, 0.2, 2.0, 0.1, 0.4, 10.0])
+COST = np.asarray([2.0, 1.0, 3.0, 1.0, 4.0, 2.0, 1.0, 1.0])
+HABITAT = np.asarray([0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0])
+LAYERS = (("benefit", "maximize", BENEFIT), ("threat", "minimize", THREAT))
+
+
+def _compile(importance: dict[str, float], cost: float, habitat: float, area: float):
+    """Compile the fixture like the production compiler, without conditioning."""
+    count = len(BENEFIT)
+    indices = np.arange(count, dtype=np.int32)
+    normalizations = [
+        resolve_objective_normalization(
+            layer=layer,
+            direction=direction,
+            importance=importance[layer],
+            attainable_scale=float(np.sum(values)),
+            selection_count=count,
+        )
+        for layer, direction, values in LAYERS
+    ]
+    compilation = compile_spatial_optimization(
+        planning_units=None,
+        planning_unit_count=count,
+        fused_objective=sum(
+            normalization.resolved_coefficient * values
+            for normalization, (_, _, values) in zip(
+                normalizations, LAYERS, strict=True
+            )
+        ),
+        canonical_objectives=[
+            CanonicalObjectiveValues(layer, indices, values)
+            for layer, _, values in LAYERS
+        ],
+        constraints=[
+            SparseConstraintSpecification("cost", indices, COST, [(None, cost)]),
+            SparseConstraintSpecification(
+                "habitat", indices, HABITAT, [(habitat, None)]
+            ),
+            SparseConstraintSpecification(
+                "area", indices, np.ones(count), [(None, area)]
+            ),
+        ],
+    )
+    return compilation, normalizations
+
+
+def _base_artifact(directory: Path):
+    compilation, normalizations = _compile(
+        {"benefit": 1.0, "threat": 1.0}, cost=6.0, habitat=2.0, area=8.0
+    )
+    reconstruction = compilation.reconstruction
+    model, scaling = condition_model(compilation.model)
+    candidates = np.flatnonzero(reconstruction.planning_unit_solver_columns >= 0)
+    fixed = np.flatnonzero(reconstruction.planning_unit_fixed_values >= 0)
+    additional_arrays = {}
+    objectives = []
+    for ordinal, normalization in enumerate(normalizations):
+        canonical = reconstruction.canonical_objectives[ordinal]
+        additional_arrays[f"canonical_objective_{ordinal}_indices"] = canonical.indices
+        additional_arrays[f"canonical_objective_{ordinal}_values"] = canonical.values
+        objectives.append(
+            {
+                **normalization.to_dict(),
+                "canonical_indices_array": f"canonical_objective_{ordinal}_indices",
+                "canonical_values_array": f"canonical_objective_{ordinal}_values",
+            }
+        )
+    write_compiled_artifact(
+        model,
+        directory,
+        problem_definition_hash="base",
+        candidate_planning_unit_ids=candidates + 100,
+        candidate_source_indices=candidates,
+        fixed_planning_unit_ids=fixed + 100,
+        fixed_source_indices=fixed,
+        fixed_values=reconstruction.planning_unit_fixed_values[fixed],
+        provenance={
+            "objectives": objectives,
+            "neighbor_penalty": None,
+            "aggregate_rows": list(reconstruction.aggregate_rows),
+            "numerical_scaling": scaling.to_dict(),
+        },
+        additional_arrays=additional_arrays,
+    )
+    return load_compiled_artifact(directory)
+
+
+class DeltaRecompilationTest(unittest.TestCase):
+    """Verify weight and bound edits reuse a compiled CSR structure exactly."""
+
+    def test_delta_matches_a_full_recompile_of_the_changed_parameters(self) -> None:
+        definition = {
+            "objectives": [{"layer": "benefit", "importance": 1.0}],
+            "constraints": [{"type": "aggregate", "layer": "cost", "max": 6.0}],
+            "neighbor_penalty": {"strength": 1.0, "method": "selected_rook_pairs"},
+        }
+        changed = {
+            "objectives": [{"layer": "benefit", "importance": 2.0}],
+            "constraints": [{"type": "aggregate", "layer": "cost", "max": 4.0}],
+            "neighbor_penalty": {"strength": 3.0, "method": "selected_rook_pairs"},
+        }
+        self.assertEqual(
+            structural_definition_hash(definition), structural_definition_hash(changed)
+        )
+        changed["constraints"][0]["min"] = 1.0
+        self.assertNotEqual(
+            structural_definition_hash(definition), structural_definition_hash(changed)
+        )
+
+        with TemporaryDirectory() as directory:
+            base = _base_artifact(Path(directory) / "base")
+            self.assertEqual(1, base.manifest.fixed_out_count)
+            delta = resolve_model_delta(
+                base,
+                objective_importance={"benefit": 2.0, "threat": 0.5},
+                neighbor_strength=None,
+                aggregate_bounds={
+                    "cost": [(None, 4.0)],
+                    "habitat": [(1.0, None)],
+                    "area": [(None, 8.0)],
+                },
+            )
+            self.assertEqual(2, len(delta.scenario.row_bounds))
+            write_derived_artifact(
+                base, delta, Path(directory) / "derived", problem_definition_hash="new"
+            )
+            derived = load_compiled_artifact(Path(directory) / "derived")
+            expected = _compile(
+                {"benefit": 2.0, "threat": 0.5}, cost=4.0, habitat=1.0, area=8.0
+            )[0].model
+
+            provenance = derived.manifest.provenance
+            self.assertEqual(
+                base.manifest.mathematical_model_hash,
+                provenance["derived_from"]["mathematical_model_hash"],
+            )
+            self.assertNotEqual(
+                base.manifest.mathematical_model_hash,
+                derived.manifest.mathematical_model_hash,
+            )
+            self.assertEqual(
+                base.manifest.arrays["matrix_values"].checksum,
+                derived.manifest.arrays["matrix_values"].checksum,
+            )
+            scaling = NumericalScaling.from_provenance(provenance)
+            np.testing.assert_allclose(
+                expected.objective,
+                np.ldexp(derived.model.objective, -scaling.objective_exponent),
+                rtol=1e-12,
+            )
+            np.testing.assert_array_equal(
+                expected.row_upper, scaling.unscale_rows(derived.model.row_upper)
+            )
+            np.testing.assert_array_equal(
+                expected.row_lower, scaling.unscale_rows(derived.model.row_lower)
+            )
+            self.assertAlmostEqual(
+                solve_with_highs(expected).objective_value,
+                scaling.unscale_objective(
+                    solve_with_highs(derived.model).objective_value
+                ),
+                places=9,
+            )
+
+    def test_delta_rejects_changes_outside_the_base_structure(self) -> None:
+        with TemporaryDirectory() as directory:
+            base = _base_artifact(Path(directory))
+            bounds = {
+                "cost": [(None, 6.0)],
+                "habitat": [(2.0, None)],
+                "area": [(None, 8.0)],
+            }
+            with self.assertRaisesRegex(ValueError, "dropped: area_maximum"):
+                resolve_model_delta(
+                    base,
+                    objective_importance={"benefit": 1.0, "threat": 1.0},
+                    neighbor_strength=None,
+                    aggregate_bounds={**bounds, "area": [(None, 3.0)]},
+                )
+            with self.assertRaisesRegex(ValueError, "removed by domain presolve"):
+                resolve_model_delta(
+                    base,
+                    objective_importance={"benefit": 100.0, "threat": 1.0},
+                    neighbor_strength=None,
+                    aggregate_bounds=bounds,
+                )
+            with self.assertRaisesRegex(ValueError, "bound sides differ"):
+                resolve_model_delta(
+                    base,
+                    objective_importance={"benefit": 1.0, "threat": 1.0},
+                    neighbor_strength=None,
+                    aggregate_bounds={**bounds, "cost": [(1.0, 6.0)]},
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
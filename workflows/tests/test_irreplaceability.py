@@ -1,11 +1,21 @@
+import json
+import os
 import unittest
+from contextlib import nullcontext
+from dataclasses import replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import numpy as np
 
+from src.flows.irreplaceability import irreplaceability
+from src.optimization.artifact import write_compiled_artifact
 from src.optimization.compiler import (
     SparseConstraintSpecification,
     compile_spatial_optimization,
 )
+from src.optimization.conditioning import condition_model
 from src.optimization.highs import solve_with_highs
 from src.optimization.irreplaceability import analyze_irreplaceability
 from src.optimization.model import SolveConfiguration
@@ -152,6 +162,59 @@ class IrreplaceabilityTest(unittest.TestCase):
         self.assertEqual("absolutely_irreplaceable", essential.replacement_status)
         self.assertIsNone(essential.replacement_cost_absolute)
 
+    def test_conditioned_artifact_reports_original_units(self) -> None:
+        values = np.asarray([3e-9, 2e-9, 1e-9])
+        compilation = compile_spatial_optimization(
+            planning_units=None,
+            planning_unit_count=3,
+            constraints=[
+                SparseConstraintSpecification(
+                    "selected_units",
+                    np.arange(3, dtype=np.int32),
+                    np.ones(3, dtype=np.float64),
+                    [(None, 1.0)],
+                ),
+            ],
+            fused_objective=values,
+        )
+        model, scaling = condition_model(compilation.model)
+        self.assertGreater(scaling.objective_exponent, 20)
+        configuration = SolveConfiguration(mode="exact_audit")
+        solved = solve_with_highs(model, configuration=configuration)
+        # Persisted reference results are reconstructed into original units.
+        reference = replace(
+            solved,
+            objective_value=scaling.unscale_objective(solved.objective_value),
+            best_bound=scaling.unscale_objective(solved.best_bound),
+        )
+        with TemporaryDirectory() as directory:
+            write_compiled_artifact(
+                model,
+                Path(directory) / "artifact",
+                problem_definition_hash="conditioned",
+                candidate_planning_unit_ids=np.asarray([10, 11, 12]),
+                provenance={"numerical_scaling": scaling.to_dict()},
+            )
+            with (
+                patch.dict(os.environ),
+                patch("src.flows.irreplaceability.acquire_task_run_slot", nullcontext),
+            ):
+                os.environ.pop("SOLVER_SERVICE_SOCKET", None)
+                output = irreplaceability.fn(
+                    str(Path(directory) / "artifact"),
+                    reference,
+                    str(Path(directory) / "irreplaceability.json"),
+                    solve_configuration=configuration,
+                )
+            result = json.loads(Path(output).read_text(encoding="utf-8"))
+        excluded = result["planning_units"][0]
+        self.assertEqual(10, excluded["planning_unit_id"])
+        self.assertTrue(excluded["counterfactual_solved"])
+        self.assertAlmostEqual(2e-9, excluded["counterfactual_objective"], delta=1e-21)
+        self.assertAlmostEqual(2e-9, excluded["best_bound"], delta=1e-21)
+        self.assertAlmostEqual(1e-9, excluded["replacement_cost_absolute"], delta=1e-21)
+        self.assertAlmostEqual(1.0 / 3.0, excluded["replacement_cost_relative"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+
+from src.optimization import model_cache
+from src.optimization.model_cache import (
+    ModelCacheEntry,
+    ModelCacheEvictionPolicy,
+    model_cache_key,
+    source_content_root,
+)
+
+DEFINITION = {"objectives": [{"layer": "benefit", "importance": 1.0}]}
+
+
+def _arguments(**overrides):
+    return {
+        "content_root": "root-a",
+        "grid_extent": [0, 0, 10, 10],
+        "planning_unit_definition": {"resolution": 30},
+        **overrides,
+    }
+
+
+def _key(**overrides):
+    return model_cache_key(DEFINITION, **_arguments(**overrides))
+
+
+class ModelCacheTest(unittest.TestCase):
+    """Verify cache addressing and the age and size eviction policy."""
+
+    def test_key_addresses_problem_and_source_content(self) -> None:
+        self.assertEqual(_key(), model_cache_key(dict(DEFINITION), **_arguments()))
+        self.assertNotEqual(_key(), _key(content_root="root-b"))
+        current = _key()
+        with patch.object(model_cache, "COMPILER_VERSION", -1):
+            self.assertNotEqual(current, _key())
+        self.assertNotEqual(
+            _key(),
+            model_cache_key(
+                {"objectives": [{"layer": "benefit", "importance": 2.0}]},
+                **_arguments(),
+            ),
+        )
+        self.assertEqual(
+            "root-a", source_content_root({"uri": "s3://a", "checksum": "root-a"})
+        )
+        self.assertIsNone(source_content_root({"uri": "s3://a", "checksum": None}))
+
+    def test_eviction_drops_expired_then_least_recently_used(self) -> None:
+        entries = [
+            ModelCacheEntry("old", 10, created_at=0.0, last_used_at=950.0),
+            ModelCacheEntry("recent", 40, created_at=800.0, last_used_at=990.0),
+            ModelCacheEntry("idle", 40, created_at=900.0, last_used_at=900.0),
+            ModelCacheEntry("small", 5, created_at=850.0, last_used_at=850.0),
+        ]
+        policy = ModelCacheEvictionPolicy(max_age_seconds=500.0, max_bytes=60)
+        self.assertTrue(policy.is_expired(entries[0], 1_000.0))
+        self.assertEqual(
+            ["old", "idle", "small"], policy.select_evictions(entries, 1_000.0)
+        )
+        self.assertEqual(
+            ["old"],
+            ModelCacheEvictionPolicy(max_age_seconds=500.0).select_evictions(
+                entries, 1_000.0
+            ),
+        )
+        with self.assertRaisesRegex(ValueError, "byte capacity"):
+            ModelCacheEvictionPolicy(max_age_seconds=1.0, max_bytes=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
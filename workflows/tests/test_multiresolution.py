@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from src.optimization.grid import coarser_resolution, grid_cell_ids, parent_cell_ids
+from src.optimization.highs import warm_start_is_feasible
+from src.optimization.multiresolution import (
+    build_projected_warm_start,
+    project_coarse_decisions,
+)
+from tests.helpers import knapsack_model
+
+
+class MultiresolutionTest(unittest.TestCase):
+    """Verify coarse decisions project onto nested fine planning units."""
+
+    def test_coarser_resolution_steps_through_the_nested_family(self) -> None:
+        self.assertEqual(120, coarser_resolution(30, 2))
+        self.assertEqual(1920, coarser_resolution(960, 3))
+        self.assertEqual(30, coarser_resolution(30, 0))
+        with self.assertRaisesRegex(ValueError, "negative"):
+            coarser_resolution(30, -1)
+
+    def test_fine_cells_inherit_their_parent_decision(self) -> None:
+        rows, cols = np.divmod(np.arange(16), 4)
+        fine_ids = grid_cell_ids(rows, cols, 4)
+        np.testing.assert_array_equal(
+            [0, 0, 1, 1, 0, 0, 1, 1, 2, 2, 3, 3, 2, 2, 3, 3],
+            parent_cell_ids(fine_ids, 4, 2, 2),
+        )
+        projected = project_coarse_decisions(
+            fine_ids,
+            grid_width=4,
+            coarse_cell_ids=np.asarray([3, 0], dtype=np.uint64),
+            coarse_decisions=np.asarray([1.0, 0.0]),
+            coarse_grid_width=2,
+            factor=2,
+        )
+        np.testing.assert_array_equal(
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1], projected
+        )
+
+    def test_projected_warm_start_is_repaired_to_feasibility(self) -> None:
+        model = knapsack_model(np.asarray([0.9, 0.8, 0.7, 0.1]), np.ones(4), 2.0)
+
+        within_cap = build_projected_warm_start(model, np.asarray([1, 0, 1, 0]))
+        np.testing.assert_array_equal([1, 0, 1, 0], within_cap)
+        repaired = build_projected_warm_start(model, np.ones(4))
+        self.assertIsNotNone(repaired)
+        self.assertTrue(warm_start_is_feasible(model, repaired))
+        self.assertEqual(2.0, float(np.sum(repaired)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,12 @@
 import json
+import time
 import unittest
+from dataclasses import replace
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from threading import Event
 from types import SimpleNamespace
+from unittest.mock import patch
 
 import numpy as np
 from pydantic import ValidationError
@@ -11,20 +15,39 @@ from src.optimization.compiler import (
     SparseConstraintSpecification,
     compile_spatial_optimization,
 )
+from src.optimization import highs
 from src.optimization.artifact import load_compiled_artifact, write_compiled_artifact
+from src.optimization.backends import solve_with_backend
+from src.optimization.conditioning import NumericalScaling, condition_model
+from src.optimization.cpsat import cp_model
 from src.optimization.highs import (
     HighsModelSession,
+    _GapPlateau,
+    _SolveProgress,
     build_objective_warm_start,
+    require_acceptable_result,
     solve_with_highs,
+    warm_start_is_feasible,
 )
+from src.optimization.local_search import build_local_search_warm_start
 from src.optimization.model import SolveConfiguration
+from src.optimization.multiresolution import build_projected_warm_start
+from src.optimization.neighbor import (
+    NeighborPenaltySpecification,
+    encode_packed_mask,
+    load_neighbor_structure,
+)
+from src.optimization.numerical import csr_row_activities
+from src.optimization.prior_runs import map_prior_decisions, prior_solution_arrays
 from src.optimization.priority_ranking import solve_priority_ranking
+from src.optimization.validation import reconstruct_and_validate
 from src.utils.cpu import available_cpu_count
 from src.optimization.objective import (
     resolve_objective_normalization,
     top_k_attainable_scale,
 )
 from src.tasks.spatial_compilation import OptimizationParameters
+from tests.helpers import knapsack_model
 
 
 class _TimeLimitedSolverWithoutIncumbent:
@@ -65,6 +88,25 @@ class _TimeLimitedSolverWithoutIncumbent:
         return
 
 
+class _SolverRunningUntilCancelled(_TimeLimitedSolverWithoutIncumbent):
+    """Solver double that runs until the session cancels it."""
+
+    def __init__(self) -> None:
+        self._cancelled = Event()
+
+    def run(self) -> None:
+        """Block as though branch and bound kept growing its tree."""
+        self._cancelled.wait(10.0)
+
+    def cancelSolve(self) -> None:
+        """Stop the simulated search."""
+        self._cancelled.set()
+
+    def modelStatusToString(self, _status) -> str:
+        """Describe the simulated native termination."""
+        return "Interrupted by user"
+
+
 class OptimizationProblemTest(unittest.TestCase):
     """Verify the small mathematical submission and compiler contracts."""
 
@@ -159,6 +201,58 @@ class OptimizationProblemTest(unittest.TestCase):
         result = solve_with_highs(compilation.model)
         np.testing.assert_allclose(result.decisions[:2], np.asarray([1.0, 0.5]))
 
+    def test_lp_profile_follows_model_shape_and_reports_its_own_path(self) -> None:
+        model = compile_spatial_optimization(
+            planning_units=None,
+            planning_unit_count=40,
+            fused_objective=np.linspace(1.0, 0.1, 40),
+            constraints=[
+                SparseConstraintSpecification(
+                    "allocation_cap",
+                    np.arange(40, dtype=np.int32),
+                    np.ones(40, dtype=np.float64),
+                    [(None, 12.5)],
+                )
+            ],
+            decision_domain="continuous",
+        ).model
+
+        small = solve_with_highs(model)
+        self.assertEqual("optimal", small.status)
+        self.assertEqual("small_model", small.solver_settings["lp_profile"]["reason"])
+        self.assertEqual("simplex", small.diagnostics["lp_algorithm"])
+        self.assertIsNone(small.diagnostics["ipm_iterations"])
+        self.assertIsNone(small.diagnostics["presolved_model"])
+        self.assertIsNone(small.optimality_gap)
+        self.assertIsNone(small.node_count)
+        self.assertEqual(small.objective_value, small.best_bound)
+        with patch.object(highs, "LP_SIMPLEX_MAX_NONZEROS", 0):
+            interior = solve_with_highs(
+                model,
+                configuration=SolveConfiguration(
+                    vertex_solution=False,
+                    options={"presolve": "off"},
+                ),
+            )
+            overridden = solve_with_highs(
+                model,
+                configuration=SolveConfiguration(options={"solver": "simplex"}),
+            )
+
+        self.assertEqual(
+            {"solver": "ipm", "run_crossover": "off"},
+            interior.solver_settings["lp_profile"]["options"],
+        )
+        self.assertEqual("ipm", interior.diagnostics["lp_algorithm"])
+        self.assertGreater(interior.diagnostics["ipm_iterations"], 0)
+        self.assertIsNone(interior.diagnostics["simplex_iterations"])
+        self.assertAlmostEqual(small.objective_value, interior.objective_value, 5)
+        self.assertEqual(
+            {"run_crossover": "on"},
+            overridden.solver_settings["lp_profile"]["options"],
+        )
+        self.assertEqual("simplex", overridden.diagnostics["lp_algorithm"])
+
     def test_discrete_decision_domain_preserves_binary_integrality(self) -> None:
         compilation = compile_spatial_optimization(
             planning_units=None,
@@ -286,6 +380,43 @@ class OptimizationProblemTest(unittest.TestCase):
             np.asarray(warm_start), np.asarray([1.0, 0.0, 1.0])
         )
 
+    def test_lp_repair_bounds_rounding_and_falls_back_outside_gap(self) -> None:
+        compilation = compile_spatial_optimization(
+            planning_units=None,
+            planning_unit_count=6,
+            fused_objective=np.asarray([0.9, 0.8, 0.7, 0.4, 0.3, 0.2]),
+            constraints=[
+                SparseConstraintSpecification(
+                    "cost/value",
+                    np.arange(6, dtype=np.int32),
+                    np.asarray([4.0, 3.0, 3.0, 2.0, 1.0, 1.0]),
+                    [(None, 7.5)],
+                )
+            ],
+        )
+        model = compilation.model
+        loose = SolveConfiguration(relative_mip_gap=0.5, mode="lp_repair")
+        repaired = solve_with_highs(model, configuration=loose)
+        require_acceptable_result(repaired, loose, model)
+        stage = repaired.solver_settings["lp_repair"]
+        self.assertFalse(stage["fallback"])
+        self.assertEqual("lp_repair_within_gap", repaired.termination_reason)
+        self.assertEqual(stage["lp_objective"], repaired.best_bound)
+        self.assertGreaterEqual(repaired.best_bound, repaired.objective_value)
+        self.assertTrue(
+            reconstruct_and_validate(
+                model,
+                repaired,
+                candidate_planning_unit_ids=np.arange(6, dtype=np.uint64),
+            ).accepted
+        )
+
+        exact = SolveConfiguration(relative_mip_gap=0.0, mode="lp_repair")
+        fallback = solve_with_highs(model, configuration=exact)
+        self.assertTrue(fallback.solver_settings["lp_repair"]["fallback"])
+        self.assertEqual("optimal", fallback.status)
+        self.assertGreaterEqual(fallback.objective_value, repaired.objective_value)
+
     def test_solver_defaults_to_all_process_available_cpus(self) -> None:
         """Expose the resolved process CPU count in solver result metadata."""
         compilation = compile_spatial_optimization(
@@ -354,6 +485,204 @@ class OptimizationProblemTest(unittest.TestCase):
             5.0,
         )
 
+    def test_warm_start_search_is_charged_to_the_solve_time_limit(self) -> None:
+        model = knapsack_model([0.9, 0.8, 0.2], [4.0, 3.0, 1.0], 5.0)
+        budgets = []
+
+        def slow_seed(model, *, local_search_seconds=None):
+            budgets.append(local_search_seconds)
+            time.sleep(0.2)
+            return None
+
+        with patch.object(highs, "build_objective_warm_start", slow_seed):
+            result = solve_with_highs(
+                model, configuration=SolveConfiguration(time_limit_seconds=5.0)
+            )
+            _, unlimited = highs.build_budgeted_warm_start(
+                model, SolveConfiguration()
+            )
+            relaxed = replace(model, integrality=np.zeros_like(model.integrality))
+            highs.build_budgeted_warm_start(
+                relaxed, SolveConfiguration(time_limit_seconds=5.0)
+            )
+        self.assertEqual([0.5, 30.0, 0.0], budgets)
+        self.assertLessEqual(result.solver_settings["time_limit_seconds"], 4.8)
+        self.assertIsNone(unlimited.time_limit_seconds)
+
+    def test_local_search_warm_start_satisfies_several_aggregate_rows(self) -> None:
+        compilation = compile_spatial_optimization(
+            planning_units=None,
+            planning_unit_count=6,
+            fused_objective=np.asarray([0.9, 0.8, 0.7, 0.4, -0.1, -0.2]),
+            constraints=[
+                SparseConstraintSpecification(
+                    "cost/value",
+                    np.arange(6, dtype=np.int32),
+                    np.asarray([4.0, 3.0, 3.0, 2.0, 1.0, 1.0]),
+                    [(None, 6.0)],
+                ),
+                SparseConstraintSpecification(
+                    "area/value",
+                    np.arange(6, dtype=np.int32),
+                    np.asarray([1.0, 2.0, 1.0, 1.0, 1.0, 1.0]),
+                    [(None, 3.0)],
+                ),
+                SparseConstraintSpecification(
+                    "wetland/value",
+                    np.asarray([4, 5], dtype=np.int32),
+                    np.asarray([1.0, 1.0]),
+                    [(1.0, None)],
+                ),
+            ],
+        )
+        model = compilation.model
+        warm_start = build_objective_warm_start(model)
+        self.assertIsNotNone(warm_start)
+        activities = csr_row_activities(model, np.asarray(warm_start))
+        self.assertTrue(np.all(activities >= model.row_lower - 1e-9))
+        self.assertTrue(np.all(activities <= model.row_upper + 1e-9))
+        self.assertGreater(float(np.dot(model.objective, warm_start)), 0.0)
+
+    def test_local_search_swaps_a_blocked_improving_flip(self) -> None:
+        compilation = compile_spatial_optimization(
+            planning_units=None,
+            planning_unit_count=2,
+            fused_objective=np.asarray([3.0, 1.0]),
+            constraints=[
+                SparseConstraintSpecification(
+                    "cost/value",
+                    np.arange(2, dtype=np.int32),
+                    np.asarray([2.0, 2.0]),
+                    [(None, 2.0)],
+                )
+            ],
+        )
+        searched = build_local_search_warm_start(
+            compilation.model, initial_columns=np.asarray([0.0, 1.0])
+        )
+        self.assertIsNotNone(searched)
+        np.testing.assert_array_equal([1.0, 0.0], searched.columns)
+        self.assertEqual((1, 0), (searched.swap_count, searched.flip_count))
+
+    def test_local_search_repair_and_swaps_count_shared_neighbor_edges(
+        self,
+    ) -> None:
+        eligible = np.ones((1, 3), dtype=bool)
+        structure = load_neighbor_structure(
+            {
+                "neighbor_method": "selected_rook_pairs",
+                "neighbor_method_version": 1,
+                "tile_size": 3,
+                "height": 1,
+                "width": 3,
+                "planning_unit_count": 3,
+                "tiles": [
+                    {
+                        "tile_id": "0-0",
+                        "row_start": 0,
+                        "row_stop": 1,
+                        "col_start": 0,
+                        "col_stop": 3,
+                        "variable_index_offset": 0,
+                        "valid_planning_unit_count": 3,
+                        "eligibility_mask": encode_packed_mask(eligible),
+                        "fixed0_mask": encode_packed_mask(~eligible),
+                        "fixed1_mask": encode_packed_mask(~eligible),
+                    }
+                ],
+            }
+        )
+        compilation = compile_spatial_optimization(
+            planning_units=None,
+            planning_unit_count=3,
+            fused_objective=np.asarray([1.0, 0.9, 1.0]),
+            constraints=[
+                SparseConstraintSpecification(
+                    "cost/value",
+                    np.arange(3, dtype=np.int32),
+                    np.ones(3),
+                    [(None, 2.0)],
+                )
+            ],
+            neighbor_penalty=NeighborPenaltySpecification(strength=1.0),
+            neighbor_structure=structure,
+        )
+        model = compilation.model
+        optimum = solve_with_highs(model).objective_value
+        # Selecting every unit violates the cap, so the search starts by
+        # repairing; the selected pair must then keep its shared edge.
+        searched = build_local_search_warm_start(
+            model, initial_columns=np.ones(model.variable_count)
+        )
+        self.assertIsNotNone(searched)
+        self.assertAlmostEqual(optimum, searched.objective_value)
+        self.assertEqual(1.0, searched.columns[1])
+        self.assertLess(searched.round_count, 100)
+
+    def test_solve_writes_certified_incumbent_to_scratch(self) -> None:
+        compilation = compile_spatial_optimization(
+            planning_units=None,
+            planning_unit_count=3,
+            fused_objective=np.asarray([0.9, 0.8, 0.2]),
+            constraints=[
+                SparseConstraintSpecification(
+                    "cost/value",
+                    np.arange(3, dtype=np.int32),
+                    np.asarray([4.0, 3.0, 1.0]),
+                    [(None, 5.0)],
+                )
+            ],
+        )
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "incumbent.npy"
+            result = solve_with_highs(compilation.model, incumbent_path=path)
+            np.testing.assert_array_equal(result.native_columns, np.load(path))
+            metadata = json.loads(path.with_suffix(".json").read_text())
+        self.assertAlmostEqual(result.objective_value, metadata["objective_value"])
+        self.assertEqual("final", metadata["source"])
+        self.assertIn("incumbent_count", result.diagnostics)
+
+    def test_solve_progress_coalesces_callback_telemetry(self) -> None:
+        progress = _SolveProgress(0.0)
+        data = SimpleNamespace(
+            mip_solution=[1.0, 0.0],
+            objective_function_value=2.0,
+            mip_dual_bound=2.5,
+            mip_gap=0.2,
+            mip_node_count=7,
+        )
+        progress.record_incumbent(SimpleNamespace(data_out=data))
+        self.assertTrue(progress.has_news())
+        snapshot = progress.snapshot()
+        self.assertFalse(progress.has_news())
+        self.assertEqual(2.0, snapshot["incumbent_objective"])
+        self.assertEqual(2.5, snapshot["best_bound"])
+        self.assertEqual(7, snapshot["node_count"])
+        self.assertGreater(snapshot["primal_dual_integral"], 0.0)
+        columns, metadata = progress.take_unwritten_incumbent()
+        np.testing.assert_array_equal([1.0, 0.0], columns)
+        self.assertEqual("callback", metadata["source"])
+        self.assertIsNone(progress.take_unwritten_incumbent())
+
+    def test_gap_plateau_stops_only_after_a_full_stalled_window(self) -> None:
+        plateau = _GapPlateau(window_seconds=10.0, minimum_improvement=0.01)
+        self.assertIsNone(plateau.observe(0.0, None, None, False))
+        self.assertIsNone(plateau.observe(1.0, 0.30, 0.0, True))
+        self.assertIsNone(plateau.observe(6.0, 0.25, 1.5, True))
+        self.assertIsNone(plateau.observe(11.0, 0.20, 2.5, True))
+        self.assertIsNone(plateau.observe(16.0, 0.195, 3.5, True))
+        stall = plateau.observe(21.0, 0.195, 4.5, True)
+        self.assertEqual("gap_plateau", stall["reason"])
+        self.assertEqual(0.20, stall["gap_at_window_start"])
+        self.assertAlmostEqual(0.2, stall["window_mean_normalized_gap"])
+        self.assertIsNone(plateau.observe(22.0, None, 4.5, True))
+        self.assertIsNone(plateau.observe(30.0, 0.195, 5.0, True))
+
+        audit = SolveConfiguration(mode="exact_audit", gap_plateau_seconds=60.0)
+        self.assertIsNone(audit.effective_gap_plateau_seconds)
+        with self.assertRaises(ValueError):
+            SolveConfiguration(gap_plateau_seconds=0.0)
+
     def test_zero_columns_without_highs_primal_are_not_an_incumbent(self) -> None:
         compilation = compile_spatial_optimization(
             planning_units=None,
@@ -407,6 +736,153 @@ class OptimizationProblemTest(unittest.TestCase):
         self.assertEqual(1.0, result.objective_value)
         self.assertTrue(result.solver_settings["deadline_fallback_used"])
 
+    def test_memory_governor_cancels_and_harvests_the_fallback(self) -> None:
+        compilation = compile_spatial_optimization(
+            planning_units=None,
+            planning_unit_count=2,
+            fused_objective=np.asarray([1.0, 0.5]),
+            constraints=[
+                SparseConstraintSpecification(
+                    "count",
+                    np.arange(2, dtype=np.int32),
+                    np.ones(2),
+                    [(None, 1.0)],
+                )
+            ],
+        )
+        session = HighsModelSession(
+            compilation.model,
+            configuration=SolveConfiguration(memory_limit_fraction=0.5),
+        )
+        session.apply_warm_start(
+            np.asarray([1.0, 0.0]),
+            retain_as_deadline_fallback=True,
+        )
+        session._solver.clear()
+        session._solver = _SolverRunningUntilCancelled()
+        with session, patch.object(highs, "memory_limit_bytes", return_value=2):
+            result = session.solve()
+        self.assertEqual("feasible", result.status)
+        self.assertEqual("memory_limit", result.termination_reason)
+        self.assertEqual([1.0, 0.0], result.decisions.tolist())
+        self.assertTrue(result.solver_settings["deadline_fallback_used"])
+        stop = result.diagnostics["early_termination"]
+        self.assertEqual(1, stop["threshold_bytes"])
+        governed = result.memory_profile["during_highs_solve"]
+        self.assertEqual(2, governed["limit_bytes"])
+        self.assertGreaterEqual(governed["sampled_peak_rss_bytes"], 1)
+
+    def test_checkpointed_warm_start_is_validated_before_reuse(self) -> None:
+        compilation = compile_spatial_optimization(
+            planning_units=None,
+            planning_unit_count=3,
+            fused_objective=np.asarray([1.0, 0.8, 0.6]),
+            constraints=[
+                SparseConstraintSpecification(
+                    "cost",
+                    np.arange(3, dtype=np.int32),
+                    np.asarray([2.0, 1.0, 1.0]),
+                    [(None, 2.0)],
+                )
+            ],
+        )
+        model = compilation.model
+        checkpoint = np.zeros(model.variable_count, dtype=np.float64)
+        checkpoint[[1, 2]] = 1.0
+        self.assertTrue(warm_start_is_feasible(model, checkpoint))
+        checkpoint[0] = 1.0
+        self.assertFalse(warm_start_is_feasible(model, checkpoint))
+        self.assertFalse(warm_start_is_feasible(model, checkpoint[:-1]))
+        self.assertFalse(warm_start_is_feasible(model, None))
+
+    def test_tighter_budget_rerun_repairs_the_prior_selection(self) -> None:
+        generator = np.random.default_rng(3)
+        values = generator.uniform(0.1, 1.0, 30)
+        prior_ids = np.arange(20, dtype=np.uint64)
+        prior = solve_with_highs(knapsack_model(values[:20], np.ones(20), 8.0))
+        ids, decisions = prior_solution_arrays(prior_ids, prior.native_columns[:20])
+
+        rerun_ids = np.arange(5, 30, dtype=np.uint64)
+        rerun = knapsack_model(values[5:], np.ones(25), 6.0)
+        mapped, overlap = map_prior_decisions(rerun_ids, ids, decisions)
+        self.assertEqual(0.6, overlap)
+        warm_start = build_projected_warm_start(rerun, mapped)
+        self.assertIsNotNone(warm_start)
+        self.assertTrue(warm_start_is_feasible(rerun, warm_start))
+        self.assertEqual(6.0, float(np.sum(warm_start[:25])))
+
+    def test_scaled_solve_unscales_exactly_to_original_units(self) -> None:
+        # Objective coefficients fall below the dual tolerance and area
+        # coefficients dwarf cost ones until conditioning recentres both.
+        area = SparseConstraintSpecification(
+            "area", np.arange(40, dtype=np.int32), np.full(40, 4.0e6), [(None, 8.0e7)]
+        )
+        arguments = (np.linspace(3e-9, 1e-10, 40), np.linspace(2e-8, 5e-8, 40))
+        original = knapsack_model(
+            *arguments, 2e-8 * 40 / 3, additional_constraints=[area]
+        )
+        model, scaling = condition_model(
+            knapsack_model(*arguments, 2e-8 * 40 / 3, additional_constraints=[area])
+        )
+
+        self.assertGreater(scaling.objective_exponent, 20)
+        self.assertEqual(
+            40, scaling.report["objective_coefficients_below_dual_tolerance"]
+        )
+        self.assertEqual(
+            0, scaling.report["scaled_objective_coefficients_below_dual_tolerance"]
+        )
+        low, high = scaling.report["scaled_matrix_coefficient_range"]
+        self.assertTrue(0.25 <= low and high <= 4.0)
+        restored = NumericalScaling.from_provenance(
+            {"numerical_scaling": scaling.to_dict()}
+        )
+        self.assertEqual(scaling.to_dict(), restored.to_dict())
+        self.assertIsNone(NumericalScaling.from_provenance({}))
+
+        result = solve_with_highs(model, configuration=SolveConfiguration())
+        self.assertEqual("optimal", result.status)
+        validation = reconstruct_and_validate(
+            model,
+            result,
+            candidate_planning_unit_ids=np.arange(40),
+            scaling=scaling,
+        )
+        self.assertTrue(validation.accepted)
+        columns = result.native_columns
+        np.testing.assert_array_equal(
+            csr_row_activities(original, columns),
+            scaling.unscale_rows(csr_row_activities(model, columns)),
+        )
+        np.testing.assert_array_equal(
+            original.row_upper, scaling.unscale_rows(model.row_upper)
+        )
+        self.assertEqual(
+            float(np.dot(original.objective, columns) + original.objective_offset),
+            validation.objective_value,
+        )
+        self.assertAlmostEqual(
+            validation.objective_value,
+            scaling.unscale_objective(result.objective_value),
+            delta=1e-12 * abs(validation.objective_value),
+        )
+
+    @unittest.skipIf(cp_model is None, "OR-Tools is not installed.")
+    def test_cpsat_matches_highs_optimum_and_passes_acceptance(self) -> None:
+        model = knapsack_model(
+            [3.0, 1.0, 2.5, 0.5, 4.0, 2.0, 1.5, 0.8],
+            [2.0, 1.0, 3.0, 1.0, 4.0, 2.0, 1.0, 1.0],
+            7.0,
+        )
+        objectives = {}
+        for backend in ("highs", "cpsat"):
+            configuration = SolveConfiguration(thread_count=2, backend=backend)
+            result = solve_with_backend(model, configuration=configuration)
+            require_acceptable_result(result, configuration, model)
+            objectives[backend] = result.objective_value
+            self.assertEqual(backend, result.solver_name)
+        self.assertAlmostEqual(objectives["highs"], objectives["cpsat"], places=6)
+
     def test_top_k_scale_uses_positive_canonical_contributions(self) -> None:
         values = np.asarray([100.0, 10.0, 1.0, 0.0, -500.0, np.nan])
         self.assertEqual(110.0, top_k_attainable_scale(values, 2))
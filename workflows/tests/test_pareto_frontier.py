@@ -0,0 +1,134 @@
+import itertools
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from src.optimization.artifact import load_compiled_artifact, write_compiled_artifact
+from src.optimization.model import CanonicalObjectiveValues
+from src.optimization.objective import resolve_objective_normalization
+from src.optimization.pareto import weighted_sum_frontier
+from tests.helpers import knapsack_compilation
+
+BENEFIT = np.asarray([3.0, 1.0, 2.5, 0.5, 4.0, 2.0, 1.5, 0.8, 2.2, 1.1])
+CARBON = np.asarray([0.5, 2.0, 1.0, 3.0, 0.2, 1.5, 2.5, 1.8, 0.4, 2.2])
+COST = np.asarray([2.0, 1.0, 3.0, 1.0, 4.0, 2.0, 1.0, 1.0, 2.0, 3.0])
+BUDGET = 8.0
+LAYERS = (("benefit", BENEFIT), ("carbon", CARBON))
+
+
+def _artifact(directory: Path):
+    count = len(BENEFIT)
+    indices = np.arange(count, dtype=np.int32)
+    normalizations = [
+        resolve_objective_normalization(
+            layer=layer,
+            direction="maximize",
+            importance=1.0,
+            attainable_scale=float(np.sum(values)),
+            selection_count=count,
+        )
+        for layer, values in LAYERS
+    ]
+    compilation = knapsack_compilation(
+        sum(
+            normalization.resolved_coefficient * values
+            for normalization, (_, values) in zip(normalizations, LAYERS, strict=True)
+        ),
+        COST,
+        BUDGET,
+        canonical_objectives=[
+            CanonicalObjectiveValues(layer, indices, values) for layer, values in LAYERS
+        ],
+        preserve_primary_domain=True,
+    )
+    reconstruction = compilation.reconstruction
+    additional_arrays = {}
+    objectives = []
+    for ordinal, normalization in enumerate(normalizations):
+        canonical = reconstruction.canonical_objectives[ordinal]
+        additional_arrays[f"canonical_objective_{ordinal}_indices"] = canonical.indices
+        additional_arrays[f"canonical_objective_{ordinal}_values"] = canonical.values
+        objectives.append(
+            {
+                **normalization.to_dict(),
+                "canonical_indices_array": f"canonical_objective_{ordinal}_indices",
+                "canonical_values_array": f"canonical_objective_{ordinal}_values",
+            }
+        )
+    write_compiled_artifact(
+        compilation.model,
+        directory,
+        problem_definition_hash="pareto",
+        candidate_planning_unit_ids=indices,
+        candidate_source_indices=indices,
+        fixed_planning_unit_ids=np.empty(0, dtype=np.int64),
+        fixed_source_indices=np.empty(0, dtype=np.int64),
+        fixed_values=np.empty(0, dtype=np.float32),
+        provenance={
+            "objectives": objectives,
+            "neighbor_penalty": None,
+            "aggregate_rows": list(reconstruction.aggregate_rows),
+            "preserve_primary_domain": True,
+        },
+        additional_arrays=additional_arrays,
+    )
+    return load_compiled_artifact(directory)
+
+
+class ParetoFrontierTest(unittest.TestCase):
+    """Verify the dichotomic search finds every supported trade-off."""
+
+    def test_frontier_contains_every_supported_point(self) -> None:
+        with TemporaryDirectory() as directory:
+            artifact = _artifact(Path(directory))
+            frontier = weighted_sum_frontier(
+                artifact, layers=("benefit", "carbon"), tolerance=1e-9
+            )
+
+        selections = np.asarray(
+            [
+                selection
+                for selection in itertools.product((0.0, 1.0), repeat=len(BENEFIT))
+                if np.dot(COST, selection) <= BUDGET
+            ]
+        )
+        scores = np.column_stack(
+            [selections @ values / np.sum(values) for _, values in LAYERS]
+        )
+        supported = set()
+        for weight in np.linspace(0.001, 0.999, 999):
+            weighted = scores @ np.asarray([weight, 1.0 - weight])
+            best = np.flatnonzero(weighted >= np.max(weighted) - 1e-12)
+            if len(best) == 1:
+                supported.add(tuple(np.round(scores[best[0]], 9)))
+        found = [
+            tuple(round(point.scores[layer], 9) for layer in ("benefit", "carbon"))
+            for point in frontier.points
+        ]
+
+        self.assertTrue(frontier.resolved)
+        self.assertGreater(len(supported), 2)
+        self.assertEqual(supported, set(found))
+        self.assertEqual(sorted(found, reverse=True), found)
+        self.assertTrue(any(point.warm_started for point in frontier.points))
+        self.assertEqual("packed_bits", frontier.decision_encoding)
+        for ordinal, point in enumerate(frontier.points):
+            decisions = frontier.candidate_decisions(ordinal)
+            self.assertLessEqual(float(np.dot(COST, decisions)), BUDGET)
+            self.assertAlmostEqual(
+                point.layer_values["benefit"], float(np.dot(BENEFIT, decisions))
+            )
+
+    def test_frontier_rejects_layers_outside_the_compile(self) -> None:
+        with TemporaryDirectory() as directory:
+            artifact = _artifact(Path(directory))
+            with self.assertRaisesRegex(ValueError, "two distinct"):
+                weighted_sum_frontier(artifact, layers=("benefit", "benefit"))
+            with self.assertRaisesRegex(ValueError, "two distinct"):
+                weighted_sum_frontier(artifact, layers=("benefit", "threat"))
+
+
+if __name__ == "__main__":
+    unittest.main()
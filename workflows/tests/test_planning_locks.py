@@ -0,0 +1,175 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from affine import Affine
+from shapely.geometry import box
+
+from src.optimization.artifact import load_compiled_artifact, write_compiled_artifact
+from src.optimization.delta import resolve_model_delta, write_derived_artifact
+from src.optimization.highs import solve_with_highs
+from src.optimization.model import CanonicalObjectiveValues
+from src.optimization.neighbor import (
+    NeighborPenaltySpecification,
+    attainable_neighbor_edge_count,
+    encode_packed_mask,
+    load_neighbor_structure,
+    resolve_neighbor_normalization,
+)
+from src.optimization.objective import resolve_objective_normalization
+from src.spatial.locks import PlanningLocks, lock_states, rasterize_lock_window
+from tests.helpers import knapsack_compilation
+
+TRANSFORM = Affine(30.0, 0.0, 0.0, 0.0, -30.0, 300.0)
+BENEFIT = np.asarray([3.0, 1.0, 2.5, 0.5, 4.0, 2.0, 1.5, 0.8, 2.2])
+COST = np.asarray([2.0, 1.0, 3.0, 1.0, 4.0, 2.0, 1.0, 1.0, 2.0])
+SPECIFICATION = NeighborPenaltySpecification(strength=2.0)
+
+
+def _structure():
+    mask = np.ones((3, 3), dtype=bool)
+    zeros = encode_packed_mask(np.zeros(mask.shape, dtype=bool))
+    return load_neighbor_structure(
+        {
+            "neighbor_method": "selected_rook_pairs",
+            "neighbor_method_version": 1,
+            "height": 3,
+            "width": 3,
+            "tile_size": 3,
+            "planning_unit_count": 9,
+            "tiles": [
+                {
+                    "tile_id": "0-0",
+                    "row_start": 0,
+                    "row_stop": 3,
+                    "col_start": 0,
+                    "col_stop": 3,
+                    "variable_index_offset": 0,
+                    "eligibility_mask": encode_packed_mask(mask),
+                    "fixed0_mask": zeros,
+                    "fixed1_mask": zeros,
+                }
+            ],
+        }
+    )
+
+
+def _compile(fixed_values: np.ndarray | None = None):
+    indices = np.arange(len(BENEFIT), dtype=np.int32)
+    return knapsack_compilation(
+        BENEFIT / np.sum(BENEFIT),
+        COST,
+        7.0,
+        canonical_objectives=[CanonicalObjectiveValues("benefit", indices, BENEFIT)],
+        neighbor_penalty=SPECIFICATION,
+        neighbor_structure=_structure(),
+        fixed_values=fixed_values,
+    )
+
+
+class PlanningLockTest(unittest.TestCase):
+    """Verify lock rasterization and both lock application paths."""
+
+    def test_tiled_lock_rasterization_matches_the_full_grid(self) -> None:
+        locks = PlanningLocks(
+            lock_in=(box(0, 0, 150, 150), box(240, 240, 300, 300)),
+            lock_out=(box(90, 90, 210, 210), box(1000, 1000, 1100, 1100)),
+        )
+        full = lock_states(*rasterize_lock_window(locks, TRANSFORM, 0, 0, (10, 10)))
+        tiled = np.empty((10, 10), dtype=np.int8)
+        for row in range(0, 10, 4):
+            for col in range(0, 10, 4):
+                shape = (min(4, 10 - row), min(4, 10 - col))
+                tiled[row : row + shape[0], col : col + shape[1]] = lock_states(
+                    *rasterize_lock_window(locks, TRANSFORM, row, col, shape)
+                )
+
+        np.testing.assert_array_equal(full, tiled)
+        self.assertEqual(1, full[9, 0])
+        self.assertEqual(0, full[5, 4])
+        self.assertEqual(1, full[0, 9])
+        self.assertEqual(-1, full[0, 0])
+        self.assertEqual(25, np.count_nonzero(full == 1))
+
+    def test_column_bound_locks_match_locks_fixed_during_compilation(self) -> None:
+        locks = np.full(len(BENEFIT), -1, dtype=np.int8)
+        locks[[4, 5]] = 0
+        locks[1] = 1
+        base = _compile()
+        reconstruction = base.reconstruction
+        candidates = np.flatnonzero(reconstruction.planning_unit_solver_columns >= 0)
+        fixed = np.flatnonzero(reconstruction.planning_unit_fixed_values >= 0)
+        canonical = reconstruction.canonical_objectives[0]
+        with TemporaryDirectory() as directory:
+            write_compiled_artifact(
+                base.model,
+                Path(directory) / "base",
+                problem_definition_hash="base",
+                candidate_planning_unit_ids=candidates,
+                candidate_source_indices=candidates,
+                fixed_planning_unit_ids=fixed,
+                fixed_source_indices=fixed,
+                fixed_values=reconstruction.planning_unit_fixed_values[fixed],
+                provenance={
+                    "objectives": [
+                        {
+                            **resolve_objective_normalization(
+                                layer="benefit",
+                                direction="maximize",
+                                importance=1.0,
+                                attainable_scale=float(np.sum(BENEFIT)),
+                                selection_count=len(BENEFIT),
+                            ).to_dict(),
+                            "canonical_indices_array": "benefit_indices",
+                            "canonical_values_array": "benefit_values",
+                        }
+                    ],
+                    "neighbor_penalty": resolve_neighbor_normalization(
+                        SPECIFICATION, 12
+                    ).to_dict(),
+                    "aggregate_rows": list(reconstruction.aggregate_rows),
+                },
+                additional_arrays={
+                    "benefit_indices": canonical.indices,
+                    "benefit_values": canonical.values,
+                },
+            )
+            artifact = load_compiled_artifact(Path(directory) / "base")
+            delta = resolve_model_delta(
+                artifact,
+                objective_importance={"benefit": 1.0},
+                neighbor_strength=SPECIFICATION.strength,
+                aggregate_bounds={"cost": [(None, 7.0)]},
+                planning_unit_locks=locks,
+                neighbor_edge_count=attainable_neighbor_edge_count(_structure(), locks),
+            )
+            self.assertEqual(3, len(delta.scenario.column_bounds))
+            self.assertEqual({"fixed_in": 1, "fixed_out": 2}, delta.changes["locks"])
+            write_derived_artifact(
+                artifact,
+                delta,
+                Path(directory) / "derived",
+                problem_definition_hash="new",
+            )
+            derived = load_compiled_artifact(Path(directory) / "derived")
+            self.assertEqual(base.model.nonzero_count, derived.model.nonzero_count)
+
+        expected = _compile(locks)
+        self.assertLess(expected.model.variable_count, base.model.variable_count)
+        self.assertEqual(
+            expected.reconstruction.neighbor.normalization_scale,
+            delta.neighbor_penalty["normalization_scale"],
+        )
+        solved = solve_with_highs(derived.model)
+        self.assertAlmostEqual(
+            solve_with_highs(expected.model).objective_value,
+            solved.objective_value,
+            places=9,
+        )
+        decisions = np.asarray(solved.native_columns[: len(candidates)])
+        np.testing.assert_array_equal([1.0, 0.0, 0.0], decisions[[1, 4, 5]])
+
+
+if __name__ == "__main__":
+    unittest.main()
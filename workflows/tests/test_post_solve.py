@@ -0,0 +1,216 @@
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from src.optimization.artifact import load_compiled_artifact, write_compiled_artifact
+from src.optimization.compiler import (
+    SparseConstraintSpecification,
+    compile_spatial_optimization,
+)
+from src.optimization.highs import solve_with_highs
+from src.optimization.model import (
+    CanonicalObjectiveValues,
+    RowBoundOverride,
+    SolveScenario,
+)
+from src.optimization.neighbor import (
+    NeighborPenaltySpecification,
+    encode_packed_mask,
+    load_neighbor_structure,
+    raw_neighbor_value,
+)
+from src.optimization.post_solve import reconstruct_solution
+from src.optimization.reconstruction import reconstruct_compilation_result
+
+BENEFIT = np.asarray([3.0, 1.0, 2.5, 0.5, 4.0, 2.0])
+COST = np.asarray([2.0, 1.0, 3.0, 1.0, 4.0, 2.0])
+
+
+def _structure():
+    zeros = np.zeros((2, 3), dtype=bool)
+    fixed_zero = zeros.copy()
+    fixed_zero[1, 2] = True
+    fixed_one = zeros.copy()
+    fixed_one[0, 1] = fixed_one[0, 2] = True
+    return load_neighbor_structure(
+        {
+            "neighbor_method": "selected_rook_pairs",
+            "neighbor_method_version": 1,
+            "tile_size": 3,
+            "height": 2,
+            "width": 3,
+            "planning_unit_count": 6,
+            "tiles": [
+                {
+                    "tile_id": "0-0",
+                    "row_start": 0,
+                    "row_stop": 2,
+                    "col_start": 0,
+                    "col_stop": 3,
+                    "variable_index_offset": 0,
+                    "valid_planning_unit_count": 6,
+                    "eligibility_mask": encode_packed_mask(~zeros),
+                    "fixed0_mask": encode_packed_mask(fixed_zero),
+                    "fixed1_mask": encode_packed_mask(fixed_one),
+                }
+            ],
+        }
+    )
+
+
+def _artifact(directory: Path, decision_domain: str):
+    structure = _structure()
+    indices = np.arange(len(BENEFIT), dtype=np.int32)
+    compilation = compile_spatial_optimization(
+        planning_units=None,
+        planning_unit_count=len(BENEFIT),
+        fused_objective=BENEFIT,
+        canonical_objectives=[CanonicalObjectiveValues("benefit", indices, BENEFIT)],
+        constraints=[
+            SparseConstraintSpecification("cost", indices, COST, [(None, 7.0)])
+        ],
+        neighbor_penalty=NeighborPenaltySpecification(strength=1.5),
+        neighbor_structure=structure,
+        decision_domain=decision_domain,
+    )
+    neighbor = compilation.reconstruction.neighbor
+    mapping = compilation.reconstruction.planning_unit_solver_columns
+    fixed = compilation.reconstruction.planning_unit_fixed_values
+    write_compiled_artifact(
+        compilation.model,
+        directory,
+        problem_definition_hash=decision_domain,
+        candidate_planning_unit_ids=np.flatnonzero(mapping >= 0),
+        candidate_source_indices=np.flatnonzero(mapping >= 0),
+        fixed_planning_unit_ids=np.flatnonzero(mapping < 0),
+        fixed_source_indices=np.flatnonzero(mapping < 0),
+        fixed_values=fixed[mapping < 0],
+        provenance={
+            "decision_domain": decision_domain,
+            "objectives": [
+                {
+                    "layer": "benefit",
+                    "resolved_coefficient": 1.0,
+                    "canonical_indices_array": "benefit_indices",
+                    "canonical_values_array": "benefit_values",
+                }
+            ],
+            "neighbor_penalty": {"resolved_coefficient": neighbor.resolved_coefficient},
+            "neighbor_reconstruction": {
+                "fixed_in_counts_array": "neighbor_fixed_in_counts",
+                "constant_selected_edges": (
+                    neighbor.constant_selected_neighbor_edge_count
+                ),
+            },
+        },
+        additional_arrays={
+            "benefit_indices": indices,
+            "benefit_values": BENEFIT,
+            "neighbor_fixed_in_counts": neighbor.fixed_in_neighbor_counts,
+        },
+    )
+    return compilation, structure, load_compiled_artifact(directory)
+
+
+class PostSolveReconstructionTest(unittest.TestCase):
+    """Verify the fused sweep against the separate reconstruction passes."""
+
+    def test_fused_sweep_matches_structure_regeneration(self) -> None:
+        for decision_domain in ("discrete", "continuous"):
+            with (
+                self.subTest(decision_domain=decision_domain),
+                TemporaryDirectory() as directory,
+            ):
+                compilation, structure, artifact = _artifact(
+                    Path(directory) / "model", decision_domain
+                )
+                result = solve_with_highs(artifact.model)
+                reconstruction = reconstruct_solution(
+                    artifact,
+                    result,
+                    Path(directory) / "decisions.npy",
+                    planning_unit_count=len(BENEFIT),
+                    thread_count=2,
+                    batch_size=2,
+                )
+                expected = reconstruct_compilation_result(
+                    result, compilation.reconstruction
+                )
+                self.assertTrue(reconstruction.validation.accepted)
+                np.testing.assert_allclose(
+                    expected.decisions, reconstruction.decisions, atol=1e-6
+                )
+                self.assertAlmostEqual(
+                    raw_neighbor_value(structure, expected.decisions, decision_domain),
+                    reconstruction.raw_neighbor_value,
+                )
+                self.assertAlmostEqual(
+                    float(BENEFIT @ expected.decisions),
+                    reconstruction.raw_objective_contributions[0],
+                    places=5,
+                )
+                self.assertAlmostEqual(
+                    result.objective_value,
+                    reconstruction.raw_objective_contributions[0]
+                    + compilation.reconstruction.neighbor.resolved_coefficient
+                    * reconstruction.raw_neighbor_value,
+                    places=5,
+                )
+
+    def test_stale_auxiliary_columns_do_not_hide_selected_pairs(self) -> None:
+        with TemporaryDirectory() as directory:
+            _, structure, artifact = _artifact(Path(directory) / "model", "discrete")
+            result = solve_with_highs(artifact.model)
+            columns = np.asarray(result.native_columns, dtype=np.float64).copy()
+            columns[artifact.model.primary_variable_count :] = 0.0
+            reconstruction = reconstruct_solution(
+                artifact,
+                replace(result, native_columns=columns),
+                Path(directory) / "decisions.npy",
+                planning_unit_count=len(BENEFIT),
+            )
+        self.assertEqual(
+            raw_neighbor_value(structure, reconstruction.decisions),
+            reconstruction.raw_neighbor_value,
+        )
+        self.assertIn("objective_mismatch", reconstruction.validation.failures)
+
+    def test_scenario_results_validate_against_scenario_bounds(self) -> None:
+        with TemporaryDirectory() as directory:
+            _, _, artifact = _artifact(Path(directory) / "model", "discrete")
+            result = solve_with_highs(artifact.model)
+            cost = next(
+                block
+                for block in artifact.manifest.row_blocks
+                if block.name == "cost_maximum"
+            )
+            tightened = SolveScenario(
+                "cost_maximum=0",
+                row_bounds=(
+                    RowBoundOverride(
+                        cost.start, float(artifact.model.row_lower[cost.start]), 0.0
+                    ),
+                ),
+            )
+            base = reconstruct_solution(
+                artifact,
+                result,
+                Path(directory) / "base.npy",
+                planning_unit_count=len(BENEFIT),
+            )
+            scenario = reconstruct_solution(
+                artifact,
+                result,
+                Path(directory) / "scenario.npy",
+                planning_unit_count=len(BENEFIT),
+                scenario=tightened,
+            )
+        self.assertTrue(base.validation.accepted)
+        self.assertEqual(("constraint_violation",), scenario.validation.failures)
+
+
+if __name__ == "__main__":
+    unittest.main()
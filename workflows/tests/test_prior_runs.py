@@ -0,0 +1,36 @@
+import unittest
+
+import numpy as np
+
+from src.optimization.prior_runs import (
+    candidate_ordering_hash,
+    map_prior_decisions,
+    prior_solution_arrays,
+)
+
+
+class PriorRunTest(unittest.TestCase):
+    """Verify prior decisions follow planning-unit IDs into a related run."""
+
+    def test_prior_decisions_map_by_planning_unit_id(self) -> None:
+        ids, decisions = prior_solution_arrays(
+            np.asarray([30, 10, 20], dtype=np.uint64),
+            np.asarray([1.0, 0.0, 1.0]),
+            fixed_planning_unit_ids=np.asarray([15], dtype=np.uint64),
+            fixed_values=np.asarray([1], dtype=np.int8),
+        )
+        np.testing.assert_array_equal([10, 15, 20, 30], ids)
+        np.testing.assert_array_equal([0.0, 1.0, 1.0, 1.0], decisions)
+
+        mapped, overlap = map_prior_decisions(
+            np.asarray([15, 40, 30, 10], dtype=np.uint64), ids, decisions
+        )
+        np.testing.assert_array_equal([1.0, 0.0, 1.0, 0.0], mapped)
+        self.assertEqual(0.75, overlap)
+        self.assertNotEqual(
+            candidate_ordering_hash([10, 20, 30]), candidate_ordering_hash([20, 10, 30])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
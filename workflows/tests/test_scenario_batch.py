@@ -0,0 +1,126 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from src.optimization.artifact import load_compiled_artifact, write_compiled_artifact
+from src.optimization.conditioning import NumericalScaling, condition_model
+from src.optimization.highs import solve_with_highs
+from src.optimization.model import CanonicalObjectiveValues, SolveConfiguration
+from src.optimization.scenario_batch import (
+    budget_sweep_scenarios,
+    efficiency_frontier,
+    solve_scenario_batch,
+)
+from tests.helpers import knapsack_compilation
+
+BENEFIT = np.asarray([3.0, 1.0, 2.5, 0.5, 4.0, 2.0, 1.5, 0.8, 2.2, 1.1])
+COST = np.asarray([2.0, 1.0, 3.0, 1.0, 4.0, 2.0, 1.0, 1.0, 2.0, 3.0])
+BUDGETS = (3.0, 6.0, 9.0, 12.0)
+
+
+def _compile(budget: float):
+    indices = np.arange(len(BENEFIT), dtype=np.int32)
+    return knapsack_compilation(
+        1000.0 * BENEFIT,
+        1000.0 * COST,
+        budget * 1000.0,
+        canonical_objectives=[CanonicalObjectiveValues("benefit", indices, BENEFIT)],
+    )
+
+
+def _artifact(directory: Path):
+    compilation = _compile(BUDGETS[0])
+    reconstruction = compilation.reconstruction
+    model, scaling = condition_model(compilation.model)
+    candidates = np.flatnonzero(reconstruction.planning_unit_solver_columns >= 0)
+    write_compiled_artifact(
+        model,
+        directory,
+        problem_definition_hash="sweep",
+        candidate_planning_unit_ids=candidates,
+        candidate_source_indices=candidates,
+        fixed_planning_unit_ids=np.empty(0, dtype=np.int64),
+        fixed_source_indices=np.empty(0, dtype=np.int64),
+        fixed_values=np.empty(0, dtype=np.float32),
+        provenance={
+            "aggregate_rows": list(reconstruction.aggregate_rows),
+            "numerical_scaling": scaling.to_dict(),
+        },
+    )
+    return load_compiled_artifact(directory)
+
+
+class ScenarioBatchTest(unittest.TestCase):
+    """Verify one compiled model answers a whole budget sweep."""
+
+    def test_sequential_sweep_matches_independent_compiles(self) -> None:
+        with TemporaryDirectory() as directory:
+            artifact = _artifact(Path(directory) / "artifact")
+            scenarios = budget_sweep_scenarios(
+                artifact, layer="cost", values=[value * 1000.0 for value in BUDGETS]
+            )
+            solves = solve_scenario_batch(
+                artifact.model,
+                scenarios,
+                configuration=SolveConfiguration(thread_count=1),
+                work_directory=Path(directory) / "columns",
+                worker_count=1,
+            )
+            scaling = NumericalScaling.from_provenance(artifact.manifest.provenance)
+            row_index = int(
+                artifact.manifest.provenance["aggregate_rows"][0]["row_index"]
+            )
+            frontier = efficiency_frontier(
+                artifact.model, scenarios, solves, row_index=row_index, scaling=scaling
+            )
+
+        self.assertEqual(
+            [False, True, True, True], [solve.warm_started for solve in solves]
+        )
+        for budget, record in zip(BUDGETS, frontier, strict=True):
+            expected = solve_with_highs(_compile(budget).model).objective_value
+            self.assertAlmostEqual(expected, record["objective_value"], places=6)
+            self.assertAlmostEqual(budget * 1000.0, record["bound"])
+            self.assertLessEqual(record["row_activity"], record["bound"] + 1e-6)
+        objectives = [record["objective_value"] for record in frontier]
+        self.assertEqual(sorted(objectives), objectives)
+
+    def test_parallel_workers_match_the_sequential_sweep(self) -> None:
+        with TemporaryDirectory() as directory:
+            artifact = _artifact(Path(directory) / "artifact")
+            scenarios = budget_sweep_scenarios(
+                artifact, layer="cost", values=[value * 1000.0 for value in BUDGETS]
+            )
+            configuration = SolveConfiguration(thread_count=2)
+            sequential = solve_scenario_batch(
+                artifact.model,
+                scenarios,
+                configuration=configuration,
+                work_directory=Path(directory) / "sequential",
+                worker_count=1,
+            )
+            parallel = solve_scenario_batch(
+                artifact.model,
+                scenarios,
+                configuration=configuration,
+                work_directory=Path(directory) / "parallel",
+                worker_count=2,
+            )
+
+            self.assertEqual({0, 1}, {solve.worker for solve in parallel})
+            for first, second in zip(sequential, parallel, strict=True):
+                self.assertEqual(first.scenario_id, second.scenario_id)
+                self.assertAlmostEqual(
+                    first.result.objective_value,
+                    second.result.objective_value,
+                    places=9,
+                )
+                np.testing.assert_array_equal(
+                    np.load(first.columns_path), np.load(second.columns_path)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import zarr
+
+from src.optimization.canonical_result import write_solver_canonical_zarr
+from src.optimization.ensemble import perturbed_objective, solve_selection_ensemble
+from src.optimization.highs import solve_with_highs
+from src.optimization.model import SolveConfiguration
+from tests.helpers import knapsack_model
+
+BENEFIT = np.asarray([3.0, 1.0, 2.5, 0.5, 4.0, 2.0, 1.5, 0.8, 2.2, 1.1, 2.0, 2.1])
+COST = np.asarray([2.0, 1.0, 3.0, 1.0, 4.0, 2.0, 1.0, 1.0, 2.0, 3.0, 2.0, 2.0])
+BUDGET = 9.0
+
+
+class SelectionEnsembleTest(unittest.TestCase):
+    """Verify randomized ensembles are reproducible and worker independent."""
+
+    def test_parallel_members_match_sequential_and_independent_solves(self) -> None:
+        model = knapsack_model(BENEFIT, COST, BUDGET)
+        configuration = SolveConfiguration(thread_count=2, random_seed=7)
+        with TemporaryDirectory() as directory:
+            sequential = solve_selection_ensemble(
+                model,
+                member_count=6,
+                configuration=configuration,
+                totals_path=Path(directory) / "sequential.npy",
+                perturbation=0.4,
+                worker_count=1,
+            )
+            parallel = solve_selection_ensemble(
+                model,
+                member_count=6,
+                configuration=configuration,
+                totals_path=Path(directory) / "parallel.npy",
+                perturbation=0.4,
+                worker_count=2,
+            )
+            sequential_totals = np.load(Path(directory) / "sequential.npy")
+            parallel_totals = np.asarray(parallel.selection_totals)
+
+        np.testing.assert_array_equal(sequential_totals, parallel_totals)
+        self.assertEqual({0, 1}, {member.worker for member in parallel.members})
+        expected = np.zeros(len(BENEFIT))
+        for member in sequential.members:
+            perturbed = replace(
+                model,
+                objective=perturbed_objective(model, member.random_seed, 0.4),
+            )
+            expected += np.asarray(solve_with_highs(perturbed).decisions) >= 0.5
+        np.testing.assert_array_equal(expected, sequential_totals)
+        frequency = sequential.selection_frequency()
+        self.assertTrue(np.any((frequency > 0) & (frequency < 1)))
+        self.assertEqual(list(range(7, 13)), [m.random_seed for m in parallel.members])
+
+    def test_frequency_surface_is_a_continuous_canonical_result(self) -> None:
+        with TemporaryDirectory() as directory:
+            planning = Path(directory) / "planning.parquet"
+            pq.write_table(
+                pa.table(
+                    {
+                        "variable_index": [0, 1, 2],
+                        "row": [0, 0, 1],
+                        "col": [0, 1, 1],
+                    }
+                ),
+                planning,
+            )
+            destination = write_solver_canonical_zarr(
+                Path(directory) / "frequency.zarr",
+                [planning],
+                np.asarray([0.25, 1.0, 0.0], dtype=np.float32),
+                height=2,
+                width=2,
+                chunk_size=2,
+                transform=[30.0, 0.0, 0.0, 0.0, -30.0, 60.0],
+                crs="EPSG:3005",
+                planning_unit_resolution=30,
+                grid_family_id="family",
+                grid_level=0,
+                surface="frequency",
+            )
+            root = zarr.open_consolidated(str(destination))
+            values = root["frequency"][:]
+            attributes = dict(root.attrs)
+
+        np.testing.assert_array_equal([0.25, 1.0], values[0])
+        self.assertTrue(np.isnan(values[1, 0]))
+        self.assertEqual("frequency", attributes["surface"])
+        self.assertEqual(
+            "selection_frequency_v1", attributes["surface_semantics"]["score"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
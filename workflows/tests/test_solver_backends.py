@@ -0,0 +1,56 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from src.optimization.backends import solve_with_backend, solver_backend
+from src.optimization.cpsat import integer_row_constraints
+from src.optimization.model import SolveConfiguration, SolverProfile
+from src.optimization.racing import default_race_profiles
+from tests.helpers import knapsack_model
+
+
+class SolverBackendTest(unittest.TestCase):
+    """Verify backend selection and the exactness of the CP-SAT translation."""
+
+    def test_registry_rejects_unknown_backends_and_cycles_race_backends(
+        self,
+    ) -> None:
+        self.assertEqual("highs", solver_backend("highs").name)
+        with self.assertRaisesRegex(ValueError, "Unknown solver backend"):
+            solver_backend("gurobi")
+        with self.assertRaisesRegex(ValueError, "Unknown solver backend"):
+            solve_with_backend(
+                knapsack_model([1.0, 0.5], [1.0, 1.0], 1.0),
+                configuration=SolveConfiguration(backend="gurobi"),
+            )
+        profiles = default_race_profiles(4, base_seed=3, backends=("highs", "cpsat"))
+        self.assertEqual(
+            ["highs", "cpsat", "highs", "cpsat"], [p.backend for p in profiles]
+        )
+        self.assertEqual(4, len({profile.name for profile in profiles}))
+        self.assertEqual([3, 4, 5, 6], [p.random_seed for p in profiles])
+        self.assertEqual("highs", SolverProfile("default", 0).backend)
+
+    def test_fractional_rows_round_conservatively(self) -> None:
+        coefficients = np.asarray([0.3, 1.1, 0.7])
+        exact, is_exact = integer_row_constraints(
+            np.asarray([0.5, 1.25, 2.0]), 0.75, 2.5
+        )
+        self.assertTrue(is_exact)
+        self.assertEqual([2, 5, 8], exact[0][0].tolist())
+        self.assertEqual((3, 10), exact[0][1:])
+        rounded, is_exact = integer_row_constraints(coefficients, 0.8, 1.5)
+        self.assertFalse(is_exact)
+        for point in itertools.product((0, 1), repeat=3):
+            columns = np.asarray(point)
+            if all(
+                (lower is None or integral @ columns >= lower)
+                and (upper is None or integral @ columns <= upper)
+                for integral, lower, upper in rounded
+            ):
+                self.assertTrue(0.8 <= coefficients @ columns <= 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import multiprocessing
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import numpy as np
+
+from src.optimization.artifact import load_compiled_artifact, write_compiled_artifact
+from src.optimization.highs import solve_with_highs
+from src.optimization.model import SolveConfiguration, SolverProfile
+from src.optimization.racing import default_race_profiles
+from src.optimization import racing, shared_model
+from src.optimization.shared_model import (
+    attach_compiled_model,
+    run_worker_processes,
+    share_compiled_model,
+)
+from tests.helpers import knapsack_compilation
+
+BENEFIT = np.asarray([0.9, 0.8, 0.7, 0.4, 0.3, 0.2])
+COST = np.asarray([4.0, 3.0, 3.0, 2.0, 1.0, 1.0])
+BUDGET = 7.0
+
+
+def _exit_after_result(key, results):
+    # Exit cleanly without the final ``None`` message.
+    results.put((key, key * 10))
+
+
+def _exit_with_error_code(key, results):
+    sys.exit(3)
+
+
+class SolverRacingTest(unittest.TestCase):
+    """Verify multi-process racing over one shared compiled model."""
+
+    def test_shared_model_reopens_memory_mapped_arrays_by_path(self) -> None:
+        compilation = knapsack_compilation(BENEFIT, COST, BUDGET)
+        with TemporaryDirectory() as directory:
+            write_compiled_artifact(
+                compilation.model,
+                Path(directory),
+                problem_definition_hash="problem",
+                candidate_planning_unit_ids=np.arange(6, dtype=np.uint64),
+            )
+            loaded = load_compiled_artifact(directory)
+            reference = share_compiled_model(loaded.model)
+            self.assertIsNotNone(reference.arrays["coefficients"].path)
+            self.assertIsNone(reference.arrays["coefficients"].values)
+            attached = attach_compiled_model(reference)
+            np.testing.assert_array_equal(
+                loaded.model.coefficients, attached.coefficients
+            )
+            self.assertEqual(loaded.model.row_names, attached.row_names)
+
+    def test_worker_supervision_counts_clean_exits_as_finished(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        received = {}
+        idle_counts = []
+        with patch.object(shared_model, "WORKER_POLL_SECONDS", 0.2):
+            failures = run_worker_processes(
+                context,
+                {
+                    1: (_exit_after_result, (1, results)),
+                    2: (_exit_after_result, (2, results)),
+                    3: (_exit_with_error_code, (3, results)),
+                },
+                results,
+                received.__setitem__,
+                name_prefix="test-worker",
+                on_idle=idle_counts.append,
+            )
+
+        self.assertEqual({1: 10, 2: 20}, received)
+        self.assertEqual({3: "exit code 3"}, failures)
+        self.assertTrue(idle_counts)
+
+    def test_race_returns_certified_winner_and_reports_profiles(self) -> None:
+        compilation = knapsack_compilation(BENEFIT, COST, BUDGET)
+        configuration = SolveConfiguration(
+            time_limit_seconds=60.0,
+            thread_count=2,
+            race_profiles=default_race_profiles(2, base_seed=7),
+        )
+        baseline = solve_with_highs(
+            compilation.model,
+            configuration=SolveConfiguration(time_limit_seconds=60.0, thread_count=1),
+        )
+        with TemporaryDirectory() as directory:
+            incumbent_path = Path(directory) / "incumbent.npy"
+            with patch.object(
+                racing,
+                "build_budgeted_warm_start",
+                wraps=racing.build_budgeted_warm_start,
+            ) as seed:
+                result = solve_with_highs(
+                    compilation.model,
+                    configuration=configuration,
+                    work_directory=directory,
+                    incumbent_path=incumbent_path,
+                )
+            seed.assert_called_once()
+            np.testing.assert_array_equal(
+                result.native_columns, np.load(incumbent_path)
+            )
+
+        self.assertEqual("optimal", result.status)
+        self.assertAlmostEqual(baseline.objective_value, result.objective_value)
+        race = result.solver_settings["race"]
+        self.assertEqual("certified_within_gap", race["winner_reason"])
+        self.assertIn(race["winner"], {"default", "primal_heuristics"})
+        self.assertEqual(1, race["thread_count_per_worker"])
+        self.assertEqual(1, result.solver_settings["thread_count"])
+        self.assertEqual(compilation.model.variable_count, len(result.native_columns))
+
+    def test_race_profiles_cannot_override_authoritative_settings(self) -> None:
+        with self.assertRaisesRegex(ValueError, "random_seed"):
+            SolveConfiguration(
+                race_profiles=(
+                    SolverProfile("a", 1),
+                    SolverProfile("b", 2, {"random_seed": 3}),
+                )
+            )
+        with self.assertRaisesRegex(ValueError, "unique"):
+            SolveConfiguration(
+                race_profiles=(SolverProfile("a", 1), SolverProfile("a", 2))
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
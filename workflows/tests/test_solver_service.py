@@ -0,0 +1,171 @@
+import os
+import stat
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+
+import numpy as np
+
+from src.optimization.artifact import load_compiled_artifact, write_compiled_artifact
+from src.optimization.compiler import (
+    SparseConstraintSpecification,
+    compile_spatial_optimization,
+)
+from src.optimization.highs import solve_with_highs
+from src.optimization.irreplaceability import analyze_irreplaceability
+from src.optimization.model import (
+    RowBoundOverride,
+    SolveConfiguration,
+    SolveScenario,
+)
+from src.optimization.solver_service import (
+    ResidentModelReference,
+    ResidentSessionCache,
+    ResidentSolveRequest,
+    SolverService,
+    SolverServiceClient,
+)
+
+BENEFIT = np.asarray([3.0, 1.0, 2.5, 0.5, 4.0, 2.0, 1.5, 0.8])
+COST = np.asarray([2.0, 1.0, 3.0, 1.0, 4.0, 2.0, 1.0, 1.0])
+AUTHKEY = b"solver-service-test"
+
+
+def _write_artifact(directory: Path, budget: float) -> str:
+    indices = np.arange(len(BENEFIT), dtype=np.int32)
+    model = compile_spatial_optimization(
+        planning_units=None,
+        planning_unit_count=len(BENEFIT),
+        fused_objective=BENEFIT,
+        canonical_objectives=[],
+        constraints=[
+            SparseConstraintSpecification("cost", indices, COST, [(None, budget)])
+        ],
+    ).model
+    write_compiled_artifact(
+        model,
+        directory,
+        problem_definition_hash=f"budget-{budget}",
+        candidate_planning_unit_ids=np.arange(len(BENEFIT)),
+    )
+    return str(directory)
+
+
+class SolverServiceTest(unittest.TestCase):
+    """Verify resident sessions are reused, restored, and evicted."""
+
+    def test_cache_restores_the_baseline_and_evicts_least_recently_used(
+        self,
+    ) -> None:
+        with TemporaryDirectory() as directory:
+            first = _write_artifact(Path(directory) / "first", 7.0)
+            second = _write_artifact(Path(directory) / "second", 5.0)
+            model = load_compiled_artifact(first).model
+            cache = ResidentSessionCache(
+                SolveConfiguration(thread_count=1), max_sessions=1
+            )
+            try:
+                baseline = cache.solve(ResidentSolveRequest(first))
+                tightened = cache.solve(
+                    ResidentSolveRequest(
+                        first,
+                        scenario=SolveScenario(
+                            "tight", row_bounds=(RowBoundOverride(0, -np.inf, 3.0),)
+                        ),
+                        objective=-np.asarray(model.objective),
+                    )
+                )
+                restored = cache.solve(ResidentSolveRequest(first))
+                other = cache.solve(ResidentSolveRequest(second))
+                statistics = cache.statistics()
+            finally:
+                cache.close()
+
+        expected = solve_with_highs(model)
+        self.assertFalse(baseline.cache_hit)
+        self.assertTrue(tightened.cache_hit and restored.cache_hit)
+        self.assertAlmostEqual(
+            expected.objective_value, baseline.result.objective_value
+        )
+        self.assertAlmostEqual(
+            expected.objective_value, restored.result.objective_value
+        )
+        self.assertAlmostEqual(0.0, tightened.result.objective_value)
+        self.assertFalse(other.cache_hit)
+        self.assertEqual(
+            (2, 2, 1), (statistics.hits, statistics.misses, statistics.evictions)
+        )
+        self.assertEqual((other.mathematical_model_hash,), statistics.resident_models)
+
+    def test_irreplaceability_over_the_socket_matches_a_local_session(self) -> None:
+        with TemporaryDirectory() as directory:
+            artifact = _write_artifact(Path(directory) / "model", 7.0)
+            model = load_compiled_artifact(artifact).model
+            reference = solve_with_highs(model)
+            service = SolverService(
+                Path(directory) / "solver.sock",
+                ResidentSessionCache(SolveConfiguration(thread_count=1)),
+                AUTHKEY,
+            )
+            thread = Thread(target=service.serve_forever, daemon=True)
+            thread.start()
+            try:
+                arguments = {
+                    "candidate_planning_unit_ids": np.arange(len(BENEFIT)),
+                    "configuration": SolveConfiguration(thread_count=1),
+                }
+                local = analyze_irreplaceability(model, reference, **arguments)
+                resident = analyze_irreplaceability(
+                    model,
+                    reference,
+                    resident_model=ResidentModelReference(
+                        service.address, artifact, AUTHKEY
+                    ),
+                    **arguments,
+                )
+                with SolverServiceClient(service.address, AUTHKEY) as client:
+                    statistics = client.statistics()
+                    client.shutdown()
+            finally:
+                service.stop()
+                thread.join(timeout=10.0)
+
+        self.assertEqual(local, resident)
+        self.assertEqual(1, statistics.misses)
+        self.assertGreater(statistics.hits, 0)
+        self.assertFalse(thread.is_alive())
+
+    def test_socket_is_private_and_rejects_a_wrong_authkey(self) -> None:
+        with TemporaryDirectory() as directory:
+            service = SolverService(
+                Path(directory) / "solver.sock",
+                ResidentSessionCache(SolveConfiguration(thread_count=1)),
+                AUTHKEY,
+            )
+            mode = stat.S_IMODE(os.stat(service.address).st_mode)
+            thread = Thread(target=service.serve_forever, daemon=True)
+            thread.start()
+            try:
+                with self.assertRaisesRegex(RuntimeError, "rejected the authkey"):
+                    SolverServiceClient(service.address, b"wrong")
+                with SolverServiceClient(service.address, AUTHKEY) as client:
+                    statistics = client.statistics()
+                    client.shutdown()
+            finally:
+                service.stop()
+                thread.join(timeout=10.0)
+
+        self.assertEqual(0o600, mode)
+        self.assertEqual(0, statistics.misses)
+        self.assertFalse(thread.is_alive())
+        with self.assertRaisesRegex(ValueError, "authkey"):
+            SolverService(
+                Path(directory) / "other.sock",
+                ResidentSessionCache(SolveConfiguration(thread_count=1)),
+                b"",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
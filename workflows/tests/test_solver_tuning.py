@@ -0,0 +1,106 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from src.optimization.model import SolveConfiguration
+from src.optimization.tuning import (
+    ModelFeatures,
+    TuningChoice,
+    TuningObservation,
+    apply_solver_tuning,
+    fit_tuning_table,
+    load_tuning_table,
+    model_features,
+    tune_solver_options,
+    write_tuning_table,
+)
+from tests.helpers import knapsack_model
+
+CHOICES = (
+    TuningChoice("default", {}),
+    TuningChoice("serial", {"parallel": "off"}, max_threads=1),
+)
+
+
+def _features(rows: int, integrality_share: float = 1.0) -> ModelFeatures:
+    return ModelFeatures(
+        rows=rows,
+        columns=10 * rows,
+        nonzeros=20 * rows,
+        nonzeros_per_row=20.0,
+        neighbor_auxiliary_share=0.0,
+        integrality_share=integrality_share,
+        has_warm_start=False,
+    )
+
+
+class SolverTuningTest(unittest.TestCase):
+    """Verify rules are fitted to replayed runtimes and applied beneath overrides."""
+
+    def test_fit_splits_where_the_fastest_choice_changes(self) -> None:
+        observations = [
+            TuningObservation(_features(rows), {"default": slow, "serial": fast})
+            for rows, slow, fast in ((10, 2.0, 1.0), (20, 2.0, 1.0))
+        ] + [
+            TuningObservation(_features(rows), {"default": fast, "serial": slow})
+            for rows, fast, slow in ((5000, 10.0, 40.0), (9000, 12.0, 50.0))
+        ]
+
+        table = fit_tuning_table(observations, CHOICES)
+
+        self.assertEqual(["serial", "default"], [rule.choice for rule in table.rules])
+        lower, upper = table.rules[0].bounds["rows"]
+        self.assertIsNone(lower)
+        self.assertTrue(20 < upper < 5000)
+        self.assertEqual((upper, None), table.rules[1].bounds["rows"])
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "rules.json"
+            write_tuning_table(table, path)
+            self.assertEqual(table, load_tuning_table(path))
+
+        tied = fit_tuning_table(
+            [
+                TuningObservation(_features(rows), {"default": 1.0, "serial": 0.99})
+                for rows in (10, 20, 30, 40)
+            ],
+            CHOICES,
+        )
+        self.assertEqual(["default"], [rule.choice for rule in tied.rules])
+
+    def test_tuning_is_recorded_and_yields_to_explicit_settings(self) -> None:
+        model = knapsack_model(np.linspace(1.0, 0.1, 12), np.ones(12), 6.0)
+        features = model_features(model, has_warm_start=True)
+        self.assertEqual(12, features.columns)
+        self.assertEqual(1.0, features.integrality_share)
+        self.assertTrue(features.has_warm_start)
+        table = fit_tuning_table(
+            [TuningObservation(features, {"default": 3.0, "serial": 1.0})],
+            CHOICES,
+        )
+
+        tuning = tune_solver_options(model, has_warm_start=True, table=table)
+        configuration, record = apply_solver_tuning(SolveConfiguration(), tuning)
+        self.assertEqual({"parallel": "off"}, dict(configuration.options))
+        self.assertEqual(1, configuration.thread_count)
+        self.assertEqual("serial", record["choice"])
+        self.assertEqual({}, record["rationale"])
+        self.assertEqual(12, record["features"]["columns"])
+
+        explicit, record = apply_solver_tuning(
+            SolveConfiguration(thread_count=4, options={"parallel": "on"}), tuning
+        )
+        self.assertEqual({"parallel": "on"}, dict(explicit.options))
+        self.assertEqual(4, explicit.thread_count)
+        self.assertEqual({}, record["applied_options"])
+        self.assertIsNone(record["thread_count"])
+
+        shipped = tune_solver_options(model)
+        self.assertIn(
+            shipped.choice, {choice.name for choice in load_tuning_table().choices}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
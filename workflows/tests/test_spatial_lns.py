@@ -0,0 +1,206 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+from scipy import sparse
+
+from src.optimization import lns
+from src.optimization.highs import (
+    _aggregate_row_mask,
+    _neighbor_columns,
+    solve_with_highs,
+)
+from src.optimization.model import SolveConfiguration
+from src.optimization.neighbor import (
+    NeighborPenaltySpecification,
+    encode_packed_mask,
+    load_neighbor_structure,
+)
+from src.optimization.shared_model import (
+    attach_column_major,
+    share_compiled_model,
+    write_column_major,
+)
+from src.optimization.validation import reconstruct_and_validate
+from tests.helpers import knapsack_model
+
+
+def _grid_knapsack(side: int):
+    generator = np.random.default_rng(3)
+    count = side * side
+    return knapsack_model(
+        generator.uniform(0.1, 1.0, count),
+        generator.uniform(1.0, 3.0, count),
+        0.3 * count,
+    )
+
+
+def _empty_incumbent(model, **arguments):
+    result = solve_with_highs(model, **arguments)
+    columns = np.zeros(model.variable_count, dtype=np.float64)
+    return replace(
+        result,
+        status="feasible",
+        objective_value=0.0,
+        optimality_gap=1.0,
+        decisions=columns[: model.primary_variable_count],
+        native_columns=columns,
+    )
+
+
+class SpatialLnsTest(unittest.TestCase):
+    """Verify window re-solves improve a validated incumbent."""
+
+    def test_windows_improve_a_poor_incumbent_to_the_global_bound(self) -> None:
+        model = _grid_knapsack(8)
+        configuration = SolveConfiguration(time_limit_seconds=60.0)
+        optimum = solve_with_highs(model, configuration=configuration)
+        progress: list[dict[str, object]] = []
+        with patch.object(lns, "solve_with_highs", side_effect=_empty_incumbent):
+            result = lns.solve_with_spatial_lns(
+                model,
+                configuration=configuration,
+                candidate_planning_unit_ids=np.arange(64, dtype=np.uint64),
+                grid_width=8,
+                window_size=4,
+                worker_count=2,
+                progress_callback=progress.append,
+            )
+
+        self.assertEqual("feasible", result.status)
+        self.assertAlmostEqual(optimum.objective_value, result.objective_value)
+        self.assertAlmostEqual(optimum.objective_value, result.best_bound)
+        self.assertLessEqual(result.optimality_gap, 1e-9)
+        self.assertGreater(result.solver_settings["lns"]["accepted_windows"], 0)
+        self.assertTrue(all(update["phase"] == "lns" for update in progress))
+        self.assertTrue(
+            reconstruct_and_validate(
+                model,
+                result,
+                candidate_planning_unit_ids=np.arange(64, dtype=np.uint64),
+            ).accepted
+        )
+
+    def test_windows_partition_flexible_columns_by_checkerboard_colour(self) -> None:
+        model = _grid_knapsack(4)
+        colours = lns._spatial_windows(
+            model, np.arange(16, dtype=np.uint64), grid_width=4, window_size=2
+        )
+
+        self.assertEqual([1, 1, 1, 1], [len(colour) for colour in colours])
+        np.testing.assert_array_equal([0, 1, 4, 5], colours[0][0])
+        np.testing.assert_array_equal(
+            np.arange(16),
+            np.sort(
+                np.concatenate([window for colour in colours for window in colour])
+            ),
+        )
+        with self.assertRaisesRegex(ValueError, "exact audit"):
+            lns.solve_with_spatial_lns(
+                model,
+                configuration=SolveConfiguration(mode="exact_audit"),
+                candidate_planning_unit_ids=np.arange(16, dtype=np.uint64),
+                grid_width=4,
+            )
+
+    def test_window_model_reads_only_window_columns_of_the_shared_matrix(
+        self,
+    ) -> None:
+        eligible = np.ones((2, 3), dtype=bool)
+        structure = load_neighbor_structure(
+            {
+                "neighbor_method": "selected_rook_pairs",
+                "neighbor_method_version": 1,
+                "tile_size": 3,
+                "height": 2,
+                "width": 3,
+                "planning_unit_count": 6,
+                "tiles": [
+                    {
+                        "tile_id": "0-0",
+                        "row_start": 0,
+                        "row_stop": 2,
+                        "col_start": 0,
+                        "col_stop": 3,
+                        "variable_index_offset": 0,
+                        "valid_planning_unit_count": 6,
+                        "eligibility_mask": encode_packed_mask(eligible),
+                        "fixed0_mask": encode_packed_mask(~eligible),
+                        "fixed1_mask": encode_packed_mask(~eligible),
+                    }
+                ],
+            }
+        )
+        model = knapsack_model(
+            np.linspace(0.5, 1.0, 6),
+            np.linspace(1.0, 2.0, 6),
+            4.0,
+            neighbor_penalty=NeighborPenaltySpecification(strength=0.5),
+            neighbor_structure=structure,
+        )
+        matrix = sparse.csr_array(
+            (
+                np.asarray(model.coefficients),
+                np.asarray(model.column_indices),
+                np.asarray(model.row_starts),
+            ),
+            shape=(model.constraint_count, model.variable_count),
+        ).tocsc()
+        columns = np.zeros(model.variable_count)
+        columns[[0, 1, 4]] = 1.0
+        lns._populate_neighbor_columns(model, columns)
+
+        with tempfile.TemporaryDirectory() as directory:
+            column_major = write_column_major(model, directory, batch_nonzeros=5)
+            column_starts, row_indices, values = attach_column_major(column_major)
+            np.testing.assert_array_equal(matrix.indptr, column_starts)
+            np.testing.assert_array_equal(matrix.indices, row_indices)
+            np.testing.assert_array_equal(matrix.data, values)
+            np.save(Path(directory) / "activities.npy", matrix @ columns)
+            lns._initialize_window_worker(
+                share_compiled_model(model), column_major, _aggregate_row_mask(model)
+            )
+            try:
+                objective = float(
+                    np.dot(model.objective, columns) + model.objective_offset
+                )
+                sub_model, free = lns._window_model(
+                    model,
+                    np.asarray([1, 0]),
+                    1,
+                    columns,
+                    np.load(Path(directory) / "activities.npy", mmap_mode="r"),
+                    objective,
+                )
+            finally:
+                lns._WORKER_STATE.clear()
+
+        auxiliaries, first, second = _neighbor_columns(model)
+        touching = np.isin(first, [0, 1]) | np.isin(second, [0, 1])
+        np.testing.assert_array_equal(
+            np.concatenate(([0, 1], np.sort(auxiliaries[touching]))), free
+        )
+        rows = np.unique(matrix[:, free].indices)
+        np.testing.assert_allclose(
+            matrix[:, free][rows, :].toarray(),
+            sparse.csr_array(
+                (
+                    sub_model.coefficients,
+                    sub_model.column_indices,
+                    sub_model.row_starts,
+                ),
+                shape=(sub_model.constraint_count, len(free)),
+            ).toarray(),
+        )
+        self.assertAlmostEqual(
+            objective,
+            float(np.dot(sub_model.objective, columns[free]))
+            + sub_model.objective_offset,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()